@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import datetime
+import functools
 from typing import TYPE_CHECKING
 from urllib.parse import ParseResult
 
@@ -26,10 +27,9 @@ from immich_autotag.types.uuid_wrappers import AlbumUUID, AssetUUID, UserUUID
 from immich_autotag.utils.decorators import conditional_typechecked
 
 if TYPE_CHECKING:
-    from immich_client.models.album_response_dto import AlbumResponseDto
-
     from immich_autotag.albums.album.album_dto_state import AlbumLoadSource
     from immich_autotag.albums.album.album_user_list import AlbumUserList
+    from immich_autotag.api.logging_proxy.types import AlbumDto
     from immich_autotag.assets.asset_response_wrapper import AssetResponseWrapper
     from immich_autotag.context.immich_context import ImmichContext
 
@@ -48,20 +48,50 @@ class RedundantAlbumCacheAccessError(Exception):
 _album_cache_global: dict[AlbumUUID, AlbumCacheEntry] = {}
 
 
+def _register_memory_caches() -> None:
+    from immich_autotag.utils.perf.memory_governor import (
+        approx_collection_size,
+        register_cache,
+    )
+
+    # Reported only: the fully loaded albums are referenced by the collection too
+    register_cache(
+        "albums",
+        estimate=lambda: approx_collection_size(
+            _album_cache_global.values(), len(_album_cache_global)
+        ),
+    )
+
+
+_register_memory_caches()
+
+
 @attrs.define(auto_attribs=True, slots=True)
 class AlbumCacheEntry:
 
     _dto: AlbumDtoState
     _max_age_seconds: int = DEFAULT_CACHE_MAX_AGE_SECONDS
 
-    def merge_from_dto(
-        self, dto: "AlbumResponseDto", load_source: "AlbumLoadSource"
-    ) -> None:
+    def merge_from_dto(self, dto: "AlbumDto", load_source: "AlbumLoadSource") -> None:
         """
         Delegates to AlbumDtoState.merge_from_dto. See AlbumDtoState for logic.
         """
         self._dto.merge_from_dto(dto, load_source)
 
+    @staticmethod
+    def _from_disk_cache(album_id: AlbumUUID) -> AlbumDtoState | None:
+        """Returns the album from the disk cache if present and not stale."""
+        from immich_autotag.utils.api_disk_cache import ApiCacheKey, ApiCacheManager
+
+        cache_mgr = ApiCacheManager.create(cache_type=ApiCacheKey.ALBUMS)
+        cache_data = cache_mgr.load(str(album_id))
+        if isinstance(cache_data, dict):
+            dto = AlbumDtoState.from_cache_dict(cache_data)
+            # Use public is_stale method
+            if not dto.is_stale():
+                return dto
+        return None
+
     @classmethod
     def _from_cache_or_api(
         cls,
@@ -75,19 +105,11 @@ class AlbumCacheEntry:
         from immich_autotag.utils.api_disk_cache import ApiCacheKey, ApiCacheManager
 
         cache_mgr = ApiCacheManager.create(cache_type=ApiCacheKey.ALBUMS)
-        cache_data = cache_mgr.load(album_id_str)
-        from immich_client.models.album_response_dto import AlbumResponseDto
-
         from immich_autotag.albums.album.album_dto_state import AlbumLoadSource
 
-        if isinstance(cache_data, dict):
-            cached_album_dto = AlbumResponseDto.from_dict(cache_data)
-            dto = AlbumDtoState.create(
-                dto=cached_album_dto, load_source=AlbumLoadSource.DETAIL
-            )
-            # Use public is_stale method
-            if not dto.is_stale():
-                return dto
+        cached = cls._from_disk_cache(album_id)
+        if cached is not None:
+            return cached
 
         # API fetch logic: call proxy_get_album_info using the default Immich client
         from immich_autotag.api.immich_proxy.albums.get_album_info import (
@@ -110,8 +132,57 @@ class AlbumCacheEntry:
         assert album_dto is not None
         from immich_autotag.utils.api_disk_cache import ApiCacheKey
 
-        cache_mgr.save(album_id_str, album_dto.to_dict())
-        return AlbumDtoState.create(dto=album_dto, load_source=AlbumLoadSource.DETAIL)
+        state = AlbumDtoState.create(dto=album_dto, load_source=AlbumLoadSource.DETAIL)
+        cache_mgr.save(album_id_str, state.to_cache_dict())
+        return state
+
+    @staticmethod
+    def prefetch_full(entries: list["AlbumCacheEntry"]) -> int:
+        """
+        Loads the full (DETAIL) DTO of every entry that is not full yet, fetching
+        the albums missing from the disk cache concurrently on the AsyncDriver
+        loop. Albums that fail here are left as they are: _ensure_full_loaded
+        loads them (and reports the error) when they are first used.
+        Returns the number of albums requested to the API.
+        """
+        from immich_autotag.albums.album.album_dto_state import AlbumLoadSource
+        from immich_autotag.api.logging_proxy.aio import proxy_get_album_info_async
+        from immich_autotag.context.immich_context import ImmichContext
+        from immich_autotag.utils.async_driver import AsyncDriver
+
+        pending: list[AlbumCacheEntry] = []
+        for entry in entries:
+            if entry._dto.is_full():
+                continue
+            cached = entry._from_disk_cache(entry.get_album_id())
+            if cached is not None:
+                entry._dto.update(
+                    dto=cached.get_dto(), load_source=cached.get_load_source()
+                )
+                continue
+            pending.append(entry)
+        if not pending:
+            return 0
+
+        client = ImmichContext.get_default_instance().get_client_wrapper().get_client()
+        driver = AsyncDriver.get_instance()
+        results = driver.run(
+            driver.gather_bounded(
+                # The disk cache was just checked above
+                functools.partial(
+                    proxy_get_album_info_async,
+                    album_id=entry.get_album_id(),
+                    client=client,
+                    use_cache=False,
+                )
+                for entry in pending
+            )
+        )
+        for entry, result in zip(pending, results):
+            if result is None or isinstance(result, BaseException):
+                continue
+            entry._dto.update(dto=result, load_source=AlbumLoadSource.DETAIL)
+        return len(pending)
 
     def _ensure_full_loaded(self) -> "AlbumCacheEntry":
         """
@@ -170,9 +241,7 @@ class AlbumCacheEntry:
     def get_album_users(self) -> "AlbumUserList":
         return self._dto.get_album_users()
 
-    def update(
-        self, *, dto: "AlbumResponseDto", load_source: "AlbumLoadSource"
-    ) -> None:
+    def update(self, *, dto: "AlbumDto", load_source: "AlbumLoadSource") -> None:
         self._dto.update(dto=dto, load_source=load_source)
 
     def is_full(self) -> bool:
@@ -247,7 +316,7 @@ class AlbumCacheEntry:
         )
 
         client = context.get_client_wrapper().get_client()
-        from immich_client.models.asset_response_dto import AssetResponseDto
+        from immich_autotag.api.immich_proxy.fast_dto import decode_asset_dict
 
         page = 1
         page_size = 5000
@@ -260,7 +329,7 @@ class AlbumCacheEntry:
             for raw in items:
                 # Convert raw dict to DTO; skip malformed entries.
                 try:
-                    asset_dto: AssetResponseDto = AssetResponseDto.from_dict(raw)
+                    asset_dto = decode_asset_dict(raw)
                 except Exception:
                     continue
                 b = asset_manager.get_wrapper_for_asset_dto(
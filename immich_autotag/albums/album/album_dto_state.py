@@ -4,9 +4,9 @@ from typing import TYPE_CHECKING
 from uuid import UUID
 
 import attrs
-from immich_client.models.album_response_dto import AlbumResponseDto
 from immich_client.types import Unset
 
+from immich_autotag.api.logging_proxy.types import ALBUM_DTO_TYPES, AlbumDto, AlbumLite
 from immich_autotag.config.cache_config import DEFAULT_CACHE_MAX_AGE_SECONDS
 from immich_autotag.types.uuid_wrappers import AlbumUUID, AssetUUID, UserUUID
 
@@ -43,8 +43,9 @@ class AlbumDtoState:
     that return only the necessary information.
     """
 
-    _dto: AlbumResponseDto = attrs.field(
-        validator=attrs.validators.instance_of(AlbumResponseDto),
+    # AlbumLite for albums decoded by the fast path (api/immich_proxy/fast_dto.py)
+    _dto: AlbumDto = attrs.field(
+        validator=attrs.validators.instance_of(ALBUM_DTO_TYPES),
         repr=lambda dto: f"AlbumResponseDto(id={dto.id}, url={album_url_from_dto(dto)})",
     )
 
@@ -111,21 +112,17 @@ class AlbumDtoState:
             f"Album end_date must be datetime.datetime, got {type(value).__name__!r}: {value!r}"
         )
 
-    def get_dto(self) -> AlbumResponseDto:
-        """Returns the underlying AlbumResponseDto (for internal use only)."""
+    def get_dto(self) -> AlbumDto:
+        """Returns the underlying album DTO (for internal use only)."""
         return self._dto
 
-    def _update_from_dto(
-        self, dto: AlbumResponseDto, load_source: "AlbumLoadSource"
-    ) -> None:
+    def _update_from_dto(self, dto: AlbumDto, load_source: "AlbumLoadSource") -> None:
         self.update(dto=dto, load_source=load_source)
 
-    def _set_album_full(self, value: AlbumResponseDto) -> None:
+    def _set_album_full(self, value: AlbumDto) -> None:
         self._update_from_dto(value, AlbumLoadSource.DETAIL)
 
-    def merge_from_dto(
-        self, dto: AlbumResponseDto, load_source: "AlbumLoadSource"
-    ) -> None:
+    def merge_from_dto(self, dto: AlbumDto, load_source: "AlbumLoadSource") -> None:
         """
         Unifies DTO update logic. Updates the state with the new DTO and load_source if:
                 - The new load_source is DETAIL (always update to full)
@@ -160,7 +157,7 @@ class AlbumDtoState:
         """Returns the timestamp when the album was obtained."""
         return self._loaded_at
 
-    def update(self, *, dto: AlbumResponseDto, load_source: AlbumLoadSource) -> None:
+    def update(self, *, dto: AlbumDto, load_source: AlbumLoadSource) -> None:
         """
         Updates the state with a new DTO, source, and current timestamp.
         Ensures loaded_at never goes backwards in time.
@@ -185,9 +182,7 @@ class AlbumDtoState:
         return UserUUID.from_string(self._dto.owner_id)
 
     @staticmethod
-    def create(
-        *, dto: AlbumResponseDto, load_source: AlbumLoadSource
-    ) -> "AlbumDtoState":
+    def create(*, dto: AlbumDto, load_source: AlbumLoadSource) -> "AlbumDtoState":
         """
         Creates a new instance of AlbumDtoState safely to avoid issues with attrs and enums.
         Arguments must be passed positionally to match attrs usage.
@@ -248,8 +243,13 @@ class AlbumDtoState:
             # then typeguard's evaluation of the `set[AssetUUID]` return annotation
             # (under conditional_typechecked) raises UnboundLocalError on the cached
             # code path, where the import line is skipped.
+            asset_ids = (
+                self._dto.get_asset_ids()
+                if isinstance(self._dto, AlbumLite)
+                else [a.id for a in self._dto.assets]
+            )
             self._asset_uuids_cache = set(
-                AssetUUID.from_uuid(UUID(a.id)) for a in self._dto.assets
+                AssetUUID.from_uuid(UUID(asset_id)) for asset_id in asset_ids
             )
         return self._asset_uuids_cache
 
@@ -276,6 +276,37 @@ class AlbumDtoState:
 
     @staticmethod
     def from_album_info(
-        album_info: AlbumResponseDto, load_source: AlbumLoadSource
+        album_info: AlbumDto, load_source: AlbumLoadSource
     ) -> "AlbumDtoState":
         return AlbumDtoState.create(dto=album_info, load_source=load_source)
+
+    def to_cache_dict(self) -> dict[str, object]:
+        """
+        Serializes the state for the disk cache: the DTO dict (API camelCase
+        keys), the load source and loaded_at in ISO format.
+        """
+        return {
+            "dto": self._dto.to_dict(),
+            "load_source": self._load_source.value,
+            "loaded_at": self._loaded_at.isoformat(),
+        }
+
+    @staticmethod
+    def from_cache_dict(data: dict[str, object]) -> "AlbumDtoState":
+        """
+        Reconstructs the state from to_cache_dict() output. A bare album DTO dict
+        (cache entries written before the state was serialized) is read as a
+        DETAIL load made now.
+        """
+        from immich_autotag.api.logging_proxy.types import decode_album_dict
+
+        if "dto" not in data:
+            return AlbumDtoState.create(
+                dto=decode_album_dict(data), load_source=AlbumLoadSource.DETAIL
+            )
+        state = AlbumDtoState.create(
+            dto=decode_album_dict(data["dto"]),  # type: ignore[arg-type]
+            load_source=AlbumLoadSource(str(data["load_source"])),
+        )
+        state._loaded_at = datetime.datetime.fromisoformat(str(data["loaded_at"]))
+        return state
@@ -7,7 +7,6 @@ from urllib.parse import ParseResult
 from uuid import UUID
 
 import attrs
-from immich_client.models.album_response_dto import AlbumResponseDto
 from immich_client.types import Unset
 from typeguard import typechecked
 
@@ -15,6 +14,7 @@ if TYPE_CHECKING:
     from immich_autotag.albums.album.album_cache_entry import AlbumCacheEntry
 
 from immich_autotag.albums.album.album_dto_state import AlbumLoadSource
+from immich_autotag.api.logging_proxy.types import AlbumDto
 from immich_autotag.types.client_types import ImmichClient
 from immich_autotag.types.uuid_wrappers import AlbumUUID, UserUUID
 
@@ -224,14 +224,22 @@ class AlbumResponseWrapper:
     # --- 7. Public Methods - Lifecycle and State ---
     @conditional_typechecked
     @typechecked
-    def merge_from_dto(
-        self, dto: AlbumResponseDto, load_source: AlbumLoadSource
-    ) -> None:
+    def merge_from_dto(self, dto: AlbumDto, load_source: AlbumLoadSource) -> None:
         """
         Delegates to AlbumCacheEntry.merge_from_dto. See AlbumCacheEntry for logic.
         """
         self._cache_entry.merge_from_dto(dto, load_source)
 
+    @staticmethod
+    def prefetch_full(albums: list["AlbumResponseWrapper"]) -> int:
+        """
+        Loads the full DTO of all the given albums concurrently (see
+        AlbumCacheEntry.prefetch_full). Returns the number of API requests made.
+        """
+        from immich_autotag.albums.album.album_cache_entry import AlbumCacheEntry
+
+        return AlbumCacheEntry.prefetch_full([a._cache_entry for a in albums])
+
     def _is_full(self) -> bool:
         return self._cache_entry.is_full()
 
@@ -1,12 +1,11 @@
 from uuid import UUID
 
-from immich_client.models.album_response_dto import AlbumResponseDto
-
+from immich_autotag.api.logging_proxy.types import AlbumDto
 from immich_autotag.types.uuid_wrappers import AlbumUUID
 from immich_autotag.utils.url_helpers import get_immich_album_url
 
 
-def album_url_from_dto(dto: AlbumResponseDto) -> str:
+def album_url_from_dto(dto: AlbumDto) -> str:
     """
     Given an AlbumResponseDto, returns the Immich album URL as a string (or None if not possible).
     """
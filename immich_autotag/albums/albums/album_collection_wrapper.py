@@ -27,6 +27,7 @@ from immich_autotag.albums.album_and_modification import AlbumAndModification
 from immich_autotag.albums.albums.album_dual_map import AlbumDualMap
 from immich_autotag.albums.albums.album_list import AlbumList
 from immich_autotag.albums.albums.asset_to_albums_map import AssetToAlbumsMap
+from immich_autotag.albums.albums.settled_album_creation import SettledAlbumCreation
 from immich_autotag.albums.albums.unavailable_manager.manager import (
     UnavailableAlbumManager,
 )
@@ -96,6 +97,14 @@ class AlbumCollectionWrapper:
         eq=False,
     )
 
+    # Sharded runs: oldest album of each name in the last server listing
+    _server_albums_by_name: dict[str, AlbumResponseDto] = attrs.field(
+        init=False,
+        factory=dict,
+        repr=False,
+        eq=False,
+    )
+
     # Enum to indicate sync state: NOT_STARTED, SYNCING, SYNCED
     _sync_state: SyncState = attrs.field(
         default=SyncState.NOT_STARTED,
@@ -103,6 +112,9 @@ class AlbumCollectionWrapper:
         repr=False,
     )
 
+    # Fingerprint of the album list seen by the last resync (see resync_if_changed)
+    _api_fingerprint: int | None = attrs.field(default=None, init=False, repr=False)
+
     # Cached asset-to-albums map for batch processing
     _batch_asset_to_albums_map: AssetToAlbumsMap | None = attrs.field(
         init=False,
@@ -195,6 +207,7 @@ class AlbumCollectionWrapper:
         """
         import time
 
+        from immich_autotag.config.internal_config import ENABLE_ASYNC_API
         from immich_autotag.utils.perf.performance_tracker import PerformanceTracker
 
         if isinstance(perf_phase_tracker, PerfPhaseTracker):
@@ -206,6 +219,17 @@ class AlbumCollectionWrapper:
         t0 = time.time()
         albums = self.get_albums()
         total = len(albums)
+        if ENABLE_ASYNC_API:
+            from immich_autotag.albums.album.album_response_wrapper import (
+                AlbumResponseWrapper,
+            )
+
+            fetched = AlbumResponseWrapper.prefetch_full(list(albums))
+            log(
+                f"[PROGRESS] [ALBUM-FULL-LOAD] Fetched {fetched} album details "
+                f"concurrently in {time.time() - t0:.2f} seconds.",
+                level=LogLevel.PROGRESS,
+            )
         tracker = PerformanceTracker.from_total(total)
         for idx, album in enumerate(albums, 1):
             log(
@@ -237,6 +261,18 @@ class AlbumCollectionWrapper:
             )
         _album_collection_singleton = self
         # Asset map is built on demand, not during initialization
+        from immich_autotag.utils.perf.memory_governor import register_cache
+
+        register_cache(
+            "asset_to_albums_map",
+            estimate=lambda: (
+                self._batch_asset_to_albums_map.approx_size()
+                if self._batch_asset_to_albums_map is not None
+                else 0
+            ),
+            shed=self.clear_batch_asset_to_albums_map,
+            priority=30,
+        )
 
     @classmethod
     def get_instance(cls) -> "AlbumCollectionWrapper":
@@ -733,6 +769,64 @@ class AlbumCollectionWrapper:
         self._albums.add(wrapper)
         return wrapper
 
+    @typechecked
+    def _find_albums_on_server(
+        self, album_name: str, client: ImmichClient
+    ) -> list[AlbumResponseDto]:
+        """
+        Albums named `album_name` on the server, oldest first (ties by id).
+        The listing is kept (oldest album of each name) for the next lookups.
+        """
+        from immich_autotag.api.immich_proxy.albums.get_all_albums import (
+            proxy_get_all_albums,
+        )
+
+        by_name: dict[str, list[AlbumResponseDto]] = {}
+        for a in proxy_get_all_albums(client=client):
+            by_name.setdefault(a.album_name, []).append(a)
+        for same_name in by_name.values():
+            same_name.sort(key=lambda a: (a.created_at, a.id))
+        self._server_albums_by_name = {
+            name: same_name[0] for name, same_name in by_name.items()
+        }
+        return by_name.get(album_name, [])
+
+    @typechecked
+    def _settle_concurrent_album_creation(
+        self, album: AlbumResponseDto, client: ImmichClient
+    ) -> SettledAlbumCreation:
+        """
+        Makes album creation idempotent across shards. If several processes
+        created an album with the same name, the oldest one wins for all of them
+        (the order does not depend on who looks first); a process that lost
+        deletes its own, still empty, album and uses the winner.
+        """
+        from immich_autotag.albums.album.album_dto_state import (
+            AlbumDtoState,
+            AlbumLoadSource,
+        )
+
+        same_name = self._find_albums_on_server(album.album_name, client)
+        winner = same_name[0] if same_name else album
+        if winner.id == album.id:
+            return SettledAlbumCreation(album, True)
+        log(
+            f"[SHARD] Album '{album.album_name}' was created concurrently by another "
+            f"process; using {winner.id} and deleting {album.id}",
+            level=LogLevel.FOCUS,
+        )
+        loser = AlbumResponseWrapper(
+            AlbumCacheEntry.create(
+                dto=AlbumDtoState.create(dto=album, load_source=AlbumLoadSource.SEARCH)
+            )
+        )
+        logging_delete_album(
+            album_wrapper=loser,
+            reason="Duplicate created concurrently by another shard",
+            client=client,
+        )
+        return SettledAlbumCreation(winner, False)
+
     @conditional_typechecked
     def create_or_get_album_with_user(
         self,
@@ -756,10 +850,27 @@ class AlbumCollectionWrapper:
                 f"Duplicate albums with name '{album_name}' were found and combined. This indicates a data integrity issue. Review the logs and investigate the cause."
             )
 
+        # Sharded runs: other processes create albums too, so the local
+        # collection may be behind the server. The server listing taken when the
+        # previous album was settled is reused here; the one taken after this
+        # creation catches any album created meanwhile.
+        from immich_autotag.config.sharding import get_current_shard
+
+        sharded = get_current_shard() is not None
+        if sharded:
+            listed = self._server_albums_by_name.get(album_name)
+            if listed is not None:
+                return self._get_or_create_partial_album_wrapper(listed)
+
         # If it doesn't exist, create it and assign user
         from immich_autotag.users.user_response_wrapper import UserResponseWrapper
 
         album = self._create_album_dto(album_name, client, tag_mod_report)
+        created = True
+        if sharded:
+            settled = self._settle_concurrent_album_creation(album, client)
+            album = settled.get_album()
+            created = settled.is_created_here()
 
         # Centralized user access
         user_wrapper_opt = UserResponseWrapper.load_current_user()
@@ -771,11 +882,12 @@ class AlbumCollectionWrapper:
 
         album_wrapper = self._get_or_create_partial_album_wrapper(album)
         # don above:          self._add_album_wrapper(album_wrapper)
-        tag_mod_report.add_album_modification(
-            kind=ModificationKind.CREATE_ALBUM,
-            album=album_wrapper,
-            extra={"created": True},
-        )
+        if created:
+            tag_mod_report.add_album_modification(
+                kind=ModificationKind.CREATE_ALBUM,
+                album=album_wrapper,
+                extra={"created": True},
+            )
         # Assign user as EDITOR if not already owner
         if album_wrapper.get_owner_uuid() != user_wrapper.get_uuid():
             from immich_autotag.context.immich_context import ImmichContext
@@ -813,6 +925,10 @@ class AlbumCollectionWrapper:
         self._get_asset_map_manager().clear()
         self._albums.clear()
 
+    @staticmethod
+    def _fingerprint(albums: list[AlbumResponseDto]) -> int:
+        return hash(frozenset((a.id, str(a.updated_at), a.asset_count) for a in albums))
+
     @typechecked
     def resync_from_api(self, clear_first: bool = True) -> None:
         """
@@ -834,6 +950,7 @@ class AlbumCollectionWrapper:
         assert isinstance(tag_mod_report, ModificationReport)
 
         albums = proxy_get_all_albums(client=client)
+        self._api_fingerprint = self._fingerprint(albums)
 
         log(
             f"[RESYNC] Starting album resync. Total albums to process: {len(albums)}",
@@ -884,6 +1001,22 @@ class AlbumCollectionWrapper:
         # Mark as synchronized
         self._sync_state = SyncState.SYNCED
 
+    def resync_if_changed(self) -> bool:
+        """
+        Fetches the album list (one API call) and resyncs the collection only if
+        any album was added, removed or updated since the last resync.
+        Returns True if a resync happened.
+        """
+        from immich_autotag.api.immich_proxy.albums.get_all_albums import (
+            proxy_get_all_albums,
+        )
+
+        albums = proxy_get_all_albums(client=self.get_client())
+        if self._api_fingerprint == self._fingerprint(albums):
+            return False
+        self.resync_from_api()
+        return True
+
     @typechecked
     def is_duplicated(self, wrapper: "AlbumResponseWrapper") -> bool:
         return self._get_duplicate_album_manager().is_duplicated(wrapper)
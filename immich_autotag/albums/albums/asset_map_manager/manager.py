@@ -60,6 +60,16 @@ class AssetMapManager:
             level=LogLevel.PROGRESS,
         )
 
+        from immich_autotag.config.internal_config import ENABLE_ASYNC_API
+
+        if ENABLE_ASYNC_API:
+            from immich_autotag.albums.album.album_response_wrapper import (
+                AlbumResponseWrapper,
+            )
+
+            # Loads the album details the loop below needs in one concurrent batch
+            AlbumResponseWrapper.prefetch_full(list(albums))
+
         from immich_client.errors import UnexpectedStatus
 
         skipped_stale_albums = 0
@@ -28,6 +28,14 @@ class AssetToAlbumsMap(MutableMapping[AssetUUID, AlbumList]):
     def clear(self) -> None:
         self._map.clear()
 
+    def approx_size(self) -> int:
+        """Approximate bytes of the map itself (the albums are counted elsewhere)."""
+        from immich_autotag.utils.perf.memory_governor import approx_collection_size
+
+        return approx_collection_size(
+            self._map.items(), len(self._map), skip_types=(AlbumResponseWrapper,)
+        )
+
     def items(self):
         return self._map.items()
 
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+import attrs
+from immich_client.models.album_response_dto import AlbumResponseDto
+
+
+@attrs.define(auto_attribs=True, slots=True, frozen=True)
+class SettledAlbumCreation:
+    """Album to use after a creation was settled against other shards."""
+
+    _album: AlbumResponseDto
+    # False when another process created the album first and it was reused
+    _created_here: bool
+
+    def get_album(self) -> AlbumResponseDto:
+        return self._album
+
+    def is_created_here(self) -> bool:
+        return self._created_here
@@ -31,6 +31,13 @@ from immich_autotag.config.models import AlbumSelectionRule, UserGroup
 if TYPE_CHECKING:
     from immich_autotag.albums.album.album_response_wrapper import AlbumResponseWrapper
 
+# Map config strings to AlbumUserRole
+_ROLE_MAP = {
+    "view": AlbumUserRole.VIEWER,
+    "edit": AlbumUserRole.EDITOR,
+    "editor": AlbumUserRole.EDITOR,
+}
+
 
 @attrs.define(auto_attribs=True, slots=True)
 class ResolvedAlbumPolicy:
@@ -113,6 +120,40 @@ def _match_keyword_in_album(album_name: str, keyword: str) -> bool:
     return keyword_lower in words
 
 
+def _build_policy(
+    album: "AlbumResponseWrapper",
+    matched_rules: List[AlbumSelectionRule],
+    user_groups: Dict[str, UserGroup],
+) -> "ResolvedAlbumPolicy":
+    """The policy of `album` given the rules (in config order) that matched it."""
+    all_groups: List[str] = []
+    all_members: List[str] = []
+    access_level = AlbumUserRole.VIEWER
+
+    # Accumulate all matches
+    for rule in matched_rules:
+        all_groups.extend(rule.groups)
+        access_level = _ROLE_MAP.get(rule.access.lower(), AlbumUserRole.VIEWER)
+
+    # Resolve members from groups
+    all_groups_unique = list(set(all_groups))  # Remove duplicates
+    for group_name in all_groups_unique:
+        if group_name in user_groups:
+            group = user_groups[group_name]
+            all_members.extend(group.members)
+
+    # Remove duplicate members
+    all_members_unique = list(set(all_members))
+
+    return ResolvedAlbumPolicy(
+        album=album,
+        matched_rules=[rule.name for rule in matched_rules],
+        groups=all_groups_unique,
+        members=all_members_unique,
+        access_level=access_level,
+    )
+
+
 def resolve_album_policy(
     album: "AlbumResponseWrapper",
     user_groups: Dict[str, UserGroup],
@@ -145,44 +186,52 @@ def resolve_album_policy(
         If later config removes "abuelo@ex.com", Phase 2 will automatically remove
         that user's access on next run (complete synchronization).
     """
-    matched_rules_names: List[str] = []
-    all_groups: List[str] = []
-    all_members: List[str] = []
-    access_level = AlbumUserRole.VIEWER
-
     album_name = album.get_album_name()
-    # album_id = str(album.get_album_uuid())  # removed unused variable
+    matched_rules = [
+        rule
+        for rule in selection_rules
+        if _match_keyword_in_album(album_name, rule.keyword)
+    ]
+    return _build_policy(album, matched_rules, user_groups)
 
-    # Iterate rules and accumulate all matches
-    for rule in selection_rules:
-        if _match_keyword_in_album(album_name, rule.keyword):
-            matched_rules_names.append(rule.name)
-            all_groups.extend(rule.groups)
-            # Map config strings to AlbumUserRole
-            role_map = {
-                "view": AlbumUserRole.VIEWER,
-                "edit": AlbumUserRole.EDITOR,
-                "editor": AlbumUserRole.EDITOR,
-            }
-            access_level = role_map.get(rule.access.lower(), AlbumUserRole.VIEWER)
 
-    # Resolve members from groups
-    all_groups_unique = list(set(all_groups))  # Remove duplicates
-    for group_name in all_groups_unique:
-        if group_name in user_groups:
-            group = user_groups[group_name]
-            all_members.extend(group.members)
+def build_album_word_index(
+    albums: List["AlbumResponseWrapper"],
+) -> Dict[str, List[int]]:
+    """
+    Inverted index: normalized album-name word → positions in `albums` of the
+    albums whose name contains it (each album at most once per word).
+    """
+    index: Dict[str, List[int]] = {}
+    for position, album in enumerate(albums):
+        for word in set(_split_album_name_to_words(album.get_album_name())):
+            index.setdefault(word, []).append(position)
+    return index
 
-    # Remove duplicate members
-    all_members_unique = list(set(all_members))
 
-    return ResolvedAlbumPolicy(
-        album=album,
-        matched_rules=matched_rules_names,
-        groups=all_groups_unique,
-        members=all_members_unique,
-        access_level=access_level,
-    )
+def resolve_album_policies(
+    albums: List["AlbumResponseWrapper"],
+    user_groups: Dict[str, UserGroup],
+    selection_rules: List[AlbumSelectionRule],
+) -> List["ResolvedAlbumPolicy"]:
+    """
+    resolve_album_policy for every album, in one pass: album names are split once
+    into an inverted word index and each rule keyword is a single lookup, instead
+    of splitting every album name for every rule.
+
+    Returns one policy per album, in the order of `albums`.
+    """
+    index = build_album_word_index(albums)
+    matches: Dict[int, List[AlbumSelectionRule]] = {}
+    # Rules are visited in config order, so each album's matches keep that order
+    # (the last matching rule decides the access level, as in resolve_album_policy)
+    for rule in selection_rules:
+        for position in index.get(rule.keyword.lower(), []):
+            matches.setdefault(position, []).append(rule)
+    return [
+        _build_policy(album, matches.get(position, []), user_groups)
+        for position, album in enumerate(albums)
+    ]
 
 
 def build_user_groups_dict(
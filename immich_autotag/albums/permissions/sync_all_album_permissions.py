@@ -1,14 +1,35 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+import hashlib
+from typing import TYPE_CHECKING, Iterable, Optional
 
-from immich_autotag.albums.permissions.album_policy_resolver import resolve_album_policy
+import attrs
+
+from immich_autotag.albums.permissions.album_policy_resolver import (
+    ResolvedAlbumPolicy,
+    resolve_album_policies,
+)
 from immich_autotag.config.models import AlbumPermissionsConfig, UserConfig, UserGroup
 from immich_autotag.context.immich_context import ImmichContext
 from immich_autotag.permissions import sync_album_permissions
 
 if TYPE_CHECKING:
     from immich_autotag.albums.album.album_response_wrapper import AlbumResponseWrapper
+    from immich_autotag.users.user_response_wrapper import UserResponseWrapper
+
+
+@attrs.define(auto_attribs=True, slots=True, frozen=True)
+class _PendingAlbumSync:
+    """An album whose sharing differs from its policy, with its target members."""
+
+    resolved_policy: ResolvedAlbumPolicy
+    target_members: list["UserResponseWrapper"]
+
+
+@attrs.define(auto_attribs=True, slots=True, frozen=True)
+class _AlbumSyncCounts:
+    synced: int
+    errors: int
 
 
 def _report_album_permission_failure(
@@ -57,14 +78,111 @@ def _report_album_permission_failure(
         )
 
 
+def _permission_state_digest(user_roles: Iterable[str]) -> str:
+    """Digest of a set of "<user UUID>:<role>" entries, independent of their order."""
+    h = hashlib.blake2b(digest_size=16)
+    for user_role in sorted(set(user_roles)):
+        h.update(f"{user_role}\n".encode("utf-8"))
+    return h.hexdigest()
+
+
+def _target_state_digest(
+    resolved_policy: ResolvedAlbumPolicy, target_members: list["UserResponseWrapper"]
+) -> str:
+    """Digest of the sharing the policy asks for."""
+    role = resolved_policy.access_level.value
+    return _permission_state_digest(
+        f"{member.get_uuid()}:{role}" for member in target_members
+    )
+
+
+def _current_state_digest(album_wrapper: "AlbumResponseWrapper") -> Optional[str]:
+    """Digest of the album's sharing as loaded, or None if it cannot be read."""
+    try:
+        return _permission_state_digest(
+            f"{album_user.get_uuid()}:{album_user.get_role().value}"
+            for album_user in album_wrapper.get_album_users()
+        )
+    except Exception:  # noqa: BLE001 - the album is then simply synchronized
+        return None
+
+
+def _sync_albums_concurrently(
+    pending: list[_PendingAlbumSync], context: ImmichContext
+) -> _AlbumSyncCounts:
+    """
+    Synchronizes the albums in `pending` on ALBUM_PERMISSIONS_MAX_WORKERS threads,
+    starting at most ALBUM_PERMISSIONS_MAX_UPDATES_PER_SECOND album updates per
+    second.
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    from immich_autotag.config.internal_config import (
+        ALBUM_PERMISSIONS_MAX_UPDATES_PER_SECOND,
+        ALBUM_PERMISSIONS_MAX_WORKERS,
+    )
+    from immich_autotag.utils.rate_limiter import RateLimiter
+
+    rate_limiter = RateLimiter(per_second=ALBUM_PERMISSIONS_MAX_UPDATES_PER_SECOND)
+
+    def sync_one(item: _PendingAlbumSync) -> None:
+        rate_limiter.acquire()
+        sync_album_permissions(
+            album_wrapper=item.resolved_policy.album,
+            resolved_policy=item.resolved_policy,
+            context=context,
+            target_members=item.target_members,
+        )
+
+    synced_count = 0
+    error_count = 0
+    with ThreadPoolExecutor(
+        max_workers=max(1, ALBUM_PERMISSIONS_MAX_WORKERS),
+        thread_name_prefix="album-permissions",
+    ) as executor:
+        futures = {
+            executor.submit(sync_one, item): item.resolved_policy.album
+            for item in pending
+        }
+        # Failures are handled here, on the calling thread. The workers are not
+        # isolated from shared state, though: the add/remove member and role
+        # update proxies call ModificationReport.add_modification and update
+        # StatisticsManager from the worker threads. That is safe only because
+        # the report appends under its lock and the statistics under its RLock.
+        for future in as_completed(futures):
+            album_wrapper = futures[future]
+            # Fault isolation, and it is the whole point of this try. Permission sync
+            # runs BEFORE the asset loop, so an exception here does not cost one album:
+            # it kills the run before a single asset is classified, and on the batch
+            # branch a failed run also stops the self-chaining -- one bad album buys
+            # days of silence. Seen 2026-08-10: Immich answers a duplicate album_user
+            # row with a bare 500, which is what a manual share racing the engine
+            # looks like from here.
+            try:
+                future.result()
+            # Broad on purpose: no single album may abort the run.
+            except Exception as exc:  # noqa: BLE001
+                error_count += 1
+                _report_album_permission_failure(album_wrapper, exc)
+                continue
+            synced_count += 1
+    return _AlbumSyncCounts(synced=synced_count, errors=error_count)
+
+
 def sync_all_album_permissions(user_config: Optional[UserConfig], context: ImmichContext) -> None:  # type: ignore
     """
     Phase 2: Synchronize all album permissions.
 
-    Iterates over albums and syncs permissions for those with matching rules.
+    Resolves the policy of every album in one pass (inverted word index), skips
+    the albums whose sharing, as loaded, already is the target one and syncs the
+    others concurrently.
     """
     from immich_autotag.logging.levels import LogLevel
     from immich_autotag.logging.utils import log
+    from immich_autotag.permissions.album_permission_executor.sync_album_permissions import (
+        policy_members_key,
+        resolve_policies_target_members,
+    )
 
     if not user_config or not user_config.album_permissions:
         return
@@ -86,43 +204,46 @@ def sync_all_album_permissions(user_config: Optional[UserConfig], context: Immic
         for group in user_groups:
             user_groups_dict[group.name] = group
 
-    synced_count = 0
-    error_count = 0
-
-    # Process each album
     # Use direct attribute access; selection_rules is Optional[List[AlbumSelectionRule]]
     selection_rules = album_perms_config.selection_rules or []
-    for album_wrapper in albums_collection.get_albums():
-        resolved_policy = resolve_album_policy(
-            album=album_wrapper,
+    matched_policies = [
+        resolved_policy
+        for resolved_policy in resolve_album_policies(
+            albums=list(albums_collection.get_albums()),
             user_groups=user_groups_dict,
-            selection_rules=selection_rules or [],
+            selection_rules=selection_rules,
+        )
+        if resolved_policy.has_match
+    ]
+    if not matched_policies:
+        log(
+            "[ALBUM_PERMISSIONS] Phase 2 Summary: no album matches the rules",
+            level=LogLevel.FOCUS,
         )
+        return
+    targets = resolve_policies_target_members(matched_policies, context)
 
-        if resolved_policy.has_match:
-            # Fault isolation, and it is the whole point of this try. Permission sync runs
-            # BEFORE the asset loop, so an exception here does not cost one album: it kills
-            # the run before a single asset is classified, and on the batch branch a failed
-            # run also stops the self-chaining -- one bad album buys days of silence.
-            # Seen 2026-08-10: Immich answers a duplicate album_user row with a bare 500,
-            # which is what a manual share racing the engine looks like from here.
-            try:
-                sync_album_permissions(
-                    album_wrapper=album_wrapper,
-                    resolved_policy=resolved_policy,
-                    context=context,
-                )
-            # Broad on purpose: no single album may abort the run.
-            except Exception as exc:  # noqa: BLE001
-                error_count += 1
-                _report_album_permission_failure(album_wrapper, exc)
-                continue
-            synced_count += 1
+    # Albums already shared as their policy asks need no diff, worker or API call
+    pending: list[_PendingAlbumSync] = []
+    unchanged_count = 0
+    for resolved_policy in matched_policies:
+        target_members = targets[policy_members_key(resolved_policy)]
+        if _target_state_digest(
+            resolved_policy, target_members
+        ) == _current_state_digest(resolved_policy.album):
+            unchanged_count += 1
+            continue
+        pending.append(_PendingAlbumSync(resolved_policy, target_members))
+
+    counts = _sync_albums_concurrently(pending, context)
+    synced_count = counts.synced
+    error_count = counts.errors
 
     # Not FOCUS: a summary nobody sees is how `error_count` stayed at a hardcoded-looking
     # zero for so long. Errors are announced at a level that survives normal verbosity.
     log(
-        f"[ALBUM_PERMISSIONS] Phase 2 Summary: {synced_count} synced, {error_count} errors",
+        f"[ALBUM_PERMISSIONS] Phase 2 Summary: {synced_count} synced, "
+        f"{unchanged_count} already up to date, {error_count} errors",
         level=LogLevel.IMPORTANT if error_count else LogLevel.FOCUS,
     )
 
@@ -132,7 +253,8 @@ def sync_all_album_permissions(user_config: Optional[UserConfig], context: Immic
     # config -- would go green forever while applying zero permissions, and the
     # self-chaining batch would happily keep doing nothing. Partial failures stay
     # isolated, which is the point; total failure is not one bad album, it is systemic.
-    if error_count and not synced_count:
+    # Unchanged albums count as healthy: their sharing was just read from the server.
+    if error_count and not synced_count and not unchanged_count:
         raise RuntimeError(
             f"[ALBUM_PERMISSIONS] every matching album failed to sync "
             f"({error_count} of {error_count}). This is systemic, not one bad album."
@@ -0,0 +1,36 @@
+"""
+Asyncio variants of the hot immich_proxy endpoints.
+
+Each function mirrors its blocking counterpart in immich_proxy (same arguments,
+same return values, same diagnostics and disk cache) but awaits the generated
+client's `asyncio`/`asyncio_detailed` functions, which use the client's shared
+httpx.AsyncClient. They must be awaited on the AsyncDriver loop
+(utils/async_driver.py), the only loop that uses that client.
+With ENABLE_FAST_DTO_DECODING, search, album info and duplicates are requested
+raw on that same client and decoded by fast_dto.py.
+"""
+
+__all__ = [
+    "proxy_add_assets_to_album_async",
+    "proxy_get_album_assets_async",
+    "proxy_get_album_info_async",
+    "proxy_get_asset_duplicates_async",
+    "proxy_get_asset_info_async",
+    "proxy_remove_asset_from_album_async",
+    "proxy_search_assets_async",
+    "proxy_tag_assets_async",
+    "proxy_untag_assets_async",
+]
+from .albums import proxy_add_assets_to_album_async as proxy_add_assets_to_album_async
+from .albums import proxy_get_album_assets_async as proxy_get_album_assets_async
+from .albums import proxy_get_album_info_async as proxy_get_album_info_async
+from .albums import (
+    proxy_remove_asset_from_album_async as proxy_remove_asset_from_album_async,
+)
+from .assets import proxy_get_asset_info_async as proxy_get_asset_info_async
+from .duplicates import (
+    proxy_get_asset_duplicates_async as proxy_get_asset_duplicates_async,
+)
+from .search import proxy_search_assets_async as proxy_search_assets_async
+from .tags import proxy_tag_assets_async as proxy_tag_assets_async
+from .tags import proxy_untag_assets_async as proxy_untag_assets_async
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from immich_client.api.albums import (
+    add_assets_to_album,
+    get_album_info,
+    remove_asset_from_album,
+)
+from immich_client.client import AuthenticatedClient
+from immich_client.models.bulk_id_response_dto import BulkIdResponseDto
+from immich_client.models.bulk_ids_dto import BulkIdsDto
+
+from immich_autotag.api.immich_proxy.albums.get_album_info import (
+    album_info_url,
+    decode_album_info_response,
+    load_cached_album_info,
+    record_album_api_call,
+    store_album_info,
+)
+from immich_autotag.api.immich_proxy.debug import write_operation_debug
+from immich_autotag.api.immich_proxy.fast_dto import AlbumDto, is_fast_dto_enabled
+from immich_autotag.api.immich_proxy.read_coalescer import (
+    album_info_reads,
+    invalidate_album_reads,
+)
+from immich_autotag.types.uuid_wrappers import AlbumUUID, AssetUUID
+
+
+async def proxy_get_album_info_async(
+    *, album_id: AlbumUUID, client: AuthenticatedClient, use_cache: bool = True
+) -> AlbumDto | None:
+    """
+    Async counterpart of proxy_get_album_info. Shares its disk cache and
+    diagnostics counters, and its memo of recent server responses.
+    """
+    if use_cache:
+        cached = load_cached_album_info(album_id)
+        if cached is not None:
+            return cached
+
+    async def fetch() -> AlbumDto | None:
+        record_album_api_call(album_id)
+        dto: AlbumDto | None
+        if is_fast_dto_enabled():
+            dto = decode_album_info_response(
+                await client.get_async_httpx_client().request(
+                    "GET", album_info_url(album_id)
+                ),
+                client,
+            )
+        else:
+            dto = await get_album_info.asyncio(id=album_id.to_uuid(), client=client)
+        if dto is not None:
+            store_album_info(album_id, dto)
+        return dto
+
+    return await album_info_reads.get_async(str(album_id), fetch)
+
+
+async def proxy_get_album_assets_async(
+    *,
+    album_id: AlbumUUID,
+    client: AuthenticatedClient,
+    page: int | None = None,
+    size: int | None = None,
+) -> list[dict]:
+    """
+    Async counterpart of proxy_get_album_assets (raw request on the client's
+    httpx.AsyncClient). Returns the raw asset dicts.
+    """
+    params = {}
+    if page is not None:
+        params["page"] = page
+    if size is not None:
+        params["size"] = size
+
+    url = f"/albums/{album_id}/assets"
+    resp = await client.get_async_httpx_client().request("GET", url, params=params)
+    resp.raise_for_status()
+    data = resp.json()
+
+    # The API may return an object with `.items` or a bare list depending on server version.
+    if isinstance(data, dict) and "items" in data:
+        return data["items"]
+    if isinstance(data, list):
+        return data
+    return []
+
+
+async def proxy_add_assets_to_album_async(
+    *, album_id: AlbumUUID, client: AuthenticatedClient, asset_ids: list[AssetUUID]
+) -> list[BulkIdResponseDto]:
+    write_operation_debug()
+    uuid_ids = [a.to_uuid() for a in asset_ids]
+    try:
+        result = await add_assets_to_album.asyncio(
+            id=album_id.to_uuid(), client=client, body=BulkIdsDto(ids=uuid_ids)
+        )
+    finally:
+        invalidate_album_reads(album_id)
+    if result is None:
+        raise RuntimeError(
+            f"Failed to add assets to album {album_id}: API returned None"
+        )
+    return result
+
+
+async def proxy_remove_asset_from_album_async(
+    *, album_id: AlbumUUID, client: AuthenticatedClient, asset_ids: list[AssetUUID]
+) -> list[BulkIdResponseDto]:
+    write_operation_debug()
+    uuid_ids = [a.to_uuid() for a in asset_ids]
+    try:
+        result = await remove_asset_from_album.asyncio(
+            id=album_id.to_uuid(), client=client, body=BulkIdsDto(ids=uuid_ids)
+        )
+    finally:
+        invalidate_album_reads(album_id)
+    if result is None:
+        raise RuntimeError(
+            f"Failed to remove assets from album {album_id}: API returned None"
+        )
+    return result
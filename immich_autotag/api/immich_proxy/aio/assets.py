@@ -0,0 +1,23 @@
+from immich_client.api.assets import get_asset_info as _get_asset_info
+from immich_client.models.asset_response_dto import AssetResponseDto
+
+from immich_autotag.api.immich_proxy.assets.get_asset_info import (
+    record_asset_api_call,
+)
+from immich_autotag.api.immich_proxy.debug import read_operation_debug
+from immich_autotag.api.immich_proxy.read_coalescer import asset_info_reads
+from immich_autotag.types.client_types import ImmichClient
+from immich_autotag.types.uuid_wrappers import AssetUUID
+
+
+async def proxy_get_asset_info_async(
+    asset_id: AssetUUID, client: ImmichClient
+) -> AssetResponseDto | None:
+    """Async counterpart of proxy_get_asset_info (shared diagnostics and memo)."""
+
+    async def fetch() -> AssetResponseDto | None:
+        read_operation_debug()
+        record_asset_api_call(asset_id)
+        return await _get_asset_info.asyncio(id=asset_id.to_uuid(), client=client)
+
+    return await asset_info_reads.get_async(str(asset_id), fetch)
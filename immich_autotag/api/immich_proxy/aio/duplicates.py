@@ -0,0 +1,20 @@
+from typing import Optional
+
+from immich_client.api.duplicates import get_asset_duplicates
+from immich_client.client import AuthenticatedClient
+
+from immich_autotag.api.immich_proxy.duplicates.get_asset_duplicates import (
+    DUPLICATES_URL,
+    decode_duplicates_response,
+)
+from immich_autotag.api.immich_proxy.fast_dto import DuplicateDto, is_fast_dto_enabled
+
+
+async def proxy_get_asset_duplicates_async(
+    *, client: AuthenticatedClient
+) -> Optional[list[DuplicateDto]]:
+    if not is_fast_dto_enabled():
+        return await get_asset_duplicates.asyncio(client=client)
+    return decode_duplicates_response(
+        await client.get_async_httpx_client().request("GET", DUPLICATES_URL), client
+    )
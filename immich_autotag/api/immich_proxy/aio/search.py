@@ -0,0 +1,22 @@
+from immich_client.api.search.search_assets import asyncio_detailed as search_assets
+from immich_client.client import AuthenticatedClient
+from immich_client.models.metadata_search_dto import MetadataSearchDto
+from immich_client.models.search_response_dto import SearchResponseDto
+from immich_client.types import Response
+
+from immich_autotag.api.immich_proxy.fast_dto import is_fast_dto_enabled
+from immich_autotag.api.immich_proxy.search.search import (
+    SEARCH_METADATA_URL,
+    build_search_response,
+)
+
+
+async def proxy_search_assets_async(
+    *, client: AuthenticatedClient, body: MetadataSearchDto
+) -> Response[SearchResponseDto]:
+    if not is_fast_dto_enabled():
+        return await search_assets(client=client, body=body)
+    raw_response = await client.get_async_httpx_client().request(
+        "POST", SEARCH_METADATA_URL, json=body.to_dict()
+    )
+    return build_search_response(raw_response, client)
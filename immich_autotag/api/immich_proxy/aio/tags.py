@@ -0,0 +1,55 @@
+from typing import List
+
+from immich_client.api.tags import tag_assets, untag_assets
+from immich_client.models.bulk_id_response_dto import BulkIdResponseDto
+from immich_client.models.bulk_ids_dto import BulkIdsDto
+
+from immich_autotag.api.immich_proxy.debug import write_operation_debug
+from immich_autotag.api.immich_proxy.read_coalescer import invalidate_asset_reads
+from immich_autotag.api.immich_proxy.tags.tag_action_enum import TagAction
+from immich_autotag.types.client_types import ImmichClient
+from immich_autotag.types.uuid_wrappers import AssetUUID, TagUUID
+
+
+async def _proxy_tag_action_async(
+    *,
+    tag_id: TagUUID,
+    client: ImmichClient,
+    asset_ids: List[AssetUUID],
+    action: TagAction,
+) -> list[BulkIdResponseDto]:
+    """Async counterpart of proxy_tag_action."""
+    write_operation_debug()
+    body = BulkIdsDto(ids=[a.to_uuid() for a in asset_ids])
+    try:
+        if action == TagAction.TAG:
+            result = await tag_assets.asyncio(
+                id=tag_id.to_uuid(), client=client, body=body
+            )
+        elif action == TagAction.UNTAG:
+            result = await untag_assets.asyncio(
+                id=tag_id.to_uuid(), client=client, body=body
+            )
+        else:
+            raise ValueError(f"Unknown action: {action}")
+    finally:
+        invalidate_asset_reads(asset_ids)
+    if result is None:
+        raise RuntimeError(f"{action}_assets.asyncio returned None (unexpected)")
+    return result
+
+
+async def proxy_tag_assets_async(
+    *, tag_id: TagUUID, client: ImmichClient, asset_ids: List[AssetUUID]
+) -> list[BulkIdResponseDto]:
+    return await _proxy_tag_action_async(
+        tag_id=tag_id, client=client, asset_ids=asset_ids, action=TagAction.TAG
+    )
+
+
+async def proxy_untag_assets_async(
+    *, tag_id: TagUUID, client: ImmichClient, asset_ids: List[AssetUUID]
+) -> list[BulkIdResponseDto]:
+    return await _proxy_tag_action_async(
+        tag_id=tag_id, client=client, asset_ids=asset_ids, action=TagAction.UNTAG
+    )
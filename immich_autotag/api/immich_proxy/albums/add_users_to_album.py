@@ -4,6 +4,7 @@ from immich_client.models.add_users_dto import AddUsersDto
 from immich_client.models.album_response_dto import AlbumResponseDto
 
 from immich_autotag.api.immich_proxy.debug import write_operation_debug
+from immich_autotag.api.immich_proxy.read_coalescer import invalidate_album_reads
 from immich_autotag.types.uuid_wrappers import AlbumUUID
 
 
@@ -11,7 +12,12 @@ def proxy_add_users_to_album(
     *, album_id: AlbumUUID, client: AuthenticatedClient, body: AddUsersDto
 ) -> AlbumResponseDto:
     write_operation_debug()
-    result = add_users_to_album.sync(id=album_id.to_uuid(), client=client, body=body)
+    try:
+        result = add_users_to_album.sync(
+            id=album_id.to_uuid(), client=client, body=body
+        )
+    finally:
+        invalidate_album_reads(album_id)
     if result is None:
         raise RuntimeError("Failed to add users to album")
     return result
@@ -7,6 +7,7 @@ from immich_client.client import AuthenticatedClient
 from immich_client.types import Response
 
 from immich_autotag.api.immich_proxy.debug import write_operation_debug
+from immich_autotag.api.immich_proxy.read_coalescer import invalidate_album_reads
 from immich_autotag.types.uuid_wrappers import AlbumUUID
 
 
@@ -27,7 +28,10 @@ def proxy_delete_album(
     """
 
     write_operation_debug()
-    response = delete_album_sync_detailed(id=album_id.to_uuid(), client=client)
+    try:
+        response = delete_album_sync_detailed(id=album_id.to_uuid(), client=client)
+    finally:
+        invalidate_album_reads(album_id)
     if response.status_code != 204:
         raise RuntimeError(
             f"Failed to delete album {album_id}: status {response.status_code}, content: {response.content!r}"
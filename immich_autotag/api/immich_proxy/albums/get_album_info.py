@@ -7,8 +7,16 @@ from immich_client.api.albums import (
     get_album_info,
 )
 from immich_client.client import AuthenticatedClient
-from immich_client.models.album_response_dto import AlbumResponseDto
 
+from immich_autotag.api.immich_proxy.fast_dto import (
+    AlbumDto,
+    AlbumLite,
+    decode_album_dict,
+    is_fast_dto_enabled,
+    json_loads,
+    raise_or_none,
+)
+from immich_autotag.api.immich_proxy.read_coalescer import album_info_reads
 from immich_autotag.logging.levels import LogLevel
 from immich_autotag.types.uuid_wrappers import AlbumUUID
 from immich_autotag.utils.api_disk_cache import ApiCacheKey, ApiCacheManager
@@ -27,7 +35,8 @@ def print_album_api_call_summary(
     log_fn = log_func or log
     lvl = loglevel or LogLevel.DEBUG
     log_fn(
-        f"[DIAG] proxy_get_album_info: total calls={_album_api_call_count}, unique IDs={len(_album_api_ids)}",
+        f"[DIAG] proxy_get_album_info: total calls={_album_api_call_count}, unique IDs={len(_album_api_ids)}, "
+        f"{album_info_reads.describe_savings()}",
         lvl,
     )
     if len(_album_api_ids) < 30:
@@ -37,38 +46,88 @@ def print_album_api_call_summary(
 atexit.register(print_album_api_call_summary)
 
 
+def decode_album_info_response(
+    raw_response, client: AuthenticatedClient
+) -> AlbumDto | None:
+    """Decodes a raw GET /albums/{id} response (None on a non-200 status)."""
+    if raw_response.status_code != 200:
+        raise_or_none(raw_response, client)
+        return None
+    return AlbumLite.from_dict(json_loads(raw_response.content))
+
+
+def load_cached_album_info(album_id: AlbumUUID) -> AlbumDto | None:
+    """Returns the album from the disk cache, or None if it is not cached."""
+    cache_mgr = ApiCacheManager.create(cache_type=ApiCacheKey.ALBUMS)
+    cache_key = str(album_id)
+    cache_data = cache_mgr.load(cache_key)
+    if cache_data is None:
+        return None
+    if isinstance(cache_data, dict):
+        # AlbumDtoState.to_cache_dict() envelope or bare DTO dict
+        dto_data = cache_data.get("dto", cache_data)
+        return decode_album_dict(dto_data)  # type: ignore[arg-type]
+    elif cache_data:
+        # Defensive: if cache is a list, return the first
+        return decode_album_dict(cache_data[0])
+    else:
+        raise RuntimeError(
+            f"Invalid cache data for album_id={album_id}: {type(cache_data)}"
+        )
+
+
+def album_info_url(album_id: AlbumUUID) -> str:
+    return f"/albums/{album_id}"
+
+
+def record_album_api_call(album_id: AlbumUUID) -> None:
+    """Counts an album info request for the diagnostics summary."""
+    global _album_api_call_count
+
+    _album_api_call_count += 1
+    _album_api_ids.add(str(album_id))
+
+
+def store_album_info(album_id: AlbumUUID, dto: AlbumDto) -> None:
+    """Traces a freshly fetched album and saves it to the disk cache."""
+    from immich_autotag.logging.utils import log
+
+    log(
+        f"[TRACE] Album loaded: {album_id} | Title: {dto.album_name}",
+        LogLevel.FOCUS,
+    )
+    cache_mgr = ApiCacheManager.create(cache_type=ApiCacheKey.ALBUMS)
+    cache_mgr.save(str(album_id), dto.to_dict())
+
+
 def proxy_get_album_info(
     *, album_id: AlbumUUID, client: AuthenticatedClient, use_cache: bool = True
-) -> AlbumResponseDto | None:
+) -> AlbumDto | None:
     """
     Centralized wrapper for get_album_info.sync. Includes disk cache.
+    With fast DTO decoding, the album is requested raw and returned as AlbumLite.
+    Identical concurrent or recent server requests share one response (see
+    read_coalescer.py), also with use_cache=False: our album writes invalidate it.
+    Only server responses are memoized, never disk cache entries, so a
+    use_cache=False caller always gets an album read from the server.
     """
-    global _album_api_call_count
+    if use_cache:
+        cached = load_cached_album_info(album_id)
+        if cached is not None:
+            return cached
 
-    cache_mgr = ApiCacheManager.create(cache_type=ApiCacheKey.ALBUMS)
-    # Only accept AlbumUUID
-    cache_key = str(album_id)
-    cache_data = cache_mgr.load(cache_key)
-    if cache_data is not None:
-        if isinstance(cache_data, dict):
-            return AlbumResponseDto.from_dict(cache_data)
-        elif cache_data:
-            # Defensive: if cache is a list, return the first
-            return AlbumResponseDto.from_dict(cache_data[0])
-        else:
-            raise RuntimeError(
-                f"Invalid cache data for album_id={album_id}: {type(cache_data)}"
+    def fetch() -> AlbumDto | None:
+        record_album_api_call(album_id)
+        dto: AlbumDto | None
+        if is_fast_dto_enabled():
+            dto = decode_album_info_response(
+                client.get_httpx_client().request("GET", album_info_url(album_id)),
+                client,
             )
-    _album_api_call_count += 1
-    _album_api_ids.add(cache_key)
-    dto = get_album_info.sync(id=album_id.to_uuid(), client=client)
-    if dto is not None:
-        from immich_autotag.logging.utils import log
-
-        album_name = dto.album_name
-        log(
-            f"[TRACE] Album loaded: {album_id} | Title: {album_name}",
-            LogLevel.FOCUS,
-        )
-        cache_mgr.save(cache_key, dto.to_dict())
-    return dto
+        else:
+            dto = get_album_info.sync(id=album_id.to_uuid(), client=client)
+        if dto is not None:
+            store_album_info(album_id, dto)
+        return dto
+
+    return album_info_reads.get(str(album_id), fetch)
@@ -4,6 +4,7 @@ from immich_client.models.bulk_id_response_dto import BulkIdResponseDto
 from immich_client.models.bulk_ids_dto import BulkIdsDto
 
 from immich_autotag.api.immich_proxy.debug import write_operation_debug
+from immich_autotag.api.immich_proxy.read_coalescer import invalidate_album_reads
 from immich_autotag.types.uuid_wrappers import AlbumUUID, AssetUUID
 
 
@@ -13,9 +14,12 @@ def proxy_remove_asset_from_album(
 
     write_operation_debug()
     uuid_ids = [a.to_uuid() for a in asset_ids]
-    result = remove_asset_from_album.sync(
-        id=album_id.to_uuid(), client=client, body=BulkIdsDto(ids=uuid_ids)
-    )
+    try:
+        result = remove_asset_from_album.sync(
+            id=album_id.to_uuid(), client=client, body=BulkIdsDto(ids=uuid_ids)
+        )
+    finally:
+        invalidate_album_reads(album_id)
     if result is None:
         raise RuntimeError(
             f"Failed to remove assets from album {album_id}: API returned None"
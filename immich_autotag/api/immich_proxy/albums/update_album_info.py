@@ -4,6 +4,7 @@ from immich_client.models.album_response_dto import AlbumResponseDto
 from immich_client.models.update_album_dto import UpdateAlbumDto
 
 from immich_autotag.api.immich_proxy.debug import write_operation_debug
+from immich_autotag.api.immich_proxy.read_coalescer import invalidate_album_reads
 from immich_autotag.types.uuid_wrappers import AlbumUUID
 
 
@@ -12,7 +13,10 @@ def proxy_update_album_info(
 ) -> AlbumResponseDto:
 
     write_operation_debug()
-    result = update_album_info.sync(id=album_id.to_uuid(), client=client, body=body)
+    try:
+        result = update_album_info.sync(id=album_id.to_uuid(), client=client, body=body)
+    finally:
+        invalidate_album_reads(album_id)
     if result is None:
         raise RuntimeError("Failed to update album info")
     return result
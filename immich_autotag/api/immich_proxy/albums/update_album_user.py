@@ -7,6 +7,7 @@ from immich_client.models.update_album_user_dto import UpdateAlbumUserDto
 from immich_client.types import Response
 
 from immich_autotag.api.immich_proxy.debug import write_operation_debug
+from immich_autotag.api.immich_proxy.read_coalescer import invalidate_album_reads
 from immich_autotag.types.uuid_wrappers import AlbumUUID, UserUUID
 
 
@@ -19,9 +20,12 @@ def proxy_update_album_user(
 ) -> Response[Any]:
     write_operation_debug()
     body = UpdateAlbumUserDto(role=role)
-    return update_album_user.sync_detailed(
-        client=client, id=album_id.to_uuid(), user_id=str(user_id), body=body
-    )
+    try:
+        return update_album_user.sync_detailed(
+            client=client, id=album_id.to_uuid(), user_id=str(user_id), body=body
+        )
+    finally:
+        invalidate_album_reads(album_id)
 
 
 __all__ = ["proxy_update_album_user"]
@@ -4,6 +4,7 @@ from immich_client.api.assets import get_asset_info as _get_asset_info
 from immich_client.models.asset_response_dto import AssetResponseDto
 
 from immich_autotag.api.immich_proxy.debug import read_operation_debug
+from immich_autotag.api.immich_proxy.read_coalescer import asset_info_reads
 from immich_autotag.logging.levels import LogLevel
 from immich_autotag.logging.utils import log
 from immich_autotag.types.client_types import ImmichClient
@@ -15,7 +16,8 @@ _asset_api_ids: set[str] = set()
 
 def _print_asset_api_call_summary():
     log(
-        f"[DIAG] get_asset_info: total calls={_asset_api_call_count}, unique IDs={len(_asset_api_ids)}",
+        f"[DIAG] get_asset_info: total calls={_asset_api_call_count}, unique IDs={len(_asset_api_ids)}, "
+        f"{asset_info_reads.describe_savings()}",
         level=LogLevel.DEBUG,
     )
     if len(_asset_api_ids) < 30:
@@ -25,20 +27,28 @@ def _print_asset_api_call_summary():
 atexit.register(_print_asset_api_call_summary)
 
 
+def record_asset_api_call(asset_id: AssetUUID) -> None:
+    """Counts an asset info request for the diagnostics summary."""
+    global _asset_api_call_count
+    _asset_api_call_count += 1
+    _asset_api_ids.add(str(asset_id))
+
+
 def proxy_get_asset_info(
     asset_id: AssetUUID, client: ImmichClient, use_cache: bool = True
 ) -> AssetResponseDto | None:
     """
     Centralized wrapper for get_asset_info.sync. Now delegates all cache logic to AssetCacheEntry.
+    Identical concurrent or recent requests share one response (see
+    read_coalescer.py); our asset writes invalidate it.
     """
 
-    read_operation_debug()
-    global _asset_api_call_count
-    _asset_api_call_count += 1
-    _asset_api_ids.add(str(asset_id))
-    # Calls the API directly, without cache logic
+    def fetch() -> AssetResponseDto | None:
+        read_operation_debug()
+        record_asset_api_call(asset_id)
+        return _get_asset_info.sync(id=asset_id.to_uuid(), client=client)
 
-    return _get_asset_info.sync(id=asset_id.to_uuid(), client=client)
+    return asset_info_reads.get(str(asset_id), fetch)
 
 
 __all__ = ["AssetResponseDto", "proxy_get_asset_info"]
@@ -3,6 +3,7 @@ from immich_client.models.asset_response_dto import AssetResponseDto
 from immich_client.models.update_asset_dto import UpdateAssetDto
 
 from immich_autotag.api.immich_proxy.debug import write_operation_debug
+from immich_autotag.api.immich_proxy.read_coalescer import invalidate_asset_reads
 from immich_autotag.types.client_types import ImmichClient
 from immich_autotag.types.uuid_wrappers import AssetUUID
 
@@ -15,4 +16,7 @@ def proxy_update_asset(
     """
 
     write_operation_debug()
-    return _update_asset.sync(id=asset_id.to_uuid(), client=client, body=body)
+    try:
+        return _update_asset.sync(id=asset_id.to_uuid(), client=client, body=body)
+    finally:
+        invalidate_asset_reads((asset_id,))
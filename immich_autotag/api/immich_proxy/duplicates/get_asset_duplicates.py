@@ -3,11 +3,34 @@ from typing import Optional
 from immich_client.api.duplicates import get_asset_duplicates
 from immich_client.client import AuthenticatedClient
 
+from immich_autotag.api.immich_proxy.fast_dto import (
+    DuplicateDto,
+    DuplicateLite,
+    is_fast_dto_enabled,
+    json_loads,
+    raise_or_none,
+)
+
 __all__ = ["proxy_get_asset_duplicates"]
-from immich_client.models.duplicate_response_dto import DuplicateResponseDto
+
+DUPLICATES_URL = "/duplicates"
+
+
+def decode_duplicates_response(
+    raw_response, client: AuthenticatedClient
+) -> Optional[list[DuplicateDto]]:
+    """Decodes a raw GET /duplicates response (None on a non-200 status)."""
+    if raw_response.status_code != 200:
+        raise_or_none(raw_response, client)
+        return None
+    return [DuplicateLite.from_dict(g) for g in json_loads(raw_response.content)]
 
 
 def proxy_get_asset_duplicates(
     *, client: AuthenticatedClient
-) -> Optional[list[DuplicateResponseDto]]:
-    return get_asset_duplicates.sync(client=client)
+) -> Optional[list[DuplicateDto]]:
+    if not is_fast_dto_enabled():
+        return get_asset_duplicates.sync(client=client)
+    return decode_duplicates_response(
+        client.get_httpx_client().request("GET", DUPLICATES_URL), client
+    )
@@ -0,0 +1,257 @@
+"""
+Fast decoding of the hot read endpoints (asset search, album info, duplicates).
+
+The generated immich_client models build every nested structure of a response
+(EXIF, people, tags, owner...) although AssetDtoState and AlbumDtoState read a
+handful of fields. Here the response bytes are parsed with orjson (stdlib json if
+it is not installed) into slotted structs holding only those fields plus the raw
+dict. A caller that needs any other field asks for the generated DTO explicitly
+with to_full(), which builds it from the raw dict once.
+
+The raw dicts use the API's camelCase keys, as the generated to_dict() does, so
+to_dict() output is interchangeable with the DTOs' for the disk caches.
+"""
+
+from __future__ import annotations
+
+import datetime
+import json
+from typing import Any, Optional, Union
+
+import attrs
+from dateutil.parser import isoparse
+from immich_client.client import AuthenticatedClient, Client
+from immich_client.errors import UnexpectedStatus
+from immich_client.models.album_response_dto import AlbumResponseDto
+from immich_client.models.album_user_response_dto import AlbumUserResponseDto
+from immich_client.models.asset_response_dto import AssetResponseDto
+from immich_client.models.duplicate_response_dto import DuplicateResponseDto
+from immich_client.types import UNSET, Unset
+
+try:
+    import orjson
+
+    def json_loads(content: bytes) -> Any:
+        return orjson.loads(content)
+
+except ImportError:  # orjson is a dependency; keep decoding without it
+
+    def json_loads(content: bytes) -> Any:
+        return json.loads(content)
+
+
+def _parse_datetime(value: str) -> datetime.datetime:
+    # Same parser as the generated models ("Z" suffix, fractions of a second)
+    return isoparse(value)
+
+
+def _optional_datetime(raw: dict, key: str) -> datetime.datetime | Unset:
+    value = raw.get(key, UNSET)
+    return value if isinstance(value, Unset) else _parse_datetime(value)
+
+
+def raise_or_none(response: Any, client: Union[AuthenticatedClient, Client]) -> None:
+    """Same outcome as a generated sync() on a non-200 response."""
+    if client.raise_on_unexpected_status:
+        raise UnexpectedStatus(response.status_code, response.content)
+    return None
+
+
+@attrs.define(slots=True, eq=False)
+class AssetLite:
+    """An asset of a search page, album or duplicate group (AssetResponseDto subset)."""
+
+    id: str
+    original_file_name: str
+    original_path: str
+    is_favorite: bool
+    created_at: datetime.datetime
+    file_created_at: datetime.datetime
+    file_modified_at: datetime.datetime
+    local_date_time: datetime.datetime
+    duplicate_id: Optional[str] | Unset
+    _raw: dict = attrs.field(repr=False)
+    _full: Optional[AssetResponseDto] = attrs.field(
+        default=None, init=False, repr=False
+    )
+
+    @classmethod
+    def from_dict(cls, raw: dict) -> "AssetLite":
+        return cls(
+            id=raw["id"],
+            original_file_name=raw["originalFileName"],
+            original_path=raw["originalPath"],
+            is_favorite=raw["isFavorite"],
+            created_at=_parse_datetime(raw["createdAt"]),
+            file_created_at=_parse_datetime(raw["fileCreatedAt"]),
+            file_modified_at=_parse_datetime(raw["fileModifiedAt"]),
+            local_date_time=_parse_datetime(raw["localDateTime"]),
+            duplicate_id=raw.get("duplicateId", UNSET),
+            raw=raw,
+        )
+
+    @property
+    def tags(self) -> Any:
+        # Search and album payloads carry no tags unless asked for
+        if "tags" not in self._raw:
+            return UNSET
+        return self.to_full().tags
+
+    def to_full(self) -> AssetResponseDto:
+        if self._full is None:
+            self._full = AssetResponseDto.from_dict(self._raw)
+        return self._full
+
+    def to_dict(self) -> dict:
+        return self._raw
+
+
+@attrs.define(slots=True, eq=False)
+class AlbumLite:
+    """An album from GET /albums/{id} (AlbumResponseDto subset)."""
+
+    id: str
+    album_name: str
+    owner_id: str
+    asset_count: int
+    start_date: datetime.datetime | Unset
+    end_date: datetime.datetime | Unset
+    _raw: dict = attrs.field(repr=False)
+    _assets: Optional[list[AssetLite]] = attrs.field(
+        default=None, init=False, repr=False
+    )
+    _album_users: Optional[list[AlbumUserResponseDto]] = attrs.field(
+        default=None, init=False, repr=False
+    )
+    _full: Optional[AlbumResponseDto] = attrs.field(
+        default=None, init=False, repr=False
+    )
+
+    @classmethod
+    def from_dict(cls, raw: dict) -> "AlbumLite":
+        return cls(
+            id=raw["id"],
+            album_name=raw["albumName"],
+            owner_id=raw["ownerId"],
+            asset_count=raw["assetCount"],
+            start_date=_optional_datetime(raw, "startDate"),
+            end_date=_optional_datetime(raw, "endDate"),
+            raw=raw,
+        )
+
+    def get_asset_ids(self) -> list[str]:
+        """The ids of the album's assets, without decoding the assets."""
+        return [a["id"] for a in self._raw.get("assets") or ()]
+
+    @property
+    def assets(self) -> list[AssetLite]:
+        if self._assets is None:
+            self._assets = [
+                AssetLite.from_dict(a) for a in self._raw.get("assets") or ()
+            ]
+        return self._assets
+
+    @property
+    def album_users(self) -> list[AlbumUserResponseDto]:
+        if self._album_users is None:
+            self._album_users = [
+                AlbumUserResponseDto.from_dict(u)
+                for u in self._raw.get("albumUsers") or ()
+            ]
+        return self._album_users
+
+    def to_full(self) -> AlbumResponseDto:
+        if self._full is None:
+            self._full = AlbumResponseDto.from_dict(self._raw)
+        return self._full
+
+    def to_dict(self) -> dict:
+        return self._raw
+
+
+@attrs.define(slots=True, eq=False)
+class DuplicateLite:
+    """A duplicate group from GET /duplicates (DuplicateResponseDto subset)."""
+
+    duplicate_id: str
+    assets: list[AssetLite]
+
+    @classmethod
+    def from_dict(cls, raw: dict) -> "DuplicateLite":
+        return cls(
+            duplicate_id=raw["duplicateId"],
+            assets=[AssetLite.from_dict(a) for a in raw["assets"]],
+        )
+
+
+@attrs.define(slots=True, eq=False)
+class SearchAssetsLite:
+    """The `assets` part of a search response (SearchAssetResponseDto subset)."""
+
+    items: list[AssetLite]
+    next_page: Optional[str]
+    total: int
+    count: int
+
+
+@attrs.define(slots=True, eq=False)
+class SearchResponseLite:
+    assets: SearchAssetsLite
+
+    @classmethod
+    def from_dict(cls, raw: dict) -> "SearchResponseLite":
+        assets = raw["assets"]
+        return cls(
+            assets=SearchAssetsLite(
+                items=[AssetLite.from_dict(a) for a in assets["items"]],
+                next_page=assets.get("nextPage"),
+                total=assets["total"],
+                count=assets["count"],
+            )
+        )
+
+
+# What the asset/album state classes accept: generated DTO or fast struct
+AssetDto = Union[AssetResponseDto, AssetLite]
+AlbumDto = Union[AlbumResponseDto, AlbumLite]
+DuplicateDto = Union[DuplicateResponseDto, DuplicateLite]
+ASSET_DTO_TYPES = (AssetResponseDto, AssetLite)
+ALBUM_DTO_TYPES = (AlbumResponseDto, AlbumLite)
+
+
+def is_fast_dto_enabled() -> bool:
+    from immich_autotag.config.internal_config import ENABLE_FAST_DTO_DECODING
+
+    return ENABLE_FAST_DTO_DECODING
+
+
+def decode_asset_dict(data: dict) -> AssetDto:
+    """An asset dict (API payload) as AssetLite or AssetResponseDto."""
+    if is_fast_dto_enabled():
+        return AssetLite.from_dict(data)
+    return AssetResponseDto.from_dict(data)
+
+
+def decode_album_dict(data: dict) -> AlbumDto:
+    """An album dict (API payload or disk cache) as AlbumLite or AlbumResponseDto."""
+    if is_fast_dto_enabled():
+        return AlbumLite.from_dict(data)
+    return AlbumResponseDto.from_dict(data)
+
+
+__all__ = [
+    "ALBUM_DTO_TYPES",
+    "ASSET_DTO_TYPES",
+    "AlbumDto",
+    "AlbumLite",
+    "AssetDto",
+    "AssetLite",
+    "DuplicateDto",
+    "DuplicateLite",
+    "SearchResponseLite",
+    "decode_album_dict",
+    "decode_asset_dict",
+    "is_fast_dto_enabled",
+    "json_loads",
+    "raise_or_none",
+]
@@ -0,0 +1,258 @@
+"""
+Request coalescing for the read proxies (album info, asset info).
+
+A ReadCoalescer sits in front of a read endpoint, keyed by entity id:
+
+- single flight: while a request for an id is in flight, identical requests
+  wait for it and share its response instead of sending their own;
+- run-scoped memo: a response is reused for READ_MEMO_TTL_SECONDS, so
+  verification and refresh paths (use_cache=False, stale reloads...) asking
+  again right away do not hit the server.
+
+Our own writes invalidate the ids they touch (tag/untag, album add/remove,
+album and asset updates), so a read after a write always reaches the server.
+A response that arrives after its id was invalidated is returned to its
+callers but not memoized. The short TTL bounds how long changes made by other
+clients can go unseen.
+
+Sync callers (threads) and async callers (the AsyncDriver loop) share the memo;
+each kind coalesces with in-flight requests of its own kind.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Any, Awaitable, Callable, Hashable, Iterable, Optional, TypeVar
+
+import attrs
+
+from immich_autotag.utils.perf.asset_phase_profiler import note_cache_hit
+
+T = TypeVar("T")
+
+
+@attrs.define(slots=True, eq=False)
+class _Flight:
+    # Exactly one of both is set: event for threads, future for the event loop
+    event: Optional[threading.Event] = None
+    future: Optional["asyncio.Future[Any]"] = None
+    result: Any = None
+    error: Optional[BaseException] = None
+    # Cleared when the id is invalidated while the request is in flight
+    memoizable: bool = True
+
+
+@attrs.define(slots=True, frozen=True)
+class _MemoEntry:
+    expires_at: float
+    value: Any
+
+
+@attrs.define(slots=True, frozen=True)
+class ReadCoalescingStats:
+    """Counters of one ReadCoalescer."""
+
+    # Requests sent to the server
+    requests: int
+    # Requests that waited for an identical one in flight instead
+    coalesced: int
+    # Requests served from the memo of recent responses
+    memo_hits: int
+
+    def saved_calls(self) -> int:
+        return self.coalesced + self.memo_hits
+
+
+@attrs.define(slots=True)
+class ReadCoalescer:
+    _name: str
+    _lock: threading.Lock = attrs.field(factory=threading.Lock, init=False)
+    _memo: dict[Hashable, _MemoEntry] = attrs.field(factory=dict, init=False)
+    _in_flight: dict[Hashable, _Flight] = attrs.field(factory=dict, init=False)
+    _async_in_flight: dict[Hashable, _Flight] = attrs.field(factory=dict, init=False)
+    _requests: int = attrs.field(default=0, init=False)
+    _coalesced: int = attrs.field(default=0, init=False)
+    _memo_hits: int = attrs.field(default=0, init=False)
+
+    @staticmethod
+    def _is_enabled() -> bool:
+        from immich_autotag.config.internal_config import ENABLE_READ_COALESCING
+
+        return ENABLE_READ_COALESCING
+
+    def _memo_lookup(self, key: Hashable) -> Any:
+        """The memoized response of `key`, or None (None is never memoized)."""
+        # Caller holds the lock
+        entry = self._memo.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() >= entry.expires_at:
+            del self._memo[key]
+            return None
+        self._memo_hits += 1
+        note_cache_hit()
+        return entry.value
+
+    def _finish(self, key: Hashable, flight: _Flight, in_flight: dict) -> None:
+        from immich_autotag.config.internal_config import READ_MEMO_TTL_SECONDS
+
+        with self._lock:
+            if in_flight.get(key) is flight:
+                del in_flight[key]
+            if flight.error is None and flight.result is not None:
+                if flight.memoizable and READ_MEMO_TTL_SECONDS > 0:
+                    self._memo[key] = _MemoEntry(
+                        expires_at=time.monotonic() + READ_MEMO_TTL_SECONDS,
+                        value=flight.result,
+                    )
+
+    def get(self, key: Hashable, fetch: Callable[[], T]) -> T:
+        """Returns fetch() for `key`, shared with identical concurrent/recent calls."""
+        if not self._is_enabled():
+            return fetch()
+        with self._lock:
+            value = self._memo_lookup(key)
+            if value is not None:
+                return value
+            flight = self._in_flight.get(key)
+            is_leader = flight is None
+            if flight is None:
+                flight = _Flight(event=threading.Event())
+                self._in_flight[key] = flight
+                self._requests += 1
+            else:
+                self._coalesced += 1
+                note_cache_hit()
+        assert flight.event is not None
+        if not is_leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+        try:
+            flight.result = fetch()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            self._finish(key, flight, self._in_flight)
+            flight.event.set()
+        return flight.result
+
+    async def get_async(self, key: Hashable, fetch: Callable[[], Awaitable[T]]) -> T:
+        """Async counterpart of get(), for coroutines on one event loop."""
+        if not self._is_enabled():
+            return await fetch()
+        with self._lock:
+            value = self._memo_lookup(key)
+            if value is not None:
+                return value
+            flight = self._async_in_flight.get(key)
+            is_leader = flight is None
+            if flight is None:
+                flight = _Flight(future=asyncio.get_running_loop().create_future())
+                self._async_in_flight[key] = flight
+                self._requests += 1
+            else:
+                self._coalesced += 1
+        future = flight.future
+        assert future is not None
+        if not is_leader:
+            # shield: a cancelled waiter must not cancel the shared request
+            return await asyncio.shield(future)
+        try:
+            flight.result = await fetch()
+        except BaseException as e:
+            flight.error = e
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                future.exception()  # Retrieved here when nobody else waits for it
+            raise
+        else:
+            future.set_result(flight.result)
+        finally:
+            self._finish(key, flight, self._async_in_flight)
+        return flight.result
+
+    def invalidate(self, keys: Iterable[Hashable]) -> None:
+        """Forgets the memoized responses of `keys` (called after our own writes)."""
+        with self._lock:
+            for key in keys:
+                self._memo.pop(key, None)
+                for in_flight in (self._in_flight, self._async_in_flight):
+                    flight = in_flight.pop(key, None)
+                    if flight is not None:
+                        flight.memoizable = False
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memo.clear()
+
+    def approx_memo_size(self) -> int:
+        from immich_autotag.utils.perf.memory_governor import approx_collection_size
+
+        with self._lock:
+            values = [entry.value for entry in self._memo.values()]
+        return approx_collection_size(values, len(values))
+
+    def get_stats(self) -> ReadCoalescingStats:
+        with self._lock:
+            return ReadCoalescingStats(
+                requests=self._requests,
+                coalesced=self._coalesced,
+                memo_hits=self._memo_hits,
+            )
+
+    def describe_savings(self) -> str:
+        stats = self.get_stats()
+        return (
+            f"saved calls={stats.saved_calls()} "
+            f"(coalesced={stats.coalesced}, memo hits={stats.memo_hits}, "
+            f"sent={stats.requests})"
+        )
+
+
+# One coalescer per read endpoint, keyed by entity id (str)
+album_info_reads = ReadCoalescer("album_info")
+asset_info_reads = ReadCoalescer("asset_info")
+
+
+def _register_memory_caches() -> None:
+    from immich_autotag.utils.perf.memory_governor import register_cache
+
+    def clear_all() -> None:
+        album_info_reads.clear()
+        asset_info_reads.clear()
+
+    register_cache(
+        "read_memo",
+        estimate=lambda: album_info_reads.approx_memo_size()
+        + asset_info_reads.approx_memo_size(),
+        shed=clear_all,
+        priority=0,
+    )
+
+
+_register_memory_caches()
+
+
+def invalidate_album_reads(album_id: object) -> None:
+    album_info_reads.invalidate((str(album_id),))
+
+
+def invalidate_asset_reads(asset_ids: Iterable[object]) -> None:
+    asset_info_reads.invalidate(str(a) for a in asset_ids)
+
+
+__all__ = [
+    "ReadCoalescer",
+    "ReadCoalescingStats",
+    "album_info_reads",
+    "asset_info_reads",
+    "invalidate_album_reads",
+    "invalidate_asset_reads",
+]
@@ -1,11 +1,42 @@
+from http import HTTPStatus
+
 from immich_client.api.search.search_assets import sync_detailed as search_assets
 from immich_client.client import AuthenticatedClient
 from immich_client.models.metadata_search_dto import MetadataSearchDto
 from immich_client.models.search_response_dto import SearchResponseDto
 from immich_client.types import Response
 
+from immich_autotag.api.immich_proxy.fast_dto import (
+    SearchResponseLite,
+    is_fast_dto_enabled,
+    json_loads,
+    raise_or_none,
+)
+
+SEARCH_METADATA_URL = "/search/metadata"
+
+
+def build_search_response(raw_response, client: AuthenticatedClient) -> Response:
+    """Response of a raw search request, parsed into a SearchResponseLite."""
+    parsed = None
+    if raw_response.status_code == HTTPStatus.OK:
+        parsed = SearchResponseLite.from_dict(json_loads(raw_response.content))
+    else:
+        raise_or_none(raw_response, client)
+    return Response(
+        status_code=HTTPStatus(raw_response.status_code),
+        content=raw_response.content,
+        headers=raw_response.headers,
+        parsed=parsed,
+    )
+
 
 def proxy_search_assets(
     *, client: AuthenticatedClient, body: MetadataSearchDto
 ) -> Response[SearchResponseDto]:
-    return search_assets(client=client, body=body)
+    if not is_fast_dto_enabled():
+        return search_assets(client=client, body=body)
+    raw_response = client.get_httpx_client().request(
+        "POST", SEARCH_METADATA_URL, json=body.to_dict()
+    )
+    return build_search_response(raw_response, client)
@@ -4,6 +4,7 @@ from immich_client.models.bulk_id_response_dto import BulkIdResponseDto
 from immich_client.models.bulk_ids_dto import BulkIdsDto
 
 from immich_autotag.api.immich_proxy.debug import write_operation_debug
+from immich_autotag.api.immich_proxy.read_coalescer import invalidate_asset_reads
 from immich_autotag.types.client_types import ImmichClient
 from immich_autotag.types.uuid_wrappers import AssetUUID, TagUUID
 
@@ -25,16 +26,19 @@ def proxy_tag_action(
 
     write_operation_debug()
     uuid_ids = [a.to_uuid() for a in asset_ids]
-    if action == TagAction.TAG:
-        result = tag_assets.sync(
-            id=tag_id.to_uuid(), client=client, body=BulkIdsDto(ids=uuid_ids)
-        )
-    elif action == TagAction.UNTAG:
-        result = untag_assets.sync(
-            id=tag_id.to_uuid(), client=client, body=BulkIdsDto(ids=uuid_ids)
-        )
-    else:
-        raise ValueError(f"Unknown action: {action}")
+    try:
+        if action == TagAction.TAG:
+            result = tag_assets.sync(
+                id=tag_id.to_uuid(), client=client, body=BulkIdsDto(ids=uuid_ids)
+            )
+        elif action == TagAction.UNTAG:
+            result = untag_assets.sync(
+                id=tag_id.to_uuid(), client=client, body=BulkIdsDto(ids=uuid_ids)
+            )
+        else:
+            raise ValueError(f"Unknown action: {action}")
+    finally:
+        invalidate_asset_reads(asset_ids)
     if result is None:
         raise RuntimeError(f"{action}_assets.sync returned None (unexpected)")
     return result
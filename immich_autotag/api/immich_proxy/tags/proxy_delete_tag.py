@@ -1,6 +1,7 @@
 from immich_client.api.tags import delete_tag as _delete_tag
 
 from immich_autotag.api.immich_proxy.debug import write_operation_debug
+from immich_autotag.api.immich_proxy.read_coalescer import asset_info_reads
 from immich_autotag.types.client_types import ImmichClient
 from immich_autotag.types.uuid_wrappers import TagUUID
 
@@ -8,7 +9,11 @@ from immich_autotag.types.uuid_wrappers import TagUUID
 def proxy_delete_tag(*, client: ImmichClient, tag_id: TagUUID) -> None:
     """Proxy for delete_tag.sync_detailed con resultado parseado."""
     write_operation_debug()
-    _delete_tag.sync_detailed(id=tag_id.to_uuid(), client=client)
+    try:
+        _delete_tag.sync_detailed(id=tag_id.to_uuid(), client=client)
+    finally:
+        # Any memoized asset may carry the deleted tag
+        asset_info_reads.clear()
     # response.parsed is None for delete operations
 
 
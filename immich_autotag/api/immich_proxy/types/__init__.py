@@ -26,6 +26,19 @@ from immich_client.models.user_admin_response_dto import UserAdminResponseDto
 from immich_client.models.user_response_dto import UserResponseDto
 from immich_client.types import UNSET, Response, Unset
 
+# Fast decoding structs of the hot endpoints and the DTO unions they belong to
+from immich_autotag.api.immich_proxy.fast_dto import (
+    ALBUM_DTO_TYPES,
+    ASSET_DTO_TYPES,
+    AlbumDto,
+    AlbumLite,
+    AssetDto,
+    AssetLite,
+    DuplicateDto,
+    decode_album_dict,
+    decode_asset_dict,
+)
+
 # Type aliases for backward compatibility
 ImmichClient = AuthenticatedClient
 
@@ -52,6 +65,16 @@ __all__ = [
     "UpdateAssetDto",
     "UserAdminResponseDto",
     "UserResponseDto",
+    # Fast decoding
+    "ALBUM_DTO_TYPES",
+    "ASSET_DTO_TYPES",
+    "AlbumDto",
+    "AlbumLite",
+    "AssetDto",
+    "AssetLite",
+    "DuplicateDto",
+    "decode_album_dict",
+    "decode_asset_dict",
     # Types
     "Response",
     "UNSET",
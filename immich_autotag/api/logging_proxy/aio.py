@@ -0,0 +1,28 @@
+"""
+Explicit re-export of the asyncio Immich proxies for architectural compliance.
+Only logging_proxy may import from immich_proxy.aio.
+"""
+
+from immich_autotag.api.immich_proxy.aio import (
+    proxy_add_assets_to_album_async,
+    proxy_get_album_assets_async,
+    proxy_get_album_info_async,
+    proxy_get_asset_duplicates_async,
+    proxy_get_asset_info_async,
+    proxy_remove_asset_from_album_async,
+    proxy_search_assets_async,
+    proxy_tag_assets_async,
+    proxy_untag_assets_async,
+)
+
+__all__ = [
+    "proxy_add_assets_to_album_async",
+    "proxy_get_album_assets_async",
+    "proxy_get_album_info_async",
+    "proxy_get_asset_duplicates_async",
+    "proxy_get_asset_info_async",
+    "proxy_remove_asset_from_album_async",
+    "proxy_search_assets_async",
+    "proxy_tag_assets_async",
+    "proxy_untag_assets_async",
+]
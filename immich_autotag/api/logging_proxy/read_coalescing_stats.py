@@ -0,0 +1,18 @@
+"""
+Counters of the read coalescers of the proxy layer (api/immich_proxy/read_coalescer.py),
+for reporting outside the API layers.
+"""
+
+from immich_autotag.api.immich_proxy.read_coalescer import (
+    ReadCoalescingStats,
+    album_info_reads,
+    asset_info_reads,
+)
+
+
+def get_read_coalescing_stats() -> dict[str, ReadCoalescingStats]:
+    """Counters of each coalesced read endpoint."""
+    return {
+        "album_info_reads": album_info_reads.get_stats(),
+        "asset_info_reads": asset_info_reads.get_stats(),
+    }
@@ -4,17 +4,26 @@ Only logging_proxy may import from immich_proxy.types.
 """
 
 from immich_autotag.api.immich_proxy.types import (
+    ALBUM_DTO_TYPES,
+    ASSET_DTO_TYPES,
     UNSET,
+    AlbumDto,
+    AlbumLite,
     AlbumUserRole,
+    AssetDto,
+    AssetLite,
     AssetResponseDto,
     AuthenticatedClient,
     Client,
+    DuplicateDto,
     ImmichClient,
     MetadataSearchDto,
     Response,
     TagResponseDto,
     Unset,
     UpdateAssetDto,
+    decode_album_dict,
+    decode_asset_dict,
     immich_errors,
 )
 
@@ -31,4 +40,13 @@ __all__ = [
     "immich_errors",
     "MetadataSearchDto",
     "Response",
+    "ALBUM_DTO_TYPES",
+    "ASSET_DTO_TYPES",
+    "AlbumDto",
+    "AlbumLite",
+    "AssetDto",
+    "AssetLite",
+    "DuplicateDto",
+    "decode_album_dict",
+    "decode_asset_dict",
 ]
@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING
 
 import attrs
 
-from immich_autotag.api.logging_proxy.types import AssetResponseDto
+from immich_autotag.api.logging_proxy.types import AssetDto, AssetResponseDto
 from immich_autotag.assets.asset_dto_state import AssetDtoState, AssetDtoType
 from immich_autotag.config.cache_config import DEFAULT_CACHE_MAX_AGE_SECONDS
 from immich_autotag.context.immich_context import ImmichContext
@@ -218,7 +218,7 @@ class AssetCacheEntry:
     def _from_dto_entry(
         cls,
         *,
-        dto: AssetResponseDto,
+        dto: AssetDto,
         dto_type: AssetDtoType,
         max_age_seconds: int = DEFAULT_CACHE_MAX_AGE_SECONDS,
     ) -> "AssetCacheEntry":
@@ -354,7 +354,7 @@ class AssetCacheEntry:
     def from_dto_entry(
         cls,
         *,
-        dto: AssetResponseDto,
+        dto: AssetDto,
         dto_type: AssetDtoType,
         max_age_seconds: int = DEFAULT_CACHE_MAX_AGE_SECONDS,
     ) -> "AssetCacheEntry":
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import enum
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Iterator, Mapping, NoReturn, cast
+from typing import TYPE_CHECKING, Any, Iterator, NoReturn, cast
 
 from immich_autotag.types.uuid_wrappers import AssetUUID, DuplicateUUID
 
@@ -14,8 +14,12 @@ from datetime import datetime
 
 import attrs
 
-from immich_autotag.api.immich_proxy.assets import AssetResponseDto
-from immich_autotag.api.logging_proxy.types import UNSET, Unset
+from immich_autotag.api.logging_proxy.types import (
+    ASSET_DTO_TYPES,
+    UNSET,
+    AssetDto,
+    Unset,
+)
 from immich_autotag.assets.dto.url_helpers import repr_dto_filename_and_id
 
 
@@ -49,10 +53,12 @@ class AssetDtoState:
     This class never performs API calls or business logic—just holds and exposes data.
     """
 
-    _dto: AssetResponseDto | None = attrs.field(
+    # AssetLite for search/album assets decoded by the fast path
+    # (api/immich_proxy/fast_dto.py); FULL assets are always AssetResponseDto
+    _dto: AssetDto | None = attrs.field(
         default=None,
         validator=attrs.validators.optional(
-            attrs.validators.instance_of(AssetResponseDto)
+            attrs.validators.instance_of(ASSET_DTO_TYPES)
         ),
         repr=repr_dto_filename_and_id,
     )
@@ -65,7 +71,7 @@ class AssetDtoState:
         validator=attrs.validators.optional(attrs.validators.instance_of(datetime)),
     )
 
-    def _require_dto(self) -> AssetResponseDto:
+    def _require_dto(self) -> AssetDto:
         """
         Returns the internal DTO if present, otherwise raises a RuntimeError.
         Centralizes the defensive check for DTO presence.
@@ -112,9 +118,7 @@ class AssetDtoState:
             raise RuntimeError("AssetDtoState: _loaded_at is None")
         return self._loaded_at
 
-    def update(
-        self, *, dto: AssetResponseDto, api_endpoint_source: AssetDtoType
-    ) -> None:
+    def update(self, *, dto: AssetDto, api_endpoint_source: AssetDtoType) -> None:
         self._dto = dto
         self._api_endpoint_source = api_endpoint_source
         self._loaded_at = datetime.now()
@@ -163,7 +167,7 @@ class AssetDtoState:
         return wrappers
 
     def get_dates(self) -> list[datetime]:
-        def _get_dates(asset__: AssetResponseDto) -> Iterator[datetime]:
+        def _get_dates(asset__: AssetDto) -> Iterator[datetime]:
             yield asset__.created_at
             yield asset__.file_created_at
             yield asset__.file_modified_at
@@ -214,7 +218,7 @@ class AssetDtoState:
     @classmethod
     def from_dto(
         cls,
-        dto: AssetResponseDto,
+        dto: AssetDto,
         api_endpoint_source: AssetDtoType,
         loaded_at: datetime | None = None,
     ) -> "AssetDtoState":
@@ -233,9 +237,9 @@ class AssetDtoState:
         """
         Reconstructs the state from a serialized dictionary.
         """
-        from immich_autotag.api.logging_proxy.types import AssetResponseDto
+        from immich_autotag.api.logging_proxy.types import decode_asset_dict
 
-        dto = AssetResponseDto.from_dict(cast(Mapping[str, Any], data["dto"]))
+        dto = decode_asset_dict(cast(dict[str, Any], data["dto"]))
         api_endpoint_source = AssetDtoType(str(data["type"]))
         loaded_at = datetime.fromisoformat(str(data["loaded_at"]))
         return cls.from_dto(dto, api_endpoint_source, loaded_at)
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+import attrs
+
+from immich_autotag.types.uuid_wrappers import AssetUUID
+
+if TYPE_CHECKING:
+    from immich_autotag.assets.asset_response_wrapper import AssetResponseWrapper
+
+
+@attrs.define(auto_attribs=True, slots=True, frozen=True)
+class AssetFetchResult:
+    """An asset yielded by AssetManager.iter_assets_by_ids: its wrapper, or the
+    error that kept it from loading (handled by the caller like any asset error).
+    """
+
+    asset_id: AssetUUID
+    wrapper: Optional["AssetResponseWrapper"] = None
+    error: Optional[Exception] = None
@@ -0,0 +1,155 @@
+"""
+Size-bounded in-memory cache of AssetResponseWrapper for AssetManager.
+
+Least recently used assets are evicted once the cache holds more than
+max_entries assets (None: unbounded, the former KEEP_ASSETS_IN_MEMORY=True).
+Two signals protect assets that are about to be used again:
+
+- pins: assets of the duplicate group being processed are never evicted until
+  unpinned (pins are counted, so nested pins of the same asset are fine);
+- hints: assets the duplicates collection says will be needed again soon get a
+  second chance: the first time eviction reaches them they are moved back to
+  the most recently used end instead.
+
+Hits, misses and evictions are counted for the run summary.
+"""
+
+from __future__ import annotations
+
+import itertools
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Iterable, Optional
+
+import attrs
+
+from immich_autotag.types.uuid_wrappers import AssetUUID
+from immich_autotag.utils.perf.asset_phase_profiler import note_cache_hit
+
+if TYPE_CHECKING:
+    from immich_autotag.assets.asset_response_wrapper import AssetResponseWrapper
+
+
+@attrs.define(auto_attribs=True, slots=True, frozen=True)
+class AssetCacheStats:
+    """Counters of an AssetLruCache."""
+
+    hits: int
+    misses: int
+    evictions: int
+
+
+@attrs.define(auto_attribs=True, slots=True)
+class AssetLruCache:
+    _max_entries: Optional[int]
+    _entries: "OrderedDict[AssetUUID, AssetResponseWrapper]" = attrs.field(
+        factory=OrderedDict, init=False, repr=False
+    )
+    _pins: dict[AssetUUID, int] = attrs.field(factory=dict, init=False, repr=False)
+    _hinted: set[AssetUUID] = attrs.field(factory=set, init=False, repr=False)
+    _lock: threading.RLock = attrs.field(factory=threading.RLock, init=False)
+    _hits: int = attrs.field(default=0, init=False)
+    _misses: int = attrs.field(default=0, init=False)
+    _evictions: int = attrs.field(default=0, init=False)
+
+    def get(self, asset_id: AssetUUID) -> Optional["AssetResponseWrapper"]:
+        with self._lock:
+            wrapper = self._entries.get(asset_id)
+            if wrapper is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            note_cache_hit()
+            self._entries.move_to_end(asset_id)
+            self._hinted.discard(asset_id)  # The hint was for this use
+            return wrapper
+
+    def _evict_overflow(self) -> None:
+        # Caller holds the lock
+        if self._max_entries is None:
+            return
+        # Each entry is looked at most twice (hinted ones get one second chance);
+        # if only pinned entries remain, the cache overflows until they are unpinned
+        budget = 2 * len(self._entries)
+        while len(self._entries) > self._max_entries and budget > 0:
+            budget -= 1
+            victim = next(
+                (a for a in self._entries if a not in self._pins),
+                None,
+            )
+            if victim is None:
+                return
+            if victim in self._hinted:
+                self._hinted.discard(victim)
+                self._entries.move_to_end(victim)
+                continue
+            del self._entries[victim]
+            self._evictions += 1
+
+    def put(self, asset_id: AssetUUID, wrapper: "AssetResponseWrapper") -> None:
+        with self._lock:
+            if self._max_entries == 0 and asset_id not in self._pins:
+                return
+            self._entries[asset_id] = wrapper
+            self._entries.move_to_end(asset_id)
+            self._evict_overflow()
+
+    def pop(self, asset_id: AssetUUID) -> None:
+        with self._lock:
+            self._entries.pop(asset_id, None)
+            self._hinted.discard(asset_id)
+
+    def clear(self) -> None:
+        """Drops every asset except the pinned ones, which are in use."""
+        with self._lock:
+            for asset_id in [a for a in self._entries if a not in self._pins]:
+                del self._entries[asset_id]
+            self._hinted.clear()
+
+    def pin(self, asset_ids: Iterable[AssetUUID]) -> None:
+        with self._lock:
+            for asset_id in asset_ids:
+                self._pins[asset_id] = self._pins.get(asset_id, 0) + 1
+
+    def unpin(self, asset_ids: Iterable[AssetUUID]) -> None:
+        with self._lock:
+            for asset_id in asset_ids:
+                count = self._pins.get(asset_id, 0) - 1
+                if count > 0:
+                    self._pins[asset_id] = count
+                else:
+                    self._pins.pop(asset_id, None)
+            self._evict_overflow()
+
+    def hint_needed_soon(self, asset_ids: Iterable[AssetUUID]) -> None:
+        """Gives the cached assets among `asset_ids` a second chance at eviction."""
+        with self._lock:
+            self._hinted.update(a for a in asset_ids if a in self._entries)
+
+    def approx_size(self) -> int:
+        from immich_autotag.utils.perf.memory_governor import approx_collection_size
+
+        with self._lock:
+            sample = list(itertools.islice(self._entries.values(), 16))
+            count = len(self._entries)
+        return approx_collection_size(sample, count)
+
+    def get_stats(self) -> AssetCacheStats:
+        with self._lock:
+            return AssetCacheStats(
+                hits=self._hits, misses=self._misses, evictions=self._evictions
+            )
+
+    def describe(self) -> str:
+        with self._lock:
+            lookups = self._hits + self._misses
+            hit_rate = 100.0 * self._hits / lookups if lookups else 0.0
+            limit = "unbounded" if self._max_entries is None else self._max_entries
+            return (
+                f"size={len(self._entries)}/{limit}, hits={self._hits}, "
+                f"misses={self._misses} ({hit_rate:.1f}% hit rate), "
+                f"evictions={self._evictions}, pinned={len(self._pins)}"
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
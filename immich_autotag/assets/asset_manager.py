@@ -1,31 +1,50 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
 from typing import TYPE_CHECKING, Iterator, Optional
 
 import attrs
 from typeguard import typechecked
 
-from immich_autotag.api.logging_proxy.assets.get_asset_info import AssetResponseDto
+from immich_autotag.api.logging_proxy.types import AssetDto
 from immich_autotag.assets.asset_cache_entry import AssetCacheEntry
 from immich_autotag.assets.asset_dto_state import AssetDtoType
+from immich_autotag.assets.asset_fetch_result import AssetFetchResult
+from immich_autotag.assets.asset_lru_cache import AssetCacheStats, AssetLruCache
 from immich_autotag.assets.asset_response_wrapper import AssetResponseWrapper
-from immich_autotag.config.internal_config import KEEP_ASSETS_IN_MEMORY
+from immich_autotag.config.internal_config import (
+    ASSET_CACHE_MAX_ENTRIES,
+    KEEP_ASSETS_IN_MEMORY,
+)
 from immich_autotag.types.uuid_wrappers import AssetUUID
 
 # Removed import: AssetCacheEntry is only used internally in AssetResponseWrapper
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from immich_autotag.api.logging_proxy.types import AssetResponseDto
     from immich_autotag.context.immich_context import ImmichContext
+    from immich_autotag.utils.api_disk_cache import ApiCacheManager
 # Singleton instance storage
 _asset_manager_singleton: AssetManager | None = None
 
 
+@attrs.define(auto_attribs=True, slots=True, frozen=True)
+class _PrefetchedAsset:
+    """An asset of the iter_assets_by_ids window and where it is loaded from."""
+
+    asset_id: AssetUUID
+    # Request in flight, when the asset is in no cache
+    future: Optional["Future"] = None
+    # Entry decoded from the disk cache, when the asset was found there
+    entry: Optional[AssetCacheEntry] = None
+
+
 @attrs.define(auto_attribs=True, slots=True)
 class AssetManager:
-    # If not kept in memory, _assets will be None
-    _assets: Optional[dict[AssetUUID, AssetResponseWrapper]] = attrs.field(
-        default=None, init=False
-    )
+    # Unbounded with KEEP_ASSETS_IN_MEMORY, else bounded to ASSET_CACHE_MAX_ENTRIES
+    _assets: AssetLruCache = attrs.field(init=False)
     _keep_assets_in_memory: bool = attrs.field(
         default=KEEP_ASSETS_IN_MEMORY, init=False
     )
@@ -39,10 +58,17 @@ class AssetManager:
             )
         _asset_manager_singleton = self
         self._keep_assets_in_memory = KEEP_ASSETS_IN_MEMORY
-        if self._keep_assets_in_memory:
-            self._assets = {}
-        else:
-            self._assets = None
+        self._assets = AssetLruCache(
+            None if self._keep_assets_in_memory else ASSET_CACHE_MAX_ENTRIES
+        )
+        from immich_autotag.utils.perf.memory_governor import register_cache
+
+        register_cache(
+            "assets",
+            estimate=self._assets.approx_size,
+            shed=self.clear_cache,
+            priority=20,
+        )
 
     @classmethod
     def get_instance(cls) -> "AssetManager":
@@ -67,9 +93,7 @@ class AssetManager:
         for asset in get_all_assets(context, max_assets=max_assets, skip_n=skip_n):
             if not isinstance(asset, AssetResponseWrapper):
                 raise RuntimeError(f"Expected AssetResponseWrapper, got {type(asset)}")
-            asset_uuid = asset.get_id()
-            if self._assets is not None:
-                self._assets[asset_uuid] = asset
+            self._assets.put(asset.get_id(), asset)
             yield asset
 
     @typechecked
@@ -81,19 +105,183 @@ class AssetManager:
         or requesting it from the API and storing it if not.
         First checks the in-memory cache, then disk, and finally the API.
         """
-        if self._assets is not None and asset_id in self._assets:
-            return self._assets[asset_id]
+        cached = self._assets.get(asset_id)
+        if cached is not None:
+            return cached
 
         asset = AssetResponseWrapper.from_id(asset_id, context)
-        if self._assets is not None:
-            self._assets[asset_id] = asset
+        self._assets.put(asset_id, asset)
         return asset
 
+    def _load_asset(
+        self, asset_id: "AssetUUID", context: "ImmichContext"
+    ) -> AssetResponseWrapper:
+        asset_wrapper = self.get_asset(asset_id, context)
+        if asset_wrapper is None:
+            raise RuntimeError(
+                f"Asset with ID {asset_id} could not be loaded from API."
+            )
+        return asset_wrapper
+
+    def _load_prefetched_asset(
+        self,
+        item: _PrefetchedAsset,
+        cache_mgr: "ApiCacheManager",
+        context: "ImmichContext",
+    ) -> AssetResponseWrapper:
+        """The wrapper of an asset of the iter_assets_by_ids window, cached in memory."""
+        asset_id = item.asset_id
+        if item.future is None and item.entry is None:  # Was in memory
+            return self._load_asset(asset_id, context)
+        dto: Optional["AssetResponseDto"] = None
+        if item.future is not None:
+            dto = item.future.result()
+            if dto is None:
+                raise RuntimeError(
+                    f"proxy_get_asset_info returned None for asset id={asset_id}"
+                )
+        cached = self._assets.get(asset_id)
+        if cached is not None:  # Loaded by someone else meanwhile
+            return cached
+        entry = item.entry
+        if dto is not None:
+            entry = AssetCacheEntry.from_dto_and_cache(
+                asset_id=asset_id,
+                dto=dto,
+                cache_mgr=cache_mgr,
+            )
+        assert entry is not None
+        wrapper = AssetResponseWrapper(context, entry)
+        self._assets.put(asset_id, wrapper)
+        return wrapper
+
+    @typechecked
+    def iter_assets_by_ids(
+        self, asset_ids: list["AssetUUID"], context: "ImmichContext"
+    ) -> Iterator[AssetFetchResult]:
+        """
+        Yields an AssetFetchResult per asset in the order of `asset_ids`: with
+        the wrapper, or with the error for an asset that could not be loaded, so
+        that the caller handles it like any other asset error.
+
+        With ENABLE_ASYNC_API, the assets neither in memory nor in the disk cache
+        are requested on the AsyncDriver loop up to FOCUSED_ASSET_FETCH_AHEAD
+        positions ahead of the one yielded: the first asset is yielded as soon as
+        it arrives and the following ones load while it is processed. Requests
+        not consumed are cancelled when the iteration stops.
+        """
+        from collections import deque
+
+        from immich_autotag.api.logging_proxy.aio import proxy_get_asset_info_async
+        from immich_autotag.config.internal_config import (
+            ENABLE_ASYNC_API,
+            FOCUSED_ASSET_FETCH_AHEAD,
+        )
+        from immich_autotag.utils.api_disk_cache import ApiCacheKey, ApiCacheManager
+        from immich_autotag.utils.async_driver import AsyncDriver
+
+        if not ENABLE_ASYNC_API:
+            for asset_id in asset_ids:
+                try:
+                    wrapper = self._load_asset(asset_id, context)
+                except Exception as e:
+                    yield AssetFetchResult(asset_id, error=e)
+                    continue
+                yield AssetFetchResult(asset_id, wrapper=wrapper)
+            return
+
+        cache_mgr = ApiCacheManager.create(cache_type=ApiCacheKey.ASSETS)
+        client = context.get_client_wrapper().get_client()
+        driver = AsyncDriver.get_instance()
+        pending_ids = iter(asset_ids)
+        window: deque[_PrefetchedAsset] = deque()
+
+        def fill_window() -> None:
+            while len(window) < max(1, FOCUSED_ASSET_FETCH_AHEAD):
+                asset_id = next(pending_ids, None)
+                if asset_id is None:
+                    return
+                if self._assets.get(asset_id) is not None:
+                    window.append(_PrefetchedAsset(asset_id))
+                    continue
+                raw = cache_mgr.load(str(asset_id))
+                entry = None
+                if isinstance(raw, dict):  # Anything else is a miss
+                    entry = AssetCacheEntry.from_cache_dict(raw)
+                if entry is not None:
+                    window.append(_PrefetchedAsset(asset_id, entry=entry))
+                    continue
+                future = driver.submit(
+                    driver.bounded(proxy_get_asset_info_async(asset_id, client))
+                )
+                window.append(_PrefetchedAsset(asset_id, future=future))
+
+        try:
+            fill_window()
+            while window:
+                item = window.popleft()
+                fill_window()
+                try:
+                    wrapper = self._load_prefetched_asset(item, cache_mgr, context)
+                except Exception as e:
+                    yield AssetFetchResult(item.asset_id, error=e)
+                    continue
+                yield AssetFetchResult(item.asset_id, wrapper=wrapper)
+        finally:
+            for item in window:
+                if item.future is not None:
+                    item.future.cancel()
+
+    @typechecked
+    def evict(self, asset_id: "AssetUUID") -> None:
+        """Drops an asset from the in-memory cache (e.g. after it changed remotely)."""
+        self._assets.pop(asset_id)
+
+    def cached_count(self) -> int:
+        return len(self._assets)
+
+    def clear_cache(self) -> None:
+        """Drops every asset kept in memory, except the pinned ones."""
+        self._assets.clear()
+
+    def get_cache_stats(self) -> AssetCacheStats:
+        """Hit, miss and eviction counters of the in-memory asset cache."""
+        return self._assets.get_stats()
+
+    def describe_cache(self) -> str:
+        """Size and hit/miss/eviction counters of the in-memory asset cache."""
+        return self._assets.describe()
+
+    @contextmanager
+    def pinned_duplicate_group(
+        self, asset_wrapper: AssetResponseWrapper, context: "ImmichContext"
+    ) -> Iterator[None]:
+        """
+        Keeps the asset and the members of its duplicate group in memory while
+        it is processed (the group phases load every member). Afterwards, the
+        other members are hinted as needed again soon: they are processed later
+        in the run and look the group up again.
+        """
+        asset_id = asset_wrapper.get_id()
+        duplicate_id = asset_wrapper.get_duplicate_id_as_uuid()
+        others: list[AssetUUID] = []
+        if duplicate_id is not None:
+            others = context.get_duplicates_collection().get_assets_needed_again(
+                duplicate_id, asset_id
+            )
+        pinned = [asset_id, *others]
+        self._assets.pin(pinned)
+        try:
+            yield
+        finally:
+            self._assets.unpin(pinned)
+            self._assets.hint_needed_soon(others)
+
     @typechecked
     def get_wrapper_for_asset_dto(
         self,
         *,
-        asset_dto: AssetResponseDto,
+        asset_dto: AssetDto,
         dto_type: AssetDtoType,
         context: "ImmichContext",
     ) -> AssetResponseWrapper:
@@ -103,11 +291,11 @@ class AssetManager:
         if dto_type not in (AssetDtoType.ALBUM, AssetDtoType.SEARCH):
             raise ValueError(f"Unsupported dto_type {dto_type} for album asset DTOs")
         asset_uuid = AssetUUID.from_string(asset_dto.id)
-        if self._assets is not None and asset_uuid in self._assets:
-            return self._assets[asset_uuid]
+        cached = self._assets.get(asset_uuid)
+        if cached is not None:
+            return cached
 
         entry = AssetCacheEntry.from_dto_entry(dto=asset_dto, dto_type=dto_type)
         wrapper = AssetResponseWrapper(context, entry)
-        if self._assets is not None:
-            self._assets[asset_uuid] = wrapper
+        self._assets.put(asset_uuid, wrapper)
         return wrapper
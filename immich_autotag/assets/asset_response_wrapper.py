@@ -456,6 +456,10 @@ class AssetResponseWrapper:
     def get_original_file_name(self) -> Path:
         return self._cache_entry.get_original_file_name()
 
+    def get_dates(self) -> list[datetime]:
+        """The raw date candidates get_best_date chooses from."""
+        return self._cache_entry.get_dates()
+
     def is_favorite(self) -> bool:
         return self._cache_entry.get_is_favorite()
 
@@ -0,0 +1,78 @@
+"""
+Assets that can match a set of criteria (tag names, album name patterns, asset
+links), found without sweeping the library:
+
+- tag names: tag -> assets through a server-side search per tag;
+- album name patterns: album -> assets through the loaded album collection;
+- asset_links: the linked assets directly.
+
+Used wherever only the assets a rule or conversion can match must be visited.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+from typeguard import typechecked
+
+from immich_autotag.types.uuid_wrappers import AssetUUID
+
+if TYPE_CHECKING:
+    from immich_autotag.assets.asset_response_wrapper import AssetResponseWrapper
+    from immich_autotag.context.immich_context import ImmichContext
+
+
+@typechecked
+def iter_candidate_assets(
+    context: "ImmichContext",
+    *,
+    tag_names: Iterable[str] = (),
+    album_name_patterns: Iterable[str] = (),
+    asset_links: Iterable[str] = (),
+) -> Iterator["AssetResponseWrapper"]:
+    """
+    Yields each asset carrying one of `tag_names`, member of an album whose name
+    matches one of `album_name_patterns` (re.match, as the rules do) or linked in
+    `asset_links`. Each asset is yielded once, restricted to the current shard.
+    """
+    from immich_autotag.assets.get_all_assets import get_assets_with_tag
+    from immich_autotag.classification.link_parsing.immich_url_uuid_extractor import (
+        ImmichUrlUuidExtractor,
+    )
+    from immich_autotag.config.sharding import get_current_shard
+
+    seen: set[AssetUUID] = set()
+    tag_collection = context.get_tag_collection()
+    for tag_name in sorted(set(tag_names)):
+        tag = tag_collection.find_by_name(tag_name)
+        if tag is None:
+            continue  # No asset can carry a tag that does not exist
+        for asset_wrapper in get_assets_with_tag(context, tag.get_id()):
+            if asset_wrapper.get_id() not in seen:
+                seen.add(asset_wrapper.get_id())
+                yield asset_wrapper
+
+    by_reference: list[AssetUUID] = []
+    patterns = [re.compile(p) for p in sorted(set(album_name_patterns))]
+    if patterns:
+        for album in context.get_albums_collection().get_albums():
+            if any(p.match(album.get_album_name()) for p in patterns):
+                by_reference.extend(album.get_asset_uuids())
+    by_reference.extend(
+        uuid
+        for uuid in ImmichUrlUuidExtractor.extract_asset_uuids_from_links(
+            sorted(set(asset_links))
+        )
+        if isinstance(uuid, AssetUUID)
+    )
+    shard = get_current_shard()
+    asset_manager = context.get_asset_manager()
+    for asset_id in by_reference:
+        if asset_id in seen or (shard is not None and not shard.owns(asset_id)):
+            continue
+        seen.add(asset_id)
+        fetched = asset_manager.get_asset(asset_id, context)
+        if fetched is None:
+            continue  # Referenced but not found on the server
+        yield fetched
@@ -6,7 +6,8 @@ If the difference is greater than a threshold (default: 6 months), logs it in th
 from __future__ import annotations
 
 import re
-from datetime import datetime
+from datetime import datetime, tzinfo
+from typing import Optional
 
 import attrs
 from typeguard import typechecked
@@ -20,6 +21,25 @@ from immich_autotag.logging.utils import log
 from immich_autotag.report.modification_kind import ModificationKind
 from immich_autotag.report.modification_report import ModificationReport
 
+_ALBUM_NAME_DATE_PATTERN = re.compile(r"^(\d{4})(?:-(\d{2}))?(?:-(\d{2}))?")
+
+
+def parse_album_name_date(
+    album_name: str, tz: Optional[tzinfo] = None
+) -> Optional[datetime]:
+    """
+    Date at the start of an album name (YYYY-MM-DD, YYYY-MM or YYYY; missing
+    month/day default to 1), or None if the name does not start with a date.
+    Raises ValueError if the name starts with an impossible date.
+    """
+    m = _ALBUM_NAME_DATE_PATTERN.match(album_name)
+    if not m:
+        return None
+    year = int(m.group(1))
+    month = int(m.group(2)) if m.group(2) else 1
+    day = int(m.group(3)) if m.group(3) else 1
+    return datetime(year, month, day, tzinfo=tz)
+
 
 @attrs.define(auto_attribs=True, slots=True)
 class AlbumDateConsistencyResult(ProcessStepResult):
@@ -120,14 +140,8 @@ class AlbumDateConsistencyResult(ProcessStepResult):
         mismatch_found = False
         for album_wrapper in albums:
             album_name = album_wrapper.get_album_name()
-            m = re.match(r"^(\d{4})(?:-(\d{2}))?(?:-(\d{2}))?", album_name)
-            if not m:
-                continue
-            year = int(m.group(1))
-            month = int(m.group(2)) if m.group(2) else 1
-            day = int(m.group(3)) if m.group(3) else 1
             try:
-                album_date = datetime(year, month, day, tzinfo=asset_date.tzinfo)
+                album_date = parse_album_name_date(album_name, asset_date.tzinfo)
             except Exception as e:
                 self._error_count += 1
                 log(
@@ -135,6 +149,8 @@ class AlbumDateConsistencyResult(ProcessStepResult):
                     level=LogLevel.FOCUS,
                 )
                 continue
+            if album_date is None:
+                continue
 
             diff_days = abs((asset_date - album_date).days)
             if diff_days > threshold_days:
@@ -67,18 +67,27 @@ class AssetDateSourcesList:
     ) -> "AssetDateSourcesList":
         """
         Build an AssetDateSourcesList from a main AssetResponseWrapper and an AssetResponseWrapperList (duplicates).
-        Each wrapper gets its own AssetDateCandidates set.
+        Each wrapper gets its own AssetDateCandidates set; the whole group is
+        extracted in one bulk call so shared filenames/paths are scanned once.
         """
-        from .get_asset_date_sources import get_asset_date_candidates
+        from .get_asset_date_sources import get_asset_date_candidates_bulk
 
         if not wrappers or len(wrappers) == 0:
             raise ValueError("wrappers list must not be empty")
         sources_list = AssetDateSourcesList(asset_wrapper)
-        for w in wrappers:
-            candidate_set = get_asset_date_candidates(w)
-            sources_list.add(candidate_set)
+        sources_list.extend(get_asset_date_candidates_bulk(wrappers))
         return sources_list
 
+    @typechecked
+    def for_asset(
+        self, asset_wrapper: "AssetResponseWrapper"
+    ) -> "AssetDateSourcesList":
+        """
+        Return a view of these sources triggered by another member of the same
+        duplicate group. Candidate sets are shared, not re-extracted.
+        """
+        return AssetDateSourcesList(asset_wrapper, self._date_candidates_per_duplicate)
+
     @typechecked
     def get_whatsapp_filename_date(self) -> Optional[datetime]:
         """
@@ -5,9 +5,11 @@ Provides classes and enums for correcting asset dates based on various sources.
 """
 
 from .asset_date_corrector import AssetDateCorrector
+from .group_date_correction import correct_duplicate_group_dates
 from .step_result import DateCorrectionStepResult
 
 __all__ = [
     "AssetDateCorrector",
     "DateCorrectionStepResult",
+    "correct_duplicate_group_dates",
 ]
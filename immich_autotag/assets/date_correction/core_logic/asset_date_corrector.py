@@ -30,6 +30,11 @@ class AssetDateCorrector(ProcessStepResult):
     """
 
     _asset_wrapper: AssetResponseWrapper
+    # Date sources already extracted for the whole duplicate group (group-scoped
+    # processing). When None, execute() loads the group and extracts them itself.
+    _shared_date_sources_list: Optional[AssetDateSourcesList] = attrs.field(
+        default=None, repr=False
+    )
 
     # Private state (initialized after execute())
     _date_sources_list: AssetDateSourcesList = attrs.field(
@@ -65,12 +70,19 @@ class AssetDateCorrector(ProcessStepResult):
             DateCorrectionStepResult indicating the outcome of the correction attempt.
         """
 
-        wrappers = self._asset_wrapper.get_all_duplicate_wrappers(include_self=True)
-        if wrappers.is_empty():
-            return DateCorrectionStepResult.EXIT  # No duplicates, nothing to correct
-        self._date_sources_list = AssetDateSourcesList.from_wrappers(
-            self._asset_wrapper, wrappers
-        )
+        if self._shared_date_sources_list is not None:
+            self._date_sources_list = self._shared_date_sources_list.for_asset(
+                self._asset_wrapper
+            )
+        else:
+            wrappers = self._asset_wrapper.get_all_duplicate_wrappers(include_self=True)
+            if wrappers.is_empty():
+                return (
+                    DateCorrectionStepResult.EXIT
+                )  # No duplicates, nothing to correct
+            self._date_sources_list = AssetDateSourcesList.from_wrappers(
+                self._asset_wrapper, wrappers
+            )
         immich_date: datetime = self._asset_wrapper.get_best_date()
 
         step_result = check_filename_candidate_and_fix(
@@ -0,0 +1,49 @@
+from typeguard import typechecked
+
+from immich_autotag.assets.asset_response_wrapper import AssetResponseWrapper
+from immich_autotag.assets.process.process_step_result_protocol import ProcessStepResult
+from immich_autotag.logging.levels import LogLevel
+from immich_autotag.logging.utils import log
+from immich_autotag.types.uuid_wrappers import AssetUUID
+
+from ..asset_date_sources_list import AssetDateSourcesList
+from .asset_date_corrector import AssetDateCorrector
+
+
+@typechecked
+def correct_duplicate_group_dates(
+    asset_wrapper: AssetResponseWrapper,
+) -> dict[AssetUUID, ProcessStepResult]:
+    """
+    Runs date correction for every member of the duplicate group of asset_wrapper.
+
+    The group is loaded and its date sources are extracted once, then each member
+    is corrected against them. The triggering asset runs first and its errors
+    propagate as in per-asset mode; a member that fails is left out of the result
+    so it is corrected (and its error reported) on its own turn.
+    """
+    wrappers = asset_wrapper.get_all_duplicate_wrappers(include_self=True)
+    results: dict[AssetUUID, ProcessStepResult] = {}
+    if wrappers.is_empty():
+        return results
+    shared_sources = AssetDateSourcesList.from_wrappers(asset_wrapper, wrappers)
+    asset_id = asset_wrapper.get_id()
+    members = [asset_wrapper] + [w for w in wrappers if w.get_id() != asset_id]
+    for member in members:
+        corrector = AssetDateCorrector(
+            asset_wrapper=member, shared_date_sources_list=shared_sources
+        )
+        if member is asset_wrapper:
+            corrector.execute()
+        else:
+            try:
+                corrector.execute()
+            except Exception as e:
+                log(
+                    f"[DATE CORRECTION][GROUP] Deferred date correction of duplicate "
+                    f"{member.get_id()} to its own turn: {e}",
+                    level=LogLevel.FOCUS,
+                )
+                continue
+        results[member.get_id()] = corrector
+    return results
@@ -0,0 +1,166 @@
+"""
+Single-pass date extraction engine for asset filenames and paths.
+
+All filename/path date patterns supported by date correction (see
+extract_date_from_filename.py for their origin) are compiled into ONE regex
+that is scanned once per string. Digits are parsed directly with int() on fixed
+offsets instead of going through strptime, and the (timezone-free) result is
+memoized per string, so duplicates sharing a name or path are only scanned once.
+
+Semantics are identical to the historical per-pattern functions:
+- WhatsApp: the first IMG/VID-YYYYMMDD-WAxxxx match wins; if it is not a valid
+  date, the first 'WhatsApp Image/Video YYYY-MM-DD at HH.MM.SS' match is used.
+- Camera (FILENAME): the first Android/Samsung YYYYMMDD_HHMMSS match wins (even
+  if invalid, in which case there is no date); otherwise the first iPhone
+  YYYY-MM-DD_HH-MM-SS match is used.
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+from datetime import datetime
+from typing import Iterable, Optional
+from zoneinfo import ZoneInfo
+
+import attrs
+from typeguard import typechecked
+
+# Maximum number of distinct strings kept in the per-string memo.
+_MEMO_MAX_SIZE = 1 << 16
+
+# Every alternative lives inside a lookahead, so the scan is zero-width and
+# overlapping candidates of different kinds are never swallowed by each other.
+# At any position at most one alternative can match (they start with different
+# character classes), so the alternation order does not hide any kind.
+_COMBINED_PATTERN = re.compile(
+    r"(?="
+    r"(?i:IMG|VID)[-_]?(?P<wa_compact>\d{8})-(?i:WA)\d"
+    r"|WhatsApp (?:Image|Video) (?P<wa_full>\d{4}-\d{2}-\d{2} at \d{2}\.\d{2}\.\d{2})"
+    r"|(?P<android>\d{8}[_-]\d{6})"
+    r"|(?P<iphone>\d{4}-\d{2}-\d{2}[_-]\d{2}[-_]\d{2}[-_]\d{2})"
+    r")"
+)
+_KINDS = ("wa_compact", "wa_full", "android", "iphone")
+
+
+@attrs.define(auto_attribs=True, slots=True, frozen=True)
+class ExtractedDates:
+    """
+    Naive dates found in a single filename or path string.
+
+    - whatsapp_date: date from WhatsApp naming patterns (to be localized with the
+      configured extraction timezone).
+    - camera_date: date from camera-style names (Android/Samsung, iPhone).
+    """
+
+    whatsapp_date: Optional[datetime] = None
+    camera_date: Optional[datetime] = None
+
+    def is_empty(self) -> bool:
+        return self.whatsapp_date is None and self.camera_date is None
+
+
+_EMPTY = ExtractedDates()
+
+
+def _build(
+    y: str, mo: str, d: str, h: str = "0", mi: str = "0", s: str = "0"
+) -> Optional[datetime]:
+    try:
+        return datetime(int(y), int(mo), int(d), int(h), int(mi), int(s))
+    except (ValueError, OverflowError):
+        # Invalid date/time values (e.g., month=13, day=32)
+        return None
+
+
+def _parse_wa_compact(t: str) -> Optional[datetime]:
+    # YYYYMMDD
+    return _build(t[0:4], t[4:6], t[6:8])
+
+
+def _parse_wa_full(t: str) -> Optional[datetime]:
+    # YYYY-MM-DD at HH.MM.SS
+    return _build(t[0:4], t[5:7], t[8:10], t[14:16], t[17:19], t[20:22])
+
+
+def _parse_android(t: str) -> Optional[datetime]:
+    # YYYYMMDD_HHMMSS
+    return _build(t[0:4], t[4:6], t[6:8], t[9:11], t[11:13], t[13:15])
+
+
+def _parse_iphone(t: str) -> Optional[datetime]:
+    # YYYY-MM-DD_HH-MM-SS
+    return _build(t[0:4], t[5:7], t[8:10], t[11:13], t[14:16], t[17:19])
+
+
+@functools.lru_cache(maxsize=_MEMO_MAX_SIZE)
+def _scan(text: str) -> ExtractedDates:
+    """Scan `text` once and return the dates it carries (memoized per string)."""
+    first: dict[str, str] = {}
+    for m in _COMBINED_PATTERN.finditer(text):
+        kind = m.lastgroup
+        if kind is not None and kind not in first:
+            first[kind] = m.group(kind)
+            if len(first) == len(_KINDS):
+                break
+    if not first:
+        return _EMPTY
+
+    whatsapp_date: Optional[datetime] = None
+    if "wa_compact" in first:
+        whatsapp_date = _parse_wa_compact(first["wa_compact"])
+    if whatsapp_date is None and "wa_full" in first:
+        whatsapp_date = _parse_wa_full(first["wa_full"])
+
+    camera_date: Optional[datetime] = None
+    if "android" in first:
+        camera_date = _parse_android(first["android"])
+    elif "iphone" in first:
+        camera_date = _parse_iphone(first["iphone"])
+
+    if whatsapp_date is None and camera_date is None:
+        return _EMPTY
+    return ExtractedDates(whatsapp_date=whatsapp_date, camera_date=camera_date)
+
+
+@typechecked
+def extract_dates(text: str) -> ExtractedDates:
+    """Return all naive dates found in a filename or path (memoized)."""
+    return _scan(text)
+
+
+@typechecked
+def extract_dates_bulk(texts: Iterable[str]) -> dict[str, ExtractedDates]:
+    """
+    Vectorized variant of extract_dates for a whole page or duplicate group.
+    Each distinct string is scanned at most once; repeated strings share the result.
+    """
+    return {t: _scan(t) for t in dict.fromkeys(texts)}
+
+
+@typechecked
+def localize(dt: Optional[datetime], tz: Optional[ZoneInfo]) -> Optional[datetime]:
+    """Attach `tz` to a naive extracted date (None-safe)."""
+    if dt is None or tz is None:
+        return None
+    return dt.replace(tzinfo=tz)
+
+
+def get_extraction_timezone() -> Optional[ZoneInfo]:
+    """Get configured timezone for date extraction, or None if not configured."""
+    try:
+        from immich_autotag.config.manager import ConfigManager
+        from immich_autotag.config.models import UserConfig
+
+        config: UserConfig = ConfigManager.get_instance().get_config()
+        if config.duplicate_processing is None:
+            return None
+        return ZoneInfo(config.duplicate_processing.date_correction.extraction_timezone)
+    except Exception:
+        return None
+
+
+def clear_memo() -> None:
+    """Drop all memoized scan results (e.g. between long-running sweeps)."""
+    _scan.cache_clear()
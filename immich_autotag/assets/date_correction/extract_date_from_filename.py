@@ -17,12 +17,13 @@ Date patterns in filenames and their origin:
 
 """
 
-import re
 from datetime import datetime
 from typing import Optional
 
 from typeguard import typechecked
 
+from immich_autotag.assets.date_correction.date_extraction_engine import extract_dates
+
 
 @typechecked
 def extract_date_from_filename(filename: str) -> Optional[datetime]:
@@ -31,29 +32,6 @@ def extract_date_from_filename(filename: str) -> Optional[datetime]:
     Supported patterns:
     - Android/Samsung: YYYYMMDD_HHMMSS.jpg
     - iPhone: YYYY-MM-DD_HHMMSS.jpg
-    - Others: can be added here
+    - Others: can be added to the combined pattern in date_extraction_engine
     """
-    # Android/Samsung: 20251215_092429.jpg
-    m = re.search(r"(\d{8})[_-](\d{6})", filename)
-    if m:
-        date_str = m.group(1)
-        time_str = m.group(2)
-        try:
-            return datetime.strptime(date_str + time_str, "%Y%m%d%H%M%S")
-        except Exception:
-            return None
-    # iPhone: 2025-12-15_09-24-29.jpg
-    m = re.search(r"(\d{4})-(\d{2})-(\d{2})[_-](\d{2})[-_](\d{2})[-_](\d{2})", filename)
-    if m:
-        try:
-            return datetime(
-                int(m.group(1)),
-                int(m.group(2)),
-                int(m.group(3)),
-                int(m.group(4)),
-                int(m.group(5)),
-                int(m.group(6)),
-            )
-        except Exception:
-            return None
-    return None
+    return extract_dates(filename).camera_date
@@ -1,6 +1,8 @@
 # get_asset_date_sources.py
-# Function: get_asset_date_sources
+# Functions: get_asset_date_candidates, get_asset_date_candidates_bulk
 from pathlib import Path
+from typing import Iterable, Optional
+from zoneinfo import ZoneInfo
 
 from immich_autotag.assets.asset_response_wrapper import AssetResponseWrapper
 from immich_autotag.assets.date_correction.asset_date_candidate import (
@@ -9,19 +11,22 @@ from immich_autotag.assets.date_correction.asset_date_candidate import (
 from immich_autotag.assets.date_correction.asset_date_candidates import (
     AssetDateCandidates,
 )
-from immich_autotag.assets.date_correction.date_source_kind import DateSourceKind
-from immich_autotag.assets.date_correction.extract_whatsapp_date_from_path import (
-    extract_whatsapp_date_from_path,
+from immich_autotag.assets.date_correction.date_extraction_engine import (
+    ExtractedDates,
+    extract_dates_bulk,
+    get_extraction_timezone,
+    localize,
 )
+from immich_autotag.assets.date_correction.date_source_kind import DateSourceKind
 
 
-def get_asset_date_candidates(
+def _build_candidates(
     asset_wrapper: AssetResponseWrapper,
+    filename: Path,
+    path: Path,
+    dates_by_text: dict[str, ExtractedDates],
+    tz: Optional[ZoneInfo],
 ) -> AssetDateCandidates:
-    """
-    Extract all relevant date candidates for a given asset.
-    Returns an AssetDateCandidates object with all found AssetDateCandidate objects.
-    """
     candidates = AssetDateCandidates.create(asset_wrapper)
     # IMMICH date
     immich_dt = asset_wrapper.get_best_date()
@@ -30,14 +35,16 @@ def get_asset_date_candidates(
             AssetDateCandidate.from_internal_attrs(
                 source_kind=DateSourceKind.IMMICH,
                 date=immich_dt,
-                file_path=Path(asset_wrapper.get_original_path()),
+                file_path=path,
                 asset_wrapper=asset_wrapper,
             )
         )
 
+    filename_dates = dates_by_text[str(filename)]
+    path_dates = dates_by_text[str(path)]
+
     # WhatsApp filename date
-    filename: Path = asset_wrapper.get_original_file_name()
-    wa_filename_dt = extract_whatsapp_date_from_path(str(filename))
+    wa_filename_dt = localize(filename_dates.whatsapp_date, tz)
     if wa_filename_dt:
         candidates.add(
             AssetDateCandidate.from_internal_attrs(
@@ -49,8 +56,7 @@ def get_asset_date_candidates(
         )
 
     # WhatsApp path date
-    path: Path = asset_wrapper.get_original_path()
-    wa_path_dt = extract_whatsapp_date_from_path(str(path))
+    wa_path_dt = localize(path_dates.whatsapp_date, tz)
     if wa_path_dt:
         candidates.add(
             AssetDateCandidate.from_internal_attrs(
@@ -62,11 +68,7 @@ def get_asset_date_candidates(
         )
 
     # Detect dates in camera-style filenames (FILENAME)
-    from immich_autotag.assets.date_correction.extract_date_from_filename import (
-        extract_date_from_filename,
-    )
-
-    filename_date = extract_date_from_filename(str(filename))
+    filename_date = filename_dates.camera_date
     if filename_date:
         candidates.add(
             AssetDateCandidate.from_internal_attrs(
@@ -78,3 +80,35 @@ def get_asset_date_candidates(
         )
 
     return candidates
+
+
+def get_asset_date_candidates_bulk(
+    asset_wrappers: Iterable[AssetResponseWrapper],
+) -> list[AssetDateCandidates]:
+    """
+    Extract the date candidates of many assets at once (a page or a duplicate group).
+    The extraction timezone is resolved once and every distinct filename/path is
+    scanned once, so duplicates sharing names cost a single scan.
+    Returns one AssetDateCandidates per input wrapper, in the same order.
+    """
+    names: list[tuple[AssetResponseWrapper, Path, Path]] = [
+        (w, w.get_original_file_name(), w.get_original_path()) for w in asset_wrappers
+    ]
+    dates_by_text = extract_dates_bulk(
+        text for _, filename, path in names for text in (str(filename), str(path))
+    )
+    tz = get_extraction_timezone()
+    return [
+        _build_candidates(w, filename, path, dates_by_text, tz)
+        for w, filename, path in names
+    ]
+
+
+def get_asset_date_candidates(
+    asset_wrapper: AssetResponseWrapper,
+) -> AssetDateCandidates:
+    """
+    Extract all relevant date candidates for a given asset.
+    Returns an AssetDateCandidates object with all found AssetDateCandidate objects.
+    """
+    return get_asset_date_candidates_bulk([asset_wrapper])[0]
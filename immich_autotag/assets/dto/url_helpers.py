@@ -1,9 +1,9 @@
-from immich_autotag.api.immich_proxy.assets import AssetResponseDto
+from immich_autotag.api.logging_proxy.types import AssetDto
 from immich_autotag.types.uuid_wrappers import AssetUUID
 from immich_autotag.utils.url_helpers import get_immich_photo_url
 
 
-def get_asset_dto_url(dto: AssetResponseDto) -> str:
+def get_asset_dto_url(dto: AssetDto) -> str:
     """
     Returns the Immich web URL for the given AssetResponseDto.
     Defensive: returns '<invalid url>' if dto or id is invalid.
@@ -18,7 +18,7 @@ def get_asset_dto_url(dto: AssetResponseDto) -> str:
         return "<invalid url>"
 
 
-def repr_dto_filename_and_id(x: AssetResponseDto | None) -> str:
+def repr_dto_filename_and_id(x: AssetDto | None) -> str:
     if x is None:
         return "None"
     try:
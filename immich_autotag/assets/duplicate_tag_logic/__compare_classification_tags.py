@@ -12,15 +12,10 @@ from ._classification_tag_comparison_result_obj import (
 
 
 @typechecked
-def compare_classification_tags(
-    asset1: "AssetResponseWrapper", asset2: "AssetResponseWrapper"
+def compare_tag_sets(
+    tags1: Set[str], tags2: Set[str]
 ) -> ClassificationTagComparisonResultObj:
-    """
-    Compares the classification tags of two assets.
-    Returns ("equal", None), ("autofix_other", tag), ("autofix_self", tag) or ("conflict", (tags1, tags2)).
-    """
-    tags1: Set[str] = set(asset1.get_classification_tags())
-    tags2: Set[str] = set(asset2.get_classification_tags())
+    """Same comparison as compare_classification_tags, on plain tag sets."""
     if tags1 == tags2:
         return ClassificationTagComparisonResultObj(
             ClassificationTagComparisonResult.EQUAL, None
@@ -36,3 +31,16 @@ def compare_classification_tags(
     return ClassificationTagComparisonResultObj(
         ClassificationTagComparisonResult.CONFLICT, (tags1, tags2)
     )
+
+
+@typechecked
+def compare_classification_tags(
+    asset1: "AssetResponseWrapper", asset2: "AssetResponseWrapper"
+) -> ClassificationTagComparisonResultObj:
+    """
+    Compares the classification tags of two assets.
+    Returns ("equal", None), ("autofix_other", tag), ("autofix_self", tag) or ("conflict", (tags1, tags2)).
+    """
+    return compare_tag_sets(
+        set(asset1.get_classification_tags()), set(asset2.get_classification_tags())
+    )
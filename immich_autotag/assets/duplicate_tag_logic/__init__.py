@@ -7,6 +7,11 @@ tags for assets. Kept minimal to avoid empty-package linter warnings.
 from .analyze_duplicate_classification_tags import (
     DuplicateTagAnalysisReport,
     analyze_duplicate_classification_tags,
+    analyze_duplicate_group_classification_tags,
 )
 
-__all__ = ["DuplicateTagAnalysisReport", "analyze_duplicate_classification_tags"]
+__all__ = [
+    "DuplicateTagAnalysisReport",
+    "analyze_duplicate_classification_tags",
+    "analyze_duplicate_group_classification_tags",
+]
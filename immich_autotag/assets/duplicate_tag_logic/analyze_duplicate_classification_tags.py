@@ -97,6 +97,15 @@ class DuplicateTagAnalysisReport(ProcessStepResult):
         report._perform_analysis()
         return report
 
+    @classmethod
+    def analyze_group(
+        cls, asset_wrapper: AssetResponseWrapper
+    ) -> "DuplicateTagAnalysisReport":
+        """Create instance and reconcile the whole duplicate group in one pass"""
+        report = cls(asset_wrapper=asset_wrapper)
+        report._perform_group_analysis()
+        return report
+
     def _get_duplicate_ids(
         self, duplicate_wrappers: list[AssetResponseWrapper], asset_id: AssetUUID
     ) -> list[AssetUUID]:
@@ -231,6 +240,62 @@ class DuplicateTagAnalysisReport(ProcessStepResult):
             all_equal,
         )
 
+    def _perform_group_analysis(self) -> None:
+        """
+        Reconcile classification tags of the whole duplicate group at once.
+
+        Equivalent to running the per-asset analysis on every member: the group is
+        consistent if all members carry the same classification tags; if the only
+        non-empty tag set is a single tag, members without classification get it;
+        anything else is a conflict and the whole group is marked.
+        """
+        from immich_autotag.logging.levels import LogLevel
+        from immich_autotag.logging.utils import log
+
+        asset_id = self._asset_wrapper.get_id()
+        members = [
+            w
+            for w in get_duplicate_wrappers(self._asset_wrapper)
+            if w.get_id() != asset_id
+        ]
+        self._duplicate_count = len(members)
+        if not members:
+            self._result = DuplicateTagAnalysisResult.NO_DUPLICATES
+            return
+        members.insert(0, self._asset_wrapper)
+        self._compared_count = self._duplicate_count
+
+        tags_by_member = [
+            (member, frozenset(member.get_classification_tags())) for member in members
+        ]
+        distinct_tag_sets = {tags for _, tags in tags_by_member}
+        log(
+            f"[DUPLICATE TAGS][GROUP] {len(members)} duplicates of asset {asset_id}, "
+            f"classification tag sets: {[sorted(t) for t in distinct_tag_sets]}",
+            level=LogLevel.FOCUS,
+        )
+        if len(distinct_tag_sets) == 1:
+            self._result = DuplicateTagAnalysisResult.ALL_EQUAL
+            return
+
+        non_empty = [tags for tags in distinct_tag_sets if tags]
+        if len(non_empty) == 1 and len(non_empty[0]) == 1:
+            tag_to_add = next(iter(non_empty[0]))
+            for member, tags in tags_by_member:
+                if tags:
+                    continue
+                fix_type = (
+                    ClassificationTagComparisonResult.AUTOFIX_SELF
+                    if member.get_id() == asset_id
+                    else ClassificationTagComparisonResult.AUTOFIX_OTHER
+                )
+                try_autofix(self._asset_wrapper, member, fix_type, tag_to_add)
+                self._autofix_count += 1
+            self._result = DuplicateTagAnalysisResult.AUTOFIXED
+            return
+
+        self._finalize_conflict([m.get_id() for m in members[1:]], [])
+
     def __str__(self) -> str:
         return self.format()
 
@@ -247,3 +312,26 @@ def analyze_duplicate_classification_tags(
     - Does not raise exceptions; only logs and marks conflicts.
     """
     return DuplicateTagAnalysisReport.analyze(asset_wrapper)
+
+
+@typechecked
+def analyze_duplicate_group_classification_tags(
+    asset_wrapper: AssetResponseWrapper,
+) -> dict[AssetUUID, ProcessStepResult]:
+    """
+    Group-scoped variant of analyze_duplicate_classification_tags: reconciles the
+    classification tags of the whole duplicate group once. The single group report
+    is returned for every member so each one can attach it to its own report.
+    """
+    report = DuplicateTagAnalysisReport.analyze_group(asset_wrapper)
+    results: dict[AssetUUID, ProcessStepResult] = {asset_wrapper.get_id(): report}
+    duplicate_id = asset_wrapper.get_duplicate_id_as_uuid()
+    if duplicate_id is not None:
+        group = (
+            asset_wrapper.get_context()
+            .get_duplicates_collection()
+            .get_group(duplicate_id)
+        )
+        for member_id in group:
+            results[member_id] = report
+    return results
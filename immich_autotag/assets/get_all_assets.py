@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+from concurrent.futures import Future
+from datetime import datetime
 from typing import TYPE_CHECKING, Callable, Generator
 
+import attrs
 from typeguard import typechecked
 
 from immich_autotag.api.immich_proxy.search import (
@@ -9,26 +12,43 @@ from immich_autotag.api.immich_proxy.search import (
     proxy_search_assets,
 )
 from immich_autotag.api.logging_proxy.types import (
-    AssetResponseDto,
+    ASSET_DTO_TYPES,
+    AssetDto,
     MetadataSearchDto,
     Response,
 )
 from immich_autotag.assets.asset_dto_state import AssetDtoType
 from immich_autotag.assets.asset_response_wrapper import AssetResponseWrapper
+from immich_autotag.config.sharding import ShardSpec, get_current_shard
 from immich_autotag.logging.utils import log_debug
+from immich_autotag.types.uuid_wrappers import AssetUUID, TagUUID
 
 if TYPE_CHECKING:
     from immich_autotag.context.immich_context import ImmichContext
 
 
+def _build_search_body(
+    page: int, updated_after: datetime | None, tag_id: TagUUID | None
+) -> MetadataSearchDto:
+    body = MetadataSearchDto(page=page)
+    if updated_after is not None:
+        body.updated_after = updated_after
+    if tag_id is not None:
+        body.tag_ids = [tag_id.to_uuid()]
+    return body
+
+
 @typechecked
 def _fetch_assets_page(
-    context: "ImmichContext", page: int
+    context: "ImmichContext",
+    page: int,
+    updated_after: datetime | None = None,
+    tag_id: TagUUID | None = None,
 ) -> Response[SearchResponseDto]:
 
     from immich_autotag.logging.utils import log_debug
 
-    body = MetadataSearchDto(page=page)
+    body = _build_search_body(page, updated_after, tag_id)
     log_debug(f"[BUG] Before search_assets.sync_detailed, page={page}")
     # Use ImmichClient type for client
     response = proxy_search_assets(
@@ -38,9 +58,60 @@ def _fetch_assets_page(
     return response
 
 
+@attrs.define(auto_attribs=True, slots=True)
+class _SearchPageSource:
+    """
+    Returns search result pages by number. With ENABLE_ASYNC_API, the next
+    ASYNC_SEARCH_PAGE_PREFETCH pages are requested on the AsyncDriver loop while
+    the current page is processed, so page latency overlaps with processing.
+    Pages behind the requested one (e.g. after a skip) are cancelled.
+    """
+
+    _context: "ImmichContext"
+    _updated_after: datetime | None = None
+    # Restricts the search to the assets carrying this tag
+    _tag_id: TagUUID | None = None
+    _futures: dict[int, Future[Response[SearchResponseDto]]] = attrs.field(
+        factory=dict, init=False, repr=False
+    )
+
+    def _submit(self, page: int) -> Future[Response[SearchResponseDto]]:
+        from immich_autotag.api.logging_proxy.aio import proxy_search_assets_async
+        from immich_autotag.utils.async_driver import AsyncDriver
+
+        body = _build_search_body(page, self._updated_after, self._tag_id)
+        client = self._context.get_client_wrapper().get_client()
+        return AsyncDriver.get_instance().submit(
+            proxy_search_assets_async(client=client, body=body)
+        )
+
+    def get(self, page: int) -> Response[SearchResponseDto]:
+        from immich_autotag.config.internal_config import (
+            ASYNC_SEARCH_PAGE_PREFETCH,
+            ENABLE_ASYNC_API,
+        )
+
+        if not ENABLE_ASYNC_API:
+            return _fetch_assets_page(
+                self._context, page, self._updated_after, self._tag_id
+            )
+        for stale in [p for p in self._futures if p < page]:
+            self._futures.pop(stale).cancel()
+        for ahead in range(page, page + ASYNC_SEARCH_PAGE_PREFETCH + 1):
+            if ahead not in self._futures:
+                self._futures[ahead] = self._submit(ahead)
+        return self._futures.pop(page).result()
+
+    def close(self) -> None:
+        """Cancels the pages requested ahead and not consumed."""
+        for future in self._futures.values():
+            future.cancel()
+        self._futures.clear()
+
+
 @typechecked
 def _yield_assets_from_page(
-    assets_page: list[AssetResponseDto],
+    assets_page: list[AssetDto],
     start_idx: int,
     context: "ImmichContext",
     max_assets: int | None,
@@ -59,7 +130,7 @@ def _yield_assets_from_page(
             continue
         if max_assets is not None and max_assets >= 0 and count + yielded >= max_assets:
             break
-        # asset is always AssetResponseDto
+        # asset is an AssetResponseDto or its fast AssetLite
         log_debug(f"[INFO] Using AssetManager to get wrapper, asset_id={asset.id}")
         wrapper = asset_manager.get_wrapper_for_asset_dto(
             asset_dto=asset, dto_type=AssetDtoType.SEARCH, context=context
@@ -71,7 +142,7 @@ def _yield_assets_from_page(
 @typechecked
 def _log_page_progress(
     page: int,
-    assets_page: list[AssetResponseDto],
+    assets_page: list[AssetDto],
     count: int,
     abs_pos: int,
     total_assets: int | None,
@@ -84,6 +155,65 @@ def _log_page_progress(
     log(msg)
 
 
+@typechecked
+def _get_shard_assets(
+    context: "ImmichContext",
+    shard: ShardSpec,
+    max_assets: int | None,
+    skip_n: int,
+) -> Generator[AssetResponseWrapper, None, None]:
+    """
+    get_all_assets for a sharded run: walks every search page and yields only the
+    assets of `shard`. skip_n and max_assets count this shard's assets (that is
+    what its checkpoints record), so skipping cannot jump pages; skipped assets
+    cost a listing, not a wrapper.
+    """
+    from immich_autotag.logging.levels import LogLevel
+    from immich_autotag.logging.utils import log
+
+    log(
+        f"[SHARD] Processing shard {shard} (skip_n={skip_n} shard assets)",
+        level=LogLevel.PROGRESS,
+    )
+    asset_manager = context.get_asset_manager()
+    pages = _SearchPageSource(context)
+    owned = 0
+    count = 0
+    page = 1
+    try:
+        while max_assets is None or max_assets < 0 or count < max_assets:
+            response = pages.get(page)
+            if response.parsed is None:
+                break
+            assets_page = [
+                item
+                for item in response.parsed.assets.items
+                if isinstance(item, ASSET_DTO_TYPES)
+            ]
+            for asset in assets_page:
+                if not shard.owns(AssetUUID.from_string(asset.id)):
+                    continue
+                owned += 1
+                if owned <= skip_n:
+                    continue
+                if max_assets is not None and 0 <= max_assets <= count:
+                    break
+                yield asset_manager.get_wrapper_for_asset_dto(
+                    asset_dto=asset, dto_type=AssetDtoType.SEARCH, context=context
+                )
+                count += 1
+            log(
+                f"[PROGRESS] [SHARD] Page {page}: {owned} shard assets seen, "
+                f"{count} yielded",
+                level=LogLevel.PROGRESS,
+            )
+            if not assets_page or not response.parsed.assets.next_page:
+                break
+            page += 1
+    finally:
+        pages.close()
+
+
 @typechecked
 def get_all_assets(
     context: "ImmichContext", max_assets: int | None = None, skip_n: int = 0
@@ -102,86 +232,151 @@ def get_all_assets(
     from immich_autotag.logging.utils import log
 
     log("Starting get_all_assets generator...", level=LogLevel.PROGRESS)
+    shard = get_current_shard()
+    if shard is not None:
+        yield from _get_shard_assets(context, shard, max_assets, skip_n)
+        return
     first_page = True
     skip_applied = False
 
-    # If there are no assets, yield nothing (empty generator)
-    # This ensures the function always returns a generator, never None.
-    while True:
-        response = _fetch_assets_page(context, page)
-        # response is expected to be a SearchResponseDto
-        # If using httpx or a custom Response, adapt as needed
-        # If response is a custom Response object, get .parsed
-        response_obj: SearchResponseDto = response.parsed if response.parsed is not None else response  # type: ignore[assignment]
-        # Now response_obj should be a SearchResponseDto
-        # assets_page should be a list[AssetResponseDto]
-        # assets_page should be a list[AssetResponseDto]
-        # Explicitly cast assets_page to correct type
-        raw_items = response_obj.assets.items  # type: ignore
-        if not isinstance(raw_items, list):
-            assets_page = []
-        else:
-            # Filter only AssetResponseDto objects
-            assets_page = [item for item in raw_items if isinstance(item, AssetResponseDto)]  # type: ignore
-        log(
-            f"[PROGRESS] Page {page}: {len(assets_page)} assets received from API.",
-            level=LogLevel.PROGRESS,
-        )
-        if not assets_page:
+    pages = _SearchPageSource(context)
+    try:
+        # If there are no assets, yield nothing (empty generator)
+        # This ensures the function always returns a generator, never None.
+        while True:
+            response = pages.get(page)
+            # response is expected to be a SearchResponseDto
+            # If using httpx or a custom Response, adapt as needed
+            # If response is a custom Response object, get .parsed
+            response_obj: SearchResponseDto = response.parsed if response.parsed is not None else response  # type: ignore[assignment]
+            # Now response_obj should be a SearchResponseDto
+            # assets_page should be a list[AssetDto]
+            # assets_page should be a list[AssetDto]
+            # Explicitly cast assets_page to correct type
+            raw_items = response_obj.assets.items  # type: ignore
+            if not isinstance(raw_items, list):
+                assets_page = []
+            else:
+                # Filter only asset DTOs (AssetResponseDto or AssetLite)
+                assets_page = [item for item in raw_items if isinstance(item, ASSET_DTO_TYPES)]  # type: ignore
             log(
-                f"[PROGRESS] No more assets in page {page}, ending loop.",
+                f"[PROGRESS] Page {page}: {len(assets_page)} assets received from API.",
                 level=LogLevel.PROGRESS,
             )
-            break
-        if first_page:
-            page_size = len(assets_page)  # type: ignore
-            if skip_n:
-                page = (skip_n // page_size) + 1
-                skip_offset = skip_n % page_size
-            first_page = False
-        # Apply skip only on the first page processed after calculation
-        start_idx = skip_offset if skip_n and not skip_applied else 0
-        log(
-            f"[PROGRESS] skip_n={skip_n}, page={page}, skip_offset={skip_offset}, start_idx={start_idx}, count={count}",
-            level=LogLevel.DEBUG,
-        )
-        log(
-            f"[PROGRESS] Yielding from page {page} with start_idx={start_idx}, count={count}",
-            level=LogLevel.DEBUG,
-        )
-        for asset_wrapper in _yield_assets_from_page(
-            assets_page, start_idx, context, max_assets, count
-        ):
-            yield asset_wrapper
-            count += 1
-            log(f"[PROGRESS] Asset processed, count={count}", level=LogLevel.DEBUG)
-        skip_applied = bool(skip_n and not skip_applied)
-        abs_pos = skip_n + count
-        response_assets = response.parsed.assets if response.parsed is not None else None  # type: ignore[attr-defined]
-        total_assets = response_assets.total if response_assets is not None else None
-        _log_page_progress(
-            page,
-            assets_page,
-            count,
-            abs_pos,
-            total_assets,
-            lambda m: log(m, level=LogLevel.PROGRESS),
-        )
-        # Only enforce limit when max_assets is a non-negative integer (None or -1 means unlimited)
-        if max_assets is not None and max_assets >= 0 and count >= max_assets:
+            if not assets_page:
+                log(
+                    f"[PROGRESS] No more assets in page {page}, ending loop.",
+                    level=LogLevel.PROGRESS,
+                )
+                break
+            if first_page:
+                page_size = len(assets_page)  # type: ignore
+                if skip_n:
+                    page = (skip_n // page_size) + 1
+                    skip_offset = skip_n % page_size
+                first_page = False
+            # Apply skip only on the first page processed after calculation
+            start_idx = skip_offset if skip_n and not skip_applied else 0
             log(
-                f"[PROGRESS] max_assets reached after processing page {page} (count={count})",
-                level=LogLevel.PROGRESS,
+                f"[PROGRESS] skip_n={skip_n}, page={page}, skip_offset={skip_offset}, start_idx={start_idx}, count={count}",
+                level=LogLevel.DEBUG,
             )
-            break
-        if response_assets is None or not response_assets.next_page:  # type: ignore[attr-defined]
             log(
-                f"[PROGRESS] No next_page in response after page {page}, ending loop.",
-                level=LogLevel.PROGRESS,
+                f"[PROGRESS] Yielding from page {page} with start_idx={start_idx}, count={count}",
+                level=LogLevel.DEBUG,
             )
-            break
-        page += 1
+            for asset_wrapper in _yield_assets_from_page(
+                assets_page, start_idx, context, max_assets, count
+            ):
+                yield asset_wrapper
+                count += 1
+                log(f"[PROGRESS] Asset processed, count={count}", level=LogLevel.DEBUG)
+            skip_applied = bool(skip_n and not skip_applied)
+            abs_pos = skip_n + count
+            response_assets = response.parsed.assets if response.parsed is not None else None  # type: ignore[attr-defined]
+            total_assets = (
+                response_assets.total if response_assets is not None else None
+            )
+            _log_page_progress(
+                page,
+                assets_page,
+                count,
+                abs_pos,
+                total_assets,
+                lambda m: log(m, level=LogLevel.PROGRESS),
+            )
+            # Only enforce limit when max_assets is a non-negative integer (None or -1 means unlimited)
+            if max_assets is not None and max_assets >= 0 and count >= max_assets:
+                log(
+                    f"[PROGRESS] max_assets reached after processing page {page} (count={count})",
+                    level=LogLevel.PROGRESS,
+                )
+                break
+            if response_assets is None or not response_assets.next_page:  # type: ignore[attr-defined]
+                log(
+                    f"[PROGRESS] No next_page in response after page {page}, ending loop.",
+                    level=LogLevel.PROGRESS,
+                )
+                break
+            page += 1
+    finally:
+        pages.close()
     log(
         "get_all_assets generator finished (no more pages or assets).",
         level=LogLevel.PROGRESS,
     )
+
+
+def _iter_search(
+    context: "ImmichContext", pages: _SearchPageSource
+) -> Generator[AssetResponseWrapper, None, None]:
+    """Yields fresh wrappers for every asset of a filtered search."""
+    asset_manager = context.get_asset_manager()
+    shard = get_current_shard()
+    page = 1
+    try:
+        while True:
+            response = pages.get(page)
+            if response.parsed is None:
+                break
+            assets_page = [
+                item
+                for item in response.parsed.assets.items
+                if isinstance(item, ASSET_DTO_TYPES)
+            ]
+            for asset in assets_page:
+                asset_id = AssetUUID.from_string(asset.id)
+                if shard is not None and not shard.owns(asset_id):
+                    continue
+                asset_manager.evict(asset_id)
+                yield asset_manager.get_wrapper_for_asset_dto(
+                    asset_dto=asset, dto_type=AssetDtoType.SEARCH, context=context
+                )
+            if not assets_page or not response.parsed.assets.next_page:
+                break
+            page += 1
+    finally:
+        pages.close()
+
+
+@typechecked
+def get_assets_updated_since(
+    context: "ImmichContext", since: datetime
+) -> Generator[AssetResponseWrapper, None, None]:
+    """
+    Generator over the assets updated after `since` (used by watch mode),
+    restricted to the current shard if the run is sharded.
+    Cached wrappers of those assets are dropped first, so fresh DTOs are used.
+    """
+    yield from _iter_search(context, _SearchPageSource(context, updated_after=since))
+
+
+@typechecked
+def get_assets_with_tag(
+    context: "ImmichContext", tag_id: TagUUID
+) -> Generator[AssetResponseWrapper, None, None]:
+    """
+    Generator over the assets carrying the tag `tag_id` (server-side search),
+    restricted to the current shard if the run is sharded.
+    """
+    yield from _iter_search(context, _SearchPageSource(context, tag_id=tag_id))
@@ -0,0 +1,234 @@
+"""
+Group-scoped processing of duplicate assets.
+
+Some phases of process_single_asset (date correction, duplicate classification
+tag reconciliation) look at the whole duplicate group of the asset. Run per
+asset, a group of N duplicates is loaded, compared and possibly autofixed N
+times. Here, the first member of a group that reaches such a phase runs it for
+the entire group; the remaining members just pick up their precomputed result
+when their turn comes, so each group is analyzed once.
+
+The registry is thread-safe: with the thread pool enabled, a member arriving
+while its group is still being processed waits for the triggering asset.
+If the group pass fails, members fall back to the per-asset path.
+"""
+
+from __future__ import annotations
+
+import threading
+from enum import Enum, auto
+from typing import TYPE_CHECKING, Callable, Optional
+
+import attrs
+from typeguard import typechecked
+
+from immich_autotag.assets.process.process_step_result_protocol import ProcessStepResult
+from immich_autotag.types.uuid_wrappers import AssetUUID, DuplicateUUID
+
+if TYPE_CHECKING:
+    from immich_autotag.assets.asset_response_wrapper import AssetResponseWrapper
+    from immich_autotag.report.modification_entries_list import (
+        ModificationEntriesList,
+    )
+
+# Per-member results of a group pass, keyed by asset
+GroupResults = dict[AssetUUID, ProcessStepResult]
+
+
+class DuplicateGroupPhase(Enum):
+    DATE_CORRECTION = auto()
+    DUPLICATE_TAG_ANALYSIS = auto()
+
+
+@attrs.define(auto_attribs=True, slots=True)
+class DuplicateGroupPhaseResult(ProcessStepResult):
+    """
+    Result of a phase run once for a whole duplicate group, attached to the
+    report of the asset that triggered the group pass.
+    """
+
+    _duplicate_id: DuplicateUUID
+    _own_result: ProcessStepResult
+    _member_results: GroupResults = attrs.field(repr=lambda x: f"size={len(x)}")
+
+    def _distinct_results(self) -> list[ProcessStepResult]:
+        # Some phases share one result object for all members
+        seen: dict[int, ProcessStepResult] = {}
+        for result in self._member_results.values():
+            seen.setdefault(id(result), result)
+        return list(seen.values())
+
+    def has_changes(self) -> bool:
+        return any(r.has_changes() for r in self._distinct_results())
+
+    def has_errors(self) -> bool:
+        return any(r.has_errors() for r in self._distinct_results())
+
+    def get_title(self) -> str:
+        return f"{self._own_result.get_title()} (duplicate group)"
+
+    def get_events(self) -> "ModificationEntriesList":
+        from immich_autotag.report.modification_entries_list import (
+            ModificationEntriesList,
+        )
+
+        aggregated = ModificationEntriesList()
+        for result in self._distinct_results():
+            aggregated = aggregated.extend(result.get_events())
+        return aggregated
+
+    def format(self) -> str:
+        changed = sum(1 for r in self._member_results.values() if r.has_changes())
+        return (
+            f"group {self._duplicate_id}: {len(self._member_results)} assets, "
+            f"{changed} changed | self: {self._own_result.format()}"
+        )
+
+
+@attrs.define(auto_attribs=True, slots=True)
+class DuplicateGroupCoveredResult(ProcessStepResult):
+    """
+    Result for a duplicate-group member whose phase already ran with its group.
+    Changes were reported on the triggering asset, so this never reports changes.
+    """
+
+    _inner: ProcessStepResult
+    _duplicate_id: DuplicateUUID
+    _trigger_asset_id: AssetUUID
+
+    def has_changes(self) -> bool:
+        return False
+
+    def has_errors(self) -> bool:
+        return self._inner.has_errors()
+
+    def get_title(self) -> str:
+        return self._inner.get_title()
+
+    def get_events(self) -> "ModificationEntriesList":
+        from immich_autotag.report.modification_entries_list import (
+            ModificationEntriesList,
+        )
+
+        return ModificationEntriesList()
+
+    def format(self) -> str:
+        return (
+            f"↺ Handled with duplicate group {self._duplicate_id} "
+            f"(asset {self._trigger_asset_id}): {self._inner.format()}"
+        )
+
+
+@attrs.define(auto_attribs=True, slots=True)
+class _GroupPhaseState:
+    trigger_asset_id: AssetUUID
+    done: threading.Event = attrs.field(factory=threading.Event)
+    failed: bool = False
+    pending: GroupResults = attrs.field(factory=dict)
+
+
+_instance: "DuplicateGroupRegistry | None" = None
+
+
+@attrs.define(auto_attribs=True, slots=True)
+class DuplicateGroupRegistry:
+    """
+    Remembers which duplicate groups already went through each group-scoped
+    phase during this run, and holds the results not yet claimed by members.
+    """
+
+    _lock: threading.Lock = attrs.field(factory=threading.Lock, init=False, repr=False)
+    _states: dict[tuple[DuplicateGroupPhase, DuplicateUUID], _GroupPhaseState] = (
+        attrs.field(factory=dict, init=False, repr=lambda x: f"size={len(x)}")
+    )
+
+    def __attrs_post_init__(self) -> None:
+        global _instance
+        if _instance is not None:
+            raise RuntimeError(
+                "DuplicateGroupRegistry instance already exists. Use get_instance()."
+            )
+        _instance = self
+
+    @staticmethod
+    def get_instance() -> "DuplicateGroupRegistry":
+        global _instance
+        if _instance is None:
+            _instance = DuplicateGroupRegistry()
+        return _instance
+
+    @typechecked
+    def run_once(
+        self,
+        phase: DuplicateGroupPhase,
+        asset_wrapper: "AssetResponseWrapper",
+        run_group: Callable[[], GroupResults],
+    ) -> Optional[ProcessStepResult]:
+        """
+        Run `run_group` for the duplicate group of `asset_wrapper` if this is the
+        first member reaching `phase`, otherwise return the member's stored result.
+
+        Returns None when the asset must be processed on its own (no duplicate
+        group, the group pass failed, or it produced no result for this asset).
+        """
+        duplicate_id = asset_wrapper.get_duplicate_id_as_uuid()
+        if duplicate_id is None:
+            return None
+        asset_id = asset_wrapper.get_id()
+        key = (phase, duplicate_id)
+        with self._lock:
+            state = self._states.get(key)
+            is_trigger = state is None
+            if state is None:
+                state = _GroupPhaseState(trigger_asset_id=asset_id)
+                self._states[key] = state
+
+        if is_trigger:
+            try:
+                results = run_group()
+                own_result = results.pop(asset_id, None)
+                member_results = dict(results)
+                with self._lock:
+                    state.pending = results
+            except Exception:
+                state.failed = True
+                raise
+            finally:
+                state.done.set()
+            if own_result is None:
+                return None
+            member_results[asset_id] = own_result
+            return DuplicateGroupPhaseResult(duplicate_id, own_result, member_results)
+
+        state.done.wait()
+        with self._lock:
+            inner = None if state.failed else state.pending.pop(asset_id, None)
+        if inner is None:
+            return None
+        return DuplicateGroupCoveredResult(inner, duplicate_id, state.trigger_asset_id)
+
+    def clear(self) -> None:
+        """Forget all processed groups (e.g. before a new sweep)."""
+        with self._lock:
+            self._states.clear()
+
+
+@typechecked
+def run_duplicate_group_phase(
+    phase: DuplicateGroupPhase,
+    asset_wrapper: "AssetResponseWrapper",
+    run_group: Callable[[], GroupResults],
+) -> Optional[ProcessStepResult]:
+    """
+    Entry point used by process_single_asset. Returns None when group-scoped
+    processing is disabled or does not apply, so the caller runs the per-asset path.
+    """
+    from immich_autotag.config.internal_config import (
+        ENABLE_DUPLICATE_GROUP_PROCESSING,
+    )
+
+    if not ENABLE_DUPLICATE_GROUP_PROCESSING:
+        return None
+    return DuplicateGroupRegistry.get_instance().run_once(
+        phase, asset_wrapper, run_group
+    )
@@ -0,0 +1,329 @@
+"""
+Per-asset fingerprint journal: skip assets whose processing inputs did not change.
+
+After an asset is processed without errors, its fingerprint is recorded:
+
+- inputs: tag names, album memberships (id and name), the four DTO dates,
+  duplicate group and its members, and original path, as they are *after*
+  processing (what the next run will read if nobody touches the asset);
+- config: a hash of the configuration that applies to the asset. Sections that
+  affect every asset (date correction, duplicate processing, album detection,
+  album date consistency, classification autotags, the package version) are
+  hashed once; classification rules and conversions only count when their
+  criteria match the asset, so editing one rule invalidates only the assets that
+  rule matches (before or after the edit).
+
+The next run skips every phase of process_single_asset for an asset whose
+fingerprint is unchanged. The journal is a SQLite file in the run directory,
+copied from the most recent run (same shard) that has one.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import shutil
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+import attrs
+from typeguard import typechecked
+
+from immich_autotag.logging.levels import LogLevel
+from immich_autotag.logging.utils import log
+
+if TYPE_CHECKING:
+    from immich_autotag.assets.asset_response_wrapper import AssetResponseWrapper
+    from immich_autotag.classification.classification_rule_wrapper import (
+        ClassificationRuleWrapper,
+    )
+    from immich_autotag.config.models import UserConfig
+
+ASSET_FINGERPRINT_JOURNAL_FILENAME = "asset_fingerprints.sqlite"
+# Bump when the fingerprint composition changes: old entries then never match
+_FINGERPRINT_FORMAT = 1
+# Recorded fingerprints are committed in batches of this size (and at exit)
+_COMMIT_EVERY = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS fingerprints (
+    asset_id TEXT PRIMARY KEY,
+    inputs TEXT NOT NULL,
+    config TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    processed_at REAL NOT NULL
+)
+"""
+
+_instance: "AssetFingerprintJournal | None" = None
+_instance_lock = threading.Lock()
+
+
+def _digest(*parts: str) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update(part.encode("utf-8"))
+        h.update(b"\x00")
+    return h.hexdigest()
+
+
+def _dump(value: object) -> str:
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+@attrs.define(auto_attribs=True, slots=True, frozen=True)
+class AssetFingerprint:
+    inputs: str
+    config: str
+
+
+@attrs.define(auto_attribs=True, slots=True, frozen=True)
+class _HashedRule:
+    """A classification rule or conversion and the hash of its configuration."""
+
+    rule_wrapper: "ClassificationRuleWrapper"
+    rule_hash: str
+
+
+@attrs.define(auto_attribs=True, slots=True)
+class _ConfigFingerprinter:
+    """Precomputed hashes of the configuration, for per-asset config hashes."""
+
+    _global_hash: str
+    _rules: list[_HashedRule]
+    _conversions: list[_HashedRule]
+
+    @staticmethod
+    def from_config(config: "UserConfig") -> "_ConfigFingerprinter":
+        from immich_autotag.classification.classification_rule_wrapper import (
+            ClassificationRuleWrapper,
+        )
+        from immich_autotag.version import __version__
+
+        classification = config.classification.model_dump(exclude={"rules"})
+        conversions = config.conversions.model_dump(exclude={"conversions"})
+        global_parts = [
+            str(_FINGERPRINT_FORMAT),
+            __version__,
+            _dump(classification),
+            _dump(conversions),
+            _dump(
+                config.duplicate_processing and config.duplicate_processing.model_dump()
+            ),
+            _dump(
+                config.album_date_consistency
+                and config.album_date_consistency.model_dump()
+            ),
+            _dump(config.album_detection_from_folders.model_dump()),
+            _dump(config.create_album_from_date_if_missing),
+            _dump(config.enable_album_name_strip),
+        ]
+        return _ConfigFingerprinter(
+            global_hash=_digest(*global_parts),
+            rules=[
+                _HashedRule(ClassificationRuleWrapper(rule), _dump(rule.model_dump()))
+                for rule in config.classification.rules
+            ],
+            conversions=[
+                _HashedRule(ClassificationRuleWrapper(c.source), _dump(c.model_dump()))
+                for c in (config.conversions.conversions or [])
+            ],
+        )
+
+    def for_asset(
+        self,
+        asset_wrapper: "AssetResponseWrapper",
+        tag_names: list[str],
+        album_names: list[str],
+    ) -> str:
+        asset_id = asset_wrapper.get_id()
+        parts = [self._global_hash]
+        for kind, entries in {
+            "rule": self._rules,
+            "conversion": self._conversions,
+        }.items():
+            for position, entry in enumerate(entries):
+                if entry.rule_wrapper.match_names(
+                    asset_id, tag_names, album_names
+                ).has_match():
+                    # The position matters: rules are evaluated in order
+                    parts.append(f"{kind}:{position}:{entry.rule_hash}")
+        return _digest(*parts)
+
+
+def _find_previous_journal() -> Optional[Path]:
+    from immich_autotag.config.internal_config import (
+        ASSET_FINGERPRINT_JOURNAL_MAX_AGE_HOURS,
+    )
+    from immich_autotag.run_output.manager import RunOutputManager
+
+    for run_exec in RunOutputManager.current().find_recent_run_dirs(
+        max_age_hours=ASSET_FINGERPRINT_JOURNAL_MAX_AGE_HOURS, same_shard_only=True
+    ):
+        candidate = run_exec.path / ASSET_FINGERPRINT_JOURNAL_FILENAME
+        if candidate.exists():
+            return candidate
+    return None
+
+
+@attrs.define(auto_attribs=True, slots=True)
+class AssetFingerprintJournal:
+    _path: Path
+    _config_fingerprinter: _ConfigFingerprinter = attrs.field(repr=False)
+    _conn: sqlite3.Connection = attrs.field(init=False, repr=False)
+    _lock: threading.Lock = attrs.field(factory=threading.Lock, init=False, repr=False)
+    # False when the run processes explicitly selected assets (focused filters)
+    _usable: bool = True
+    _pending_writes: int = attrs.field(default=0, init=False)
+    _skipped: int = attrs.field(default=0, init=False)
+
+    def __attrs_post_init__(self) -> None:
+        self._conn = sqlite3.connect(self._path, check_same_thread=False)
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    @staticmethod
+    def get_instance() -> Optional["AssetFingerprintJournal"]:
+        """
+        The journal of this run, or None when disabled (internal config) or when
+        the run processes explicitly selected assets (focused filters): those are
+        always processed.
+        """
+        global _instance
+        from immich_autotag.config.internal_config import (
+            ENABLE_ASSET_FINGERPRINT_JOURNAL,
+        )
+
+        if not ENABLE_ASSET_FINGERPRINT_JOURNAL:
+            return None
+        if _instance is None:
+            with _instance_lock:
+                if _instance is None:
+                    _instance = AssetFingerprintJournal._open()
+        return _instance if _instance._usable else None
+
+    @staticmethod
+    def _open() -> "AssetFingerprintJournal":
+        from immich_autotag.config.filter_wrapper import FilterConfigWrapper
+        from immich_autotag.config.manager import ConfigManager
+        from immich_autotag.run_output.manager import RunOutputManager
+
+        path = (
+            RunOutputManager.current()
+            .get_run_output_dir()
+            .get_custom_path(ASSET_FINGERPRINT_JOURNAL_FILENAME)
+        )
+        if not path.exists():
+            previous = _find_previous_journal()
+            if previous is not None:
+                shutil.copy2(previous, path)
+                log(
+                    f"[FINGERPRINT] Continuing journal from {previous}",
+                    level=LogLevel.PROGRESS,
+                )
+        config = ConfigManager.get_instance().get_config()
+        journal = AssetFingerprintJournal(
+            path=path,
+            config_fingerprinter=_ConfigFingerprinter.from_config(config),
+            usable=not FilterConfigWrapper.from_filter_config(
+                config.filters
+            ).is_focused(),
+        )
+        atexit.register(journal.close)
+        return journal
+
+    @typechecked
+    def compute(self, asset_wrapper: "AssetResponseWrapper") -> AssetFingerprint:
+        """The fingerprint of the asset as it is now in memory."""
+        context = asset_wrapper.get_context()
+        tag_names = sorted(asset_wrapper.get_tag_names())
+        albums = sorted(
+            (str(album.get_album_uuid()), album.get_album_name())
+            for album in context.get_albums_collection().albums_for_asset(asset_wrapper)
+        )
+        duplicates = context.get_duplicates_collection()
+        duplicate_id = duplicates.find_duplicate_id(asset_wrapper.get_id())
+        members = (
+            sorted(duplicates.get_group(duplicate_id).as_str_list())
+            if duplicate_id is not None
+            else []
+        )
+        inputs = _digest(
+            _dump(tag_names),
+            _dump(albums),
+            _dump([d.isoformat() for d in asset_wrapper.get_dates() if d is not None]),
+            _dump([str(duplicate_id), members]),
+            str(asset_wrapper.get_original_path()),
+        )
+        config = self._config_fingerprinter.for_asset(
+            asset_wrapper, tag_names, [name for _, name in albums]
+        )
+        return AssetFingerprint(inputs=inputs, config=config)
+
+    @typechecked
+    def is_unchanged(self, asset_wrapper: "AssetResponseWrapper") -> bool:
+        """True if the asset was processed before with these exact inputs and config."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT inputs, config FROM fingerprints WHERE asset_id = ?",
+                (str(asset_wrapper.get_id()),),
+            ).fetchone()
+        if row is None:
+            return False
+        unchanged = AssetFingerprint(inputs=row[0], config=row[1]) == self.compute(
+            asset_wrapper
+        )
+        if unchanged:
+            self._skipped += 1
+        return unchanged
+
+    @typechecked
+    def record(self, asset_wrapper: "AssetResponseWrapper", outcome: str) -> None:
+        """Stores the fingerprint of a successfully processed asset."""
+        fingerprint = self.compute(asset_wrapper)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO fingerprints VALUES (?, ?, ?, ?, ?)",
+                (
+                    str(asset_wrapper.get_id()),
+                    fingerprint.inputs,
+                    fingerprint.config,
+                    outcome,
+                    time.time(),
+                ),
+            )
+            self._pending_writes += 1
+            if self._pending_writes >= _COMMIT_EVERY:
+                self._conn.commit()
+                self._pending_writes = 0
+
+    @typechecked
+    def forget(self, asset_wrapper: "AssetResponseWrapper") -> None:
+        """Drops the asset's fingerprint so it is processed again next time."""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM fingerprints WHERE asset_id = ?",
+                (str(asset_wrapper.get_id()),),
+            )
+            self._pending_writes += 1
+
+    def get_skipped_count(self) -> int:
+        return self._skipped
+
+    def close(self) -> None:
+        with self._lock:
+            try:
+                self._conn.commit()
+                self._conn.close()
+            except sqlite3.ProgrammingError:
+                pass  # Already closed
+        if self._skipped:
+            log(
+                f"[FINGERPRINT] {self._skipped} unchanged assets were skipped",
+                level=LogLevel.PROGRESS,
+            )
@@ -11,6 +11,7 @@ from immich_autotag.report.modification_report import ModificationReport
 
 @typechecked
 def log_final_summary() -> None:
+    from immich_autotag.assets.asset_manager import AssetManager
     from immich_autotag.statistics.statistics_manager import StatisticsManager
 
     stats = StatisticsManager.get_instance().get_stats()
@@ -24,7 +25,7 @@ def log_final_summary() -> None:
     # Show modification type counts for better communication
     entry_type_counts = tag_mod_report.get_entry_type_counts()
     log(f"Modification type counts: {entry_type_counts}", level=LogLevel.DEBUG)
-    total_modifications = len(tag_mod_report.get_entries())
+    total_modifications = tag_mod_report.get_entry_count()
 
     # Build the complete report as a single string
     report_lines = [
@@ -33,6 +34,7 @@ def log_final_summary() -> None:
         "───────────────────────────────────────────────────────",
         f"Total assets processed: {count}",
         f"Total time: {total_time:.2f} s | Average per asset: {total_time/count if count else 0:.3f} s",
+        f"Asset cache: {AssetManager.get_instance().describe_cache()}",
         "───────────────────────────────────────────────────────",
         "MODIFICATIONS DETECTED",
         "───────────────────────────────────────────────────────",
@@ -51,6 +53,11 @@ def log_final_summary() -> None:
     # Print entire report in one call
     log("\n".join(report_lines), level=LogLevel.PROGRESS)
 
+    from immich_autotag.utils.perf.asset_phase_profiler import AssetPhaseProfiler
+
+    if AssetPhaseProfiler.is_enabled():
+        AssetPhaseProfiler.get_instance().log_final_report()
+
     # Flush report to file if needed
     if total_modifications > 0:
         tag_mod_report.flush()
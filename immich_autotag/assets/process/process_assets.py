@@ -16,6 +16,7 @@ from immich_autotag.assets.process.process_assets_threadpool import (
     process_assets_threadpool,
 )
 from immich_autotag.config.internal_config import USE_THREADPOOL
+from immich_autotag.config.sharding import get_current_shard
 from immich_autotag.context.immich_context import ImmichContext
 from immich_autotag.statistics.statistics_manager import StatisticsManager
 
@@ -24,6 +25,11 @@ from immich_autotag.statistics.statistics_manager import StatisticsManager
 def process_assets(context: ImmichContext) -> None:
     log_execution_parameters()
     total_assets = fetch_total_assets(context.get_client_wrapper().get_client())
+    shard = get_current_shard()
+    if shard is not None:
+        # Progress, ETA and end-of-cycle detection are relative to this shard
+        total_assets = shard.expected_share(total_assets)
+        StatisticsManager.get_instance().get_stats().extra["shard"] = str(shard)
     StatisticsManager.get_instance().initialize_for_run(total_assets)
 
     if USE_THREADPOOL:
@@ -4,12 +4,11 @@ from typeguard import typechecked
 
 from immich_autotag.assets.process.asset_process_report import AssetProcessReport
 from immich_autotag.assets.process.process_single_asset import process_single_asset
+from immich_autotag.assets.process.skip_asset_on_error import skip_asset_on_error
 from immich_autotag.config.manager import ConfigManager
 from immich_autotag.context.immich_context import ImmichContext
-from immich_autotag.errors.recoverable_error import categorize_error
 from immich_autotag.logging.levels import LogLevel
 from immich_autotag.logging.utils import log
-from immich_autotag.report.modification_report import ModificationReport
 from immich_autotag.statistics.statistics_manager import StatisticsManager
 
 
@@ -66,60 +65,14 @@ def process_assets_sequential(
                     level=LogLevel.DEBUG,
                 )
             except Exception as e:
-                # Categorize the error as recoverable or fatal
-                categorized = categorize_error(e)
-                is_recoverable = categorized.is_recoverable
-                category = categorized.category_name
-
-                # Check if we should continue on errors based on config
-                config = ConfigManager.get_instance().get_config()
-                fail_fast = config.performance.fail_fast_on_asset_errors
-                # Skip asset if error is recoverable OR if fail_fast is disabled
-                should_skip = is_recoverable or not fail_fast
-
-                if should_skip:
-                    import traceback
-
-                    tb = traceback.format_exc()
-                    asset_id = asset_wrapper.get_id()
-                    error_prefix = "[WARN]" if is_recoverable else "[ERROR]"
-                    log(
-                        f"{error_prefix} {category} - Skipping asset {asset_id}: {e}\nTraceback:\n{tb}",
-                        level=LogLevel.IMPORTANT,
-                    )
-                    from immich_autotag.report.modification_kind import ModificationKind
-
-                    tag_mod_report = ModificationReport.get_instance()
-                    if tag_mod_report:
-                        error_kind = (
-                            ModificationKind.ERROR_ASSET_SKIPPED_RECOVERABLE
-                            if is_recoverable
-                            else ModificationKind.ERROR_ASSET_SKIPPED_FATAL
-                        )
-                        tag_mod_report.add_error_modification(
-                            kind=error_kind,
-                            asset_wrapper=asset_wrapper,
-                            error_message=str(e),
-                            error_category=category,
-                            extra={"traceback": tb},
-                        )
-                    count += 1
-                    StatisticsManager.get_instance().update_checkpoint(
-                        last_processed_id=asset_wrapper.get_id(),
-                        count=skip_n + count,
-                    )
-                    continue
-                else:
-                    # Fatal error - re-raise immediately
-                    import traceback
-
-                    tb = traceback.format_exc()
-                    asset_id = asset_wrapper.get_id()
-                    log(
-                        f"[ERROR] {category} - Aborting at asset {asset_id}: {e}\nTraceback:\n{tb}",
-                        level=LogLevel.IMPORTANT,
-                    )
+                if not skip_asset_on_error(e, asset_wrapper.get_id(), asset_wrapper):
                     raise
+                count += 1
+                StatisticsManager.get_instance().update_checkpoint(
+                    last_processed_id=asset_wrapper.get_id(),
+                    count=skip_n + count,
+                )
+                continue
 
             asset_id = asset_wrapper.get_id()
             log(
@@ -0,0 +1,153 @@
+"""
+Focused mode (asset_links filters): processes only the linked assets.
+
+The linked assets are fetched concurrently ahead of processing
+(AssetManager.iter_assets_by_ids), so processing starts with the first asset
+that arrives. Every asset, including one that cannot be loaded, goes through the
+same error categorization as the main loop (skip_asset_on_error).
+
+Progress is checkpointed in focused_checkpoint.json in the run folder, keyed by a
+digest of the ordered link list: a later run over the same list resumes after
+the last asset recorded, as the main loop resumes from its checkpoint. The main
+loop's checkpoint (run statistics count, skip_n) is left untouched, since it
+counts positions in the whole library, not in a link list.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import time
+from typing import TYPE_CHECKING
+
+from pydantic import BaseModel
+from typeguard import typechecked
+
+from immich_autotag.logging.levels import LogLevel
+from immich_autotag.logging.utils import log
+from immich_autotag.types.uuid_wrappers import AssetUUID
+
+if TYPE_CHECKING:
+    from immich_autotag.context.immich_context import ImmichContext
+
+FOCUSED_CHECKPOINT_FILENAME = "focused_checkpoint.json"
+# The checkpoint is rewritten every this many assets (and when the loop ends)
+_SAVE_EVERY = 25
+# Same lookback as the main loop's checkpoint resume
+_RESUME_MAX_AGE_HOURS = 72
+
+
+class FocusedCheckpoint(BaseModel):
+    links_digest: str
+    total: int
+    # Assets of the list handled (processed or skipped on error), in list order
+    done: int = 0
+
+
+def _links_digest(asset_ids: list[AssetUUID]) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    for asset_id in asset_ids:
+        h.update(f"{asset_id}\n".encode("ascii"))
+    return h.hexdigest()
+
+
+def _save_checkpoint(checkpoint: FocusedCheckpoint) -> None:
+    from immich_autotag.run_output.manager import RunOutputManager
+
+    path = (
+        RunOutputManager.current()
+        .get_run_output_dir()
+        .get_custom_path(FOCUSED_CHECKPOINT_FILENAME)
+    )
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    try:
+        tmp_path.write_text(checkpoint.model_dump_json(), encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError as e:
+        log(f"[FOCUSED] Could not save checkpoint {path}: {e}", level=LogLevel.WARNING)
+
+
+def _find_resume_position(links_digest: str) -> int:
+    """
+    Assets of the list already handled by the most recent run over the same list,
+    or 0 when there is none, it completed the list, or resume is disabled.
+    """
+    from immich_autotag.config.manager import ConfigManager
+    from immich_autotag.run_output.manager import RunOutputManager
+
+    if not ConfigManager.is_checkpoint_resume_enabled():
+        return 0
+    for run_exec in RunOutputManager.current().find_recent_run_dirs(
+        max_age_hours=_RESUME_MAX_AGE_HOURS, same_shard_only=True
+    ):
+        path = run_exec.path / FOCUSED_CHECKPOINT_FILENAME
+        try:
+            previous = FocusedCheckpoint.model_validate_json(path.read_bytes())
+        except (OSError, ValueError):
+            continue
+        if previous.links_digest != links_digest:
+            continue
+        if previous.done >= previous.total:
+            return 0  # That run completed the list: start over
+        log(
+            f"[CHECKPOINT] Focused mode: resuming after {previous.done} of "
+            f"{previous.total} linked assets (from {run_exec.path})",
+            level=LogLevel.PROGRESS,
+        )
+        return previous.done
+    return 0
+
+
+@typechecked
+def process_focused_assets(context: "ImmichContext", asset_ids: list[AssetUUID]) -> int:
+    """
+    Processes the assets in `asset_ids` in order, resuming from the checkpoint of
+    a previous run over the same list. Returns how many assets were handled.
+    """
+    from immich_autotag.assets.process.process_single_asset import (
+        process_single_asset,
+    )
+    from immich_autotag.assets.process.skip_asset_on_error import (
+        skip_asset_on_error,
+    )
+
+    links_digest = _links_digest(asset_ids)
+    start = _find_resume_position(links_digest)
+    checkpoint = FocusedCheckpoint(
+        links_digest=links_digest, total=len(asset_ids), done=start
+    )
+    log(
+        f"[FOCUSED] Processing {len(asset_ids) - start} of {len(asset_ids)} "
+        f"linked asset(s) from filter rules",
+        level=LogLevel.PROGRESS,
+    )
+    t0 = time.time()
+    asset_manager = context.get_asset_manager()
+    try:
+        for fetched in asset_manager.iter_assets_by_ids(asset_ids[start:], context):
+            position = checkpoint.done + 1
+            try:
+                if fetched.error is not None:
+                    raise fetched.error
+                wrapper = fetched.wrapper
+                assert wrapper is not None
+                log(
+                    f"[PROGRESS] Processing asset {position}/{checkpoint.total}: "
+                    f"{fetched.asset_id} | Link: {wrapper.get_immich_photo_url().geturl()}",
+                    level=LogLevel.ASSET_SUMMARY,
+                )
+                process_single_asset(wrapper)
+            except Exception as e:
+                if not skip_asset_on_error(e, fetched.asset_id, fetched.wrapper):
+                    raise
+            checkpoint.done = position
+            if position % _SAVE_EVERY == 0:
+                _save_checkpoint(checkpoint)
+    finally:
+        _save_checkpoint(checkpoint)
+        log(
+            f"[FOCUSED] Handled {checkpoint.done - start} linked asset(s) in "
+            f"{time.time() - t0:.2f}s ({checkpoint.done}/{checkpoint.total} of the list)",
+            level=LogLevel.PROGRESS,
+        )
+    return checkpoint.done - start
@@ -15,12 +15,18 @@ from immich_autotag.assets.consistency_checks._album_date_consistency import (
 )
 from immich_autotag.assets.date_correction.core_logic import (
     AssetDateCorrector,
+    correct_duplicate_group_dates,
 )
 from immich_autotag.assets.duplicate_tag_logic import (
-    DuplicateTagAnalysisReport,
     analyze_duplicate_classification_tags,
+    analyze_duplicate_group_classification_tags,
 )
 from immich_autotag.assets.process.asset_process_report import AssetProcessReport
+from immich_autotag.assets.process.duplicate_group_processing import (
+    DuplicateGroupPhase,
+    run_duplicate_group_phase,
+)
+from immich_autotag.assets.process.process_step_result_protocol import ProcessStepResult
 from immich_autotag.config.manager import ConfigManager
 from immich_autotag.conversions.tag_conversions import TagConversions
 from immich_autotag.logging.levels import LogLevel
@@ -53,11 +59,13 @@ def _apply_tag_conversions(
 @typechecked
 def _correct_date_if_enabled(
     asset_wrapper: AssetResponseWrapper,
-) -> AssetDateCorrector | None:
+) -> ProcessStepResult | None:
     """Correct the asset date if the feature is enabled in config.
 
     Returns the AssetDateCorrector instance so that diagnostic information
     can be accessed at the upper level (format_diagnosis, get_reasoning, etc.)
+    For duplicates, the whole group is corrected by its first processed member
+    and the result is wrapped in a duplicate-group result.
     """
 
     config = ConfigManager.get_instance().get_config()
@@ -66,6 +74,13 @@ def _correct_date_if_enabled(
         raise ValueError("duplicate_processing configuration must not be None")
     if duplicate_processing.date_correction.enabled:
         log("[DEBUG] Correcting asset date...", level=LogLevel.FOCUS)
+        group_result = run_duplicate_group_phase(
+            DuplicateGroupPhase.DATE_CORRECTION,
+            asset_wrapper,
+            lambda: correct_duplicate_group_dates(asset_wrapper),
+        )
+        if group_result is not None:
+            return group_result
         corrector = AssetDateCorrector(asset_wrapper=asset_wrapper)
         corrector.execute()
         return corrector
@@ -75,8 +90,8 @@ def _correct_date_if_enabled(
 @typechecked
 def _analyze_duplicate_tags(
     asset_wrapper: AssetResponseWrapper,
-) -> DuplicateTagAnalysisReport | None:
-    """Analyze duplicate classification tags for the asset."""
+) -> ProcessStepResult | None:
+    """Analyze duplicate classification tags for the asset (once per group)."""
     from immich_autotag.config.internal_config import (
         FORCE_ENABLE_DUPLICATE_TAG_ANALYSIS,
     )
@@ -89,6 +104,13 @@ def _analyze_duplicate_tags(
         return None
 
     log("[DEBUG] Analyzing duplicate classification tags...", level=LogLevel.FOCUS)
+    group_result = run_duplicate_group_phase(
+        DuplicateGroupPhase.DUPLICATE_TAG_ANALYSIS,
+        asset_wrapper,
+        lambda: analyze_duplicate_group_classification_tags(asset_wrapper),
+    )
+    if group_result is not None:
+        return group_result
     return analyze_duplicate_classification_tags(asset_wrapper)
 
 
@@ -149,6 +171,62 @@ def _check_album_date_consistency_if_enabled(
     return check_album_date_consistency(asset_wrapper, tag_mod_report)
 
 
+@typechecked
+def _run_phases(
+    asset_wrapper: AssetResponseWrapper, report: AssetProcessReport
+) -> ModificationReport:
+    """Runs the analysis and tagging phases, adding their results to `report`."""
+    from contextlib import nullcontext
+    from typing import ContextManager
+
+    from immich_autotag.utils.perf.asset_phase_profiler import AssetPhaseProfiler
+
+    profiler = (
+        AssetPhaseProfiler.get_instance() if AssetPhaseProfiler.is_enabled() else None
+    )
+    asset_id = str(asset_wrapper.get_id())
+    asset_url = asset_wrapper.get_immich_photo_url().geturl()
+
+    def phase(name: str) -> ContextManager[None]:
+        if profiler is None:
+            return nullcontext()
+        return profiler.measure(name, asset_id, asset_url)
+
+    with phase("tag_conversions"):
+        result_01_tag_conversion = _apply_tag_conversions(asset_wrapper)
+    report.add_result(result_01_tag_conversion)
+
+    with phase("date_correction"):
+        result_02_date_correction = _correct_date_if_enabled(asset_wrapper)
+    report.add_result(result_02_date_correction)
+
+    with phase("duplicate_tag_analysis"):
+        result_03_duplicate_tag_analysis = _analyze_duplicate_tags(asset_wrapper)
+    report.add_result(result_03_duplicate_tag_analysis)
+
+    tag_mod_report = ModificationReport.get_instance()
+    with phase("album_assignment"):
+        result_04_album_assignment = _assign_album_if_enabled(
+            asset_wrapper,
+            tag_mod_report,
+        )
+    report.add_result(result_04_album_assignment)
+
+    with phase("classification_validation"):
+        result_05_validation = _validate_classification_if_enabled(asset_wrapper)
+    report.add_result(result_05_validation)
+
+    with phase("album_date_consistency"):
+        result_06_album_date_consistency = _check_album_date_consistency_if_enabled(
+            asset_wrapper, tag_mod_report
+        )
+    report.add_result(result_06_album_date_consistency)
+
+    if profiler is not None:
+        profiler.maybe_report()
+    return tag_mod_report
+
+
 @typechecked
 def process_single_asset(
     asset_wrapper: "AssetResponseWrapper",
@@ -175,35 +253,36 @@ def process_single_asset(
 
     # Execute each phase and store results in the typed report
     from immich_autotag.assets.process.asset_process_report import AssetProcessReport
-
-    report = AssetProcessReport(asset_wrapper=asset_wrapper)
-    result_01_tag_conversion = _apply_tag_conversions(asset_wrapper)
-
-    report.add_result(result_01_tag_conversion)
-    result_02_date_correction = _correct_date_if_enabled(asset_wrapper)
-
-    report.add_result(result_02_date_correction)
-    result_03_duplicate_tag_analysis = _analyze_duplicate_tags(asset_wrapper)
-
-    report.add_result(result_03_duplicate_tag_analysis)
-    tag_mod_report = ModificationReport.get_instance()
-    result_04_album_assignment = _assign_album_if_enabled(
-        asset_wrapper,
-        tag_mod_report,
+    from immich_autotag.assets.process.fingerprint_journal import (
+        AssetFingerprintJournal,
     )
-    report.add_result(result_04_album_assignment)
 
-    result_05_validation = _validate_classification_if_enabled(asset_wrapper)
-    report.add_result(result_05_validation)
-
-    result_06_album_date_consistency = _check_album_date_consistency_if_enabled(
-        asset_wrapper, tag_mod_report
-    )
-    report.add_result(result_06_album_date_consistency)
+    report = AssetProcessReport(asset_wrapper=asset_wrapper)
+    journal = AssetFingerprintJournal.get_instance()
+    if journal is not None and journal.is_unchanged(asset_wrapper):
+        log(
+            f"[FINGERPRINT] Asset {asset_id} unchanged since last run; skipping phases",
+            level=LogLevel.FOCUS,
+        )
+        StatisticsManager.get_instance().process_asset_tags(
+            asset_wrapper.get_tag_names()
+        )
+        return report
+    context = asset_wrapper.get_context()
+    # The group phases load every member of the duplicate group: keep them cached
+    with context.get_asset_manager().pinned_duplicate_group(asset_wrapper, context):
+        tag_mod_report = _run_phases(asset_wrapper, report)
 
     log(f"[PROCESS REPORT] {report.summary()}", level=LogLevel.ASSET_SUMMARY)
 
     tag_mod_report.flush()
+    if journal is not None:
+        if report.has_errors():
+            journal.forget(asset_wrapper)
+        else:
+            journal.record(
+                asset_wrapper, "changed" if report.has_changes() else "unchanged"
+            )
     StatisticsManager.get_instance().process_asset_tags(asset_wrapper.get_tag_names())
     log(
         f"[DEBUG] [process_single_asset] END asset_url={asset_url}",
@@ -0,0 +1,82 @@
+"""
+Targeted reprocessing after a classification rule / conversion edit.
+
+When the only difference with the previous run's config is in
+classification.rules or conversions.conversions (see config/rule_change_diff.py),
+only the assets touched by the changed criteria are processed (found through
+assets/candidate_assets.py). Each affected asset is processed once, through
+process_single_asset.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+from typeguard import typechecked
+
+from immich_autotag.config.rule_change_diff import RuleChangeSet
+from immich_autotag.logging.levels import LogLevel
+from immich_autotag.logging.utils import log
+
+if TYPE_CHECKING:
+    from immich_autotag.context.immich_context import ImmichContext
+
+
+@typechecked
+def plan_rule_change_reprocess() -> RuleChangeSet | None:
+    """
+    The change set to reprocess, or None when a regular sweep is needed: the
+    planner is disabled, there is no previous config dump, nothing changed, or
+    the edit is not limited to rules and conversions.
+    """
+    from immich_autotag.config.internal_config import ENABLE_RULE_CHANGE_PLANNER
+    from immich_autotag.config.manager import ConfigManager
+    from immich_autotag.config.rule_change_diff import (
+        diff_rule_changes,
+        load_previous_config_dump,
+    )
+
+    if not ENABLE_RULE_CHANGE_PLANNER:
+        return None
+    previous = load_previous_config_dump()
+    if previous is None:
+        return None
+    changes = diff_rule_changes(
+        previous.data, ConfigManager.get_instance().get_config()
+    )
+    if changes.is_empty():
+        return None
+    log(
+        f"[RULE_CHANGE] Config differs from {previous.path}: " f"{changes.describe()}",
+        level=LogLevel.PROGRESS,
+    )
+    if changes.requires_full_sweep():
+        return None
+    return changes
+
+
+@typechecked
+def reprocess_rule_change(context: "ImmichContext", changes: RuleChangeSet) -> int:
+    """Processes the assets affected by `changes`. Returns how many were processed."""
+    from immich_autotag.assets.candidate_assets import iter_candidate_assets
+    from immich_autotag.assets.process.process_single_asset import (
+        process_single_asset,
+    )
+
+    t0 = time.time()
+    count = 0
+    for asset_wrapper in iter_candidate_assets(
+        context,
+        tag_names=changes.tag_names,
+        album_name_patterns=changes.album_name_patterns,
+        asset_links=changes.asset_links,
+    ):
+        process_single_asset(asset_wrapper)
+        count += 1
+    log(
+        f"[RULE_CHANGE] Reprocessed {count} affected assets in {time.time() - t0:.2f}s "
+        f"instead of a full sweep",
+        level=LogLevel.PROGRESS,
+    )
+    return count
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+from typeguard import typechecked
+
+from immich_autotag.config.manager import ConfigManager
+from immich_autotag.errors.recoverable_error import categorize_error
+from immich_autotag.logging.levels import LogLevel
+from immich_autotag.logging.utils import log
+from immich_autotag.report.modification_report import ModificationReport
+from immich_autotag.types.uuid_wrappers import AssetUUID
+
+if TYPE_CHECKING:
+    from immich_autotag.assets.asset_response_wrapper import AssetResponseWrapper
+
+
+@typechecked
+def skip_asset_on_error(
+    e: Exception,
+    asset_id: AssetUUID,
+    asset_wrapper: Optional["AssetResponseWrapper"] = None,
+) -> bool:
+    """
+    Categorizes an error raised while loading or processing an asset. Recoverable
+    errors, and every error when performance.fail_fast_on_asset_errors is off, are
+    logged and recorded in the modification report: returns True and the caller
+    skips the asset. Otherwise the abort is logged and False is returned: the
+    caller re-raises.
+
+    Must be called from the `except` block handling `e` (its traceback is logged).
+    `asset_wrapper` is None when the asset itself could not be loaded.
+    """
+    import traceback
+
+    # Categorize the error as recoverable or fatal
+    categorized = categorize_error(e)
+    is_recoverable = categorized.is_recoverable
+    category = categorized.category_name
+
+    # Check if we should continue on errors based on config
+    config = ConfigManager.get_instance().get_config()
+    fail_fast = config.performance.fail_fast_on_asset_errors
+    # Skip asset if error is recoverable OR if fail_fast is disabled
+    should_skip = is_recoverable or not fail_fast
+
+    tb = traceback.format_exc()
+    if not should_skip:
+        # Fatal error - the caller re-raises immediately
+        log(
+            f"[ERROR] {category} - Aborting at asset {asset_id}: {e}\nTraceback:\n{tb}",
+            level=LogLevel.IMPORTANT,
+        )
+        return False
+
+    error_prefix = "[WARN]" if is_recoverable else "[ERROR]"
+    log(
+        f"{error_prefix} {category} - Skipping asset {asset_id}: {e}\nTraceback:\n{tb}",
+        level=LogLevel.IMPORTANT,
+    )
+    from immich_autotag.report.modification_kind import ModificationKind
+
+    tag_mod_report = ModificationReport.get_instance()
+    if tag_mod_report:
+        error_kind = (
+            ModificationKind.ERROR_ASSET_SKIPPED_RECOVERABLE
+            if is_recoverable
+            else ModificationKind.ERROR_ASSET_SKIPPED_FATAL
+        )
+        extra: dict[str, object] = {"traceback": tb}
+        if asset_wrapper is None:
+            extra["asset_id"] = str(asset_id)
+        tag_mod_report.add_error_modification(
+            kind=error_kind,
+            asset_wrapper=asset_wrapper,
+            error_message=str(e),
+            error_category=category,
+            extra=extra,
+        )
+    return True
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, Iterable, List
 
 import attrs
 from typeguard import typechecked
@@ -11,9 +11,13 @@ from immich_autotag.classification.classification_rule_wrapper import (
 )
 from immich_autotag.classification.match_result import MatchResult
 from immich_autotag.classification.match_result_list import MatchResultList
-from immich_autotag.context.immich_context import ImmichContext
 from immich_autotag.types.uuid_wrappers import AssetUUID
 
+if TYPE_CHECKING:
+    from immich_autotag.classification.name_classification import (
+        NameClassification,
+    )
+
 # Imports the MatchResult class from the new file
 
 
@@ -105,42 +109,17 @@ class ClassificationRuleSet:
         return False
 
     @typechecked
-    def get_filtered_in_assets_by_uuid(
-        self, context: ImmichContext
-    ) -> List["AssetResponseWrapper"]:
+    def get_filtered_in_asset_uuids(self) -> List[AssetUUID]:
         """
-        Extracts all UUIDs from asset_links of all rules,
-        loads the assets from the API and returns the list of AssetResponseWrapper.
+        All UUIDs from asset_links of all rules, in rule order, each UUID once.
         """
-
-        all_uuids: List[AssetUUID] = []
+        all_uuids: Dict[AssetUUID, None] = {}
         for rule_wrapper in self._rules:
             # Only add non-None AssetUUIDs
-            all_uuids.extend(
-                [
-                    uuid
-                    for uuid in rule_wrapper.extract_uuids_from_asset_links()
-                    if isinstance(uuid, AssetUUID)
-                ]
-            )
-
-        if not all_uuids:
-            return []
-
-        wrappers: List[AssetResponseWrapper] = []
-
-        for asset_uuid in all_uuids:
-            asset_wrapper = context.get_asset_manager().get_asset(asset_uuid, context)
-            if asset_wrapper is None:
-                raise RuntimeError(
-                    f"[ERROR] Asset with ID {asset_uuid} could not be loaded from API."
-                )
-            wrappers.append(asset_wrapper)
-
-        print(
-            f"[INFO] Filtered mode: Only processing {len(wrappers)} asset(s) from filter rules."
-        )
-        return wrappers
+            for uuid in rule_wrapper.extract_uuids_from_asset_links():
+                if isinstance(uuid, AssetUUID):
+                    all_uuids[uuid] = None
+        return list(all_uuids)
 
     @typechecked
     def match_asset(self, asset: "AssetResponseWrapper") -> list[MatchResult]:
@@ -155,6 +134,41 @@ class ClassificationRuleSet:
                 matches.append(match)
         return matches
 
+    @typechecked
+    def classify_names(
+        self,
+        asset_id: AssetUUID,
+        tag_names: Iterable[str],
+        album_names: Iterable[str],
+    ) -> "NameClassification":
+        """
+        Classifies plain asset data without a wrapper or API access (same
+        results as matching_rules() on the live asset, given each album name
+        once).
+        """
+        from immich_autotag.classification.classification_status import (
+            ClassificationStatus,
+        )
+        from immich_autotag.classification.name_classification import (
+            NameClassification,
+        )
+
+        tag_names = list(tag_names)
+        album_names = list(album_names)
+        num_rules_matched = 0
+        tags: list[str] = []
+        num_albums = 0
+        for rule_wrapper in self._rules:
+            name_match = rule_wrapper.match_names(asset_id, tag_names, album_names)
+            if name_match.has_match():
+                num_rules_matched += 1
+                tags.extend(name_match.tags_matched())
+                num_albums += len(name_match.albums_matched())
+        status = ClassificationStatus.from_counts(
+            num_rules_matched=num_rules_matched, num_albums=num_albums
+        )
+        return NameClassification(status=status, tags=tags)
+
     def get_rules(self) -> list[ClassificationRuleWrapper]:
         """
         Public method to access the list of rule wrappers.
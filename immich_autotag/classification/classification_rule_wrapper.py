@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable
 
 if TYPE_CHECKING:
     from immich_autotag.classification.match_result import MatchResult
+    from immich_autotag.classification.name_match import NameMatch
 
 from immich_autotag.config.dev_mode import is_crazy_debug_mode
 from immich_autotag.config.internal_config import DEFAULT_ERROR_MODE
@@ -88,22 +89,16 @@ class ClassificationRuleWrapper:
         log(f"album_names: {album_names}", level=LogLevel.TRACE)
         log(f"asset_url: {asset_url}", level=LogLevel.TRACE)
 
-        tags_matched = [tag for tag in asset_tags if self.has_tag(tag)]
-        log(f"tags_matched: {tags_matched}", level=LogLevel.TRACE)
-        albums_matched = [album for album in album_names if self.matches_album(album)]
-        log(f"albums_matched: {albums_matched}", level=LogLevel.TRACE)
-
-        # Check asset_links (UUIDs)
-        asset_link_uuids = self.extract_uuids_from_asset_links()
-        log(f"asset_link_uuids: {asset_link_uuids}", level=LogLevel.TRACE)
         asset_uuid = asset_wrapper.get_id()
         log(f"asset_uuid: {asset_uuid}", level=LogLevel.TRACE)
         # Also show the URL as a string in debug mode
         log(f"asset_url (string): {asset_url}", level=LogLevel.TRACE)
-        asset_links_matched = []
-        if asset_link_uuids:
-            if asset_uuid in asset_link_uuids:
-                asset_links_matched = [str(asset_uuid)]
+        name_match = self.match_names(asset_uuid, asset_tags, album_names)
+        tags_matched = name_match.tags_matched()
+        albums_matched = name_match.albums_matched()
+        asset_links_matched = name_match.asset_links_matched()
+        log(f"tags_matched: {tags_matched}", level=LogLevel.TRACE)
+        log(f"albums_matched: {albums_matched}", level=LogLevel.TRACE)
         log(f"asset_links_matched: {asset_links_matched}", level=LogLevel.TRACE)
 
         log(f"DEFAULT_ERROR_MODE: {DEFAULT_ERROR_MODE}", level=LogLevel.TRACE)
@@ -134,6 +129,32 @@ class ClassificationRuleWrapper:
             asset=asset_wrapper,
         )
 
+    @typechecked
+    def match_names(
+        self,
+        asset_id: AssetUUID,
+        tag_names: Iterable[str],
+        album_names: Iterable[str],
+    ) -> "NameMatch":
+        """
+        Matches this rule against plain asset data (no wrapper, no API access).
+        `album_names` holds each album name once, as get_album_names() of the
+        live asset does after deduplication.
+        """
+        from immich_autotag.classification.name_match import NameMatch
+
+        tags_matched = [tag for tag in tag_names if self.has_tag(tag)]
+        albums_matched = [album for album in album_names if self.matches_album(album)]
+        asset_links_matched: list[str] = []
+        asset_link_uuids = self.extract_uuids_from_asset_links()
+        if asset_link_uuids and asset_id in asset_link_uuids:
+            asset_links_matched = [str(asset_id)]
+        return NameMatch(
+            tags_matched=tags_matched,
+            albums_matched=albums_matched,
+            asset_links_matched=asset_links_matched,
+        )
+
     @typechecked
     def is_focused(self) -> bool:
         """
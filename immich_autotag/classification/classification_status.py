@@ -57,9 +57,20 @@ class ClassificationStatus(Enum):
             ClassificationStatus enum value indicating the asset's classification state.
         """
         # num_tags = len(match_results.tags())
-        num_albums = len(match_results.albums())
-        num_rules_matched = len(match_results.rules())
+        return ClassificationStatus.from_counts(
+            num_rules_matched=len(match_results.rules()),
+            num_albums=len(match_results.albums()),
+        )
 
+    @staticmethod
+    @typechecked
+    def from_counts(
+        *, num_rules_matched: int, num_albums: int
+    ) -> "ClassificationStatus":
+        """
+        Same decision as from_match_results, from the number of matched rules and
+        matched albums (used when matching plain data, e.g. a library snapshot).
+        """
         if num_rules_matched == 0:
             return ClassificationStatus.UNCLASSIFIED
         elif num_rules_matched == 1:
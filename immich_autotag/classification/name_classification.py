@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import attrs
+
+from immich_autotag.classification.classification_status import (
+    ClassificationStatus,
+)
+
+
+@attrs.define(auto_attribs=True, slots=True, frozen=True)
+class NameClassification:
+    """Classification of plain asset data (see ClassificationRuleSet.classify_names)."""
+
+    _status: ClassificationStatus
+    # Classification tags matched, as matching_rules() would report them
+    _tags: list[str] = attrs.field(factory=list)
+
+    def get_status(self) -> ClassificationStatus:
+        return self._status
+
+    def get_tags(self) -> list[str]:
+        return self._tags
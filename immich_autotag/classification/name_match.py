@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import attrs
+
+
+@attrs.define(auto_attribs=True, slots=True, frozen=True)
+class NameMatch:
+    """
+    What a rule matched on plain asset data (see ClassificationRuleWrapper
+    .match_names). Unlike MatchResult it may be empty and holds no asset.
+    """
+
+    _tags_matched: list[str] = attrs.field(factory=list)
+    _albums_matched: list[str] = attrs.field(factory=list)
+    _asset_links_matched: list[str] = attrs.field(factory=list)
+
+    def tags_matched(self) -> list[str]:
+        return self._tags_matched
+
+    def albums_matched(self) -> list[str]:
+        return self._albums_matched
+
+    def asset_links_matched(self) -> list[str]:
+        return self._asset_links_matched
+
+    def has_match(self) -> bool:
+        return bool(
+            self._tags_matched or self._albums_matched or self._asset_links_matched
+        )
@@ -8,6 +8,21 @@ USE_CACHE_ASSETS = False
 USE_CACHE_ALBUMS = USE_CACHE_ASSETS
 USE_CACHE_ALBUM_PAGES = USE_CACHE_ASSETS
 USE_CACHE_USERS = USE_CACHE_ASSETS
+# The tag catalog is persisted across runs and reconciled with the server, so it
+# is enabled independently of the debug caches above.
+USE_CACHE_TAGS = True
+# A persisted tag catalog younger than this is trusted without asking the server;
+# it is still reconciled on the first lookup miss.
+TAG_CATALOG_TRUST_SECONDS = 3600
+# Tags created during a run are written to the persisted catalog every this many
+# creations (and once when the run finishes), not after each one.
+TAG_CATALOG_SAVE_EVERY = 50
+# Write API cache entries with the compact binary codec (utils/cache_codec.py)
+# as <key>.bin instead of indented <key>.json. Legacy JSON entries are still read
+# and migrated to the binary format on first load.
+USE_BINARY_API_CACHE = True
+# Cache codec payloads at least this large (bytes) are zlib-compressed
+CACHE_CODEC_COMPRESS_MIN_BYTES = 4096
 
 
 # ==================== MULTITHREADING / CONCURRENCY ====================
@@ -16,6 +31,67 @@ USE_CACHE_USERS = USE_CACHE_ASSETS
 USE_THREADPOOL = False  # Set to True to force thread pool usage, False for direct loop
 # Sequential mode is usually faster for this workload, but you can experiment with USE_THREADPOOL for benchmarking.
 MAX_WORKERS = 1  # Set to 1 for sequential processing (recommended for best performance in this environment)
+# Load albums, tags, users and duplicates concurrently at startup (see
+# entrypoint/startup_orchestrator.py). If False, they are loaded one after another.
+ENABLE_PARALLEL_STARTUP = True
+# Threads used by the startup orchestrator (one per independent loading phase)
+STARTUP_MAX_WORKERS = 4
+# Use the asyncio proxies (api/immich_proxy/aio) for the bulk, I/O-bound loads:
+# full album load and search page prefetch. If False, the blocking proxies are used.
+ENABLE_ASYNC_API = True
+# Maximum concurrent requests in flight on the async event loop. Kept below the
+# httpx connection pool size (100) so requests never queue for a connection.
+ASYNC_MAX_IN_FLIGHT = 32
+# Search pages requested ahead of the page being processed by get_all_assets
+ASYNC_SEARCH_PAGE_PREFETCH = 2
+# Decode asset search pages, album info and duplicates with orjson into slotted
+# structs holding the fields the state classes read (api/immich_proxy/fast_dto.py).
+# The generated DTO is only built when another field is accessed. If False, the
+# responses are decoded by the generated immich_client models.
+ENABLE_FAST_DTO_DECODING = True
+# Coalesce identical album/asset info reads: concurrent requests for the same id
+# share one response, and responses are reused for READ_MEMO_TTL_SECONDS unless
+# one of our writes touched the entity (api/immich_proxy/read_coalescer.py).
+ENABLE_READ_COALESCING = True
+# Short on purpose: bounds how long changes made by other clients go unseen
+READ_MEMO_TTL_SECONDS = 30
+# Linked assets requested ahead of the one being processed in focused mode
+# (asset_links filters); they load on the async event loop during processing
+FOCUSED_ASSET_FETCH_AHEAD = 64
+# Threads applying album permission changes (sync_all_album_permissions)
+ALBUM_PERMISSIONS_MAX_WORKERS = 8
+# Album permission updates started per second across those threads (None: unlimited)
+ALBUM_PERMISSIONS_MAX_UPDATES_PER_SECOND: float | None = 10
+
+# ==================== SKIP UNCHANGED ASSETS ====================
+# Record a fingerprint of each processed asset (inputs + applicable config) and skip
+# the processing phases for assets whose fingerprint did not change since the
+# previous run (see assets/process/fingerprint_journal.py).
+ENABLE_ASSET_FINGERPRINT_JOURNAL = True
+# The journal of previous runs is only continued if the run is at most this old
+ASSET_FINGERPRINT_JOURNAL_MAX_AGE_HOURS = 30 * 24
+
+# ==================== RULE CHANGE PLANNER ====================
+# When the only config difference with the previous run is in classification.rules
+# or conversions.conversions, process only the assets touched by the changed
+# criteria instead of the whole library (see assets/process/rule_change_reprocess.py).
+# The next run (same config) performs the regular sweep again.
+ENABLE_RULE_CHANGE_PLANNER = True
+# Config dumps of runs older than this are not compared
+RULE_CHANGE_PLANNER_MAX_AGE_HOURS = 30 * 24
+
+# ==================== RUN OUTPUT CATALOG ====================
+# Persistent catalog of the run folders of logs_local (run_output/run_catalog.py):
+# lookups of previous runs (caches, checkpoints, skip_n) read it instead of
+# listing and parsing every run folder.
+ENABLE_RUN_CATALOG = True
+# Retention, applied in the background when a run starts: run folders older than
+# this are packed into logs_local/_compressed/<run>.tar.gz (None: never). Keep it
+# above the longest lookback (ASSET_FINGERPRINT_JOURNAL_MAX_AGE_HOURS,
+# RULE_CHANGE_PLANNER_MAX_AGE_HOURS).
+RUN_OUTPUT_COMPRESS_AFTER_DAYS: int | None = 45
+# Run folders and archives older than this are deleted (None: never)
+RUN_OUTPUT_DELETE_AFTER_DAYS: int | None = None
 
 # ==================== DEBUGGING / PROFILING / PERFORMANCE ====================
 # Error handling mode (affects debug/trace behavior)
@@ -24,10 +100,50 @@ DEFAULT_ERROR_MODE = ErrorHandlingMode.USER
 ENABLE_PROFILING = False  # Set to True to enable cProfile profiling
 # Enable tracemalloc memory profiling
 ENABLE_MEMORY_PROFILING = False  # Set to False to disable tracemalloc memory profiling
+# Time each phase of process_single_asset (wall time, API calls, cache hits) into
+# per-phase histograms (utils/perf/asset_phase_profiler.py), logged every
+# ASSET_PHASE_REPORT_INTERVAL_SECONDS and in the final summary with the
+# ASSET_PHASE_SLOWEST_N slowest assets of each phase.
+ENABLE_ASSET_PHASE_PROFILING = True
+ASSET_PHASE_REPORT_INTERVAL_SECONDS = 600
+ASSET_PHASE_SLOWEST_N = 5
+# Sampling profiler (utils/perf/sampling_profiler.py): wall-clock samples of every
+# thread plus CPU samples of the main thread, per PerfPhaseTracker phase, written
+# as collapsed stacks (flame graph input) to the run output folder. Light enough
+# to stay on in production runs, unlike ENABLE_PROFILING (cProfile).
+ENABLE_SAMPLING_PROFILER = True
+# Samples per second (odd, so sampling does not run in lockstep with periodic work)
+SAMPLING_PROFILER_HZ = 19
+SAMPLING_PROFILER_FLUSH_INTERVAL_SECONDS = 300
+# OpenMetrics export of the run progress (utils/perf/metrics_exporter.py):
+# throughput, ETA, phase, per-endpoint API requests and latency, cache hit rates,
+# modifications by kind and memory, rewritten atomically while the run progresses.
+ENABLE_METRICS_EXPORT = True
+METRICS_EXPORT_INTERVAL_SECONDS = 15
+# Textfile path (e.g. in node_exporter's textfile collector folder); None: metrics.prom
+# in the run output folder
+METRICS_TEXTFILE_PATH: str | None = None
+# Also serve the metrics on http://127.0.0.1:<port>/metrics; None: no endpoint
+METRICS_HTTP_PORT: int | None = None
 
 # ==================== MEMORY CONTROL ====================
 # Control whether assets are kept in memory (True = keep in memory, False = release after use)
 KEEP_ASSETS_IN_MEMORY = False  # Default False; set to True to keep assets in memory
+# With KEEP_ASSETS_IN_MEMORY=False, AssetManager still keeps the most recently used
+# assets (assets/asset_lru_cache.py), so duplicate group lookups stay in memory
+# with flat memory use. The current duplicate group is pinned. 0 disables it.
+ASSET_CACHE_MAX_ENTRIES = 2000
+# Memory governor (utils/perf/memory_governor.py): samples the process RSS and,
+# over budget, sheds the registered in-memory caches in priority order.
+# Per-cache sizes are logged with the progress.
+ENABLE_MEMORY_GOVERNOR = True
+# Budget in MiB; None: MEMORY_BUDGET_CGROUP_FRACTION of the container memory
+# limit (no budget, only reporting, if the container is not limited)
+MEMORY_BUDGET_MB = None
+MEMORY_BUDGET_CGROUP_FRACTION = 0.8
+# Shedding stops once RSS (minus the estimated size shed) is below this fraction
+MEMORY_BUDGET_LOW_WATERMARK = 0.85
+MEMORY_GOVERNOR_CHECK_INTERVAL_SECONDS = 5.0
 
 # ==================== ALBUM HANDLING / THRESHOLDS ====================
 # Number of errors in the window required to mark an album unavailable
@@ -49,6 +165,19 @@ MERGE_DUPLICATE_ALBUMS_ENABLED = (
 FORCED_LOG_LEVEL = (
     LogLevel.PROGRESS
 )  # Change to 'DEBUG' to force massive logging in development/CI
+# Full output log (utils/tee_logging.py). Async: stdout/stderr writes are queued and
+# a background thread writes the console and the log file in batches.
+TEE_LOG_ASYNC = True
+TEE_LOG_QUEUE_MAX_RECORDS = 100_000
+# When the queue is full: "block" (the writing thread waits) or "drop" (the text is
+# dropped, and the number of dropped writes logged)
+TEE_LOG_QUEUE_FULL_POLICY = "block"
+TEE_LOG_BATCH_MAX_RECORDS = 512
+# Rotate the log into gzip segments (<log>.1.gz newest) above this size; None: never
+TEE_LOG_ROTATE_MAX_BYTES: int | None = 256 * 1024 * 1024
+TEE_LOG_ROTATE_KEEP = 10
+# Gzip the full output logs of runs last written this long ago; None: never
+TEE_LOG_COMPRESS_OLD_RUNS_AFTER_HOURS: float | None = 24
 
 # ==================== ARCHITECTURE IMPORT HOOK CONTROL ====================
 # Set to True to enable architecture import hook, False to disable enforcement
@@ -57,6 +186,11 @@ ENABLE_ARCHITECTURE_IMPORT_HOOK = True
 # ==================== CONVERSIONS AT STARTUP ====================
 # Controls whether all conversions are applied to assets at application startup
 APPLY_CONVERSIONS_AT_START = False  # Set to False to disable mass processing at startup
+# Visit only each conversion's candidate assets (source tags via server-side search,
+# source albums via the album collection) instead of every asset of the library.
+ENABLE_TARGETED_CONVERSIONS = True
+# Assets per tag_assets call when adding a conversion's destination tags in bulk
+CONVERSION_BULK_TAG_CHUNK_SIZE = 500
 
 # ==================== CONVERSION OVERRIDES ====================
 # If set (True/False), this will override user config's conversions.enabled value.
@@ -108,6 +242,11 @@ FORCE_ENABLE_CLASSIFICATION_VALIDATION: bool | None = None
 # If None, normal processing flow is used.
 FORCE_ENABLE_DUPLICATE_TAG_ANALYSIS: bool | None = None
 
+# ==================== DUPLICATE GROUP PROCESSING ====================
+# If True, date correction and duplicate classification tag analysis run once per
+# duplicate group (when its first member is processed) instead of once per member.
+ENABLE_DUPLICATE_GROUP_PROCESSING = True
+
 # ==================== ALBUM DATE CONSISTENCY OVERRIDES ====================
 # If set (True/False), this enables or disables the album date consistency check phase.
 # If None, normal processing flow is used.
@@ -285,6 +285,38 @@ class PerformanceConfig(BaseModel):
     )
 
 
+class WatchConfig(BaseModel):
+    """
+    Resident (daemon) mode: after the initial run, keep running and process
+    assets and albums as they change instead of waiting for the next cron run.
+    """
+
+    model_config = {"extra": "forbid"}
+    description: Optional[str] = Field(
+        default=None,
+        description="Optional description for the watch mode configuration.",
+    )
+    enabled: bool = Field(
+        default=False,
+        description="Keep running after the initial run and process changes as they happen.",
+    )
+    poll_interval_seconds: int = Field(
+        default=60,
+        ge=1,
+        description="Seconds between polls for assets and albums changed since the last poll.",
+    )
+    full_sweep_interval_hours: float = Field(
+        default=24.0,
+        gt=0,
+        description="Hours between full reconciliation sweeps over all assets.",
+    )
+    max_cached_assets: int = Field(
+        default=50000,
+        ge=0,
+        description="Upper bound of asset wrappers kept in memory between polls.",
+    )
+
+
 class UserGroup(BaseModel):
     """
     Represents a logical group of users for album sharing.
@@ -424,3 +456,7 @@ class UserConfig(BaseModel):
     create_album_from_date_if_missing: bool = Field(
         default=False, description="Create album from date if missing."
     )
+    watch: Optional[WatchConfig] = Field(
+        default=None,
+        description="Resident watch (daemon) mode configuration. Disabled if missing.",
+    )
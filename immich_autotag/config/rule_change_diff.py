@@ -0,0 +1,181 @@
+"""
+Difference between the classification rules / conversions of this run and those
+of the previous run, as recorded in its config dump (ConfigManager.dump_to_yaml).
+
+A RuleChangeSet lists the criteria touched by the edit: tag names, album name
+patterns and asset links of every rule or conversion that was added, removed or
+modified (old and new versions alike, so assets leaving a rule are found too).
+The assets carrying those tags, in albums matching those patterns or linked
+directly are the only ones whose processing outcome can change.
+
+Edits to any other processing setting (autotags, date correction, duplicate
+processing, album detection...) affect every asset: the change set then carries
+a full-sweep reason instead.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+
+import attrs
+import yaml
+from typeguard import typechecked
+
+if TYPE_CHECKING:
+    from immich_autotag.config.models import UserConfig
+
+# Settings whose change affects every asset (the rule lists are compared apart)
+_GLOBAL_SECTIONS = (
+    "duplicate_processing",
+    "album_date_consistency",
+    "album_detection_from_folders",
+    "create_album_from_date_if_missing",
+    "enable_album_name_strip",
+)
+
+
+@attrs.define(auto_attribs=True, slots=True, frozen=True)
+class RuleChangeSet:
+    tag_names: frozenset[str] = frozenset()
+    album_name_patterns: frozenset[str] = frozenset()
+    asset_links: frozenset[str] = frozenset()
+    # Set when the edit is not limited to rules/conversions
+    full_sweep_reason: Optional[str] = None
+
+    def is_empty(self) -> bool:
+        return (
+            self.full_sweep_reason is None
+            and not self.tag_names
+            and not self.album_name_patterns
+            and not self.asset_links
+        )
+
+    def requires_full_sweep(self) -> bool:
+        return self.full_sweep_reason is not None
+
+    def matches_album_name(self, album_name: str) -> bool:
+        return any(re.match(p, album_name) for p in self.album_name_patterns)
+
+    def describe(self) -> str:
+        if self.full_sweep_reason is not None:
+            return f"full sweep ({self.full_sweep_reason})"
+        return (
+            f"tags={sorted(self.tag_names)}, "
+            f"album_patterns={sorted(self.album_name_patterns)}, "
+            f"asset_links={len(self.asset_links)}"
+        )
+
+
+def _canonical(item: Any) -> str:
+    return json.dumps(item, sort_keys=True, default=str)
+
+
+def _changed_items(old: Iterable[dict], new: Iterable[dict]) -> list[dict]:
+    """Items present in only one of the lists (a modified item is in both results)."""
+    old_by_key = {_canonical(i): i for i in old}
+    new_by_key = {_canonical(i): i for i in new}
+    return [i for k, i in old_by_key.items() if k not in new_by_key] + [
+        i for k, i in new_by_key.items() if k not in old_by_key
+    ]
+
+
+@attrs.define(auto_attribs=True, slots=True, frozen=True)
+class _RuleCriteria:
+    """Selection criteria of one dumped rule (or conversion source)."""
+
+    tag_names: list[str]
+    album_name_patterns: list[str]
+    asset_links: list[str]
+
+
+@attrs.define(auto_attribs=True, slots=True, frozen=True)
+class PreviousConfigDump:
+    """Config dump of a previous run, as loaded from `path`."""
+
+    path: Path
+    data: dict
+
+
+def _criteria_of(rule: dict) -> _RuleCriteria:
+    return _RuleCriteria(
+        tag_names=list(rule.get("tag_names") or []),
+        album_name_patterns=list(rule.get("album_name_patterns") or []),
+        asset_links=list(rule.get("asset_links") or []),
+    )
+
+
+@typechecked
+def diff_rule_changes(old_dump: dict, new_config: "UserConfig") -> RuleChangeSet:
+    """Compares the previous run's config dump with the current config."""
+    new_dump = new_config.model_dump(mode="json")
+    for section in _GLOBAL_SECTIONS:
+        if _canonical(old_dump.get(section)) != _canonical(new_dump.get(section)):
+            return RuleChangeSet(full_sweep_reason=f"'{section}' changed")
+    for section, list_key in (
+        ("classification", "rules"),
+        ("conversions", "conversions"),
+    ):
+        old_rest = {
+            k: v for k, v in (old_dump.get(section) or {}).items() if k != list_key
+        }
+        new_rest = {k: v for k, v in new_dump[section].items() if k != list_key}
+        if _canonical(old_rest) != _canonical(new_rest):
+            return RuleChangeSet(
+                full_sweep_reason=f"'{section}' settings other than {list_key} changed"
+            )
+
+    tags: set[str] = set()
+    patterns: set[str] = set()
+    links: set[str] = set()
+
+    def add(criteria: _RuleCriteria) -> None:
+        tags.update(criteria.tag_names)
+        patterns.update(criteria.album_name_patterns)
+        links.update(criteria.asset_links)
+
+    for rule in _changed_items(
+        (old_dump.get("classification") or {}).get("rules") or [],
+        new_dump["classification"]["rules"],
+    ):
+        add(_criteria_of(rule))
+    for conversion in _changed_items(
+        (old_dump.get("conversions") or {}).get("conversions") or [],
+        new_dump["conversions"]["conversions"],
+    ):
+        add(_criteria_of(conversion.get("source") or {}))
+        # Assets already converted carry the old destination tags/albums
+        destination = conversion.get("destination") or {}
+        tags.update(destination.get("tag_names") or [])
+        patterns.update(
+            f"^{re.escape(name)}$" for name in destination.get("album_names") or []
+        )
+    return RuleChangeSet(
+        tag_names=frozenset(tags),
+        album_name_patterns=frozenset(patterns),
+        asset_links=frozenset(links),
+    )
+
+
+@typechecked
+def load_previous_config_dump() -> Optional[PreviousConfigDump]:
+    """
+    The config dump of the most recent previous run of this shard that has one,
+    or None.
+    """
+    from immich_autotag.config.internal_config import RULE_CHANGE_PLANNER_MAX_AGE_HOURS
+    from immich_autotag.run_output.manager import RunOutputManager
+
+    for run_exec in RunOutputManager.current().find_recent_run_dirs(
+        max_age_hours=RULE_CHANGE_PLANNER_MAX_AGE_HOURS, same_shard_only=True
+    ):
+        path = run_exec.get_user_config_dump_path()
+        if not path.exists():
+            continue
+        with open(path, "r", encoding="utf-8") as f:
+            data = yaml.safe_load(f)
+        if isinstance(data, dict):
+            return PreviousConfigDump(path=path, data=data)
+    return None
@@ -0,0 +1,114 @@
+"""
+Horizontal sharding of the asset sweep.
+
+`--shard i/N` (or the IMMICH_AUTOTAG_SHARD=i/N environment variable, handy for
+containers) makes this process handle only the assets whose UUID hashes to
+shard i (1-based) out of N. Several processes or hosts started with the same N
+and different i cover the whole library exactly once between them.
+
+Each shard keeps its own run output directory (suffixed with the shard), its own
+ModificationReport, RunStatistics and checkpoint. run_output/shard_merge.py
+combines the shard outputs afterwards.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import sys
+from typing import Optional, Sequence
+
+import attrs
+from typeguard import typechecked
+
+from immich_autotag.types.uuid_wrappers import AssetUUID
+
+SHARD_CLI_FLAG = "--shard"
+SHARD_ENV_VAR = "IMMICH_AUTOTAG_SHARD"
+_SHARD_PATTERN = re.compile(r"^\s*(\d+)\s*/\s*(\d+)\s*$")
+_RUN_DIR_SUFFIX_PATTERN = re.compile(r"_shard(\d+)of(\d+)$")
+
+
+@attrs.define(auto_attribs=True, slots=True, frozen=True)
+class ShardSpec:
+    """Shard `index` (1-based) of `count` shards."""
+
+    index: int
+    count: int
+
+    def __attrs_post_init__(self) -> None:
+        if self.count < 1 or not 1 <= self.index <= self.count:
+            raise ValueError(
+                f"Invalid shard {self.index}/{self.count}: expected 1 <= i <= N"
+            )
+
+    @staticmethod
+    @typechecked
+    def parse(text: str) -> "ShardSpec":
+        match = _SHARD_PATTERN.match(text)
+        if match is None:
+            raise ValueError(f"Invalid shard '{text}': expected the form i/N, e.g. 2/4")
+        return ShardSpec(int(match.group(1)), int(match.group(2)))
+
+    @staticmethod
+    def from_run_dir_name(name: str) -> Optional["ShardSpec"]:
+        """The shard a run directory belongs to, or None for unsharded runs."""
+        match = _RUN_DIR_SUFFIX_PATTERN.search(name)
+        if match is None:
+            return None
+        return ShardSpec(int(match.group(1)), int(match.group(2)))
+
+    @typechecked
+    def owns(self, asset_id: AssetUUID) -> bool:
+        """
+        True if the asset belongs to this shard. The UUID bytes are hashed first:
+        time-ordered UUIDs would otherwise spread unevenly across shards.
+        """
+        digest = hashlib.blake2b(asset_id.to_uuid().bytes, digest_size=8).digest()
+        return int.from_bytes(digest, "big") % self.count == self.index - 1
+
+    def expected_share(self, total: int) -> int:
+        """Approximate number of assets of this shard in a library of `total`."""
+        return -(-total // self.count)
+
+    def get_run_dir_suffix(self) -> str:
+        return f"_shard{self.index}of{self.count}"
+
+    def __str__(self) -> str:
+        return f"{self.index}/{self.count}"
+
+
+def _shard_from_argv(argv: Sequence[str]) -> Optional[str]:
+    for position, arg in enumerate(argv):
+        if arg == SHARD_CLI_FLAG:
+            if position + 1 >= len(argv):
+                raise ValueError(f"{SHARD_CLI_FLAG} requires a value of the form i/N")
+            return argv[position + 1]
+        if arg.startswith(SHARD_CLI_FLAG + "="):
+            return arg.split("=", 1)[1]
+    return None
+
+
+_current: Optional[ShardSpec] = None
+_resolved = False
+
+
+def get_current_shard() -> Optional[ShardSpec]:
+    """
+    The shard of this process, from the command line or the environment
+    (command line wins). None when the run is not sharded.
+    """
+    global _current, _resolved
+    if not _resolved:
+        text = _shard_from_argv(sys.argv[1:]) or os.environ.get(SHARD_ENV_VAR)
+        _current = ShardSpec.parse(text) if text else None
+        _resolved = True
+    return _current
+
+
+def set_current_shard(shard: Optional[ShardSpec]) -> None:
+    """Overrides the shard of this process (e.g. when embedding the app)."""
+    global _current, _resolved
+    _current = shard
+    _resolved = True
@@ -40,5 +40,16 @@ class ImmichClientWrapper:
 
     def get_client(self) -> ImmichClient:
         if self._client is None:
-            self._client = self._build_client()
+            from immich_autotag.utils.perf.api_request_stats import ApiRequestStats
+            from immich_autotag.utils.perf.asset_phase_profiler import note_api_call
+
+            client = self._build_client()
+            # Per-thread request count for the per-phase asset profiling and
+            # per-endpoint stats for the metrics export. Only on the sync client:
+            # the async one requires coroutine hooks.
+            request_stats = ApiRequestStats.get_instance()
+            hooks = client.get_httpx_client().event_hooks
+            hooks["request"].extend((note_api_call, request_stats.on_request))
+            hooks["response"].append(request_stats.on_response)
+            self._client = client
         return self._client
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import threading
 from typing import TYPE_CHECKING
 
 import attrs
@@ -30,6 +31,14 @@ class ImmichContext:
         default=None
     )
     _asset_manager: "AssetManager | None" = attrs.field(default=None)
+    # Lazy getters may be reached concurrently from startup phase threads:
+    # one lock for creating the cheap singletons, one for the duplicates load
+    _instance_lock: threading.Lock = attrs.field(
+        factory=threading.Lock, init=False, repr=False
+    )
+    _duplicates_lock: threading.Lock = attrs.field(
+        factory=threading.Lock, init=False, repr=False
+    )
 
     def get_client_wrapper(self) -> "ImmichClientWrapper":
         from immich_autotag.context.immich_client_wrapper import ImmichClientWrapper
@@ -40,30 +49,57 @@ class ImmichContext:
 
     def get_albums_collection(self) -> "AlbumCollectionWrapper":
         if self._albums_collection is None:
-            from immich_autotag.albums.albums.album_collection_wrapper import (
-                AlbumCollectionWrapper,
-            )
+            with self._instance_lock:
+                from immich_autotag.albums.albums.album_collection_wrapper import (
+                    AlbumCollectionWrapper,
+                )
 
-            self._albums_collection = AlbumCollectionWrapper.get_instance()
+                if self._albums_collection is None:
+                    self._albums_collection = AlbumCollectionWrapper.get_instance()
         return self._albums_collection
 
     def get_tag_collection(self) -> "TagCollectionWrapper":
         if self._tag_collection is None:
-            from immich_autotag.tags.tag_collection_wrapper import TagCollectionWrapper
+            with self._instance_lock:
+                from immich_autotag.tags.tag_collection_wrapper import (
+                    TagCollectionWrapper,
+                )
 
-            self._tag_collection = TagCollectionWrapper.get_instance()
+                if self._tag_collection is None:
+                    self._tag_collection = TagCollectionWrapper.get_instance()
         return self._tag_collection
 
+    def _register_duplicates_memory(self) -> None:
+        from immich_autotag.utils.perf.memory_governor import register_cache
+
+        # Reported only: reloading the duplicates costs a full API fetch
+        register_cache(
+            "duplicates",
+            estimate=lambda: (
+                self._duplicates_collection.approx_size()
+                if self._duplicates_collection is not None
+                else 0
+            ),
+        )
+
     def get_duplicates_collection(self) -> "DuplicateCollectionWrapper":
         if self._duplicates_collection is None:
-            from immich_autotag.duplicates.load_duplicates_collection import (
-                load_duplicates_collection,
-            )
-
-            client = self.get_client_wrapper().get_client()
-            self._duplicates_collection = load_duplicates_collection(client)
+            with self._duplicates_lock:
+                if self._duplicates_collection is None:
+                    from immich_autotag.duplicates.load_duplicates_collection import (
+                        load_duplicates_collection,
+                    )
+
+                    client = self.get_client_wrapper().get_client()
+                    self._duplicates_collection = load_duplicates_collection(client)
+                    self._register_duplicates_memory()
         return self._duplicates_collection
 
+    def reset_duplicates_collection(self) -> None:
+        """Forgets the duplicates collection so the next access reloads it."""
+        with self._duplicates_lock:
+            self._duplicates_collection = None
+
     def get_asset_manager(self) -> "AssetManager":
         if self._asset_manager is None:
             from immich_autotag.assets.asset_manager import AssetManager
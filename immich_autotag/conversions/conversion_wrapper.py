@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterator, Sequence
 
 import attrs
 from typeguard import typechecked
@@ -14,6 +14,7 @@ from immich_autotag.report.modification_entries_list import ModificationEntriesL
 
 if TYPE_CHECKING:
     from immich_autotag.assets.asset_response_wrapper import AssetResponseWrapper
+    from immich_autotag.context.immich_context import ImmichContext
 
 
 @attrs.define(auto_attribs=True, slots=True, frozen=True, eq=True)
@@ -48,9 +49,46 @@ class ConversionWrapper:
         """Returns a DestinationWrapper for the conversion destination."""
         return DestinationWrapper(self.conversion.destination)
 
+    @typechecked
+    def iter_candidate_assets(
+        self, context: "ImmichContext"
+    ) -> Iterator["AssetResponseWrapper"]:
+        """
+        The only assets the source can match: those carrying a source tag, in an
+        album matching a source pattern, or linked by the source.
+        """
+        from immich_autotag.assets.candidate_assets import iter_candidate_assets
+
+        return iter_candidate_assets(
+            context,
+            tag_names=self.source_tags(),
+            album_name_patterns=self.source_album_patterns(),
+            asset_links=self.conversion.source.asset_links or [],
+        )
+
+    @typechecked
+    def apply_destination_tags_in_bulk(
+        self, asset_wrappers: Sequence["AssetResponseWrapper"]
+    ) -> ModificationEntriesList:
+        """
+        Adds the destination tags to the assets of `asset_wrappers` matching the
+        source, in bulk. Follow with apply_to_asset(..., skip_destination_tags=True)
+        per asset for albums and the MOVE removal.
+        """
+        source = self.get_source_wrapper()
+        matched = []
+        for asset_wrapper in asset_wrappers:
+            match_result = source.matches_asset(asset_wrapper)
+            if match_result is not None and match_result.is_match():
+                matched.append(asset_wrapper)
+        return self.get_destination_wrapper().apply_tags_in_bulk(matched)
+
     @typechecked
     def apply_to_asset(
-        self, asset_wrapper: "AssetResponseWrapper"
+        self,
+        asset_wrapper: "AssetResponseWrapper",
+        *,
+        skip_destination_tags: bool = False,
     ) -> ModificationEntriesList:
         """
         Applies the conversion on the asset_wrapper.
@@ -64,7 +102,9 @@ class ConversionWrapper:
         if source_matched:
             # Applies the destination action (add tags, albums, etc.)
             result_action = self.get_destination_wrapper()
-            action_changes = result_action.apply_action(asset_wrapper)
+            action_changes = result_action.apply_action(
+                asset_wrapper, include_tags=not skip_destination_tags
+            )
             changes = changes.extend(action_changes)
             # Depending on the conversion mode, removes the source tags/albums
             if self.conversion.mode == ConversionMode.MOVE and match_result is not None:
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Sequence
 
 import attrs
 from typeguard import typechecked
@@ -23,16 +23,17 @@ class DestinationWrapper:
 
     @typechecked
     def apply_action(
-        self, asset_wrapper: "AssetResponseWrapper"
+        self, asset_wrapper: "AssetResponseWrapper", *, include_tags: bool = True
     ) -> ModificationEntriesList:
         """
         Applies the destination action on the asset_wrapper.
         Adds all destination tags and adds the asset to all destination albums if not already present.
+        With include_tags=False the tags are skipped (already applied by apply_tags_in_bulk).
         Returns ModificationEntriesList containing all modifications created during the operation.
         """
         changes = ModificationEntriesList()
         # Add destination tags
-        for tag in self.get_tag_names():
+        for tag in self.get_tag_names() if include_tags else []:
             if not asset_wrapper.has_tag(tag_name=tag):
                 entries = asset_wrapper.add_tag_by_name(tag_name=tag)
                 if entries:
@@ -76,6 +77,67 @@ class DestinationWrapper:
                     raise
         return changes
 
+    @typechecked
+    def apply_tags_in_bulk(
+        self, asset_wrappers: Sequence["AssetResponseWrapper"]
+    ) -> ModificationEntriesList:
+        """
+        Adds every destination tag to those of `asset_wrappers` that lack it, with
+        one tag_assets call per tag (and per CONVERSION_BULK_TAG_CHUNK_SIZE assets)
+        instead of one per asset. Each addition is recorded per asset, as in
+        AssetResponseWrapper.add_tag_by_name.
+        """
+        from immich_autotag.api.immich_proxy.tags.tag_assets import proxy_tag_assets
+        from immich_autotag.config.internal_config import (
+            CONVERSION_BULK_TAG_CHUNK_SIZE,
+        )
+        from immich_autotag.report.modification_kind import ModificationKind
+        from immich_autotag.report.modification_report import ModificationReport
+        from immich_autotag.users.user_response_wrapper import UserResponseWrapper
+
+        changes = ModificationEntriesList()
+        if not asset_wrappers:
+            return changes
+        context = asset_wrappers[0].get_context()
+        client = context.get_client_wrapper().get_client()
+        tag_mod_report = ModificationReport.get_instance()
+        user_wrapper = UserResponseWrapper.load_current_user()
+        for tag_name in self.get_tag_names():
+            tag = context.get_tag_collection().create_tag_if_not_exists(
+                name=tag_name, client=client
+            )
+            missing = [a for a in asset_wrappers if not a.has_tag(tag_name=tag_name)]
+            for start in range(0, len(missing), CONVERSION_BULK_TAG_CHUNK_SIZE):
+                chunk = missing[start : start + CONVERSION_BULK_TAG_CHUNK_SIZE]
+                results = proxy_tag_assets(
+                    tag_id=tag.get_id(),
+                    client=client,
+                    asset_ids=[a.get_id() for a in chunk],
+                )
+                errors = {
+                    str(item.id): str(item.error)
+                    for item in results
+                    if not item.success
+                }
+                for asset_wrapper in chunk:
+                    error = errors.get(str(asset_wrapper.get_id()))
+                    if error is not None and "duplicate" in error.lower():
+                        continue  # Tagged meanwhile: nothing was added
+                    changes.append(
+                        tag_mod_report.add_modification(
+                            kind=(
+                                ModificationKind.ADD_TAG_TO_ASSET
+                                if error is None
+                                else ModificationKind.WARNING_TAG_ADDITION_TO_ASSET_FAILED
+                            ),
+                            asset_wrapper=asset_wrapper,
+                            tag=tag,
+                            user=user_wrapper,
+                            extra=None if error is None else {"error": error},
+                        )
+                    )
+        return changes
+
     def __attrs_post_init__(self):
         if not (self.get_tag_names() or self.get_album_names()):
             raise ValueError(
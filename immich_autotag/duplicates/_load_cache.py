@@ -1,4 +1,3 @@
-import pickle
 from pathlib import Path
 from typing import Optional
 
@@ -7,17 +6,18 @@ from typeguard import typechecked
 from immich_autotag.duplicates.duplicate_collection_wrapper import (
     DuplicateCollectionWrapper,
 )
+from immich_autotag.duplicates.duplicates_columnar_cache import DuplicatesColumnarCache
 
 
 @typechecked
 def load_cache(cache_path: Path) -> Optional[DuplicateCollectionWrapper]:
     """
-    Attempts to load the duplicates cache from the given file.
+    Attempts to open the duplicates cache from the given file.
+    Only the header is read; groups are looked up lazily in the mapped file.
     Returns the object or None if it fails.
     """
     try:
-        with open(cache_path, "rb") as f:
-            return pickle.load(f)
+        cache = DuplicatesColumnarCache.open(cache_path)
     except Exception as e:
         from immich_autotag.logging.levels import LogLevel
         from immich_autotag.logging.utils import log
@@ -26,3 +26,4 @@ def load_cache(cache_path: Path) -> Optional[DuplicateCollectionWrapper]:
             f"Could not load duplicates cache {cache_path}: {e}", level=LogLevel.WARNING
         )
         return None
+    return DuplicateCollectionWrapper.from_columnar_cache(cache)
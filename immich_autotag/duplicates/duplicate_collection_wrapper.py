@@ -1,17 +1,20 @@
-from typing import TYPE_CHECKING, Dict, Optional
+from typing import TYPE_CHECKING, Dict, Iterator, Optional
 from urllib.parse import ParseResult
 from uuid import UUID
 
 import attrs
-from immich_client.models.duplicate_response_dto import DuplicateResponseDto
 from typeguard import typechecked
 
+from immich_autotag.api.logging_proxy.types import DuplicateDto
 from immich_autotag.types.uuid_wrappers import AssetUUID, DuplicateUUID
 
 if TYPE_CHECKING:
     from immich_autotag.assets.asset_manager import AssetManager
     from immich_autotag.assets.asset_response_wrapper import AssetResponseWrapper
     from immich_autotag.context.immich_context import ImmichContext
+    from immich_autotag.duplicates.duplicates_columnar_cache import (
+        DuplicatesColumnarCache,
+    )
 
 
 @attrs.define(auto_attribs=True, slots=True, frozen=True)
@@ -34,6 +37,9 @@ class DuplicateAssetGroup:
 
     _assets: list[AssetUUID]
 
+    def as_uuid_list(self) -> list[AssetUUID]:
+        return list(self._assets)
+
     def as_str_list(self) -> list[str]:
         return [str(u) for u in self._assets]
 
@@ -49,14 +55,66 @@ class DuplicateCollectionWrapper:
     """
     Wrapper for the Immich duplicates database structure.
     Holds a mapping from duplicate_id (UUID) to DuplicateAssetGroup.
+
+    When backed by a DuplicatesColumnarCache, groups_by_duplicate_id stays empty
+    and groups are read on demand from the memory-mapped cache file.
     """
 
-    groups_by_duplicate_id: dict[DuplicateUUID, DuplicateAssetGroup]
+    groups_by_duplicate_id: dict[DuplicateUUID, DuplicateAssetGroup] = attrs.field(
+        factory=dict
+    )
+    _columnar_cache: Optional["DuplicatesColumnarCache"] = attrs.field(
+        default=None, repr=False
+    )
+
+    @classmethod
+    @typechecked
+    def from_columnar_cache(
+        cls: type["DuplicateCollectionWrapper"], cache: "DuplicatesColumnarCache"
+    ) -> "DuplicateCollectionWrapper":
+        """Builds a wrapper that reads groups lazily from a mapped cache file."""
+        return cls(columnar_cache=cache)
+
+    def approx_size(self) -> int:
+        """Approximate bytes held in memory (a columnar cache is memory-mapped)."""
+        from immich_autotag.utils.perf.memory_governor import approx_collection_size
+
+        return approx_collection_size(
+            self.groups_by_duplicate_id.items(), len(self.groups_by_duplicate_id)
+        )
+
+    def group_count(self) -> int:
+        if self._columnar_cache is not None:
+            return self._columnar_cache.group_count()
+        return len(self.groups_by_duplicate_id)
+
+    def asset_count(self) -> int:
+        if self._columnar_cache is not None:
+            return self._columnar_cache.asset_count()
+        return sum(len(g) for g in self.groups_by_duplicate_id.values())
+
+    def iter_groups(self) -> Iterator[tuple[DuplicateUUID, list[AssetUUID]]]:
+        """Streams all (duplicate_id, asset_ids) pairs without materializing groups."""
+        if self._columnar_cache is not None:
+            yield from self._columnar_cache.iter_groups()
+            return
+        for duplicate_id, group in self.groups_by_duplicate_id.items():
+            yield duplicate_id, group.as_uuid_list()
+
+    @typechecked
+    def find_duplicate_id(self, asset_id: AssetUUID) -> Optional[DuplicateUUID]:
+        """Returns the duplicate group of an asset (reverse index), or None."""
+        if self._columnar_cache is not None:
+            return self._columnar_cache.find_duplicate_id(asset_id)
+        for duplicate_id, group in self.groups_by_duplicate_id.items():
+            if asset_id in group.as_uuid_list():
+                return duplicate_id
+        return None
 
     @classmethod
     @typechecked
     def from_api_response(
-        cls: type["DuplicateCollectionWrapper"], data: list[DuplicateResponseDto]
+        cls: type["DuplicateCollectionWrapper"], data: list[DuplicateDto]
     ) -> "DuplicateCollectionWrapper":
         """
         Builds the duplicate mapping from the API response, using duplicate_id as key and the asset list as DuplicateAssetGroup.
@@ -71,7 +129,24 @@ class DuplicateCollectionWrapper:
     @typechecked
     def get_group(self, duplicate_id: DuplicateUUID) -> DuplicateAssetGroup:
         """Return the DuplicateAssetGroup for a given duplicate_id. Empty if not found."""
-        return self.groups_by_duplicate_id.get(duplicate_id, DuplicateAssetGroup([]))
+        group = self.groups_by_duplicate_id.get(duplicate_id)
+        if group is not None:
+            return group
+        if self._columnar_cache is None:
+            return DuplicateAssetGroup([])
+        return DuplicateAssetGroup(
+            self._columnar_cache.get_group_asset_ids(duplicate_id)
+        )
+
+    @typechecked
+    def get_assets_needed_again(
+        self, duplicate_id: DuplicateUUID, processed_asset_id: AssetUUID
+    ) -> list[AssetUUID]:
+        """
+        The other members of a duplicate group: each looks the whole group up
+        again when its own turn comes, so they are worth keeping in memory.
+        """
+        return [a for a in self.get_group(duplicate_id) if a != processed_asset_id]
 
     @typechecked
     def get_duplicate_asset_links(
@@ -1,2 +1,3 @@
 # Common constant for the duplicates cache filename
-DUPLICATES_CACHE_FILENAME = "duplicates_cache.pkl"
+# (columnar format, see duplicates_columnar_cache.py)
+DUPLICATES_CACHE_FILENAME = "duplicates_cache.dupc"
@@ -0,0 +1,230 @@
+"""
+Compact, memory-mappable on-disk format for the duplicates cache.
+
+Replaces the whole-object pickle of DuplicateCollectionWrapper: opening the
+file only reads a fixed-size header (O(1)), lookups binary-search fixed-width
+records directly in the mapped file, and nothing is unpickled (no code
+execution risk). The format scales to libraries of any size.
+
+Layout (little-endian), sections follow each other right after the header:
+
+    header          magic(8) version(u32) reserved(u32) n_groups(u64) n_assets(u64)
+    group_ids       n_groups x 16 bytes, sorted            -> binary search
+    group_offsets   (n_groups + 1) x u64                   -> slice of asset_ids
+    asset_ids       n_assets x 16 bytes, one contiguous slice per group
+    reverse_ids     n_assets x 16 bytes, sorted            -> binary search
+    reverse_groups  n_assets x u32, index into group_ids   -> asset -> group
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, Optional, Sequence
+from uuid import UUID
+
+import attrs
+from typeguard import typechecked
+
+from immich_autotag.types.uuid_wrappers import AssetUUID, DuplicateUUID
+
+_MAGIC = b"IADUPCOL"
+FORMAT_VERSION = 1
+_HEADER = struct.Struct("<8sIIQQ")
+_ID_SIZE = 16
+_OFFSET = struct.Struct("<Q")
+_GROUP_INDEX = struct.Struct("<I")
+
+
+class DuplicatesCacheFormatError(Exception):
+    """Raised when a duplicates cache file is not in the expected format."""
+
+
+def _write_atomic(path: Path, chunks: Iterable[bytes]) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        for chunk in chunks:
+            f.write(chunk)
+    os.replace(tmp_path, path)
+
+
+def _encode(groups: Iterable[tuple[bytes, Sequence[bytes]]]) -> Iterator[bytes]:
+    """Serialize (group_id, asset_ids) pairs, already sorted by group_id."""
+    group_ids: list[bytes] = []
+    slices: list[Sequence[bytes]] = []
+    for group_id, asset_ids in groups:
+        group_ids.append(group_id)
+        slices.append(asset_ids)
+    n_assets = sum(len(s) for s in slices)
+    yield _HEADER.pack(_MAGIC, FORMAT_VERSION, 0, len(group_ids), n_assets)
+    yield b"".join(group_ids)
+    offsets = bytearray()
+    position = 0
+    for asset_ids in slices:
+        offsets += _OFFSET.pack(position)
+        position += len(asset_ids)
+    offsets += _OFFSET.pack(position)
+    yield bytes(offsets)
+    for asset_ids in slices:
+        yield b"".join(asset_ids)
+    reverse = sorted(
+        (asset_id, group_index)
+        for group_index, asset_ids in enumerate(slices)
+        for asset_id in asset_ids
+    )
+    yield b"".join(asset_id for asset_id, _ in reverse)
+    yield b"".join(_GROUP_INDEX.pack(group_index) for _, group_index in reverse)
+
+
+@attrs.define(auto_attribs=True, slots=True)
+class DuplicatesColumnarCache:
+    """
+    Read-only view over a duplicates cache file mapped in memory.
+    Use open() to map an existing file and write() to produce one.
+    """
+
+    _path: Path
+    _file: BinaryIO = attrs.field(repr=False)
+    _mm: mmap.mmap = attrs.field(repr=False)
+    _n_groups: int
+    _n_assets: int
+    _group_ids_at: int = attrs.field(init=False, repr=False)
+    _offsets_at: int = attrs.field(init=False, repr=False)
+    _assets_at: int = attrs.field(init=False, repr=False)
+    _reverse_ids_at: int = attrs.field(init=False, repr=False)
+    _reverse_groups_at: int = attrs.field(init=False, repr=False)
+
+    def __attrs_post_init__(self) -> None:
+        self._group_ids_at = _HEADER.size
+        self._offsets_at = self._group_ids_at + self._n_groups * _ID_SIZE
+        self._assets_at = self._offsets_at + (self._n_groups + 1) * _OFFSET.size
+        self._reverse_ids_at = self._assets_at + self._n_assets * _ID_SIZE
+        self._reverse_groups_at = self._reverse_ids_at + self._n_assets * _ID_SIZE
+        expected_size = self._reverse_groups_at + self._n_assets * _GROUP_INDEX.size
+        if len(self._mm) != expected_size:
+            raise DuplicatesCacheFormatError(
+                f"Truncated duplicates cache {self._path}: "
+                f"{len(self._mm)} bytes, expected {expected_size}"
+            )
+
+    # --- construction ---
+
+    @staticmethod
+    @typechecked
+    def open(path: Path) -> "DuplicatesColumnarCache":
+        """Map `path` and validate its header. Does not read the sections."""
+        f = open(path, "rb")
+        try:
+            if os.fstat(f.fileno()).st_size < _HEADER.size:
+                raise DuplicatesCacheFormatError(f"Not a duplicates cache: {path}")
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            f.close()
+            raise
+        magic, version, _, n_groups, n_assets = _HEADER.unpack_from(mm, 0)
+        if magic != _MAGIC or version != FORMAT_VERSION:
+            mm.close()
+            f.close()
+            raise DuplicatesCacheFormatError(
+                f"Unsupported duplicates cache {path} (magic={magic!r}, "
+                f"version={version})"
+            )
+        return DuplicatesColumnarCache(path, f, mm, n_groups, n_assets)
+
+    @staticmethod
+    @typechecked
+    def write(
+        path: Path, groups: Iterable[tuple[DuplicateUUID, Sequence[AssetUUID]]]
+    ) -> None:
+        """Write a new cache file atomically from (duplicate_id, asset_ids) pairs."""
+        encoded = sorted(
+            (group_id.to_uuid().bytes, [a.to_uuid().bytes for a in asset_ids])
+            for group_id, asset_ids in groups
+        )
+        _write_atomic(path, _encode(encoded))
+
+    def close(self) -> None:
+        self._mm.close()
+        self._file.close()
+
+    # --- low-level access ---
+
+    def _group_id_bytes(self, index: int) -> bytes:
+        start = self._group_ids_at + index * _ID_SIZE
+        return self._mm[start : start + _ID_SIZE]
+
+    def _asset_id_bytes_of(self, index: int) -> list[bytes]:
+        (begin,) = _OFFSET.unpack_from(
+            self._mm, self._offsets_at + index * _OFFSET.size
+        )
+        (end,) = _OFFSET.unpack_from(
+            self._mm, self._offsets_at + (index + 1) * _OFFSET.size
+        )
+        base = self._assets_at
+        return [
+            self._mm[base + k * _ID_SIZE : base + (k + 1) * _ID_SIZE]
+            for k in range(begin, end)
+        ]
+
+    def _bisect(self, section_at: int, count: int, key: bytes) -> Optional[int]:
+        lo, hi = 0, count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = section_at + mid * _ID_SIZE
+            if self._mm[start : start + _ID_SIZE] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        start = section_at + lo * _ID_SIZE
+        if lo < count and self._mm[start : start + _ID_SIZE] == key:
+            return lo
+        return None
+
+    # --- queries ---
+
+    def group_count(self) -> int:
+        return self._n_groups
+
+    def asset_count(self) -> int:
+        return self._n_assets
+
+    @typechecked
+    def get_group_asset_ids(self, duplicate_id: DuplicateUUID) -> list[AssetUUID]:
+        """Asset IDs of a duplicate group (empty if unknown). O(log groups)."""
+        index = self._bisect(
+            self._group_ids_at, self._n_groups, duplicate_id.to_uuid().bytes
+        )
+        if index is None:
+            return []
+        return [
+            AssetUUID.from_uuid(UUID(bytes=b)) for b in self._asset_id_bytes_of(index)
+        ]
+
+    @typechecked
+    def find_duplicate_id(self, asset_id: AssetUUID) -> Optional[DuplicateUUID]:
+        """Duplicate group an asset belongs to (None if none). O(log assets)."""
+        position = self._bisect(
+            self._reverse_ids_at, self._n_assets, asset_id.to_uuid().bytes
+        )
+        if position is None:
+            return None
+        (group_index,) = _GROUP_INDEX.unpack_from(
+            self._mm, self._reverse_groups_at + position * _GROUP_INDEX.size
+        )
+        return DuplicateUUID.from_uuid(UUID(bytes=self._group_id_bytes(group_index)))
+
+    def iter_groups(self) -> Iterator[tuple[DuplicateUUID, list[AssetUUID]]]:
+        """Stream all groups in group-id order."""
+        for index in range(self._n_groups):
+            yield (
+                DuplicateUUID.from_uuid(UUID(bytes=self._group_id_bytes(index))),
+                [
+                    AssetUUID.from_uuid(UUID(bytes=b))
+                    for b in self._asset_id_bytes_of(index)
+                ],
+            )
+
+    def get_path(self) -> Path:
+        return self._path
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from pathlib import Path
+
 from typeguard import typechecked
 
 from immich_autotag.api.logging_proxy.duplicates.get_asset_duplicates import (
@@ -13,106 +15,79 @@ from immich_autotag.duplicates.duplicate_collection_wrapper import (
     DuplicateCollectionWrapper,
 )
 from immich_autotag.duplicates.duplicates_cache_file import DuplicatesCacheFile
+from immich_autotag.duplicates.duplicates_columnar_cache import DuplicatesColumnarCache
 from immich_autotag.types.client_types import ImmichClient
 
+# A cache younger than this is used as-is, without asking the server
+_CACHE_FRESH_HOURS = 3
+
+
+@typechecked
+def _write_cache(
+    duplicates_collection: DuplicateCollectionWrapper, cache_path: Path
+) -> None:
+    """
+    Writes the whole columnar cache from the collection just loaded from the
+    server (a full refresh: the server API has no "changed since" query, so every
+    group is fetched and encoded again).
+    """
+    from immich_autotag.logging.levels import LogLevel
+    from immich_autotag.logging.utils import log
+
+    DuplicatesColumnarCache.write(cache_path, duplicates_collection.iter_groups())
+    log(
+        f"Duplicates cached to {cache_path.resolve()} "
+        f"(groups={duplicates_collection.group_count()}, "
+        f"assets={duplicates_collection.asset_count()})",
+        level=LogLevel.INFO,
+    )
+
 
 @typechecked
 def load_duplicates_collection(client: ImmichClient) -> DuplicateCollectionWrapper:
     """
-    Loads the duplicate collection from the Immich server and prints timing information.
+    Loads the duplicate collection from a recent cache or from the Immich server,
+    and prints timing information. The result is backed by the memory-mapped
+    columnar cache whenever it could be written or opened.
     """
     import time
 
-    cache_fresh_hours = 3
+    from immich_autotag.logging.levels import LogLevel
+    from immich_autotag.logging.utils import log
 
-    cache_path = find_recent_duplicates_cache(cache_fresh_hours)
-    duplicates_collection = None
+    cache_path = find_recent_duplicates_cache(_CACHE_FRESH_HOURS)
     if cache_path:
-        duplicates_collection = load_cache(cache_path)
-        if duplicates_collection:
-            from immich_autotag.logging.levels import LogLevel
-            from immich_autotag.logging.utils import log
-
+        cached = load_cache(cache_path)
+        if cached is not None:
             log(f"Loaded duplicates from cache ({cache_path})", level=LogLevel.INFO)
-    if duplicates_collection is None:
-        from immich_autotag.logging.levels import LogLevel
-        from immich_autotag.logging.utils import log
+            return cached
 
-        log(
-            "Requesting duplicates from Immich server... (this may take a while)",
-            level=LogLevel.INFO,
-        )
-        t0 = time.perf_counter()
-        duplicates_loader = DuplicatesLoader(client=client)
-        duplicates_collection = duplicates_loader.load()
-        t1 = time.perf_counter()
-        log(
-            f"Duplicates loaded in {t1-t0:.2f} s. Total groups: {len(duplicates_collection.groups_by_duplicate_id)}",
-            level=LogLevel.INFO,
-        )
-        # Save the cache in the current execution directory.
-        # Avoid writing extremely large caches in CI or when the collection is huge.
-        from immich_autotag.context.immich_context import ImmichContext
-
-        cache_file = DuplicatesCacheFile(
-            run_execution=ImmichContext.get_run_output_dir()
-        )
-        cache_path = cache_file.path
-        import pickle
+    log(
+        "Requesting duplicates from Immich server... (this may take a while)",
+        level=LogLevel.INFO,
+    )
+    t0 = time.perf_counter()
+    duplicates_loader = DuplicatesLoader(client=client)
+    duplicates_collection = duplicates_loader.load()
+    t1 = time.perf_counter()
+    log(
+        f"Duplicates loaded in {t1-t0:.2f} s. "
+        f"Total groups: {duplicates_collection.group_count()}",
+        level=LogLevel.INFO,
+    )
 
-        try:
-            # Estimate size by counting groups and assets; avoid full serialization if huge.
-            total_groups = len(duplicates_collection.groups_by_duplicate_id)
-            total_assets = sum(
-                len(g.assets)
-                for g in duplicates_collection.groups_by_duplicate_id.values()
-            )
-        except Exception:
-            total_groups = -1
-            total_assets = -1
+    # Save the cache in the current execution directory
+    from immich_autotag.context.immich_context import ImmichContext
 
-        # Thresholds (tunable): if exceeded, skip writing the full pickle to avoid huge files.
-        # Thresholds (tunable): if exceeded, skip writing the full pickle to avoid huge files.
-        # Increased thresholds to ensure cache is written for typical user libraries
-        GROUPS_THRESHOLD = 500000
-        ASSETS_THRESHOLD = 1000000
-
-        if (0 <= total_groups <= GROUPS_THRESHOLD) and (
-            0 <= total_assets <= ASSETS_THRESHOLD
-        ):
-            with open(cache_path, "wb") as f:
-                pickle.dump(duplicates_collection, f)
-            log(
-                f"Duplicates cached to {cache_path.resolve()} (groups={total_groups}, assets={total_assets})",
-                level=LogLevel.INFO,
-            )
-        else:
-            # Instead of serializing the full collection, write a small summary file
-            # containing counts and a limited sample of group ids to help diagnostics.
-            try:
-                import json
-                from typing import Any, Dict
-
-                sample_limit = 100
-                sample_group_ids = list(
-                    duplicates_collection.groups_by_duplicate_id.keys()
-                )[:sample_limit]
-                summary: Dict[str, Any] = {
-                    "groups": total_groups,
-                    "assets": total_assets,
-                    "sample_group_ids": sample_group_ids,
-                }
-                summary_path = cache_path.with_suffix(".summary.json")
-                with open(summary_path, "w", encoding="utf-8") as sf:
-                    json.dump(summary, sf, ensure_ascii=False)
-                log(
-                    f"Skipped full duplicates pickle (too large). Wrote summary to {summary_path}",
-                    level=LogLevel.INFO,
-                )
-            except Exception:
-                log(
-                    f"Skipping caching duplicates to {cache_path} because collection is large "
-                    f"(groups={total_groups}, assets={total_assets}). Set a higher threshold if you need caching.",
-                    level=LogLevel.INFO,
-                )
-    return duplicates_collection
+    cache_file = DuplicatesCacheFile(run_execution=ImmichContext.get_run_output_dir())
+    try:
+        _write_cache(duplicates_collection, cache_file.path)
+        cache = DuplicatesColumnarCache.open(cache_file.path)
+    except Exception as e:
+        log(
+            f"Could not write duplicates cache {cache_file.path}: {e}",
+            level=LogLevel.WARNING,
+        )
+        return duplicates_collection
+    # Serve lookups from the mapped file and drop the in-memory mapping
+    return DuplicateCollectionWrapper.from_columnar_cache(cache)
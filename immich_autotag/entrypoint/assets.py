@@ -16,14 +16,28 @@ def process_assets_or_filtered(manager: ConfigManager, context: ImmichContext) -
     )
 
     if filter_wrapper.is_focused():
-        ruleset = filter_wrapper.get_filter_in_ruleset()
-        assets_to_process = ruleset.get_filtered_in_assets_by_uuid(context)
-        from immich_autotag.assets.process.process_single_asset import (
-            process_single_asset,
+        from immich_autotag.assets.process.process_focused_assets import (
+            process_focused_assets,
         )
 
-        for wrapper in assets_to_process:
-            process_single_asset(asset_wrapper=wrapper)
+        ruleset = filter_wrapper.get_filter_in_ruleset()
+        perf_phase_tracker.mark(phase="assets", event="start")
+        process_focused_assets(context, ruleset.get_filtered_in_asset_uuids())
+        perf_phase_tracker.mark(phase="assets", event="end")
+        return
+
+    # Only rules/conversions changed since the previous run: process the assets
+    # they touch instead of the whole library
+    from immich_autotag.assets.process.rule_change_reprocess import (
+        plan_rule_change_reprocess,
+        reprocess_rule_change,
+    )
+
+    changes = plan_rule_change_reprocess()
+    if changes is not None:
+        perf_phase_tracker.mark(phase="assets", event="start")
+        reprocess_rule_change(context, changes)
+        perf_phase_tracker.mark(phase="assets", event="end")
     else:
         import time
 
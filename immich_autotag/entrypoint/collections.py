@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from immich_autotag.albums.albums.album_collection_wrapper import AlbumCollectionWrapper
 from immich_autotag.context.immich_client_wrapper import ImmichClientWrapper
 from immich_autotag.context.immich_context import ImmichContext
+from immich_autotag.types.uuid_wrappers import AssetUUID
+
+if TYPE_CHECKING:
+    from immich_autotag.conversions.tag_conversions import TagConversions
 
 
 def init_collections_and_context(
@@ -22,44 +28,118 @@ def force_full_album_loading(albums_collection: AlbumCollectionWrapper) -> None:
     albums_collection.ensure_all_full(perf_phase_tracker=perf_phase_tracker)
 
 
-# New function: apply conversions to all assets before loading tags
-def apply_conversions_to_all_assets_early(context: ImmichContext) -> None:
+def _handle_conversion_error(asset_id: AssetUUID, e: Exception) -> bool:
     """
-    Iterates over all assets and applies the configured conversions as early as possible,
-    before tags are accessed (lazy-load).
-    Skips assets on error based on fail_fast_on_asset_errors config.
+    Logs a conversion error and returns True if the asset can be skipped
+    (recoverable error, or fail_fast_on_asset_errors disabled); returns False
+    otherwise and the caller re-raises.
+
+    Must be called from the `except` block handling `e` (its traceback is logged).
     """
     from immich_autotag.config.manager import ConfigManager
-    from immich_autotag.conversions.tag_conversions import TagConversions
     from immich_autotag.errors.recoverable_error import categorize_error
     from immich_autotag.logging.levels import LogLevel
     from immich_autotag.logging.utils import log
 
-    tag_conversions = TagConversions.from_config_manager()
-    asset_manager = context.get_asset_manager()
     config = ConfigManager.get_instance().get_config()
     fail_fast = config.performance.fail_fast_on_asset_errors
+    categorized = categorize_error(e)
+    is_recoverable = categorized.is_recoverable
+    category = categorized.category_name
+    should_skip = is_recoverable or not fail_fast
+
+    if should_skip:
+        import traceback
+
+        tb = traceback.format_exc()
+        error_prefix = "[WARN]" if is_recoverable else "[ERROR]"
+        log(
+            f"{error_prefix} {category} - Skipping conversion for asset {asset_id}: {e}\nTraceback:\n{tb}",
+            level=LogLevel.IMPORTANT,
+        )
+        return True
+    # Fatal error in fail-fast mode - the caller re-raises
+    return False
+
+
+def apply_conversions_to_candidate_assets(
+    context: ImmichContext, tag_conversions: "TagConversions"
+) -> None:
+    """
+    Applies each conversion to its candidate assets only (assets with a source
+    tag, in a source album or linked by the source), so the cost follows the
+    number of assets a conversion can touch, not the library size.
+    Destination tags are added in bulk per conversion; destination albums and the
+    MOVE removal of the source are then applied asset by asset.
+    """
+    import time
+
+    from immich_autotag.logging.levels import LogLevel
+    from immich_autotag.logging.utils import log
+    from immich_autotag.report.modification_kind import ModificationKind
+
+    for position, conversion in enumerate(tag_conversions):
+        t0 = time.time()
+        candidates = list(conversion.iter_candidate_assets(context))
+        # Assets whose bulk tagging failed go through the per-asset path instead,
+        # which raises on failure: a MOVE must never drop the source tag of an
+        # asset that did not get the destination.
+        retry_tags: set[AssetUUID] = set()
+        bulk_tagged = False
+        try:
+            bulk_changes = conversion.apply_destination_tags_in_bulk(candidates)
+            retry_tags = {
+                entry.asset_wrapper.get_id()
+                for entry in bulk_changes.filter_by_kind(
+                    ModificationKind.WARNING_TAG_ADDITION_TO_ASSET_FAILED
+                )
+                if entry.asset_wrapper is not None
+            }
+            bulk_tagged = True
+        except Exception as e:
+            log(
+                f"[CONVERSION] Bulk tagging failed for conversion {position + 1}, "
+                f"applying it asset by asset: {e}",
+                level=LogLevel.WARNING,
+            )
+        for asset in candidates:
+            try:
+                conversion.apply_to_asset(
+                    asset,
+                    skip_destination_tags=bulk_tagged
+                    and asset.get_id() not in retry_tags,
+                )
+            except Exception as e:
+                if not _handle_conversion_error(asset.get_id(), e):
+                    raise
+        log(
+            f"[CONVERSION] Conversion {position + 1}: {len(candidates)} candidate "
+            f"assets in {time.time() - t0:.2f}s",
+            level=LogLevel.PROGRESS,
+        )
+
+
+# New function: apply conversions to all assets before loading tags
+def apply_conversions_to_all_assets_early(context: ImmichContext) -> None:
+    """
+    Applies the configured conversions as early as possible, before tags are
+    accessed (lazy-load).
+    With ENABLE_TARGETED_CONVERSIONS only the candidate assets of each conversion
+    are visited (see apply_conversions_to_candidate_assets); otherwise every asset.
+    Skips assets on error based on fail_fast_on_asset_errors config.
+    """
+    from immich_autotag.config.internal_config import ENABLE_TARGETED_CONVERSIONS
+    from immich_autotag.conversions.tag_conversions import TagConversions
 
+    tag_conversions = TagConversions.from_config_manager()
+    if ENABLE_TARGETED_CONVERSIONS:
+        apply_conversions_to_candidate_assets(context, tag_conversions)
+        return
+
+    asset_manager = context.get_asset_manager()
     for asset in asset_manager.iter_assets(context):
         try:
             asset.apply_tag_conversions(tag_conversions=tag_conversions)
         except Exception as e:
-            categorized = categorize_error(e)
-            is_recoverable = categorized.is_recoverable
-            category = categorized.category_name
-            should_skip = is_recoverable or not fail_fast
-
-            if should_skip:
-                import traceback
-
-                tb = traceback.format_exc()
-                asset_id = asset.get_id()
-                error_prefix = "[WARN]" if is_recoverable else "[ERROR]"
-                log(
-                    f"{error_prefix} {category} - Skipping conversion for asset {asset_id}: {e}\nTraceback:\n{tb}",
-                    level=LogLevel.IMPORTANT,
-                )
-                continue
-            else:
-                # Fatal error in fail-fast mode - re-raise
+            if not _handle_conversion_error(asset.get_id(), e):
                 raise
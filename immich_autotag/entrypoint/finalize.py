@@ -13,6 +13,7 @@ def finalize(manager: ConfigManager, client: ImmichClient) -> None:
     from immich_autotag.utils.user_help import print_welcome_links
 
     print_welcome_links(manager.get_config())
+    TagCollectionWrapper.get_instance().flush_catalog()
     deleted_count = TagCollectionWrapper.maintenance_delete_conflict_tags(client)
     if deleted_count > 0:
         log(
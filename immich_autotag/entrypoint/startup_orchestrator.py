@@ -0,0 +1,241 @@
+"""
+Concurrent startup of the independent, API-bound loading phases.
+
+Album resync, full album load, tag catalog, users and duplicates used to be
+loaded one after the other. The orchestrator runs them on a small thread pool
+following a dependency graph: a phase is submitted as soon as all the phases it
+depends on have finished. Callers block only on the phases they really need
+(wait_for), so asset processing starts as soon as its hard dependencies are
+ready while the remaining loads keep going in the background.
+
+Each phase is reported to PerfPhaseTracker as 'startup_<name>' and its start
+and end are logged as they happen.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Iterable, Optional
+
+import attrs
+from typeguard import typechecked
+
+from immich_autotag.logging.levels import LogLevel
+from immich_autotag.logging.utils import log
+
+if TYPE_CHECKING:
+    from immich_autotag.context.immich_context import ImmichContext
+
+# Phase names
+ALBUM_RESYNC = "album_resync"
+ALBUM_FULL_LOAD = "album_full_load"
+TAGS = "tags"
+USERS = "users"
+DUPLICATES = "duplicates"
+
+# Phases that must be ready before asset processing starts. Duplicates are
+# loaded lazily (and thread-safely) by ImmichContext, so an asset that needs
+# them before the phase ends just waits for that load.
+ASSET_PROCESSING_DEPENDENCIES = (ALBUM_FULL_LOAD, TAGS, USERS)
+PERMISSIONS_DEPENDENCIES = (ALBUM_FULL_LOAD, USERS)
+
+
+@attrs.define(auto_attribs=True, slots=True, frozen=True)
+class StartupPhase:
+    name: str
+    run: Callable[[], None] = attrs.field(repr=False)
+    depends_on: frozenset[str] = frozenset()
+
+
+@attrs.define(auto_attribs=True, slots=True)
+class StartupOrchestrator:
+    """
+    Runs StartupPhase objects concurrently, respecting their dependencies.
+    A phase whose dependency failed is not run and fails with the same error.
+    """
+
+    _phases: dict[str, StartupPhase] = attrs.field(factory=dict)
+    _max_workers: int = 4
+    # Reentrant: a done callback may run while _submit_ready holds the lock
+    _lock: threading.RLock = attrs.field(
+        factory=threading.RLock, init=False, repr=False
+    )
+    _executor: Optional[ThreadPoolExecutor] = attrs.field(
+        default=None, init=False, repr=False
+    )
+    _futures: dict[str, Future[None]] = attrs.field(
+        factory=dict, init=False, repr=False
+    )
+    _t0: float = attrs.field(default=0.0, init=False, repr=False)
+    _summary_logged: bool = attrs.field(default=False, init=False, repr=False)
+
+    @typechecked
+    def add(self, phase: StartupPhase) -> "StartupOrchestrator":
+        if phase.name in self._phases:
+            raise ValueError(f"Startup phase '{phase.name}' already registered")
+        self._phases[phase.name] = phase
+        return self
+
+    def _validate(self) -> None:
+        for phase in self._phases.values():
+            for dep in phase.depends_on:
+                if dep not in self._phases:
+                    raise ValueError(
+                        f"Startup phase '{phase.name}' depends on unknown '{dep}'"
+                    )
+        # Detect cycles with a depth-first walk
+        visiting: set[str] = set()
+        done: set[str] = set()
+
+        def visit(name: str) -> None:
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Cycle in startup phases at '{name}'")
+            visiting.add(name)
+            for dep in self._phases[name].depends_on:
+                visit(dep)
+            visiting.discard(name)
+            done.add(name)
+
+        for name in self._phases:
+            visit(name)
+
+    def _run_phase(
+        self, phase: StartupPhase, deps: list[Optional[Future[None]]]
+    ) -> None:
+        from immich_autotag.utils.perf.perf_phase_tracker import perf_phase_tracker
+
+        for dep_future in deps:
+            assert dep_future is not None
+            # Propagates the error of a failed dependency
+            dep_future.result()
+        perf_phase_tracker.mark(phase=f"startup_{phase.name}", event="start")
+        log(f"[STARTUP] Phase '{phase.name}' started", level=LogLevel.PROGRESS)
+        t0 = time.time()
+        try:
+            phase.run()
+        except Exception as e:
+            log(
+                f"[STARTUP] Phase '{phase.name}' failed: {e}",
+                level=LogLevel.WARNING,
+            )
+            raise
+        perf_phase_tracker.mark(phase=f"startup_{phase.name}", event="end")
+        log(
+            f"[STARTUP] Phase '{phase.name}' finished in {time.time() - t0:.2f} s",
+            level=LogLevel.PROGRESS,
+        )
+
+    def _submit_ready(self) -> None:
+        with self._lock:
+            assert self._executor is not None
+            for name, phase in self._phases.items():
+                if name in self._futures:
+                    continue
+                deps = [self._futures.get(dep) for dep in phase.depends_on]
+                if all(f is not None and f.done() for f in deps):
+                    future = self._executor.submit(self._run_phase, phase, deps)
+                    self._futures[name] = future
+                    # Schedules the dependents once this phase is done
+                    future.add_done_callback(self._on_phase_done)
+
+    def start(self) -> "StartupOrchestrator":
+        """Submits every phase whose dependencies are already satisfied."""
+        self._validate()
+        self._t0 = time.time()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="startup"
+        )
+        log(
+            f"[STARTUP] Launching {len(self._phases)} startup phases: "
+            f"{', '.join(self._phases)}",
+            level=LogLevel.PROGRESS,
+        )
+        self._submit_ready()
+        return self
+
+    def _on_phase_done(self, _future: Future[None]) -> None:
+        self._submit_ready()
+        with self._lock:
+            if self._summary_logged or len(self._futures) < len(self._phases):
+                return
+            if not all(f.done() for f in self._futures.values()):
+                return
+            self._summary_logged = True
+        log(
+            f"[STARTUP] All startup phases finished in {time.time() - self._t0:.2f} s",
+            level=LogLevel.PROGRESS,
+        )
+
+    @typechecked
+    def wait_for(self, names: Iterable[str]) -> None:
+        """
+        Blocks until the given phases (and thus their dependencies) have finished.
+        Re-raises the error of the first failed phase.
+        """
+        for name in names:
+            if name not in self._phases:
+                raise ValueError(f"Unknown startup phase '{name}'")
+            while True:
+                with self._lock:
+                    future = self._futures.get(name)
+                if future is not None:
+                    future.result()
+                    break
+                # Not submitted yet: its dependencies are still running
+                self.wait_for(self._phases[name].depends_on)
+                self._submit_ready()
+
+    def shutdown(self) -> None:
+        """
+        Waits for all phases. Errors of phases nobody waited for are logged
+        instead of raised: their data is loaded again lazily when needed.
+        """
+        for name in self._phases:
+            try:
+                self.wait_for([name])
+            except Exception as e:
+                log(
+                    f"[STARTUP] Phase '{name}' did not complete: {e}",
+                    level=LogLevel.WARNING,
+                )
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+
+@typechecked
+def build_startup_orchestrator(context: "ImmichContext") -> StartupOrchestrator:
+    """Builds the orchestrator with the standard startup loading phases."""
+    from immich_autotag.config.internal_config import STARTUP_MAX_WORKERS
+    from immich_autotag.entrypoint.collections import force_full_album_loading
+
+    def album_resync() -> None:
+        context.get_albums_collection().log_lazy_load_timing()
+
+    def album_full_load() -> None:
+        force_full_album_loading(context.get_albums_collection())
+
+    def tags() -> None:
+        # Forces the tag catalog load (persisted catalog or API)
+        len(context.get_tag_collection())
+
+    def users() -> None:
+        from immich_autotag.users.user_manager import UserManager
+
+        UserManager.get_instance().load_all()
+
+    def duplicates() -> None:
+        context.get_duplicates_collection()
+
+    orchestrator = StartupOrchestrator(max_workers=STARTUP_MAX_WORKERS)
+    orchestrator.add(StartupPhase(ALBUM_RESYNC, album_resync))
+    orchestrator.add(
+        StartupPhase(ALBUM_FULL_LOAD, album_full_load, frozenset({ALBUM_RESYNC}))
+    )
+    orchestrator.add(StartupPhase(TAGS, tags))
+    orchestrator.add(StartupPhase(USERS, users))
+    orchestrator.add(StartupPhase(DUPLICATES, duplicates))
+    return orchestrator
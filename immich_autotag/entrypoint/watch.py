@@ -0,0 +1,203 @@
+"""
+Resident watch (daemon) mode.
+
+After the regular run in run_main_inner_logic has warmed the ImmichContext
+singletons (albums and their asset map, tags, users, duplicates), the process
+keeps running instead of exiting:
+
+- every poll interval, the album list is checked (one API call) and resynced
+  only if it changed, and the assets updated since the previous poll are
+  processed through process_single_asset;
+- every full-sweep interval, all assets are processed again and the warm
+  indexes (tags, users, duplicates, duplicate-group registry) are refreshed,
+  to reconcile anything a poll could have missed.
+
+SIGTERM/SIGINT stop the service after the asset being processed. The asset
+cache is bounded by watch.max_cached_assets.
+"""
+
+from __future__ import annotations
+
+import signal
+import threading
+import time
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Iterable
+
+import attrs
+
+from immich_autotag.logging.levels import LogLevel
+from immich_autotag.logging.utils import log
+
+if TYPE_CHECKING:
+    from immich_autotag.assets.asset_response_wrapper import AssetResponseWrapper
+    from immich_autotag.config.models import WatchConfig
+    from immich_autotag.context.immich_context import ImmichContext
+
+
+@attrs.define(auto_attribs=True, slots=True)
+class WatchService:
+    _context: "ImmichContext"
+    _config: "WatchConfig"
+    # Assets updated after this instant are processed by the next poll
+    _last_poll_at: datetime
+    _last_full_sweep_at: float = attrs.field(factory=time.monotonic, init=False)
+    _stop: threading.Event = attrs.field(factory=threading.Event, init=False)
+
+    def install_signal_handlers(self) -> None:
+        """SIGTERM/SIGINT request a graceful stop (main thread only)."""
+
+        def _handler(signum: int, _frame: object) -> None:
+            log(
+                f"[WATCH] Received signal {signum}, stopping after current asset",
+                level=LogLevel.FOCUS,
+            )
+            self.request_stop()
+
+        signal.signal(signal.SIGTERM, _handler)
+        signal.signal(signal.SIGINT, _handler)
+
+    def request_stop(self) -> None:
+        self._stop.set()
+
+    def is_stopping(self) -> bool:
+        return self._stop.is_set()
+
+    @staticmethod
+    def _flush_report() -> None:
+        """Writes the modifications of the cycle to the modification report."""
+        from immich_autotag.report.modification_report import ModificationReport
+
+        ModificationReport.get_instance().flush()
+
+    def _full_sweep_due(self) -> bool:
+        elapsed_hours = (time.monotonic() - self._last_full_sweep_at) / 3600.0
+        return elapsed_hours >= self._config.full_sweep_interval_hours
+
+    def _process_one(self, asset_wrapper: "AssetResponseWrapper") -> None:
+        from immich_autotag.assets.process.process_single_asset import (
+            process_single_asset,
+        )
+        from immich_autotag.config.manager import ConfigManager
+        from immich_autotag.errors.recoverable_error import categorize_error
+
+        try:
+            process_single_asset(asset_wrapper)
+        except Exception as e:
+            categorized = categorize_error(e)
+            fail_fast = (
+                ConfigManager.get_instance()
+                .get_config()
+                .performance.fail_fast_on_asset_errors
+            )
+            if not categorized.is_recoverable and fail_fast:
+                raise
+            log(
+                f"[WATCH] {categorized.category_name} - Skipping asset "
+                f"{asset_wrapper.get_id()}: {e}",
+                level=LogLevel.IMPORTANT,
+            )
+
+    def _process_all(self, assets: Iterable["AssetResponseWrapper"]) -> int:
+        count = 0
+        for asset_wrapper in assets:
+            if self.is_stopping():
+                break
+            self._process_one(asset_wrapper)
+            count += 1
+        return count
+
+    def _poll_changes(self, since: datetime) -> None:
+        from immich_autotag.assets.get_all_assets import get_assets_updated_since
+
+        if self._context.get_albums_collection().resync_if_changed():
+            log("[WATCH] Album list changed, collection resynced", level=LogLevel.INFO)
+        processed = self._process_all(get_assets_updated_since(self._context, since))
+        if processed:
+            log(
+                f"[WATCH] Processed {processed} assets changed since "
+                f"{since.isoformat()}",
+                level=LogLevel.PROGRESS,
+            )
+
+    def _full_sweep(self) -> None:
+        from immich_autotag.assets.date_correction.date_extraction_engine import (
+            clear_memo,
+        )
+        from immich_autotag.users.user_manager import UserManager
+
+        log("[WATCH] Starting full reconciliation sweep", level=LogLevel.FOCUS)
+        t0 = time.time()
+        self._context.get_albums_collection().resync_from_api()
+        self._context.get_tag_collection().mark_stale()
+        UserManager.get_instance().load_all()
+        self._context.reset_duplicates_collection()
+        self._context.get_asset_manager().clear_cache()
+        clear_memo()
+        processed = self._process_all(
+            self._context.get_asset_manager().iter_assets(self._context)
+        )
+        log(
+            f"[WATCH] Full sweep processed {processed} assets in "
+            f"{time.time() - t0:.2f}s",
+            level=LogLevel.FOCUS,
+        )
+
+    def _enforce_memory_bounds(self) -> None:
+        asset_manager = self._context.get_asset_manager()
+        if asset_manager.cached_count() > self._config.max_cached_assets:
+            log(
+                f"[WATCH] Asset cache over {self._config.max_cached_assets} "
+                f"entries, clearing it",
+                level=LogLevel.DEBUG,
+            )
+            asset_manager.clear_cache()
+
+    def _run_cycle(self) -> None:
+        from immich_autotag.assets.process.duplicate_group_processing import (
+            DuplicateGroupRegistry,
+        )
+
+        # Taken before querying, so changes made while processing are seen next time
+        cycle_started_at = datetime.now(timezone.utc)
+        # Each cycle must re-run group phases for the groups it touches
+        DuplicateGroupRegistry.get_instance().clear()
+        if self._full_sweep_due():
+            self._full_sweep()
+            self._last_full_sweep_at = time.monotonic()
+        else:
+            self._poll_changes(self._last_poll_at)
+        if not self.is_stopping():
+            self._last_poll_at = cycle_started_at
+        self._enforce_memory_bounds()
+
+    def run(self) -> None:
+        log(
+            f"[WATCH] Watch mode started: polling every "
+            f"{self._config.poll_interval_seconds}s, full sweep every "
+            f"{self._config.full_sweep_interval_hours}h",
+            level=LogLevel.FOCUS,
+        )
+        try:
+            while not self._stop.wait(self._config.poll_interval_seconds):
+                self._run_cycle()
+                self._flush_report()
+        finally:
+            self._flush_report()
+        log("[WATCH] Watch mode stopped", level=LogLevel.FOCUS)
+
+
+def run_watch_mode_if_enabled(context: "ImmichContext", since: datetime) -> None:
+    """
+    Enters watch mode if enabled in the configuration (blocks until stopped).
+    `since` is when the initial run started: the first poll picks up every
+    asset changed while it was running.
+    """
+    from immich_autotag.config.manager import ConfigManager
+
+    watch_config = ConfigManager.get_instance().get_config().watch
+    if watch_config is None or not watch_config.enabled:
+        return
+    service = WatchService(context, watch_config, since)
+    service.install_signal_handlers()
+    service.run()
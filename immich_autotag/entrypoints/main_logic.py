@@ -1,16 +1,80 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Optional
 
-def run_main_inner_logic():
+if TYPE_CHECKING:
+    from immich_autotag.config.manager import ConfigManager
+    from immich_autotag.context.immich_context import ImmichContext
+    from immich_autotag.entrypoint.startup_orchestrator import StartupOrchestrator
+
+
+def _run_after_startup(
+    manager: "ConfigManager",
+    context: "ImmichContext",
+    orchestrator: Optional["StartupOrchestrator"],
+) -> None:
+    """Maintenance, conversions, permissions and asset processing."""
+    from immich_autotag.albums.maintenance_tasks.delete_unhealthy_temp_albums import (
+        delete_unhealthy_temp_albums,
+    )
+    from immich_autotag.entrypoint import startup_orchestrator as startup
     from immich_autotag.entrypoint.assets import process_assets_or_filtered
+    from immich_autotag.entrypoint.collections import force_full_album_loading
+    from immich_autotag.entrypoint.permissions import process_permissions
+
+    def wait_for(*names: str) -> None:
+        if orchestrator is not None:
+            orchestrator.wait_for(names)
+
+    # The maintenance steps and conversions below iterate and modify the album
+    # collection: wait until the full album load no longer touches it.
+    wait_for(startup.ALBUM_FULL_LOAD)
+    # Check for duplicate album names after rescue
+    from immich_autotag.albums.albums.album_collection_wrapper import (
+        AlbumCollectionWrapper,
+    )
+    from immich_autotag.albums.albums.duplicates_manager.rename_strategy.find_duplicate_names import (
+        find_duplicate_album_names,
+    )
+
+    print("[MAINTENANCE] Checking for duplicate album names...")
+    collection = AlbumCollectionWrapper.get_instance()
+    duplicates = find_duplicate_album_names(collection)
+    if duplicates:
+        raise RuntimeError(
+            f"Duplicate album names still exist after rescue: {duplicates}"
+        )
+    print("[MAINTENANCE] No duplicate album names found. Asset processing is skipped.")
+
+    from immich_autotag.report.modification_entries_list import ModificationEntriesList
+
+    result: ModificationEntriesList = delete_unhealthy_temp_albums(context)
+    print(f"[PROGRESS] Maintenance result: {result.entries()}")
+
+    # Apply conversions to all assets before processing them (needs the tags)
+    from immich_autotag.config.internal_config import APPLY_CONVERSIONS_AT_START
     from immich_autotag.entrypoint.collections import (
-        force_full_album_loading,
-        init_collections_and_context,
+        apply_conversions_to_all_assets_early,
     )
+
+    if APPLY_CONVERSIONS_AT_START:
+        wait_for(startup.TAGS)
+        apply_conversions_to_all_assets_early(context)
+
+    if orchestrator is None:
+        force_full_album_loading(context.get_albums_collection())
+
+    wait_for(*startup.PERMISSIONS_DEPENDENCIES)
+    process_permissions(manager, context)
+    wait_for(*startup.ASSET_PROCESSING_DEPENDENCIES)
+    process_assets_or_filtered(manager, context)
+
+
+def run_main_inner_logic():
+    from immich_autotag.entrypoint.collections import init_collections_and_context
     from immich_autotag.entrypoint.finalize import finalize
     from immich_autotag.entrypoint.init import init_config_and_logging
     from immich_autotag.entrypoint.maintenance import maintenance_cleanup_labels
-    from immich_autotag.entrypoint.permissions import process_permissions
 
     manager = init_config_and_logging()
     from immich_autotag.context.immich_client_wrapper import ImmichClientWrapper
@@ -24,10 +88,6 @@ def run_main_inner_logic():
     assert_client_server_version_match(client)
     # Initialize context early so it's available for maintenance operations
     context = init_collections_and_context(client_wrapper)
-    # Maintenance: delete unhealthy temporary albums
-    from immich_autotag.albums.maintenance_tasks.delete_unhealthy_temp_albums import (
-        delete_unhealthy_temp_albums,
-    )
     from immich_autotag.config.internal_config import ENABLE_ALBUM_CLEANUP_RESCUE
 
     if ENABLE_ALBUM_CLEANUP_RESCUE:
@@ -46,42 +106,33 @@ def run_main_inner_logic():
         report_album_cleanup_modifications(modifications)
 
         return
-    # Check for duplicate album names after rescue
-    from immich_autotag.albums.albums.album_collection_wrapper import (
-        AlbumCollectionWrapper,
-    )
-    from immich_autotag.albums.albums.duplicates_manager.rename_strategy.find_duplicate_names import (
-        find_duplicate_album_names,
-    )
-
-    print("[MAINTENANCE] Checking for duplicate album names...")
-    collection = AlbumCollectionWrapper.get_instance()
-    duplicates = find_duplicate_album_names(collection)
-    if duplicates:
-        raise RuntimeError(
-            f"Duplicate album names still exist after rescue: {duplicates}"
-        )
-    print("[MAINTENANCE] No duplicate album names found. Asset processing is skipped.")
-
-    from immich_autotag.report.modification_entries_list import ModificationEntriesList
-
-    result: ModificationEntriesList = delete_unhealthy_temp_albums(context)
-    print(f"[PROGRESS] Maintenance result: {result.entries()}")
+    # Conflict-tag cleanup deletes tags server-side: run it before the tag
+    # catalog is loaded by the startup phases.
     # TODO: Maintenance cleanup disabled during stability testing - causes performance issues
     maintenance_cleanup_labels(client)
 
-    # Apply conversions to all assets before loading tags
-    from immich_autotag.config.internal_config import APPLY_CONVERSIONS_AT_START
-    from immich_autotag.entrypoint.collections import (
-        apply_conversions_to_all_assets_early,
-    )
+    # Load albums, tags, users and duplicates concurrently; each step below only
+    # waits for the phases it needs.
+    from datetime import datetime, timezone
 
-    if APPLY_CONVERSIONS_AT_START:
-        apply_conversions_to_all_assets_early(context)
-    albums_collection = context.get_albums_collection()
+    from immich_autotag.config.internal_config import ENABLE_PARALLEL_STARTUP
+    from immich_autotag.entrypoint import startup_orchestrator as startup
 
-    force_full_album_loading(albums_collection)
+    run_started_at = datetime.now(timezone.utc)
+    orchestrator = (
+        startup.build_startup_orchestrator(context).start()
+        if ENABLE_PARALLEL_STARTUP
+        else None
+    )
+    try:
+        _run_after_startup(manager, context, orchestrator)
+    finally:
+        if orchestrator is not None:
+            orchestrator.shutdown()
 
-    process_permissions(manager, context)
-    process_assets_or_filtered(manager, context)
+    # Resident mode: keep the warm context and process changes as they happen;
+    # the run is finalized once it stops.
+    from immich_autotag.entrypoint.watch import run_watch_mode_if_enabled
+
+    run_watch_mode_if_enabled(context, since=run_started_at)
     finalize(manager, client)
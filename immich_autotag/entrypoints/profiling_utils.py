@@ -2,6 +2,7 @@ def setup_profiling_and_memory():
     from immich_autotag.config.internal_config import (
         ENABLE_MEMORY_PROFILING,
         ENABLE_PROFILING,
+        ENABLE_SAMPLING_PROFILER,
     )
 
     if ENABLE_MEMORY_PROFILING:
@@ -12,3 +13,7 @@ def setup_profiling_and_memory():
         from immich_autotag.utils.perf.cprofile_profiler import setup_cprofile_profiler
 
         setup_cprofile_profiler()
+    if ENABLE_SAMPLING_PROFILER:
+        from immich_autotag.utils.perf.sampling_profiler import setup_sampling_profiler
+
+        setup_sampling_profiler()
@@ -40,17 +40,12 @@ class MemberDiff:
     )
 
 
-def _resolve_target_members(
-    resolved_policy: ResolvedAlbumPolicy, context: ImmichContext
-) -> list[UserResponseWrapper]:
+def _wrap_members(members: list) -> list[UserResponseWrapper]:
     from immich_autotag.users.user_response_wrapper import UserResponseWrapper
 
-    email_objs = [EmailAddress.from_string(e) for e in resolved_policy.members]
-    member_resolution = EmailMemberResolution()
-    member_resolution.resolve_emails_to_user_ids(email_objs, context)
     # Only wrap if not already a UserResponseWrapper
     result: list[UserResponseWrapper] = []
-    for u in member_resolution.get_resolved_members():
+    for u in members:
         if isinstance(u, UserResponseWrapper):
             result.append(u)
         else:
@@ -58,6 +53,46 @@ def _resolve_target_members(
     return result
 
 
+def _resolve_target_members(
+    resolved_policy: ResolvedAlbumPolicy, context: ImmichContext
+) -> list[UserResponseWrapper]:
+    email_objs = [EmailAddress.from_string(e) for e in resolved_policy.members]
+    member_resolution = EmailMemberResolution()
+    member_resolution.resolve_emails_to_user_ids(email_objs, context)
+    return _wrap_members(member_resolution.get_resolved_members())
+
+
+def policy_members_key(resolved_policy: ResolvedAlbumPolicy) -> frozenset[str]:
+    """Key of resolve_policies_target_members for the policy's member emails."""
+    return frozenset(resolved_policy.members)
+
+
+def resolve_policies_target_members(
+    resolved_policies: list[ResolvedAlbumPolicy], context: ImmichContext
+) -> dict[frozenset[str], list[UserResponseWrapper]]:
+    """
+    Target members of many policies, loading the users once and resolving each
+    distinct member set once (albums matched by the same rules share one), keyed
+    by policy_members_key.
+    """
+    from immich_autotag.users.user_manager import UserManager
+
+    manager = UserManager.get_instance()
+    manager.load_all()
+    all_users = manager.all_users()
+    targets: dict[frozenset[str], list[UserResponseWrapper]] = {}
+    for resolved_policy in resolved_policies:
+        key = policy_members_key(resolved_policy)
+        if key in targets:
+            continue
+        member_resolution = EmailMemberResolution()
+        member_resolution.resolve(
+            [EmailAddress.from_string(e) for e in sorted(key)], all_users
+        )
+        targets[key] = _wrap_members(member_resolution.get_resolved_members())
+    return targets
+
+
 def _get_current_member_wrappers(
     album_wrapper: "AlbumResponseWrapper",
 ) -> list[UserResponseWrapper]:
@@ -168,6 +203,7 @@ def sync_album_permissions(
     album_wrapper: "AlbumResponseWrapper",
     resolved_policy: ResolvedAlbumPolicy,
     context: ImmichContext,
+    target_members: list[UserResponseWrapper] | None = None,
 ) -> None:
     """
     Phase 2: Synchronize album permissions with configured rules.
@@ -178,14 +214,15 @@ def sync_album_permissions(
         album_wrapper: Album wrapper with album data
         resolved_policy: Resolved policy with target members (emails)
         context: ImmichContext with API client
+        target_members: Users the policy resolves to, if already resolved
+            (see resolve_policies_target_members); resolved here otherwise
     """
     album_name: str = album_wrapper.get_album_name()
     if not resolved_policy.has_match:
         log_debug(f"[ALBUM_PERMISSIONS] Skipping {album_name}: no matching rules")
         return
-    target_members: list[UserResponseWrapper] = _resolve_target_members(
-        resolved_policy, context
-    )
+    if target_members is None:
+        target_members = _resolve_target_members(resolved_policy, context)
     current_member_wrappers: list[UserResponseWrapper] = _get_current_member_wrappers(
         album_wrapper
     )
@@ -11,7 +11,9 @@ from typing import TYPE_CHECKING
 
 from typeguard import typechecked
 
-from immich_autotag.albums.permissions.album_policy_resolver import resolve_album_policy
+from immich_autotag.albums.permissions.album_policy_resolver import (
+    resolve_album_policies,
+)
 from immich_autotag.context.immich_context import ImmichContext
 
 if TYPE_CHECKING:
@@ -58,13 +60,12 @@ def process_album_permissions(
     # Process each album
     matched_count = 0
     unmatched_count = 0
-    for album_wrapper in albums_collection.get_albums():
-        resolved_policy = resolve_album_policy(
-            album=album_wrapper,
-            user_groups=user_groups_dict,
-            selection_rules=album_perms_config.selection_rules or [],
-        )
-
+    for resolved_policy in resolve_album_policies(
+        albums=list(albums_collection.get_albums()),
+        user_groups=user_groups_dict,
+        selection_rules=album_perms_config.selection_rules or [],
+    ):
+        album_wrapper = resolved_policy.album
         if resolved_policy.has_match:
             matched_count += 1
             log(
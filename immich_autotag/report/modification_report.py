@@ -56,6 +56,8 @@ class ModificationReport:
     _since_last_flush: int = attrs.field(
         default=0, init=False, validator=attrs.validators.instance_of(int)
     )
+    # Kind counts of entries dropped from memory once flushed (memory governor)
+    _shed_counts: dict[ModificationKind, int] = attrs.field(factory=dict, init=False)
     _cleared_report: bool = attrs.field(
         default=False,
         init=False,
@@ -76,6 +78,19 @@ class ModificationReport:
         _instance_created = True
         print("[INFO] Assigning self to reserved global variable _instance.")
         _instance = self
+        from immich_autotag.utils.perf.memory_governor import (
+            approx_collection_size,
+            register_cache,
+        )
+
+        register_cache(
+            "modification_report",
+            estimate=lambda: approx_collection_size(
+                self._modifications, len(self._modifications)
+            ),
+            shed=self.shed_flushed_entries,
+            priority=10,
+        )
 
     def _get_report_path(self) -> Path:
         return self._run_execution.get_modification_report_path()
@@ -95,8 +110,23 @@ class ModificationReport:
     def get_entries(self) -> list[ModificationEntry]:
         return self._modifications
 
+    def get_entry_count(self) -> int:
+        """Entries recorded this run, including those shed from memory."""
+        return len(self._modifications) + sum(self._shed_counts.values())
+
+    def shed_flushed_entries(self) -> None:
+        """
+        Drops the entries already written to the report file, keeping their
+        kind counts for the summary.
+        """
+        with self._lock:
+            flushed_count = len(self._modifications) - self._since_last_flush
+            for entry in self._modifications[:flushed_count]:
+                self._shed_counts[entry.kind] = self._shed_counts.get(entry.kind, 0) + 1
+            del self._modifications[:flushed_count]
+
     def get_entry_type_counts(self) -> dict[ModificationKind, int]:
-        counts: dict[ModificationKind, int] = {}
+        counts: dict[ModificationKind, int] = dict(self._shed_counts)
         for entry in self._modifications:
             counts[entry.kind] = counts.get(entry.kind, 0) + 1
         return counts
@@ -182,7 +212,10 @@ class ModificationReport:
             extra=extra,
             progress=progress_str,
         )
-        self._modifications.append(entry)
+        with self._lock:
+            self._modifications.append(entry)
+            self._since_last_flush += 1
+            flush_due = self._since_last_flush >= self._batch_size
         # Centralized statistics update for tag actions (now encapsulated in StatisticsManager)
         if tag is not None:
             from immich_autotag.statistics.statistics_manager import StatisticsManager
@@ -190,8 +223,7 @@ class ModificationReport:
             StatisticsManager.get_instance().increment_tag_action(
                 tag=tag, kind=kind, album=album
             )
-        self._since_last_flush += 1
-        if self._since_last_flush >= self._batch_size:
+        if flush_due:
             self.flush()
         return entry
 
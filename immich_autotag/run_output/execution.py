@@ -46,6 +46,20 @@ class RunExecution:
         pid = os.getpid()
         return self.run_dir / f"tracemalloc_{ts}_PID{pid}.dat"
 
+    def get_sampling_profile_dir(self) -> Path:
+        """
+        Returns the folder of the sampling profiler's collapsed-stack files for this run.
+        """
+        d = self.run_dir / "sampling_profile"
+        d.mkdir(parents=True, exist_ok=True)
+        return d
+
+    def get_metrics_path(self) -> Path:
+        """
+        Returns the path of the OpenMetrics textfile of the live run progress.
+        """
+        return self.run_dir / "metrics.prom"
+
     def get_full_output_log_path(self) -> Path:
         """
         Returns the path for the main tee log file for this run.
@@ -87,6 +101,12 @@ class RunExecution:
         """
         return self.get_custom_path("modification_report.txt")
 
+    def get_library_snapshot_path(self) -> Path:
+        """
+        Returns the path of the offline library snapshot (SQLite) for this execution.
+        """
+        return self.get_custom_path("library_snapshot.sqlite")
+
     def get_log_path(self, name: str) -> Path:
         return self.run_dir / f"{name}.log"
 
@@ -8,6 +8,7 @@ import attrs
 
 from ._recent_run_dir import RecentRunDir
 from .execution import RunExecution
+from .run_catalog import RunCatalog
 
 # --- Private module-level constants and variables for execution management ---
 
@@ -17,6 +18,13 @@ _RUN_DIR_DATE_FORMAT = "%Y%m%d_%H%M%S"
 _current_instance = None
 
 
+def _shard_suffix() -> str:
+    from immich_autotag.config.sharding import get_current_shard
+
+    shard = get_current_shard()
+    return shard.get_run_dir_suffix() if shard is not None else ""
+
+
 @attrs.define(auto_attribs=True, slots=True)
 class RunOutputManager:
     """
@@ -103,6 +111,22 @@ class RunOutputManager:
         """Returns all valid execution subfolders in base_dir."""
         return [d for d in base_dir.iterdir() if self._is_run_dir(d)]
 
+    def _register_in_catalog(self, run_dir: Path, now: str) -> None:
+        import threading
+
+        catalog = self.get_catalog()
+        try:
+            catalog.register_run(run_dir, datetime.strptime(now, _RUN_DIR_DATE_FORMAT))
+        except OSError as e:
+            print(f"[RUN CATALOG] Could not register {run_dir}: {e}")
+            return
+        threading.Thread(
+            target=catalog.apply_retention,
+            args=(run_dir.name,),
+            name="run-output-retention",
+            daemon=True,
+        ).start()
+
     def get_run_output_dir(self) -> RunExecution:
         """
         Returns a RunExecution object for the current run. Argument must be a Path.
@@ -111,27 +135,106 @@ class RunOutputManager:
             base_dir = self._logs_local_dir
             now = datetime.now().strftime(_RUN_DIR_DATE_FORMAT)
             pid = os.getpid()
-            run_dir = Path(base_dir) / f"{now}{_RUN_DIR_PID_SEP}{pid}"
+            run_dir = Path(base_dir) / f"{now}{_RUN_DIR_PID_SEP}{pid}{_shard_suffix()}"
             run_dir.mkdir(parents=True, exist_ok=True)
             self._run_output_dir = RunExecution(run_dir)
+            if RunCatalog.is_enabled():
+                self._register_in_catalog(run_dir, now)
         return self._run_output_dir
 
+    def get_catalog(self) -> RunCatalog:
+        """The catalog of the runs of this logs folder (see run_catalog.py)."""
+        return RunCatalog.for_logs_dir(self._logs_local_dir)
+
+    def record_run_end(
+        self,
+        *,
+        aborted: bool,
+        count: int,
+        total_assets: Optional[int],
+        skip_n: Optional[int],
+    ) -> None:
+        """Records the outcome and outputs of the current run in the catalog."""
+        if not RunCatalog.is_enabled():
+            return
+        try:
+            self.get_catalog().record_finished_run(
+                self.get_run_output_dir().path,
+                aborted=aborted,
+                count=count,
+                total_assets=total_assets,
+                skip_n=skip_n,
+            )
+        except OSError as e:
+            print(f"[RUN CATALOG] Could not record the end of the run: {e}")
+
+    def _find_recent_run_dirs_in_catalog(
+        self,
+        max_age_hours: int,
+        exclude_current: bool,
+        same_shard_only: bool,
+        with_api_cache: Optional[str],
+    ) -> list["RunExecution"]:
+        from immich_autotag.config.sharding import ShardSpec, get_current_shard
+
+        current_name = self.get_run_output_dir().path.name if exclude_current else None
+        current_shard = get_current_shard()
+        result: list[RunExecution] = []
+        for name, entry in self.get_catalog().find_recent(
+            datetime.now(), max_age_hours
+        ):
+            if name == current_name:
+                continue
+            if same_shard_only and ShardSpec.from_run_dir_name(name) != current_shard:
+                continue
+            if (
+                with_api_cache is not None
+                and entry.api_caches is not None
+                and with_api_cache not in entry.api_caches
+            ):
+                continue
+            run_dir = self._logs_local_dir / name
+            if run_dir.is_dir():  # Not moved or deleted behind the catalog's back
+                result.append(RunExecution(run_dir))
+        return result
+
     def find_recent_run_dirs(
-        self, max_age_hours: int = 3, exclude_current: bool = True
+        self,
+        max_age_hours: int = 3,
+        exclude_current: bool = True,
+        same_shard_only: bool = False,
+        with_api_cache: Optional[str] = None,
     ) -> list["RunExecution"]:
         """
         Returns a list of RunExecution objects for recent executions (subfolders with 'PID' in the name and valid date),
         ordered from most recent to oldest, filtered by age (max_age_hours).
         If exclude_current is True, excludes the current execution folder.
+        If same_shard_only is True, only runs of the same shard as this one are
+        returned (only unsharded runs when this run is not sharded): checkpoints
+        of other shards count different assets.
+        If with_api_cache is set, runs known (from the catalog) to have no API
+        cache of that type are left out.
         """
+        from immich_autotag.config.sharding import ShardSpec, get_current_shard
+
+        if RunCatalog.is_enabled():
+            return self._find_recent_run_dirs_in_catalog(
+                max_age_hours, exclude_current, same_shard_only, with_api_cache
+            )
         logs_dir = self._logs_local_dir
         now = datetime.now()
         current_run = self.get_run_output_dir() if exclude_current else None
         current_run_dir = current_run.path if current_run else None
+        current_shard = get_current_shard()
         recent_dirs: list[RecentRunDir] = []
         for subdir in self._list_run_dirs(logs_dir):
             if exclude_current and subdir.resolve() == current_run_dir:
                 continue
+            if (
+                same_shard_only
+                and ShardSpec.from_run_dir_name(subdir.name) != current_shard
+            ):
+                continue
             rrd = RecentRunDir.from_path(subdir)
             if rrd is not None and rrd.is_recent(now, max_age_hours):
                 recent_dirs.append(rrd)
@@ -148,6 +251,13 @@ class RunOutputManager:
             raise RuntimeError(
                 f"Logs directory does not exist or is not a directory: {base}"
             )
+        current = self.get_run_output_dir()
+        if RunCatalog.is_enabled():
+            for name, _ in self.get_catalog().find_all():
+                run_dir = base / name
+                if name != current.path.name and run_dir.is_dir():
+                    return RunExecution(run_dir)
+            return None
         dirs = self._list_run_dirs(base)
         if not dirs:
             raise RuntimeError(f"No run directories found in logs directory: {base}")
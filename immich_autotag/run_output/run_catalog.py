@@ -0,0 +1,342 @@
+"""
+run_catalog.py
+
+Persistent catalog of the run directories of a logs folder
+(<logs_local>/run_catalog.json), so that looking up previous runs does not
+list and parse every run directory name each time.
+
+Each run registers itself when its directory is created and records, when it
+finishes, its status, processed count and which caches it left behind. The
+catalog is rewritten atomically (temporary file + rename) under an exclusive
+lock file, as several runs (shards) may share the logs folder; readers keep it
+in memory and reload it only when the file changes. A missing or unreadable
+catalog is rebuilt from a directory scan.
+
+The retention policy (RUN_OUTPUT_COMPRESS_AFTER_DAYS /
+RUN_OUTPUT_DELETE_AFTER_DAYS) compresses old run directories into
+<logs_local>/_compressed/<run>.tar.gz and deletes the oldest ones.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import shutil
+import tarfile
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Iterator, Literal, Optional
+
+import attrs
+from pydantic import BaseModel, Field
+
+RUN_CATALOG_FILENAME = "run_catalog.json"
+_RUN_CATALOG_VERSION = 1
+_COMPRESSED_DIRNAME = "_compressed"
+_RETENTION_LOCK_FILENAME = ".run_retention.lock"
+
+RunStatus = Literal["running", "finished", "aborted", "compressed"]
+
+_instances: dict[Path, "RunCatalog"] = {}
+_instances_lock = threading.Lock()
+
+
+class RunCatalogEntry(BaseModel):
+    started_at: datetime
+    status: RunStatus = "running"
+    finished_at: Optional[datetime] = None
+    # Known once the run has finished (None: unknown, read run_statistics.yaml)
+    count: Optional[int] = None
+    total_assets: Optional[int] = None
+    skip_n: Optional[int] = None
+    api_caches: Optional[list[str]] = Field(
+        default=None, description="Non-empty api_cache/<type> folders"
+    )
+    has_duplicates_cache: Optional[bool] = None
+    has_checkpoint: Optional[bool] = Field(
+        default=None, description="Whether run_statistics.yaml exists"
+    )
+
+
+class RunCatalogData(BaseModel):
+    version: int = _RUN_CATALOG_VERSION
+    runs: dict[str, RunCatalogEntry] = Field(default_factory=dict)
+
+
+@contextlib.contextmanager
+def _exclusive_lock(lock_path: Path) -> Iterator[None]:
+    try:
+        import fcntl
+    except ImportError:  # Windows: atomic replace only
+        yield
+        return
+    with open(lock_path, "a+") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+@attrs.define(auto_attribs=True, slots=True)
+class RunCatalog:
+    _logs_dir: Path
+    _data: Optional[RunCatalogData] = attrs.field(default=None, init=False)
+    _mtime_ns: Optional[int] = attrs.field(default=None, init=False)
+    _lock: threading.RLock = attrs.field(factory=threading.RLock, init=False)
+
+    @staticmethod
+    def for_logs_dir(logs_dir: Path) -> "RunCatalog":
+        """The catalog of `logs_dir`, shared by the whole process."""
+        key = Path(logs_dir).resolve()
+        with _instances_lock:
+            catalog = _instances.get(key)
+            if catalog is None:
+                catalog = _instances[key] = RunCatalog(Path(logs_dir))
+            return catalog
+
+    @staticmethod
+    def is_enabled() -> bool:
+        from immich_autotag.config.internal_config import ENABLE_RUN_CATALOG
+
+        return ENABLE_RUN_CATALOG
+
+    def _path(self) -> Path:
+        return self._logs_dir / RUN_CATALOG_FILENAME
+
+    def _read_file(self) -> Optional[RunCatalogData]:
+        try:
+            data = RunCatalogData.model_validate_json(self._path().read_bytes())
+        except (OSError, ValueError):
+            return None
+        if data.version > _RUN_CATALOG_VERSION:
+            return None
+        return data
+
+    def _scan(self) -> RunCatalogData:
+        """Builds the catalog from the run directories (first use, or lost file)."""
+        from .manager import RunOutputManager
+
+        data = RunCatalogData()
+        if not self._logs_dir.is_dir():
+            return data
+        for subdir in self._logs_dir.iterdir():
+            if not RunOutputManager._is_run_dir(subdir):
+                continue
+            started_at = RunOutputManager._extract_datetime_from_run_dir(subdir)
+            if started_at is None:
+                continue
+            # Outputs are left unknown: consumers then look at the folder itself
+            data.runs[subdir.name] = RunCatalogEntry(
+                started_at=started_at, status="finished"
+            )
+        return data
+
+    def _update(self, change: Callable[[RunCatalogData], None]) -> None:
+        """Re-reads, changes and atomically rewrites the catalog under the lock."""
+        with self._lock:
+            self._logs_dir.mkdir(parents=True, exist_ok=True)
+            path = self._path()
+            with _exclusive_lock(self._logs_dir / f".{RUN_CATALOG_FILENAME}.lock"):
+                data = self._read_file() or self._scan()
+                change(data)
+                tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+                tmp_path.write_text(data.model_dump_json(), encoding="utf-8")
+                os.replace(tmp_path, path)
+                self._data, self._mtime_ns = data, path.stat().st_mtime_ns
+
+    def _load(self) -> RunCatalogData:
+        """The catalog, reloaded only when the file changed since the last read."""
+        with self._lock:
+            try:
+                mtime_ns: Optional[int] = self._path().stat().st_mtime_ns
+            except OSError:
+                mtime_ns = None
+            if self._data is not None and mtime_ns == self._mtime_ns:
+                return self._data
+            if mtime_ns is None:
+                self._update(lambda data: None)  # Builds and writes it
+                assert self._data is not None
+                return self._data
+            data = self._read_file()
+            if data is None:
+                self._update(lambda data: None)
+                assert self._data is not None
+                return self._data
+            self._data, self._mtime_ns = data, mtime_ns
+            return data
+
+    @staticmethod
+    def _describe_outputs(run_dir: Path, entry: RunCatalogEntry) -> None:
+        """Fills the cache and checkpoint availability of `entry` from `run_dir`."""
+        from immich_autotag.duplicates.duplicates_cache_constants import (
+            DUPLICATES_CACHE_FILENAME,
+        )
+        from immich_autotag.statistics.constants import RUN_STATISTICS_FILENAME
+
+        api_caches = []
+        api_cache_root = run_dir / "api_cache"
+        if api_cache_root.is_dir():
+            with os.scandir(api_cache_root) as cache_dirs:
+                for cache_dir in cache_dirs:
+                    if not cache_dir.is_dir():
+                        continue
+                    with os.scandir(cache_dir.path) as files:
+                        if any(True for _ in files):
+                            api_caches.append(cache_dir.name)
+        entry.api_caches = sorted(api_caches)
+        entry.has_duplicates_cache = (run_dir / DUPLICATES_CACHE_FILENAME).exists()
+        entry.has_checkpoint = (run_dir / RUN_STATISTICS_FILENAME).exists()
+
+    def register_run(self, run_dir: Path, started_at: datetime) -> None:
+        """Records a run that has just created its directory."""
+
+        def change(data: RunCatalogData) -> None:
+            data.runs[run_dir.name] = RunCatalogEntry(started_at=started_at)
+
+        self._update(change)
+
+    def record_finished_run(
+        self,
+        run_dir: Path,
+        *,
+        aborted: bool,
+        count: int,
+        total_assets: Optional[int],
+        skip_n: Optional[int],
+    ) -> None:
+        """Records the outcome and the outputs of a run that is ending."""
+
+        def change(data: RunCatalogData) -> None:
+            entry = data.runs.get(run_dir.name)
+            if entry is None:
+                entry = data.runs[run_dir.name] = RunCatalogEntry(
+                    started_at=datetime.now()
+                )
+            entry.status = "aborted" if aborted else "finished"
+            entry.finished_at = datetime.now()
+            entry.count = count
+            entry.total_assets = total_assets
+            entry.skip_n = skip_n
+            self._describe_outputs(run_dir, entry)
+
+        self._update(change)
+
+    def forget(self, run_names: list[str]) -> None:
+        """Drops runs whose directories were moved away (e.g. cycle archiving)."""
+
+        def change(data: RunCatalogData) -> None:
+            for name in run_names:
+                data.runs.pop(name, None)
+
+        self._update(change)
+
+    def find_recent(
+        self, now: datetime, max_age_hours: float
+    ) -> list[tuple[str, RunCatalogEntry]]:
+        """Runs (not compressed) started less than max_age_hours ago, newest first."""
+        cutoff = now - timedelta(hours=max_age_hours)
+        runs = [
+            (name, entry)
+            for name, entry in self._load().runs.items()
+            if entry.started_at > cutoff and entry.status != "compressed"
+        ]
+        runs.sort(key=lambda item: item[1].started_at, reverse=True)
+        return runs
+
+    def find_all(self) -> list[tuple[str, RunCatalogEntry]]:
+        """Every run not compressed, newest first."""
+        runs = [
+            (name, entry)
+            for name, entry in self._load().runs.items()
+            if entry.status != "compressed"
+        ]
+        runs.sort(key=lambda item: item[1].started_at, reverse=True)
+        return runs
+
+    def get_entry(self, run_name: str) -> Optional[RunCatalogEntry]:
+        return self._load().runs.get(run_name)
+
+    @staticmethod
+    def _compress_run_dir(run_dir: Path, archive: Path) -> None:
+        """
+        Archives `run_dir` into `archive` and removes it. An existing archive is
+        kept as is: the folder left next to it is what remains of an interrupted
+        removal, and tarring it again would replace the complete archive.
+        """
+        if not run_dir.is_dir():
+            return
+        if not archive.exists():
+            archive.parent.mkdir(parents=True, exist_ok=True)
+            tmp_archive = archive.with_name(f".{archive.name}.{os.getpid()}.tmp")
+            try:
+                with tarfile.open(tmp_archive, "w:gz") as tar:
+                    tar.add(run_dir, arcname=run_dir.name)
+                os.replace(tmp_archive, archive)
+            finally:
+                tmp_archive.unlink(missing_ok=True)
+        shutil.rmtree(run_dir)
+
+    def _record_compressed(self, run_name: str) -> None:
+        def change(data: RunCatalogData) -> None:
+            entry = data.runs.get(run_name)
+            if entry is not None:
+                entry.status = "compressed"
+
+        self._update(change)
+
+    def apply_retention(self, current_run_name: str) -> None:
+        """
+        Compresses the run directories older than RUN_OUTPUT_COMPRESS_AFTER_DAYS
+        and deletes those older than RUN_OUTPUT_DELETE_AFTER_DAYS.
+
+        Runs under its own lock file, so that shards started together do not
+        process the same folders; the catalog is updated after each folder.
+        """
+        from immich_autotag.config.internal_config import (
+            RUN_OUTPUT_COMPRESS_AFTER_DAYS,
+            RUN_OUTPUT_DELETE_AFTER_DAYS,
+        )
+        from immich_autotag.logging.levels import LogLevel
+        from immich_autotag.logging.utils import log
+
+        self._logs_dir.mkdir(parents=True, exist_ok=True)
+        compressed = 0
+        deleted = 0
+        with _exclusive_lock(self._logs_dir / _RETENTION_LOCK_FILENAME):
+            now = datetime.now()
+            for name, entry in list(self._load().runs.items()):
+                if name == current_run_name:
+                    continue
+                age = now - entry.started_at
+                run_dir = self._logs_dir / name
+                archive = self._logs_dir / _COMPRESSED_DIRNAME / f"{name}.tar.gz"
+                try:
+                    if RUN_OUTPUT_DELETE_AFTER_DAYS is not None and age > timedelta(
+                        days=RUN_OUTPUT_DELETE_AFTER_DAYS
+                    ):
+                        shutil.rmtree(run_dir, ignore_errors=True)
+                        archive.unlink(missing_ok=True)
+                        self.forget([name])
+                        deleted += 1
+                    elif (
+                        RUN_OUTPUT_COMPRESS_AFTER_DAYS is not None
+                        and entry.status != "compressed"
+                        and age > timedelta(days=RUN_OUTPUT_COMPRESS_AFTER_DAYS)
+                    ):
+                        self._compress_run_dir(run_dir, archive)
+                        self._record_compressed(name)
+                        compressed += 1
+                except OSError as e:
+                    log(
+                        f"[RUN CATALOG] Retention failed for {run_dir}: {e}",
+                        level=LogLevel.WARNING,
+                    )
+        if not compressed and not deleted:
+            return
+        log(
+            f"[RUN CATALOG] Retention: compressed {compressed} and deleted "
+            f"{deleted} old run folder(s) in {self._logs_dir}",
+            level=LogLevel.PROGRESS,
+        )
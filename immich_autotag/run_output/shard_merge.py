@@ -0,0 +1,219 @@
+"""
+Merge of the outputs of a sharded run (see config/sharding.py).
+
+Each shard writes its own run directory (`<date>_PID<pid>_shard<i>of<N>`). This
+module combines the latest run of every shard into one directory containing the
+summed run_statistics.yaml and the concatenated modification_report.txt:
+
+    python -m immich_autotag.run_output.shard_merge --shards 4
+    python -m immich_autotag.run_output.shard_merge logs_local/A logs_local/B
+
+The merged directory has no PID mark, so checkpoint resume never reads it.
+"""
+
+from __future__ import annotations
+
+import argparse
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Sequence
+
+from typeguard import typechecked
+
+from immich_autotag.config.sharding import ShardSpec
+from immich_autotag.logging.levels import LogLevel
+from immich_autotag.logging.utils import log
+
+from .execution import RunExecution
+from .manager import RunOutputManager
+
+if TYPE_CHECKING:
+    from immich_autotag.statistics.run_statistics import (
+        OutputAlbumCounter,
+        OutputTagCounter,
+        RunStatistics,
+    )
+
+_DEFAULT_LOGS_DIR = Path("logs_local")
+
+
+@typechecked
+def find_latest_shard_runs(logs_dir: Path, shard_count: int) -> list[RunExecution]:
+    """
+    The most recent run directory of each shard 1..shard_count in `logs_dir`.
+    Raises if a shard has no run.
+    """
+    latest: dict[int, tuple[datetime, Path]] = {}
+    for subdir in logs_dir.iterdir():
+        shard = ShardSpec.from_run_dir_name(subdir.name)
+        if shard is None or shard.count != shard_count or not subdir.is_dir():
+            continue
+        try:
+            started = datetime.strptime(
+                subdir.name.split(RunOutputManager.get_run_dir_pid_sep())[0],
+                RunOutputManager.get_run_dir_date_format(),
+            )
+        except ValueError:
+            continue
+        if shard.index not in latest or latest[shard.index][0] < started:
+            latest[shard.index] = (started, subdir)
+    missing = [i for i in range(1, shard_count + 1) if i not in latest]
+    if missing:
+        raise RuntimeError(
+            f"No run directory found in {logs_dir} for shard(s) "
+            f"{', '.join(f'{i}/{shard_count}' for i in missing)}"
+        )
+    return [RunExecution(latest[i][1]) for i in range(1, shard_count + 1)]
+
+
+def _sum_counters(target: dict, source: dict) -> None:
+    for key, value in source.items():
+        target[key] = target.get(key, 0) + value
+
+
+def _add_tag_counter(target: "OutputTagCounter", source: "OutputTagCounter") -> None:
+    target.total += source.total
+    target.added += source.added
+    target.removed += source.removed
+    target.removed_globally += source.removed_globally
+    target.created += source.created
+    target.errors += source.errors
+
+
+def _add_album_counter(
+    target: "OutputAlbumCounter", source: "OutputAlbumCounter"
+) -> None:
+    target.total += source.total
+    target.assigned += source.assigned
+    target.removed += source.removed
+    target.errors += source.errors
+
+
+@typechecked
+def merge_run_statistics(stats: Sequence["RunStatistics"]) -> "RunStatistics":
+    """Sums the counters of the shard statistics; times span all shards."""
+    from immich_autotag.statistics.run_statistics import (
+        OutputAlbumCounter,
+        OutputTagCounter,
+        RunStatistics,
+    )
+
+    if not stats:
+        raise ValueError("No statistics to merge")
+    finished = [s.finished_at for s in stats]
+    totals = [s.total_assets for s in stats if s.total_assets is not None]
+    event_counters: dict[str, int] = {}
+    output_tag_counters: dict[str, OutputTagCounter] = {}
+    output_album_counters: dict[str, OutputAlbumCounter] = {}
+    for s in stats:
+        _sum_counters(event_counters, s.event_counters)
+        for name, tag_counter in s.output_tag_counters.items():
+            _add_tag_counter(
+                output_tag_counters.setdefault(name, OutputTagCounter()),
+                tag_counter,
+            )
+        for name, album_counter in s.output_album_counters.items():
+            _add_album_counter(
+                output_album_counters.setdefault(name, OutputAlbumCounter()),
+                album_counter,
+            )
+    return RunStatistics(
+        git_describe_runtime=stats[0].git_describe_runtime,
+        git_describe_package=stats[0].git_describe_package,
+        album_date_mismatch_count=sum(s.album_date_mismatch_count for s in stats),
+        update_asset_date_count=sum(s.update_asset_date_count for s in stats),
+        total_assets=sum(totals) if totals else None,
+        max_assets=None,
+        skip_n=None,
+        last_processed_id=None,
+        count=sum(s.count for s in stats),
+        started_at=min(s.started_at for s in stats if s.started_at is not None),
+        finished_at=(
+            max(f for f in finished if f is not None) if all(finished) else None
+        ),
+        abrupt_exit_at=None,
+        previous_sessions_time=None,
+        extra={"merged_shards": [s.extra.get("shard") for s in stats]},
+        output_tag_counters=output_tag_counters,
+        output_album_counters=output_album_counters,
+        progress_description=f"Merged from {len(stats)} shard runs",
+        event_counters=event_counters,
+    )
+
+
+@typechecked
+def merge_shard_runs(
+    runs: Sequence[RunExecution], output_dir: Optional[Path] = None
+) -> Path:
+    """
+    Writes the merged statistics and modification report of `runs` into
+    `output_dir` (default: logs_local/<date>_merged_<n>shards). Returns it.
+    """
+    from immich_autotag.statistics.constants import RUN_STATISTICS_FILENAME
+    from immich_autotag.statistics.run_statistics import RunStatistics
+
+    if output_dir is None:
+        now = datetime.now().strftime(RunOutputManager.get_run_dir_date_format())
+        output_dir = runs[0].path.parent / f"{now}_merged_{len(runs)}shards"
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    stats: list[RunStatistics] = []
+    for run in runs:
+        stats_path = run.path / RUN_STATISTICS_FILENAME
+        if not stats_path.exists():
+            # The merged counters then cover fewer shards than the report
+            log(
+                f"[SHARD] {run.path.name} has no {RUN_STATISTICS_FILENAME} "
+                f"(the shard did not get to write it): its counters are missing "
+                f"from the merged statistics",
+                level=LogLevel.WARNING,
+            )
+            continue
+        stats.append(RunStatistics.from_yaml(stats_path))
+    if stats:
+        (output_dir / RUN_STATISTICS_FILENAME).write_text(
+            merge_run_statistics(stats).to_yaml(), encoding="utf-8"
+        )
+
+    report_path = RunExecution(output_dir).get_modification_report_path()
+    with report_path.open("w", encoding="utf-8") as out:
+        for run in runs:
+            shard_report = run.path / report_path.name
+            if not shard_report.exists():
+                continue
+            out.write(f"# --- {run.path.name} ---\n")
+            with shard_report.open("r", encoding="utf-8") as f:
+                for line in f:
+                    out.write(line)
+    return output_dir
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Merge the statistics and reports of a sharded run."
+    )
+    parser.add_argument(
+        "run_dirs", nargs="*", type=Path, help="Shard run directories to merge"
+    )
+    parser.add_argument(
+        "--shards",
+        type=int,
+        help="Merge the latest run of each of the N shards found in --logs-dir",
+    )
+    parser.add_argument("--logs-dir", type=Path, default=_DEFAULT_LOGS_DIR)
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args(argv)
+
+    if args.run_dirs:
+        runs = [RunExecution(p) for p in args.run_dirs]
+    elif args.shards:
+        runs = find_latest_shard_runs(args.logs_dir, args.shards)
+    else:
+        parser.error("give the shard run directories or --shards N")
+    output_dir = merge_shard_runs(runs, args.output)
+    print(f"[SHARD] Merged {len(runs)} shard runs into {output_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,5 @@
+"""Local library snapshot for offline analysis (export once, analyze many times)."""
+
+from .library_snapshot import LibrarySnapshot, SnapshotAsset, SnapshotWriter
+
+__all__ = ["LibrarySnapshot", "SnapshotAsset", "SnapshotWriter"]
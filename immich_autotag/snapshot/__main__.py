@@ -0,0 +1,77 @@
+"""
+Command line for the library snapshot:
+
+    python -m immich_autotag.snapshot export [--output PATH]
+    python -m immich_autotag.snapshot analyze PATH
+    python -m immich_autotag.snapshot classify PATH
+
+`export` connects to the server configured as for a regular run; `analyze` and
+`classify` only read the snapshot file and the local configuration.
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+from typing import Optional, Sequence
+
+from immich_autotag.utils.hooks import setup_all_hooks
+
+setup_all_hooks()
+
+
+def _export(output: Optional[Path]) -> Path:
+    from immich_autotag.context.immich_client_wrapper import ImmichClientWrapper
+    from immich_autotag.entrypoint.collections import init_collections_and_context
+    from immich_autotag.entrypoint.init import init_config_and_logging
+
+    from .export import export_library_snapshot
+
+    init_config_and_logging()
+    context = init_collections_and_context(ImmichClientWrapper.get_default_instance())
+    return export_library_snapshot(context, output)
+
+
+def _analyze(path: Path) -> str:
+    from .library_snapshot import LibrarySnapshot
+    from .offline_analysis import analyze_snapshot
+
+    with LibrarySnapshot(path) as snapshot:
+        return analyze_snapshot(snapshot).format()
+
+
+def _classify(path: Path) -> str:
+    from .batch_classification import classify_snapshot
+    from .library_snapshot import LibrarySnapshot
+
+    with LibrarySnapshot(path) as snapshot:
+        return classify_snapshot(snapshot).format()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m immich_autotag.snapshot",
+        description="Export the library metadata and analyze it offline.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    export_parser = commands.add_parser("export", help="Write a library snapshot")
+    export_parser.add_argument("--output", type=Path, default=None)
+    analyze_parser = commands.add_parser("analyze", help="Analyze a snapshot offline")
+    analyze_parser.add_argument("path", type=Path)
+    classify_parser = commands.add_parser(
+        "classify", help="Classification status of every asset, per rule"
+    )
+    classify_parser.add_argument("path", type=Path)
+    args = parser.parse_args(argv)
+
+    if args.command == "export":
+        print(f"[SNAPSHOT] Snapshot written to {_export(args.output)}")
+    elif args.command == "analyze":
+        print(_analyze(args.path))
+    else:
+        print(_classify(args.path))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
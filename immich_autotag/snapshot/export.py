@@ -0,0 +1,134 @@
+"""
+Export of the library metadata to a local snapshot (see library_snapshot.py).
+
+Albums are read from the warm AlbumCollectionWrapper (fully loaded first, so
+members and users are known) and assets are streamed once through
+AssetManager.iter_assets, i.e. the same proxies and DTO state readers as a
+regular run. Nothing on the server is modified.
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+from typeguard import typechecked
+
+from immich_autotag.logging.levels import LogLevel
+from immich_autotag.logging.utils import log
+
+from .library_snapshot import (
+    LibrarySnapshot,
+    SnapshotAlbumUser,
+    SnapshotAssetDates,
+    SnapshotWriter,
+)
+
+if TYPE_CHECKING:
+    from immich_autotag.albums.album.album_response_wrapper import (
+        AlbumResponseWrapper,
+    )
+    from immich_autotag.assets.asset_response_wrapper import AssetResponseWrapper
+    from immich_autotag.context.immich_context import ImmichContext
+
+# Progress is logged every this many exported assets
+_PROGRESS_EVERY = 5000
+
+
+def _as_datetime(value: object) -> Optional[datetime]:
+    """Album dates are Unset when the album has no assets."""
+    return value if isinstance(value, datetime) else None
+
+
+def _write_album(writer: SnapshotWriter, album: "AlbumResponseWrapper") -> None:
+    users = [
+        SnapshotAlbumUser(
+            user_id=str(user.get_uuid()),
+            name=user.get_name(),
+            email=str(user.get_email()),
+            role=str(user.get_role().value),
+        )
+        for user in album.get_album_users()
+    ]
+    writer.add_album(
+        album_id=str(album.get_album_uuid()),
+        name=album.get_album_name(),
+        owner_id=str(album.get_owner_uuid()),
+        start_date=_as_datetime(album.get_start_date()),
+        end_date=_as_datetime(album.get_end_date()),
+        asset_ids=[str(asset_id) for asset_id in album.get_asset_uuids()],
+        users=users,
+    )
+
+
+def _write_asset(
+    writer: SnapshotWriter, asset: "AssetResponseWrapper", context: "ImmichContext"
+) -> None:
+    dates = asset.get_dates()
+    try:
+        best_date: Optional[datetime] = asset.get_best_date()
+    except Exception as e:
+        # Stored as unknown: the live album date check skips these assets too
+        log(
+            f"[SNAPSHOT] No best date for asset {asset.get_id()}: {e}",
+            level=LogLevel.DEBUG,
+        )
+        best_date = None
+    duplicate_id = context.get_duplicates_collection().find_duplicate_id(asset.get_id())
+    writer.add_asset(
+        asset_id=str(asset.get_id()),
+        original_file_name=str(asset.get_original_file_name()),
+        original_path=str(asset.get_original_path()),
+        dates=SnapshotAssetDates(
+            created_at=dates[0],
+            file_created_at=dates[1],
+            file_modified_at=dates[2],
+            local_date_time=dates[3],
+        ),
+        best_date=best_date,
+        is_favorite=asset.is_favorite(),
+        duplicate_id=str(duplicate_id) if duplicate_id is not None else None,
+        tag_names=asset.get_tag_names(),
+    )
+
+
+@typechecked
+def export_library_snapshot(
+    context: "ImmichContext", path: Optional[Path] = None
+) -> Path:
+    """
+    Writes the albums and assets of the library to a snapshot at `path` (default:
+    library_snapshot.sqlite in the run output directory). Returns the path.
+
+    In a sharded run (config/sharding.py) only the assets of this shard are
+    exported; albums are always exported whole.
+    """
+    if path is None:
+        path = context.get_run_output_dir().get_library_snapshot_path()
+    t0 = time.time()
+    albums_collection = context.get_albums_collection()
+    albums_collection.ensure_all_full()
+    albums = albums_collection.get_albums()
+
+    asset_count = 0
+    with LibrarySnapshot.create(path) as writer:
+        writer.set_meta("exported_at", datetime.now(timezone.utc).isoformat())
+        for album in albums:
+            _write_album(writer, album)
+        for asset in context.get_asset_manager().iter_assets(context):
+            _write_asset(writer, asset, context)
+            asset_count += 1
+            if asset_count % _PROGRESS_EVERY == 0:
+                log(
+                    f"[SNAPSHOT] Exported {asset_count} assets...",
+                    level=LogLevel.PROGRESS,
+                )
+        writer.set_meta("asset_count", str(asset_count))
+    log(
+        f"[SNAPSHOT] Exported {asset_count} assets and {len(albums)} albums to "
+        f"{path} in {time.time() - t0:.2f}s",
+        level=LogLevel.FOCUS,
+    )
+    return path
@@ -0,0 +1,344 @@
+"""
+SQLite store for the offline library snapshot.
+
+The snapshot holds the metadata the analyses need (assets with their tags, dates,
+paths and duplicate group; albums with their members and users) in one local
+file. It is written once by snapshot/export.py and read by
+snapshot/offline_analysis.py without any network access.
+
+Writes go to a temporary file that replaces the target on close(), so a
+half-written export never shadows a good snapshot.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+import attrs
+from typeguard import typechecked
+
+SNAPSHOT_SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE assets (
+    id TEXT PRIMARY KEY,
+    original_file_name TEXT,
+    original_path TEXT,
+    created_at TEXT,
+    file_created_at TEXT,
+    file_modified_at TEXT,
+    local_date_time TEXT,
+    best_date TEXT,
+    is_favorite INTEGER NOT NULL DEFAULT 0,
+    duplicate_id TEXT
+);
+CREATE TABLE asset_tags (asset_id TEXT NOT NULL, tag_name TEXT NOT NULL);
+CREATE TABLE albums (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    owner_id TEXT,
+    start_date TEXT,
+    end_date TEXT,
+    asset_count INTEGER
+);
+CREATE TABLE album_assets (album_id TEXT NOT NULL, asset_id TEXT NOT NULL);
+CREATE TABLE album_users (
+    album_id TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    name TEXT,
+    email TEXT,
+    role TEXT
+);
+"""
+
+# Created after the bulk load: building them once is faster than maintaining them
+_INDEXES = """
+CREATE INDEX idx_asset_tags_asset ON asset_tags (asset_id);
+CREATE INDEX idx_asset_tags_tag ON asset_tags (tag_name);
+CREATE INDEX idx_album_assets_asset ON album_assets (asset_id);
+CREATE INDEX idx_album_assets_album ON album_assets (album_id);
+CREATE INDEX idx_assets_duplicate ON assets (duplicate_id);
+"""
+
+_INSERT_BATCH_SIZE = 5000
+
+
+def _to_text(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value is not None else None
+
+
+def _from_text(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+@attrs.define(auto_attribs=True, slots=True, frozen=True)
+class SnapshotAssetDates:
+    """The raw date fields of an asset, as stored in the snapshot."""
+
+    created_at: Optional[datetime]
+    file_created_at: Optional[datetime]
+    file_modified_at: Optional[datetime]
+    local_date_time: Optional[datetime]
+
+
+@attrs.define(auto_attribs=True, slots=True, frozen=True)
+class SnapshotAlbumUser:
+    user_id: str
+    name: str
+    email: str
+    role: str
+
+
+@attrs.define(auto_attribs=True, slots=True, frozen=True)
+class SnapshotAssetTag:
+    asset_id: str
+    tag_name: str
+
+
+@attrs.define(auto_attribs=True, slots=True, frozen=True)
+class SnapshotAlbumMembership:
+    album_id: str
+    album_name: str
+    asset_id: str
+
+
+@attrs.define(auto_attribs=True, slots=True, frozen=True)
+class SnapshotAsset:
+    """One asset as stored in the snapshot, with its tag and album names."""
+
+    asset_id: str
+    original_path: Optional[str]
+    best_date: Optional[datetime]
+    duplicate_id: Optional[str]
+    tag_names: list[str]
+    # One entry per album membership (two albums may share a name)
+    album_names: list[str]
+
+
+@attrs.define(auto_attribs=True, slots=True)
+class SnapshotWriter:
+    """Bulk writer for a new snapshot file (use as a context manager)."""
+
+    _path: Path
+    _tmp_path: Path = attrs.field(init=False)
+    _conn: sqlite3.Connection = attrs.field(init=False, repr=False)
+    _pending: dict[str, list[tuple]] = attrs.field(factory=dict, init=False)
+
+    def __attrs_post_init__(self) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._tmp_path = self._path.with_name(self._path.name + ".tmp")
+        if self._tmp_path.exists():
+            self._tmp_path.unlink()
+        self._conn = sqlite3.connect(self._tmp_path)
+        # The file is discarded on failure, so durability during the load is moot
+        self._conn.execute("PRAGMA journal_mode = OFF")
+        self._conn.execute("PRAGMA synchronous = OFF")
+        self._conn.executescript(_SCHEMA)
+        self.set_meta("schema_version", str(SNAPSHOT_SCHEMA_VERSION))
+
+    def set_meta(self, key: str, value: str) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value)
+        )
+
+    def _flush(self, table: str) -> None:
+        rows = self._pending.pop(table, None)
+        if not rows:
+            return
+        placeholders = ", ".join("?" * len(rows[0]))
+        self._conn.executemany(f"INSERT INTO {table} VALUES ({placeholders})", rows)
+
+    def _add(self, table: str, row: tuple) -> None:
+        rows = self._pending.setdefault(table, [])
+        rows.append(row)
+        if len(rows) >= _INSERT_BATCH_SIZE:
+            self._flush(table)
+
+    @typechecked
+    def add_asset(
+        self,
+        *,
+        asset_id: str,
+        original_file_name: Optional[str],
+        original_path: Optional[str],
+        dates: SnapshotAssetDates,
+        best_date: Optional[datetime],
+        is_favorite: bool,
+        duplicate_id: Optional[str],
+        tag_names: Iterable[str],
+    ) -> None:
+        self._add(
+            "assets",
+            (
+                asset_id,
+                original_file_name,
+                original_path,
+                _to_text(dates.created_at),
+                _to_text(dates.file_created_at),
+                _to_text(dates.file_modified_at),
+                _to_text(dates.local_date_time),
+                _to_text(best_date),
+                int(is_favorite),
+                duplicate_id,
+            ),
+        )
+        for tag_name in tag_names:
+            self._add("asset_tags", (asset_id, tag_name))
+
+    @typechecked
+    def add_album(
+        self,
+        *,
+        album_id: str,
+        name: str,
+        owner_id: Optional[str],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        asset_ids: Iterable[str],
+        users: Iterable[SnapshotAlbumUser],
+    ) -> None:
+        asset_ids = list(asset_ids)
+        self._add(
+            "albums",
+            (
+                album_id,
+                name,
+                owner_id,
+                _to_text(start_date),
+                _to_text(end_date),
+                len(asset_ids),
+            ),
+        )
+        for asset_id in asset_ids:
+            self._add("album_assets", (album_id, asset_id))
+        for user in users:
+            self._add(
+                "album_users",
+                (album_id, user.user_id, user.name, user.email, user.role),
+            )
+
+    def close(self) -> None:
+        for table in list(self._pending):
+            self._flush(table)
+        self._conn.executescript(_INDEXES)
+        self._conn.commit()
+        self._conn.close()
+        os.replace(self._tmp_path, self._path)
+
+    def abort(self) -> None:
+        self._conn.close()
+        if self._tmp_path.exists():
+            self._tmp_path.unlink()
+
+    def __enter__(self) -> "SnapshotWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+@attrs.define(auto_attribs=True, slots=True)
+class LibrarySnapshot:
+    """Read access to a snapshot file written by SnapshotWriter."""
+
+    _path: Path
+    _conn: sqlite3.Connection = attrs.field(init=False, repr=False)
+
+    def __attrs_post_init__(self) -> None:
+        if not self._path.exists():
+            raise FileNotFoundError(f"Library snapshot not found: {self._path}")
+        self._conn = sqlite3.connect(f"file:{self._path}?mode=ro", uri=True)
+        version = self.get_meta("schema_version")
+        if version != str(SNAPSHOT_SCHEMA_VERSION):
+            raise ValueError(
+                f"Unsupported snapshot schema version {version} in {self._path} "
+                f"(expected {SNAPSHOT_SCHEMA_VERSION}); export it again"
+            )
+
+    @staticmethod
+    @typechecked
+    def create(path: Path) -> SnapshotWriter:
+        return SnapshotWriter(path)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def get_path(self) -> Path:
+        return self._path
+
+    def get_meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute(
+            "SELECT value FROM meta WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def count_assets(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM assets").fetchone()[0]
+
+    def count_albums(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM albums").fetchone()[0]
+
+    def _names_by_asset(self, query: str) -> dict[str, list[str]]:
+        names: dict[str, list[str]] = {}
+        for asset_id, name in self._conn.execute(query):
+            names.setdefault(asset_id, []).append(name)
+        return names
+
+    def get_tag_names_by_asset(self) -> dict[str, list[str]]:
+        return self._names_by_asset("SELECT asset_id, tag_name FROM asset_tags")
+
+    def get_album_names_by_asset(self) -> dict[str, list[str]]:
+        return self._names_by_asset(
+            "SELECT aa.asset_id, al.name FROM album_assets aa "
+            "JOIN albums al ON al.id = aa.album_id"
+        )
+
+    def get_asset_ids(self) -> list[str]:
+        return [row[0] for row in self._conn.execute("SELECT id FROM assets")]
+
+    def iter_asset_tags(self) -> Iterator[SnapshotAssetTag]:
+        for asset_id, tag_name in self._conn.execute(
+            "SELECT asset_id, tag_name FROM asset_tags"
+        ):
+            yield SnapshotAssetTag(asset_id=asset_id, tag_name=tag_name)
+
+    def iter_album_memberships(self) -> Iterator[SnapshotAlbumMembership]:
+        """Album memberships of every asset, grouped by album."""
+        for album_id, album_name, asset_id in self._conn.execute(
+            "SELECT al.id, al.name, aa.asset_id FROM album_assets aa "
+            "JOIN albums al ON al.id = aa.album_id ORDER BY al.id"
+        ):
+            yield SnapshotAlbumMembership(
+                album_id=album_id, album_name=album_name, asset_id=asset_id
+            )
+
+    def iter_assets(self) -> Iterator[SnapshotAsset]:
+        """All assets with their tag and album names (two grouped queries)."""
+        tags = self.get_tag_names_by_asset()
+        albums = self.get_album_names_by_asset()
+        query = "SELECT id, original_path, best_date, duplicate_id FROM assets"
+        for asset_id, original_path, best_date, duplicate_id in self._conn.execute(
+            query
+        ):
+            yield SnapshotAsset(
+                asset_id=asset_id,
+                original_path=original_path,
+                best_date=_from_text(best_date),
+                duplicate_id=duplicate_id,
+                tag_names=tags.get(asset_id, []),
+                album_names=albums.get(asset_id, []),
+            )
+
+    def __enter__(self) -> "LibrarySnapshot":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
@@ -0,0 +1,165 @@
+"""
+Analyses run against a library snapshot, without network access.
+
+They reuse the decision logic of the live pipeline on plain data:
+- classification: ClassificationRuleSet.classify_names / ClassificationStatus
+- album date consistency: parse_album_name_date and the configured threshold
+- duplicate classification tags: compare_tag_sets over each duplicate group
+
+Nothing is tagged or reported to the ModificationReport; the results are a
+preview of what a live run would find.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import TYPE_CHECKING, Optional
+
+import attrs
+from typeguard import typechecked
+
+from immich_autotag.types.uuid_wrappers import AssetUUID
+
+from .library_snapshot import LibrarySnapshot, SnapshotAsset
+
+if TYPE_CHECKING:
+    from immich_autotag.classification.classification_rule_set import (
+        ClassificationRuleSet,
+    )
+
+
+@attrs.define(auto_attribs=True, slots=True, frozen=True)
+class AlbumDateMismatch:
+    asset_id: str
+    album_name: str
+    album_date: str
+    asset_date: str
+    diff_days: int
+
+
+@attrs.define(auto_attribs=True, slots=True)
+class OfflineAnalysisReport:
+    total_assets: int = 0
+    # ClassificationStatus name -> number of assets
+    status_counts: Counter = attrs.field(factory=Counter)
+    album_date_mismatches: list[AlbumDateMismatch] = attrs.field(factory=list)
+    album_date_errors: int = 0
+    # ClassificationTagComparisonResult value -> number of duplicate groups
+    duplicate_group_results: Counter = attrs.field(factory=Counter)
+
+    def format(self) -> str:
+        lines = [f"Assets: {self.total_assets}", "Classification status:"]
+        for status, count in sorted(self.status_counts.items()):
+            lines.append(f"  {status}: {count}")
+        lines.append(
+            f"Album date mismatches: {len(self.album_date_mismatches)} "
+            f"(unparseable album dates: {self.album_date_errors})"
+        )
+        for mismatch in self.album_date_mismatches:
+            lines.append(
+                f"  {mismatch.asset_id} in '{mismatch.album_name}': asset "
+                f"{mismatch.asset_date} vs album {mismatch.album_date} "
+                f"(diff {mismatch.diff_days} days)"
+            )
+        lines.append("Duplicate groups by classification tags:")
+        for result, count in sorted(self.duplicate_group_results.items()):
+            lines.append(f"  {result}: {count}")
+        return "\n".join(lines)
+
+
+def _check_album_dates(
+    asset: SnapshotAsset, threshold_days: int, report: OfflineAnalysisReport
+) -> None:
+    from immich_autotag.assets.consistency_checks._album_date_consistency import (
+        parse_album_name_date,
+    )
+
+    asset_date = asset.best_date
+    if asset_date is None:
+        return
+    for album_name in asset.album_names:
+        try:
+            album_date = parse_album_name_date(album_name, asset_date.tzinfo)
+        except ValueError:
+            report.album_date_errors += 1
+            continue
+        if album_date is None:
+            continue
+        diff_days = abs((asset_date - album_date).days)
+        if diff_days > threshold_days:
+            report.album_date_mismatches.append(
+                AlbumDateMismatch(
+                    asset_id=asset.asset_id,
+                    album_name=album_name,
+                    album_date=str(album_date.date()),
+                    asset_date=str(asset_date.date()),
+                    diff_days=diff_days,
+                )
+            )
+
+
+def _compare_duplicate_groups(
+    groups: dict[str, list[set[str]]], report: OfflineAnalysisReport
+) -> None:
+    """Each group is compared member by member against its first member."""
+    from immich_autotag.assets.duplicate_tag_logic.__compare_classification_tags import (
+        compare_tag_sets,
+    )
+    from immich_autotag.assets.duplicate_tag_logic._classification_tag_comparison_result import (
+        ClassificationTagComparisonResult,
+    )
+
+    for members in groups.values():
+        if len(members) < 2:
+            continue
+        results = {compare_tag_sets(members[0], other).result for other in members[1:]}
+        if ClassificationTagComparisonResult.CONFLICT in results:
+            outcome = ClassificationTagComparisonResult.CONFLICT
+        elif results == {ClassificationTagComparisonResult.EQUAL}:
+            outcome = ClassificationTagComparisonResult.EQUAL
+        else:
+            outcome = ClassificationTagComparisonResult.AUTOFIX_OTHER
+        report.duplicate_group_results[outcome.value] += 1
+
+
+@typechecked
+def analyze_snapshot(
+    snapshot: LibrarySnapshot,
+    rule_set: Optional["ClassificationRuleSet"] = None,
+    threshold_days: Optional[int] = None,
+) -> OfflineAnalysisReport:
+    """
+    Runs the classification, album date and duplicate analyses over `snapshot`.
+    The rules and the date threshold default to the current configuration; pass
+    them explicitly to preview edited rules.
+    """
+    from immich_autotag.classification.classification_rule_set import (
+        ClassificationRuleSet,
+    )
+
+    if rule_set is None:
+        rule_set = ClassificationRuleSet.get_rule_set_from_config_manager()
+    if threshold_days is None:
+        from immich_autotag.config.manager import ConfigManager
+
+        date_config = ConfigManager.get_instance().get_config().album_date_consistency
+        if date_config is not None and date_config.enabled:
+            threshold_days = date_config.threshold_days
+
+    report = OfflineAnalysisReport()
+    duplicate_groups: dict[str, list[set[str]]] = {}
+    for asset in snapshot.iter_assets():
+        report.total_assets += 1
+        # Each album name once, like the live asset's rule matching
+        classification = rule_set.classify_names(
+            AssetUUID(asset.asset_id), asset.tag_names, set(asset.album_names)
+        )
+        report.status_counts[classification.get_status().name] += 1
+        if threshold_days is not None:
+            _check_album_dates(asset, threshold_days, report)
+        if asset.duplicate_id is not None:
+            duplicate_groups.setdefault(asset.duplicate_id, []).append(
+                set(classification.get_tags())
+            )
+    _compare_duplicate_groups(duplicate_groups, report)
+    return report
@@ -4,7 +4,7 @@ from typing import Optional
 from typeguard import typechecked
 
 from immich_autotag.run_output.manager import RunOutputManager
-from immich_autotag.statistics.run_statistics import RunStatistics
+from immich_autotag.statistics._run_count import read_run_count
 
 
 @typechecked
@@ -16,19 +16,17 @@ def get_max_skip_n_from_recent(
     """
     max_count = 0
     for run_exec in RunOutputManager.current().find_recent_run_dirs(
-        max_age_hours=max_age_hours
+        max_age_hours=max_age_hours, same_shard_only=True
     ):
-        stats_path = run_exec.get_run_statistics_path()
-        if stats_path.exists():
-            try:
-                stats = RunStatistics.from_yaml(stats_path)
-                count = stats.count
-                if count > max_count:
-                    max_count = count
-            except Exception as e:
-                import warnings
+        try:
+            count = read_run_count(run_exec)
+        except Exception as e:
+            import warnings
 
-                warnings.warn(f"Could not load {stats_path}: {e}")
+            warnings.warn(f"Could not load the statistics of {run_exec.path}: {e}")
+            continue
+        if count is not None and count > max_count:
+            max_count = count
     if max_count > 0:
         return max(0, max_count - overlap)
     return None
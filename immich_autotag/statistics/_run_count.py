@@ -0,0 +1,25 @@
+from typing import Optional
+
+from typeguard import typechecked
+
+from immich_autotag.run_output.execution import RunExecution
+from immich_autotag.run_output.manager import RunOutputManager
+from immich_autotag.run_output.run_catalog import RunCatalog
+from immich_autotag.statistics.run_statistics import RunStatistics
+
+
+@typechecked
+def read_run_count(run_exec: RunExecution) -> Optional[int]:
+    """
+    Processed count of a run: from the run catalog when the run has finished,
+    else from its run_statistics.yaml (None if it has none). Parse errors of the
+    YAML are raised.
+    """
+    if RunCatalog.is_enabled():
+        entry = RunOutputManager.current().get_catalog().get_entry(run_exec.path.name)
+        if entry is not None and entry.count is not None:
+            return entry.count
+    stats_path = run_exec.get_run_statistics_path()
+    if not stats_path.exists():
+        return None
+    return RunStatistics.from_yaml(stats_path).count
@@ -94,27 +94,27 @@ class CheckpointManager:
         Returns True if archiving happened, False otherwise.
         """
         from immich_autotag.run_output.manager import RunOutputManager
-        from immich_autotag.statistics.run_statistics import RunStatistics
+        from immich_autotag.run_output.run_catalog import RunCatalog
+        from immich_autotag.statistics._run_count import read_run_count
 
         threshold = total_assets - self.OVERLAP
         recent_dirs = list(
-            RunOutputManager.current().find_recent_run_dirs(max_age_hours=72)
+            RunOutputManager.current().find_recent_run_dirs(
+                max_age_hours=72, same_shard_only=True
+            )
         )
 
         cycle_completed = False
         for run_exec in recent_dirs:
-            stats_path = run_exec.get_run_statistics_path()
-            if not stats_path.exists():
-                continue
             try:
-                stats = RunStatistics.from_yaml(stats_path)
-                if stats.count >= threshold:
+                count = read_run_count(run_exec)
+                if count is not None and count >= threshold:
                     cycle_completed = True
                     break
             except Exception as e:
                 log(
-                    f"[CHECKPOINT] Could not read {stats_path} during cycle "
-                    f"detection: {e}",
+                    f"[CHECKPOINT] Could not read the count of {run_exec.path} "
+                    f"during cycle detection: {e}",
                     level=LogLevel.WARNING,
                 )
                 continue
@@ -132,16 +132,19 @@ class CheckpointManager:
         archive_root = logs_dir / "_archive" / f"cycle-{datetime.now():%Y%m%d_%H%M%S}"
         archive_root.mkdir(parents=True, exist_ok=True)
 
-        archived = 0
+        archived_names: list[str] = []
         for run_exec in recent_dirs:
             try:
                 run_exec.path.rename(archive_root / run_exec.path.name)
-                archived += 1
+                archived_names.append(run_exec.path.name)
             except Exception as e:
                 log(
                     f"[CHECKPOINT] Failed to archive {run_exec.path}: {e}",
                     level=LogLevel.WARNING,
                 )
+        archived = len(archived_names)
+        if archived_names and RunCatalog.is_enabled():
+            RunOutputManager.current().get_catalog().forget(archived_names)
 
         log(
             f"[CHECKPOINT] End of cycle detected: a recent run reached "
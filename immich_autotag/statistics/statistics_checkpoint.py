@@ -11,6 +11,7 @@ from typing import Optional
 from typeguard import typechecked
 
 from immich_autotag.run_output.manager import RunOutputManager
+from immich_autotag.statistics._run_count import read_run_count
 from immich_autotag.statistics.run_statistics import RunStatistics
 
 
@@ -25,17 +26,15 @@ def _find_recent_max_count(overlap: int, hours: int) -> Optional[int]:
     max_count = 0
     found = False
     for run_exec in RunOutputManager.current().find_recent_run_dirs(
-        max_age_hours=hours
+        max_age_hours=hours, same_shard_only=True
     ):
-        stats_path = run_exec.get_run_statistics_path()
-        if stats_path.exists():
-            try:
-                stats = RunStatistics.from_yaml(stats_path)
-                if stats.count > max_count:
-                    max_count = stats.count
-                    found = True
-            except Exception:
-                continue
+        try:
+            count = read_run_count(run_exec)
+        except Exception:
+            continue
+        if count is not None and count > max_count:
+            max_count = count
+            found = True
     if found:
         return max(0, max_count - overlap)
     return None
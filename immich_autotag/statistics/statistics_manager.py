@@ -14,7 +14,10 @@ from typeguard import typechecked
 
 from immich_autotag.config.models import UserConfig  # GitPython
 from immich_autotag.types.uuid_wrappers import AssetUUID
-from immich_autotag.utils.perf.performance_tracker import PerformanceTracker
+from immich_autotag.utils.perf.performance_tracker import (
+    PerformanceTracker,
+    ProgressSnapshot,
+)
 
 from .checkpoint_manager import CheckpointManager
 from .run_statistics import RunStatistics
@@ -56,6 +59,9 @@ class StatisticsManager:
         default=None, init=False, repr=False
     )  # noqa
     _tags: TagStatsManager = attr.ib(default=None, init=False, repr=False)  # noqa
+    _relevant_tags: Optional[frozenset[str]] = attr.ib(
+        default=None, init=False, repr=False
+    )  # noqa
 
     @typechecked
     def _get_or_create_perf_tracker(self) -> PerformanceTracker:
@@ -178,6 +184,13 @@ class StatisticsManager:
             self._to_session_count(abs_count)
         )
 
+    @typechecked
+    def get_progress_snapshot(self) -> ProgressSnapshot:
+        abs_count = self.get_or_create_run_stats().count
+        return self._get_or_create_perf_tracker().get_progress_snapshot(
+            self._to_session_count(abs_count)
+        )
+
     @typechecked
     def set_total_assets(self, total_assets: int) -> None:
         with self._lock:
@@ -186,7 +199,22 @@ class StatisticsManager:
             self._get_or_create_perf_tracker()
 
     def maybe_print_progress(self, count: int) -> None:
-        self._get_or_create_perf_tracker().update(self._to_session_count(count))
+        from immich_autotag.logging.levels import LogLevel
+        from immich_autotag.logging.utils import log
+        from immich_autotag.utils.perf.memory_governor import MemoryGovernor
+        from immich_autotag.utils.perf.metrics_exporter import MetricsExporter
+
+        printed = self._get_or_create_perf_tracker().update(
+            self._to_session_count(count)
+        )
+        if MetricsExporter.is_enabled():
+            MetricsExporter.get_instance().maybe_export()
+        if not MemoryGovernor.is_enabled():
+            return
+        governor = MemoryGovernor.get_instance()
+        governor.maybe_check()
+        if printed:
+            log(governor.describe(), level=LogLevel.PROGRESS)
 
     @typechecked
     def print_progress(self, count: int) -> None:
@@ -295,10 +323,11 @@ class StatisticsManager:
             level=LogLevel.WARNING,
         )
 
-    @typechecked
-    def finish_run(self) -> None:
+    def _finish_run(self, *, aborted: bool) -> None:
         from datetime import datetime, timezone
 
+        from immich_autotag.run_output.manager import RunOutputManager
+
         with self._lock:
             now = datetime.now(timezone.utc)
             self.get_or_create_run_stats().finished_at = now
@@ -313,12 +342,27 @@ class StatisticsManager:
                     prev + session_time
                 )
             self.save_to_file()
+            stats = self.get_or_create_run_stats()
+            RunOutputManager.current().record_run_end(
+                aborted=aborted,
+                count=stats.count,
+                total_assets=stats.total_assets,
+                skip_n=stats.skip_n,
+            )
+        from immich_autotag.utils.perf.metrics_exporter import MetricsExporter
+
+        if MetricsExporter.is_enabled():
+            MetricsExporter.get_instance().export()
+
+    @typechecked
+    def finish_run(self) -> None:
+        self._finish_run(aborted=False)
 
     @typechecked
     def abrupt_exit(self) -> None:
-        self.finish_run()
+        self._finish_run(aborted=True)
 
-    def get_relevant_tags(self) -> set[str]:
+    def _compute_relevant_tags(self) -> frozenset[str]:
         from immich_autotag.config.manager import ConfigManager
 
         manager: ConfigManager = ConfigManager.get_instance()
@@ -335,7 +379,16 @@ class StatisticsManager:
                 tags.add(config.duplicate_processing.autotag_album_conflict)
             if config.duplicate_processing.autotag_classification_conflict is not None:
                 tags.add(config.duplicate_processing.autotag_classification_conflict)
-        return tags
+        return frozenset(tags)
+
+    def get_relevant_tags(self) -> frozenset[str]:
+        """
+        Tags whose counters are tracked in the statistics. Computed once from the
+        configuration, as it is checked for every processed asset.
+        """
+        if self._relevant_tags is None:
+            self._relevant_tags = self._compute_relevant_tags()
+        return self._relevant_tags
 
     @typechecked
     def process_asset_tags(self, tag_names: list[str]) -> None:
@@ -27,14 +27,16 @@ class TagStatsManager:
 
     @typechecked
     def process_asset_tags(self, tag_names: list[str]) -> None:
+        present = self._stats_manager.get_relevant_tags().intersection(tag_names)
+        if not present:
+            return
         stats = self._stats_manager.get_stats()
-        for tag in self._stats_manager.get_relevant_tags():
-            if tag in tag_names:
-                if tag not in stats.output_tag_counters:
-                    from .run_statistics import OutputTagCounter
+        for tag in present:
+            if tag not in stats.output_tag_counters:
+                from .run_statistics import OutputTagCounter
 
-                    stats.output_tag_counters[tag] = OutputTagCounter()
-                stats.output_tag_counters[tag].total += 1
+                stats.output_tag_counters[tag] = OutputTagCounter()
+            stats.output_tag_counters[tag].total += 1
         self._stats_manager.save_to_file()
 
     @typechecked
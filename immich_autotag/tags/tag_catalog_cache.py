@@ -0,0 +1,71 @@
+"""
+Persistent tag catalog shared across runs.
+
+The whole tag list is stored through ApiCacheManager (current run directory,
+falling back to recent runs) together with the time it was saved. The tags API
+has no "updated since" filter, so reconciling the catalog with the server still
+lists every tag; only the tags whose `updatedAt` (or name) differs are replaced,
+added or removed in the index.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Iterable, Optional
+
+import attrs
+
+from immich_autotag.tags.tag_response_wrapper import TagWrapper
+from immich_autotag.types.timestamp import Timestamp
+from immich_autotag.utils.api_disk_cache import ApiCacheKey, ApiCacheManager
+
+TAG_CATALOG_CACHE_KEY = "tag_catalog"
+TAG_CATALOG_FORMAT_VERSION = 1
+
+
+@attrs.define(auto_attribs=True, slots=True, frozen=True)
+class TagCatalogSnapshot:
+    """Tags read from the persisted catalog, with its save time."""
+
+    tags: list[TagWrapper]
+    saved_at: Timestamp
+
+    def age_seconds(self) -> float:
+        return time.time() - self.saved_at
+
+
+def load_tag_catalog() -> Optional[TagCatalogSnapshot]:
+    """Returns the persisted tag catalog, or None if missing or unreadable."""
+    data = ApiCacheManager.create(cache_type=ApiCacheKey.TAGS).load(
+        TAG_CATALOG_CACHE_KEY
+    )
+    if not isinstance(data, dict) or data.get("format") != TAG_CATALOG_FORMAT_VERSION:
+        return None
+    items = data.get("tags")
+    if not isinstance(items, list):
+        return None
+    try:
+        saved_at = float(data["saved_at"])  # type: ignore[arg-type]
+        tags = [TagWrapper.from_cache_dict(item, saved_at) for item in items]
+        return TagCatalogSnapshot(tags=tags, saved_at=saved_at)
+    except Exception as e:
+        from immich_autotag.logging.levels import LogLevel
+        from immich_autotag.logging.utils import log
+
+        log(
+            f"[TAG_CATALOG] Ignoring unreadable tag catalog: {e}",
+            level=LogLevel.WARNING,
+        )
+        return None
+
+
+def save_tag_catalog(tags: Iterable[TagWrapper]) -> None:
+    """Persists the given tags as the current tag catalog."""
+    ApiCacheManager.create(cache_type=ApiCacheKey.TAGS).save(
+        TAG_CATALOG_CACHE_KEY,
+        {
+            "format": TAG_CATALOG_FORMAT_VERSION,
+            "saved_at": time.time(),
+            "tags": [t.to_cache_dict() for t in tags],
+        },
+    )
@@ -27,6 +27,11 @@ class TagCollectionWrapper:
 
     _index: TagDualMap = attrs.field(factory=TagDualMap)
     _fully_loaded: bool = attrs.field(default=False, init=False)
+    # True once the index has been reconciled with the server during this run
+    # (False while it only reflects the persisted tag catalog)
+    _synced_with_api: bool = attrs.field(default=False, init=False)
+    # Tags created since the persisted catalog was last written
+    _unsaved_creations: int = attrs.field(default=0, init=False)
     from immich_autotag.report.modification_entry import ModificationEntry
 
     def __attrs_post_init__(self):
@@ -38,26 +43,101 @@ class TagCollectionWrapper:
                 "TagCollectionWrapper singleton already exists. Use "
                 "TagCollectionWrapper.get_instance()."
             )
+        from immich_autotag.utils.perf.memory_governor import (
+            approx_collection_size,
+            register_cache,
+        )
+
+        # Reported only: the tag index is needed for every asset
+        register_cache(
+            "tags",
+            estimate=lambda: approx_collection_size(
+                self._index.values(), len(self._index.values())
+            ),
+        )
 
     def _set_fully_loaded(self):
         self._fully_loaded = True
 
-    def _load_all_from_api(self):
+    def _add_or_replace(self, tag: "TagWrapper") -> None:
+        try:
+            previous = self._index.get_by_id(tag.get_id())
+        except Exception:
+            previous = None
+        if previous is not None:
+            self._index.remove(previous)
+        self._index.add(tag)
+
+    def _reconcile_with_api(self) -> None:
         """
-        Loads all tags from the API and adds them to the index, marking as fully_loaded.
-        If already fully_loaded, does nothing.
+        Fetches the tag list and applies only the delta to the index: tags whose
+        `updatedAt` changed are replaced, new ones added and missing ones removed.
+        The result is persisted as the tag catalog for later runs.
         """
-        if self._fully_loaded:
-            return
         from immich_autotag.api.logging_proxy.load_all_tags_wrapped import (
             load_all_tags_wrapped,
         )
-
-        self._index.clear()
-        for tag in load_all_tags_wrapped():
+        from immich_autotag.logging.levels import LogLevel
+        from immich_autotag.logging.utils import log
+        from immich_autotag.tags.tag_catalog_cache import save_tag_catalog
+
+        remote = {tag.get_id(): tag for tag in load_all_tags_wrapped()}
+        local = {tag.get_id(): tag for tag in self._index}
+        removed = [tag for tag_id, tag in local.items() if tag_id not in remote]
+        changed = [
+            tag
+            for tag_id, tag in remote.items()
+            if tag_id not in local
+            or local[tag_id].get_updated_at() != tag.get_updated_at()
+            or local[tag_id].get_name() != tag.get_name()
+        ]
+        # Remove first so renamed tags do not clash by name
+        for tag in removed:
+            self._index.remove(tag)
+        for tag in changed:
+            if tag.get_id() in local:
+                self._index.remove(local[tag.get_id()])
+        for tag in changed:
             self._index.add(tag)
+        log(
+            f"[TAG_CATALOG] Reconciled with API: {len(remote)} tags, "
+            f"{len(changed)} added/updated, {len(removed)} removed",
+            level=LogLevel.PROGRESS,
+        )
+        if changed or removed or not local:
+            save_tag_catalog(self._index)
+            self._unsaved_creations = 0
+        self._synced_with_api = True
         self._set_fully_loaded()
 
+    def _load_all_from_api(self):
+        """
+        Loads all tags into the index, marking as fully_loaded.
+        A recent persisted tag catalog is used without calling the API; otherwise
+        the index is reconciled with the API. If already fully_loaded, does nothing.
+        """
+        if self._fully_loaded:
+            return
+        from immich_autotag.config.internal_config import TAG_CATALOG_TRUST_SECONDS
+        from immich_autotag.tags.tag_catalog_cache import load_tag_catalog
+
+        snapshot = load_tag_catalog()
+        if snapshot is not None:
+            for tag in snapshot.tags:
+                self._add_or_replace(tag)
+            if snapshot.age_seconds() < TAG_CATALOG_TRUST_SECONDS:
+                from immich_autotag.logging.levels import LogLevel
+                from immich_autotag.logging.utils import log
+
+                log(
+                    f"[TAG_CATALOG] Using persisted tag catalog "
+                    f"({len(snapshot.tags)} tags, age {snapshot.age_seconds():.0f}s)",
+                    level=LogLevel.PROGRESS,
+                )
+                self._set_fully_loaded()
+                return
+        self._reconcile_with_api()
+
     def _sync_from_api(self, client: ImmichClient) -> None:
         """
         Refresh tag cache from the API to handle external changes or race conditions.
@@ -70,8 +150,7 @@ class TagCollectionWrapper:
             "[TAG_CACHE] Detected out-of-sync tag cache, refreshing from API"
         )
 
-        self._fully_loaded = False
-        self._load_all_from_api()
+        self._reconcile_with_api()
 
     def _load_single_by_id_from_api(self, id_: "TagUUID") -> "TagWrapper | None":
         """
@@ -101,8 +180,16 @@ class TagCollectionWrapper:
         try:
             return self._index.get_by_name(name)
         except TagNotFoundError:
-            # Tag doesn't exist in the collection after full load
-            return None
+            pass
+        if not self._synced_with_api:
+            # The persisted catalog may predate the tag: reconcile once
+            self._reconcile_with_api()
+            try:
+                return self._index.get_by_name(name)
+            except TagNotFoundError:
+                pass
+        # Tag doesn't exist in the collection after full load
+        return None
 
     @typechecked
     def create_tag_if_not_exists(
@@ -129,6 +216,11 @@ class TagCollectionWrapper:
                     f"Tag creation succeeded but entry has no tag: {name}"
                 )
             self._index.add(new_tag)
+            self._unsaved_creations += 1
+            from immich_autotag.config.internal_config import TAG_CATALOG_SAVE_EVERY
+
+            if self._unsaved_creations >= TAG_CATALOG_SAVE_EVERY:
+                self.flush_catalog()
             return new_tag
         except immich_errors.UnexpectedStatus as e:
             if e.status_code == 400 and "already exists" in str(e):
@@ -138,6 +230,26 @@ class TagCollectionWrapper:
                     return tag
             raise
 
+    def mark_stale(self) -> None:
+        """
+        Forces the next lookup miss to reconcile with the API again (for
+        long-running processes where tags may change between sweeps).
+        """
+        self._synced_with_api = False
+
+    def flush_catalog(self) -> None:
+        """
+        Writes the index to the persisted catalog if tags were created since it
+        was last written (only once fully loaded). Called in batches while tags
+        are created and once at the end of the run.
+        """
+        if not self._fully_loaded or not self._unsaved_creations:
+            return
+        from immich_autotag.tags.tag_catalog_cache import save_tag_catalog
+
+        save_tag_catalog(self._index)
+        self._unsaved_creations = 0
+
     @staticmethod
     @typechecked
     def _from_api() -> "TagCollectionWrapper":
@@ -159,8 +271,8 @@ class TagCollectionWrapper:
             pass
         except Exception:
             pass
-        # Lazy-load individual tag if not fully_loaded
-        if not self._fully_loaded:
+        # Lazy-load individual tag if not fully_loaded (or only loaded from catalog)
+        if not self._fully_loaded or not self._synced_with_api:
             return self._load_single_by_name_from_api(name)
         return None
 
@@ -171,8 +283,8 @@ class TagCollectionWrapper:
             return tag_obj
         except Exception:
             pass
-        # Lazy-load individual tag if not fully_loaded
-        if not self._fully_loaded:
+        # Lazy-load individual tag if not fully_loaded (or only loaded from catalog)
+        if not self._fully_loaded or not self._synced_with_api:
             return self._load_single_by_id_from_api(id_)
         return None
 
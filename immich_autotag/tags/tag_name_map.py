@@ -13,12 +13,19 @@ if TYPE_CHECKING:
 class TagNameMap:
     """
     Efficient map from name (str) to TagWrapper.
+    Lookups try the exact name first and then its case-normalized form, both as
+    plain dict lookups.
     """
 
     _name_to_tag: Dict[str, "TagWrapper"] = attrs.field(
         factory=dict,
         repr=lambda value: f"size={len(value)}",
     )
+    _normalized_to_tag: Dict[str, "TagWrapper"] = attrs.field(factory=dict, repr=False)
+
+    @staticmethod
+    def normalize(name: str) -> str:
+        return name.casefold()
 
     @typechecked
     def add(self, tag: "TagWrapper"):
@@ -26,22 +33,34 @@ class TagNameMap:
         if name in self._name_to_tag:
             raise RuntimeError(f"Tag with name '{name}' already exists in TagNameMap.")
         self._name_to_tag[name] = tag
+        # On a case-only clash the first tag keeps the normalized entry
+        self._normalized_to_tag.setdefault(self.normalize(name), tag)
 
     @typechecked
     def remove(self, tag: "TagWrapper"):
         name = tag.get_name()
         if name not in self._name_to_tag:
             raise RuntimeError(f"No tag with name '{name}' exists in TagNameMap.")
-        del self._name_to_tag[name]
+        removed = self._name_to_tag.pop(name)
+        normalized = self.normalize(name)
+        if self._normalized_to_tag.get(normalized) is removed:
+            del self._normalized_to_tag[normalized]
+            for other_name, other in self._name_to_tag.items():
+                if self.normalize(other_name) == normalized:
+                    self._normalized_to_tag[normalized] = other
+                    break
 
     @typechecked
     def get(self, name: str) -> "TagWrapper":
-        if name not in self._name_to_tag:
+        tag = self._name_to_tag.get(name)
+        if tag is None:
+            tag = self._normalized_to_tag.get(self.normalize(name))
+        if tag is None:
             raise TagNotFoundError(
                 tag_name=name,
                 message=f"Tag with name '{name}' does not exist in TagNameMap.",
             )
-        return self._name_to_tag[name]
+        return tag
 
     def to_list(self) -> List["TagWrapper"]:
         return list(self._name_to_tag.values())
@@ -52,3 +71,4 @@ class TagNameMap:
         Remove all elements from the name map.
         """
         self._name_to_tag.clear()
+        self._normalized_to_tag.clear()
@@ -1,5 +1,7 @@
 import time
+from datetime import datetime
 from enum import Enum
+from typing import Any, Mapping, cast
 
 import attrs
 
@@ -50,6 +52,21 @@ class TagWrapper:
     def get_name(self) -> str:
         return self._tag.name
 
+    def get_updated_at(self) -> datetime:
+        return self._tag.updated_at
+
+    def to_cache_dict(self) -> dict[str, Any]:
+        """Serializes the wrapped DTO for the persistent tag catalog."""
+        return self._tag.to_dict()
+
+    @classmethod
+    def from_cache_dict(
+        cls, data: Mapping[str, object], loaded_at: Timestamp
+    ) -> "TagWrapper":
+        """Rebuilds a tag stored in the persistent tag catalog."""
+        dto = TagResponseDto.from_dict(cast(Mapping[str, Any], data))
+        return cls(dto, TagSource.GET_ALL_TAGS, loaded_at)
+
     def name(self) -> str:
         return self.get_name()
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import threading
 from typing import Dict, List, Optional
 
 import attrs
@@ -30,6 +31,9 @@ class UserManager:
     )
     _loaded: bool = attrs.field(init=False, default=False)
     _current_user: Optional[UserResponseWrapper] = attrs.field(init=False, default=None)
+    # Serializes loads: the users startup phase may run while other threads
+    # already look users up
+    _load_lock: threading.Lock = attrs.field(init=False, factory=threading.Lock)
 
     def __attrs_post_init__(self):
         # Prevent direct instantiation
@@ -47,14 +51,17 @@ class UserManager:
 
     def _load_users(self, client: ImmichClient) -> None:
         user_dtos = proxy_search_users(client=client) or []
-        self._users.clear()
-        self._email_map.clear()
+        users: Dict["UserUUID", "UserResponseWrapper"] = {}
+        email_map: Dict["EmailAddress", "UserResponseWrapper"] = {}
         for user_dto in user_dtos:
             wrapper = UserResponseWrapper.from_user(user_dto)
-            self._users[wrapper.get_uuid()] = wrapper
+            users[wrapper.get_uuid()] = wrapper
             email = wrapper.get_email()
             if email:
-                self._email_map[email] = wrapper
+                email_map[email] = wrapper
+        # Swapped in whole, so concurrent readers never see a half-filled map
+        self._users = users
+        self._email_map = email_map
 
     def _load_current_user(self, client: ImmichClient) -> None:
         user_dto = proxy_get_my_user(client=client)
@@ -63,18 +70,25 @@ class UserManager:
         else:
             self._current_user = None
 
-    def load_all(self) -> None:
-        """
-        Loads all users from Immich and caches them as UserResponseWrapper instances.
-        """
+    def _load_all_locked(self) -> None:
         client = ImmichContext.get_default_client().get_client()
         self._load_users(client)
         self._load_current_user(client)
         self._loaded = True
 
+    def load_all(self) -> None:
+        """
+        Loads all users from Immich and caches them as UserResponseWrapper instances.
+        """
+        with self._load_lock:
+            self._load_all_locked()
+
     def _ensure_loaded(self) -> None:
-        if not self._loaded:
-            self.load_all()
+        if self._loaded:
+            return
+        with self._load_lock:
+            if not self._loaded:  # Not loaded by another thread meanwhile
+                self._load_all_locked()
 
     def get_by_uuid(self, uuid: "UserUUID") -> Optional["UserResponseWrapper"]:
         self._ensure_loaded()
@@ -1,5 +1,7 @@
 import json
 import logging
+import os
+import threading
 from enum import Enum
 from pathlib import Path
 from typing import Optional
@@ -8,20 +10,55 @@ import attrs
 
 from immich_autotag.config import internal_config
 from immich_autotag.run_output.manager import RunOutputManager
+from immich_autotag.utils import cache_codec
+from immich_autotag.utils.perf.asset_phase_profiler import note_cache_hit
 
 logger = logging.getLogger(__name__)
 
 # Global config to enable/disable caching (can be overridden by parameter)
 
+# Lookups per cache type, [hits, misses], for the metrics export
+_lookup_counts: dict[str, list[int]] = {}
+_lookup_counts_lock = threading.Lock()
+
+
+def _count_lookup(cache_type: str, hit: bool) -> None:
+    with _lookup_counts_lock:
+        _lookup_counts.setdefault(cache_type, [0, 0])[0 if hit else 1] += 1
+
+
+@attrs.define(auto_attribs=True, slots=True, frozen=True)
+class CacheLookupCounts:
+    hits: int
+    misses: int
+
+
+def get_lookup_counts() -> dict[str, CacheLookupCounts]:
+    """Hits and misses of ApiCacheManager.load per cache type."""
+    with _lookup_counts_lock:
+        return {
+            k: CacheLookupCounts(hits=v[0], misses=v[1])
+            for k, v in _lookup_counts.items()
+        }
+
 
 class ApiCacheKey(Enum):
     ALBUMS = "albums"
     ASSETS = "assets"
     USERS = "users"
+    TAGS = "tags"  # Persistent tag catalog (see tags/tag_catalog_cache.py)
     ALBUM_PAGES = "album_pages"  # For caching paginated album results
     # Add more as needed
 
 
+@attrs.define(auto_attribs=True, slots=True, frozen=True)
+class _BinaryCacheEntry:
+    """A binary cache file as read: its raw frame and the decoded data."""
+
+    blob: bytes
+    data: object
+
+
 @attrs.define(auto_attribs=True, slots=True)
 class ApiCacheManager:
     _cache_type: ApiCacheKey = attrs.field(
@@ -44,6 +81,8 @@ class ApiCacheManager:
             self._use_cache = internal_config.USE_CACHE_ALBUM_PAGES
         elif self._cache_type.value == ApiCacheKey.USERS.value:
             self._use_cache = internal_config.USE_CACHE_USERS
+        elif self._cache_type.value == ApiCacheKey.TAGS.value:
+            self._use_cache = internal_config.USE_CACHE_TAGS
         else:
             self._use_cache = True
 
@@ -68,14 +107,38 @@ class ApiCacheManager:
         run_execution = RunOutputManager.current().get_run_output_dir()
         return run_execution.get_api_cache_dir(self._cache_type.value)
 
+    def _write_json(self, path: Path, data: object) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+    def _write_binary(self, path: Path, blob: bytes) -> None:
+        # Written aside and renamed, so a reader never sees a partial frame. The
+        # temp name is unique per process and thread: shards and worker threads
+        # may write the same key at once.
+        tmp_path = path.with_name(
+            f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        tmp_path.write_bytes(blob)
+        os.replace(tmp_path, path)
+
     def save(self, key: str, data: dict[str, object] | list[dict[str, object]]) -> None:
         if not self._use_cache:
             return
 
         cache_dir = self._get_cache_dir()
-        path = cache_dir / f"{key}.json"
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        if internal_config.USE_BINARY_API_CACHE:
+            self._write_binary(cache_dir / f"{key}.bin", cache_codec.encode(data))
+        else:
+            self._write_json(cache_dir / f"{key}.json", data)
+
+    @staticmethod
+    def _discard_corrupted(path: Path, error: Exception) -> None:
+        logger.warning(f"Corrupted cache file {path}: {error}")
+        # Try to delete the corrupted file
+        try:
+            path.unlink()
+        except Exception:
+            pass
 
     def _try_load_json(
         self, path: Path
@@ -87,34 +150,82 @@ class ApiCacheManager:
             with open(path, "r", encoding="utf-8") as f:
                 return json.load(f)
         except json.JSONDecodeError as e:
-            logger.warning(f"Corrupted cache file {path}: {e}")
-            # Try to delete the corrupted file
-            try:
-                path.unlink()
-            except Exception:
-                pass
+            self._discard_corrupted(path, e)
+            return None
+
+    def _try_read_binary(self, path: Path) -> Optional["_BinaryCacheEntry"]:
+        """The raw frame of a binary cache file and its decoded data, or None."""
+        if not path.exists() or path.stat().st_size == 0:
+            return None
+        blob = path.read_bytes()
+        try:
+            return _BinaryCacheEntry(blob=blob, data=cache_codec.decode(blob))
+        except cache_codec.CacheCodecError as e:
+            self._discard_corrupted(path, e)
+            return None
+
+    def _load_from_dir(
+        self, cache_dir: Path, key: str, is_current: bool
+    ) -> Optional[dict[str, object] | list[dict[str, object]]]:
+        """
+        Loads `key` from one run's cache dir, in the format selected by
+        USE_BINARY_API_CACHE first, then in the other one. An entry found in
+        another run, or in the other format, is saved into the current run in the
+        selected format (a binary frame is copied as-is, without re-encoding), so
+        that a stale entry in the other format never shadows later saves.
+        """
+        binary_path = cache_dir / f"{key}.bin"
+        json_path = cache_dir / f"{key}.json"
+        if internal_config.USE_BINARY_API_CACHE:
+            binary = self._try_read_binary(binary_path)
+            if binary is not None and isinstance(binary.data, (dict, list)):
+                if not is_current and self._use_cache:
+                    self._write_binary(
+                        self._get_cache_dir() / f"{key}.bin", binary.blob
+                    )
+                return binary.data
+            data = self._try_load_json(json_path)
+            if data is None:
+                return None
+            self.save(key, data)  # Cached for the current run as <key>.bin
+            if is_current:
+                json_path.unlink(missing_ok=True)
+            return data
+
+        data = self._try_load_json(json_path)
+        if data is not None:
+            if not is_current:
+                self.save(key, data)  # Cache for current run
+            return data
+        binary = self._try_read_binary(binary_path)
+        if binary is None or not isinstance(binary.data, (dict, list)):
             return None
+        self.save(key, binary.data)  # Cached for the current run as <key>.json
+        if is_current:
+            binary_path.unlink(missing_ok=True)
+        return binary.data
 
     def load(self, key: str) -> Optional[dict[str, object] | list[dict[str, object]]]:
         if not self._use_cache:
             return None
 
         # Try current run cache
-        cache_dir = self._get_cache_dir()
-        path = cache_dir / f"{key}.json"
-        data = self._try_load_json(path)
+        data = self._load_from_dir(self._get_cache_dir(), key, is_current=True)
         if data is not None:
+            note_cache_hit()
+            _count_lookup(self._cache_type.value, hit=True)
             return data
 
         # Try previous run caches
         for run_execution in RunOutputManager.current().find_recent_run_dirs(
-            exclude_current=True
+            exclude_current=True, with_api_cache=self._cache_type.value
         ):
             prev_cache_dir = run_execution.get_api_cache_dir(self._cache_type.value)
-            prev_path = prev_cache_dir / f"{key}.json"
-            data = self._try_load_json(prev_path)
+            data = self._load_from_dir(prev_cache_dir, key, is_current=False)
             if data is not None:
-                self.save(key, data)  # Cache for current run
+                note_cache_hit()
+                _count_lookup(self._cache_type.value, hit=True)
                 return data
 
+        _count_lookup(self._cache_type.value, hit=False)
         return None
@@ -0,0 +1,112 @@
+"""
+Event-loop driver for the asyncio proxies (api/immich_proxy/aio).
+
+The rest of the application is synchronous. The driver owns a single event loop
+running forever in a daemon thread; synchronous code hands coroutines to it with
+run() (blocking) or submit() (returns a concurrent.futures.Future). Everything
+that touches the shared httpx.AsyncClient runs on that one loop, so the client
+is never used from two loops.
+
+Concurrency is bounded by a semaphore (ASYNC_MAX_IN_FLIGHT): gather_bounded()
+runs many requests at once without flooding the server.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Coroutine, Iterable, Optional, TypeVar
+
+import attrs
+
+T = TypeVar("T")
+
+_instance: "AsyncDriver | None" = None
+_instance_lock = threading.Lock()
+
+
+async def _call(factory: Callable[[], Awaitable[T]]) -> T:
+    return await factory()
+
+
+@attrs.define(auto_attribs=True, slots=True)
+class AsyncDriver:
+    _max_in_flight: int
+    _loop: asyncio.AbstractEventLoop = attrs.field(
+        factory=asyncio.new_event_loop, init=False, repr=False
+    )
+    _thread: Optional[threading.Thread] = attrs.field(
+        default=None, init=False, repr=False
+    )
+    # Created on the loop thread (it must belong to the driver's loop)
+    _semaphore: Optional[asyncio.Semaphore] = attrs.field(
+        default=None, init=False, repr=False
+    )
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    def __attrs_post_init__(self) -> None:
+        self._thread = threading.Thread(
+            target=self._run_loop, name="async-driver", daemon=True
+        )
+        self._thread.start()
+
+    @staticmethod
+    def get_instance() -> "AsyncDriver":
+        global _instance
+        if _instance is None:
+            with _instance_lock:
+                if _instance is None:
+                    from immich_autotag.config.internal_config import (
+                        ASYNC_MAX_IN_FLIGHT,
+                    )
+
+                    _instance = AsyncDriver(max_in_flight=ASYNC_MAX_IN_FLIGHT)
+                    atexit.register(_instance.shutdown)
+        return _instance
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> "Future[T]":
+        """Schedules `coro` on the driver loop without waiting for it."""
+        if self._loop.is_closed():
+            raise RuntimeError("AsyncDriver is shut down")
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Runs `coro` on the driver loop and blocks until it returns."""
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("AsyncDriver.run() called from the driver loop")
+        return self.submit(coro).result()
+
+    async def bounded(self, awaitable: Awaitable[T]) -> T:
+        """Awaits `awaitable` holding one of the ASYNC_MAX_IN_FLIGHT slots."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_in_flight)
+        async with self._semaphore:
+            return await awaitable
+
+    async def gather_bounded(
+        self, factories: Iterable[Callable[[], Awaitable[T]]]
+    ) -> list[T | BaseException]:
+        """
+        Runs the coroutines built by `factories` concurrently (bounded) and returns
+        their results in order. A failing request yields its exception instead of
+        cancelling the others.
+        """
+        # Coroutines are created lazily so only in-flight ones hold resources
+        return await asyncio.gather(
+            *(self.bounded(_call(factory)) for factory in factories),
+            return_exceptions=True,
+        )
+
+    def shutdown(self) -> None:
+        if self._loop.is_closed():
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        if not self._loop.is_running():
+            self._loop.close()
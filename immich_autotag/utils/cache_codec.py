@@ -0,0 +1,98 @@
+"""
+Compact, versioned encoding of cached entities (asset and album DTO states, tag
+catalog, album pages...), independent of where the bytes are stored.
+
+A frame is a 5-byte header followed by the payload:
+
+    b"IAC" | codec version (1 byte) | flags (1 byte) | payload
+
+The payload is compact JSON written by orjson (stdlib json if it is not
+installed), zlib-compressed when it is at least CACHE_CODEC_COMPRESS_MIN_BYTES
+long. Frames of a newer codec version are rejected, so an older release never
+misreads a cache written by a newer one.
+
+encode_many / decode_many pack several entities into one frame, for backends
+that store records in bulk.
+"""
+
+from __future__ import annotations
+
+import json
+import zlib
+from typing import Any, Iterable
+
+try:
+    import orjson
+except ImportError:  # orjson is a dependency; keep encoding without it
+    orjson = None  # type: ignore[assignment]
+
+CACHE_CODEC_VERSION = 1
+_MAGIC = b"IAC"
+_HEADER_SIZE = len(_MAGIC) + 2
+_FLAG_ZLIB = 0x01
+# zlib level 1: most of the size gain of JSON compression at a fraction of the cost
+_ZLIB_LEVEL = 1
+
+
+class CacheCodecError(ValueError):
+    """The bytes are not a frame this codec version can decode."""
+
+
+def _dumps(data: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, default=str)
+    return json.dumps(data, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def _loads(payload: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+def is_encoded(blob: bytes) -> bool:
+    """True if `blob` starts like a codec frame (of any version)."""
+    return blob[: len(_MAGIC)] == _MAGIC
+
+
+def encode(data: Any) -> bytes:
+    """Encodes a JSON-compatible value (dicts, lists, str, numbers...) as a frame."""
+    from immich_autotag.config.internal_config import CACHE_CODEC_COMPRESS_MIN_BYTES
+
+    payload = _dumps(data)
+    flags = 0
+    if len(payload) >= CACHE_CODEC_COMPRESS_MIN_BYTES:
+        payload = zlib.compress(payload, _ZLIB_LEVEL)
+        flags |= _FLAG_ZLIB
+    return _MAGIC + bytes((CACHE_CODEC_VERSION, flags)) + payload
+
+
+def decode(blob: bytes) -> Any:
+    """Decodes a frame written by encode(). Raises CacheCodecError if invalid."""
+    if len(blob) < _HEADER_SIZE or not is_encoded(blob):
+        raise CacheCodecError("Not a cache codec frame")
+    version, flags = blob[len(_MAGIC)], blob[len(_MAGIC) + 1]
+    if version > CACHE_CODEC_VERSION:
+        raise CacheCodecError(
+            f"Cache codec version {version} is newer than {CACHE_CODEC_VERSION}"
+        )
+    payload = blob[_HEADER_SIZE:]
+    try:
+        if flags & _FLAG_ZLIB:
+            payload = zlib.decompress(payload)
+        return _loads(payload)
+    except (zlib.error, ValueError) as e:
+        raise CacheCodecError(f"Corrupted cache codec frame: {e}") from e
+
+
+def encode_many(items: Iterable[Any]) -> bytes:
+    """Encodes several values as a single frame (compressed together)."""
+    return encode(list(items))
+
+
+def decode_many(blob: bytes) -> list[Any]:
+    """Decodes a frame written by encode_many()."""
+    data = decode(blob)
+    if not isinstance(data, list):
+        raise CacheCodecError("Frame does not hold a list of entities")
+    return data
@@ -0,0 +1,96 @@
+"""
+Per-endpoint request counts and latencies of the Immich API, recorded by httpx
+event hooks on the sync client (see ImmichClientWrapper.get_client).
+
+Endpoints are keyed by method and path, with ids replaced by {id} so that
+every album or asset shares one series. Latency is measured up to the response
+headers (the hooks run before the body is read).
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+from typing import Any, Optional
+
+import attrs
+
+# Upper bounds (seconds) of the latency histogram buckets; +Inf is implicit
+LATENCY_BUCKETS_SECONDS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+_ID_SEGMENT = re.compile(
+    r"/[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+    r"(?=/|$)"
+)
+_START_KEY = "immich_autotag_start"
+
+_instance: Optional["ApiRequestStats"] = None
+_instance_lock = threading.Lock()
+
+
+@attrs.define(auto_attribs=True, slots=True)
+class EndpointStats:
+    count: int = 0
+    errors: int = 0
+    latency_sum: float = 0.0
+    # Non-cumulative counts per LATENCY_BUCKETS_SECONDS bucket, plus +Inf
+    buckets: list[int] = attrs.field(
+        factory=lambda: [0] * (len(LATENCY_BUCKETS_SECONDS) + 1)
+    )
+
+    def add(self, seconds: float, is_error: bool) -> None:
+        self.count += 1
+        self.errors += is_error
+        self.latency_sum += seconds
+        for index, bound in enumerate(LATENCY_BUCKETS_SECONDS):
+            if seconds <= bound:
+                self.buckets[index] += 1
+                return
+        self.buckets[-1] += 1
+
+
+@attrs.define(auto_attribs=True, slots=True)
+class ApiRequestStats:
+    _endpoints: dict[str, EndpointStats] = attrs.field(factory=dict, init=False)
+    _lock: threading.Lock = attrs.field(factory=threading.Lock, init=False)
+
+    @staticmethod
+    def get_instance() -> "ApiRequestStats":
+        global _instance
+        if _instance is None:
+            with _instance_lock:
+                if _instance is None:
+                    _instance = ApiRequestStats()
+        return _instance
+
+    @staticmethod
+    def endpoint_of(method: str, path: str) -> str:
+        return f"{method} {_ID_SEGMENT.sub('/{id}', path)}"
+
+    def on_request(self, request: Any) -> None:
+        """httpx request hook."""
+        request.extensions[_START_KEY] = time.perf_counter()
+
+    def on_response(self, response: Any) -> None:
+        """httpx response hook."""
+        request = response.request
+        start = request.extensions.get(_START_KEY)
+        if start is None:
+            return
+        elapsed = time.perf_counter() - start
+        endpoint = self.endpoint_of(request.method, request.url.path)
+        with self._lock:
+            stats = self._endpoints.get(endpoint)
+            if stats is None:
+                stats = self._endpoints[endpoint] = EndpointStats()
+            stats.add(elapsed, response.status_code >= 400)
+
+    def snapshot(self) -> dict[str, EndpointStats]:
+        """A copy of the stats of every endpoint seen so far."""
+        with self._lock:
+            return {
+                endpoint: EndpointStats(
+                    stats.count, stats.errors, stats.latency_sum, list(stats.buckets)
+                )
+                for endpoint, stats in self._endpoints.items()
+            }
@@ -0,0 +1,218 @@
+"""
+Per-phase timing of process_single_asset.
+
+Each phase run for an asset records its wall time, the API requests it sent
+and the cache hits it got (counted per thread: requests through a hook on the
+client's httpx.Client, hits by the read memo, the asset LRU cache and the API
+disk cache). Times are aggregated per phase into streaming histograms
+(logarithmic buckets, so memory does not grow with the library), and the
+slowest ASSET_PHASE_SLOWEST_N assets of each phase are kept with their Immich
+links.
+
+The breakdown is logged every ASSET_PHASE_REPORT_INTERVAL_SECONDS and in the
+final summary.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+import attrs
+
+from immich_autotag.logging.levels import LogLevel
+from immich_autotag.logging.utils import log
+
+# Bucket i holds durations in [2^(i-1), 2^i) * _BUCKET_BASE_SECONDS (bucket 0: below)
+_BUCKET_BASE_SECONDS = 0.0005
+_BUCKET_COUNT = 24  # Up to ~70 min
+
+_thread_counters = threading.local()
+_instance: Optional["AssetPhaseProfiler"] = None
+_instance_lock = threading.Lock()
+
+
+def _counters() -> list[int]:
+    try:
+        return _thread_counters.value
+    except AttributeError:  # First use in this thread
+        counters = _thread_counters.value = [0, 0]  # api calls, cache hits
+        return counters
+
+
+def note_api_call(*_args: Any) -> None:
+    """Counts an API request sent by this thread (httpx request hook)."""
+    _counters()[0] += 1
+
+
+def note_cache_hit() -> None:
+    """Counts a read served from a cache instead of the API by this thread."""
+    _counters()[1] += 1
+
+
+@attrs.define(auto_attribs=True, slots=True, frozen=True, order=True)
+class _SlowAsset:
+    """An asset and its duration in a phase; ordered by duration for the heap."""
+
+    seconds: float
+    asset_id: str
+    asset_url: str
+
+
+@attrs.define(auto_attribs=True, slots=True)
+class PhaseHistogram:
+    """Streaming histogram of one phase's durations, with API and cache totals."""
+
+    _buckets: list[int] = attrs.field(factory=lambda: [0] * _BUCKET_COUNT)
+    _count: int = 0
+    _total_seconds: float = 0.0
+    _max_seconds: float = 0.0
+    _api_calls: int = 0
+    _cache_hits: int = 0
+    # Min-heap of the slowest assets seen
+    _slowest: list[_SlowAsset] = attrs.field(factory=list)
+
+    @staticmethod
+    def _bucket_of(seconds: float) -> int:
+        if seconds < _BUCKET_BASE_SECONDS:
+            return 0
+        index = int(math.log2(seconds / _BUCKET_BASE_SECONDS)) + 1
+        return min(index, _BUCKET_COUNT - 1)
+
+    @staticmethod
+    def _bucket_upper(index: int) -> float:
+        return _BUCKET_BASE_SECONDS * (2**index)
+
+    def add(
+        self,
+        seconds: float,
+        api_calls: int,
+        cache_hits: int,
+        asset_id: str,
+        asset_url: str,
+        slowest_n: int,
+    ) -> None:
+        self._buckets[self._bucket_of(seconds)] += 1
+        self._count += 1
+        self._total_seconds += seconds
+        self._max_seconds = max(self._max_seconds, seconds)
+        self._api_calls += api_calls
+        self._cache_hits += cache_hits
+        item = _SlowAsset(seconds=seconds, asset_id=asset_id, asset_url=asset_url)
+        if len(self._slowest) < slowest_n:
+            heapq.heappush(self._slowest, item)
+        elif slowest_n and seconds > self._slowest[0].seconds:
+            heapq.heapreplace(self._slowest, item)
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-quantile (0 if empty)."""
+        if self._count == 0:
+            return 0.0
+        rank = q * self._count
+        seen = 0
+        for index, count in enumerate(self._buckets):
+            seen += count
+            if seen >= rank:
+                return min(self._bucket_upper(index), self._max_seconds)
+        return self._max_seconds
+
+    def get_total_seconds(self) -> float:
+        return self._total_seconds
+
+    def format(self, phase: str) -> str:
+        if self._count == 0:
+            return f"  {phase}: no samples"
+        avg_ms = 1000 * self._total_seconds / self._count
+        return (
+            f"  {phase}: n={self._count} total={self._total_seconds:.1f}s "
+            f"avg={avg_ms:.1f}ms p50<={1000 * self.quantile(0.5):.1f}ms "
+            f"p90<={1000 * self.quantile(0.9):.1f}ms "
+            f"p99<={1000 * self.quantile(0.99):.1f}ms "
+            f"max={1000 * self._max_seconds:.1f}ms | api calls={self._api_calls} "
+            f"({self._api_calls / self._count:.2f}/asset) cache hits={self._cache_hits}"
+        )
+
+    def format_slowest(self) -> list[str]:
+        return [
+            f"      {slow.seconds * 1000:.0f}ms {slow.asset_url}"
+            for slow in sorted(self._slowest, reverse=True)
+        ]
+
+
+@attrs.define(auto_attribs=True, slots=True)
+class AssetPhaseProfiler:
+    _slowest_n: int
+    _histograms: dict[str, PhaseHistogram] = attrs.field(factory=dict, init=False)
+    _lock: threading.Lock = attrs.field(factory=threading.Lock, init=False)
+    _last_report: float = attrs.field(factory=time.monotonic, init=False)
+
+    @staticmethod
+    def get_instance() -> "AssetPhaseProfiler":
+        global _instance
+        if _instance is None:
+            with _instance_lock:
+                if _instance is None:
+                    from immich_autotag.config.internal_config import (
+                        ASSET_PHASE_SLOWEST_N,
+                    )
+
+                    _instance = AssetPhaseProfiler(ASSET_PHASE_SLOWEST_N)
+        return _instance
+
+    @staticmethod
+    def is_enabled() -> bool:
+        from immich_autotag.config.internal_config import ENABLE_ASSET_PHASE_PROFILING
+
+        return ENABLE_ASSET_PHASE_PROFILING
+
+    @contextmanager
+    def measure(self, phase: str, asset_id: str, asset_url: str) -> Iterator[None]:
+        """Records the duration, API calls and cache hits of `phase` for an asset."""
+        counters = _counters()
+        api_before, hits_before = counters[0], counters[1]
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - t0
+            api_calls = counters[0] - api_before
+            cache_hits = counters[1] - hits_before
+            with self._lock:
+                histogram = self._histograms.setdefault(phase, PhaseHistogram())
+                histogram.add(
+                    elapsed, api_calls, cache_hits, asset_id, asset_url, self._slowest_n
+                )
+
+    def format_report(self, *, with_slowest: bool) -> str:
+        with self._lock:
+            items = sorted(
+                self._histograms.items(),
+                key=lambda kv: kv[1].get_total_seconds(),
+                reverse=True,
+            )
+            lines = ["[PERF] Per-phase breakdown of process_single_asset:"]
+            for phase, histogram in items:
+                lines.append(histogram.format(phase))
+                if with_slowest:
+                    lines.extend(histogram.format_slowest())
+        return "\n".join(lines)
+
+    def maybe_report(self) -> None:
+        """Logs the breakdown every ASSET_PHASE_REPORT_INTERVAL_SECONDS."""
+        from immich_autotag.config.internal_config import (
+            ASSET_PHASE_REPORT_INTERVAL_SECONDS,
+        )
+
+        now = time.monotonic()
+        if now - self._last_report < ASSET_PHASE_REPORT_INTERVAL_SECONDS:
+            return
+        self._last_report = now
+        log(self.format_report(with_slowest=False), level=LogLevel.PROGRESS)
+
+    def log_final_report(self) -> None:
+        if self._histograms:
+            log(self.format_report(with_slowest=True), level=LogLevel.PROGRESS)
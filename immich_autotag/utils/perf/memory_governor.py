@@ -0,0 +1,314 @@
+"""
+Memory budget governor for the in-memory caches.
+
+Caches register themselves with an estimator of their approximate size and,
+when they can be rebuilt on demand, a shed callback and a priority (lower is
+shed first). The governor samples the process RSS (rate limited, from the
+per-asset progress path) and, when it exceeds the budget, sheds the registered
+caches in priority order until the RSS, minus the estimated size of what was
+shed, is back under the low watermark.
+
+The budget is MEMORY_BUDGET_MB, or a fraction of the container (cgroup) memory
+limit when it is None, so a run sheds its caches before the OOM killer steps in.
+Sizes are estimates: a sample of each cache's entries is measured recursively
+and extrapolated to the entry count.
+"""
+
+from __future__ import annotations
+
+import gc
+import itertools
+import os
+import sys
+import threading
+import time
+import types
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+import attrs
+
+from immich_autotag.logging.levels import LogLevel
+from immich_autotag.logging.utils import log
+
+_MIB = 1024 * 1024
+# Attributes leading to shared singletons (context, client...) are not followed
+_SKIP_ATTRS = frozenset({"_context", "context", "_client", "_lock", "_instance_lock"})
+_LEAF_TYPES = (str, bytes, bytearray, int, float, bool, type(None))
+_OPAQUE_TYPES = (type, types.ModuleType, types.FunctionType, types.MethodType)
+# Elements measured per container, and reference depth of the walk
+_CONTAINER_SAMPLE = 32
+_MAX_DEPTH = 10
+# Largest cgroup value that means "no limit" on some kernels
+_CGROUP_UNLIMITED = 1 << 60
+
+_instance: Optional["MemoryGovernor"] = None
+_instance_lock = threading.Lock()
+
+
+def _attribute_values(o: Any) -> list[Any]:
+    """Values of the instance attributes of `o` (__dict__ and slots)."""
+    values: list[Any] = []
+    try:
+        instance_dict = vars(o)
+    except TypeError:  # No __dict__
+        instance_dict = {}
+    values.extend(v for k, v in instance_dict.items() if k not in _SKIP_ATTRS)
+    for cls in type(o).__mro__:
+        slots = cls.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for slot in slots:
+            if slot in _SKIP_ATTRS or slot in ("__dict__", "__weakref__"):
+                continue
+            try:
+                values.append(object.__getattribute__(o, slot))
+            except AttributeError:  # Slot not set
+                continue
+    return values
+
+
+def approx_deep_size(obj: Any, *, skip_types: tuple[type, ...] = ()) -> int:
+    """
+    Approximate deep size of `obj` in bytes. Large containers are measured on a
+    sample of their elements, and the walk stops _MAX_DEPTH references deep.
+    Objects of `skip_types` (owned and counted by another cache) are not counted.
+    """
+    seen: set[int] = set()
+    opaque = _OPAQUE_TYPES + skip_types
+
+    def walk(o: Any, depth: int) -> float:
+        if depth > _MAX_DEPTH or id(o) in seen or isinstance(o, opaque):
+            return 0
+        seen.add(id(o))
+        size: float = sys.getsizeof(o, 64)
+        if isinstance(o, _LEAF_TYPES):
+            return size
+        if isinstance(o, dict):
+            sample = list(itertools.islice(o.items(), _CONTAINER_SAMPLE))
+            measured = sum(walk(k, depth + 1) + walk(v, depth + 1) for k, v in sample)
+            return size + (measured * len(o) / len(sample) if sample else 0)
+        if isinstance(o, (list, tuple, set, frozenset)):
+            sample = list(itertools.islice(o, _CONTAINER_SAMPLE))
+            measured = sum(walk(i, depth + 1) for i in sample)
+            return size + (measured * len(o) / len(sample) if sample else 0)
+        children = _attribute_values(o)
+        return size + sum(walk(c, depth + 1) for c in children if c is not None)
+
+    return int(walk(obj, 0))
+
+
+def approx_collection_size(
+    items: Iterable[Any],
+    count: int,
+    sample: int = 16,
+    skip_types: tuple[type, ...] = (),
+) -> int:
+    """Size of `count` entries extrapolated from the first `sample` of `items`."""
+    if count <= 0:
+        return 0
+    sampled = list(itertools.islice(items, sample))
+    if not sampled:
+        return 0
+    measured = sum(approx_deep_size(i, skip_types=skip_types) for i in sampled)
+    per_entry = measured / len(sampled)
+    return int(per_entry * count)
+
+
+def read_rss_bytes() -> Optional[int]:
+    """Resident set size of this process, or None if it cannot be read."""
+    try:
+        with open("/proc/self/statm", "r", encoding="ascii") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+
+        # Peak, not current, RSS; kilobytes on Linux, bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+    except (ImportError, OSError):
+        return None
+
+
+def read_cgroup_memory_limit() -> Optional[int]:
+    """Memory limit of the container (cgroup v2 or v1), or None if unlimited."""
+    for path in (
+        Path("/sys/fs/cgroup/memory.max"),
+        Path("/sys/fs/cgroup/memory/memory.limit_in_bytes"),
+    ):
+        try:
+            raw = path.read_text(encoding="ascii").strip()
+        except OSError:
+            continue
+        if raw == "max":
+            return None
+        try:
+            limit = int(raw)
+        except ValueError:
+            continue
+        return None if limit >= _CGROUP_UNLIMITED else limit
+    return None
+
+
+@attrs.define(auto_attribs=True, slots=True)
+class _GovernedCache:
+    name: str
+    estimate: Callable[[], int]
+    shed: Optional[Callable[[], None]]
+    priority: int
+    shed_count: int = 0
+
+
+@attrs.define(auto_attribs=True, slots=True)
+class MemoryGovernor:
+    _budget_bytes: Optional[int]
+    _caches: dict[str, _GovernedCache] = attrs.field(factory=dict, init=False)
+    _lock: threading.RLock = attrs.field(factory=threading.RLock, init=False)
+    _last_check: float = attrs.field(default=0.0, init=False)
+    _warned_unsheddable: bool = attrs.field(default=False, init=False)
+
+    @staticmethod
+    def get_instance() -> "MemoryGovernor":
+        global _instance
+        if _instance is None:
+            with _instance_lock:
+                if _instance is None:
+                    _instance = MemoryGovernor(MemoryGovernor._resolve_budget())
+        return _instance
+
+    @staticmethod
+    def _resolve_budget() -> Optional[int]:
+        from immich_autotag.config.internal_config import (
+            MEMORY_BUDGET_CGROUP_FRACTION,
+            MEMORY_BUDGET_MB,
+        )
+
+        if MEMORY_BUDGET_MB is not None:
+            return MEMORY_BUDGET_MB * _MIB
+        limit = read_cgroup_memory_limit()
+        if limit is None:
+            return None
+        return int(limit * MEMORY_BUDGET_CGROUP_FRACTION)
+
+    def get_budget_bytes(self) -> Optional[int]:
+        return self._budget_bytes
+
+    @staticmethod
+    def is_enabled() -> bool:
+        from immich_autotag.config.internal_config import ENABLE_MEMORY_GOVERNOR
+
+        return ENABLE_MEMORY_GOVERNOR
+
+    def register(
+        self,
+        name: str,
+        *,
+        estimate: Callable[[], int],
+        shed: Optional[Callable[[], None]] = None,
+        priority: int = 100,
+    ) -> None:
+        """
+        Registers (or replaces) a cache. `shed` drops what can be rebuilt on
+        demand; caches without it are only reported.
+        """
+        with self._lock:
+            self._caches[name] = _GovernedCache(name, estimate, shed, priority)
+
+    def _estimate(self, cache: _GovernedCache) -> int:
+        try:
+            return cache.estimate()
+        except Exception:  # A cache mutating while sampled is not worth failing for
+            return 0
+
+    def maybe_check(self) -> None:
+        """check(), at most once every MEMORY_GOVERNOR_CHECK_INTERVAL_SECONDS."""
+        from immich_autotag.config.internal_config import (
+            MEMORY_GOVERNOR_CHECK_INTERVAL_SECONDS,
+        )
+
+        now = time.monotonic()
+        if now - self._last_check < MEMORY_GOVERNOR_CHECK_INTERVAL_SECONDS:
+            return
+        self._last_check = now
+        self.check()
+
+    def check(self) -> None:
+        """Sheds caches in priority order while the RSS exceeds the budget."""
+        from immich_autotag.config.internal_config import MEMORY_BUDGET_LOW_WATERMARK
+
+        if not self.is_enabled() or self._budget_bytes is None:
+            return
+        rss = read_rss_bytes()
+        if rss is None or rss <= self._budget_bytes:
+            return
+        target = self._budget_bytes * MEMORY_BUDGET_LOW_WATERMARK
+        with self._lock:
+            sheddable = sorted(
+                (c for c in self._caches.values() if c.shed is not None),
+                key=lambda c: c.priority,
+            )
+            log(
+                f"[MEMORY] RSS {rss / _MIB:.0f} MiB over budget "
+                f"{self._budget_bytes / _MIB:.0f} MiB; shedding caches",
+                level=LogLevel.WARNING,
+            )
+            freed = 0
+            for cache in sheddable:
+                size = self._estimate(cache)
+                if size == 0:
+                    continue
+                assert cache.shed is not None
+                cache.shed()
+                cache.shed_count += 1
+                freed += size
+                gc.collect()
+                rss = read_rss_bytes() or rss
+                log(
+                    f"[MEMORY] Shed '{cache.name}' (~{size / _MIB:.1f} MiB); "
+                    f"RSS now {rss / _MIB:.0f} MiB",
+                    level=LogLevel.PROGRESS,
+                )
+                # Freed memory is not always returned to the OS: count the estimate
+                if rss - freed <= target:
+                    return
+            if not self._warned_unsheddable:
+                self._warned_unsheddable = True
+                log(
+                    f"[MEMORY] Still over budget after shedding every cache: "
+                    f"{self.describe()}",
+                    level=LogLevel.WARNING,
+                )
+
+    def describe(self) -> str:
+        """RSS, budget and approximate size of each registered cache."""
+        rss = read_rss_bytes()
+        rss_str = f"{rss / _MIB:.0f} MiB" if rss is not None else "?"
+        budget_str = (
+            f"{self._budget_bytes / _MIB:.0f} MiB"
+            if self._budget_bytes is not None
+            else "none"
+        )
+        with self._lock:
+            caches = sorted(self._caches.values(), key=lambda c: c.priority)
+            parts = []
+            for cache in caches:
+                part = f"{cache.name}={self._estimate(cache) / _MIB:.1f}MiB"
+                if cache.shed_count:
+                    part += f" (shed x{cache.shed_count})"
+                parts.append(part)
+        return f"[MEMORY] RSS={rss_str} budget={budget_str} | " + ", ".join(parts)
+
+
+def register_cache(
+    name: str,
+    *,
+    estimate: Callable[[], int],
+    shed: Optional[Callable[[], None]] = None,
+    priority: int = 100,
+) -> None:
+    """Shortcut for MemoryGovernor.get_instance().register(...)."""
+    MemoryGovernor.get_instance().register(
+        name, estimate=estimate, shed=shed, priority=priority
+    )
@@ -0,0 +1,334 @@
+"""
+OpenMetrics (Prometheus) export of the live run progress.
+
+Every METRICS_EXPORT_INTERVAL_SECONDS (from the per-asset progress path) and at
+the end of the run, the metrics are rendered and written atomically (temporary
+file + rename) to METRICS_TEXTFILE_PATH, or to metrics.prom in the run output
+folder when it is None. Point node_exporter's textfile collector at a fixed
+METRICS_TEXTFILE_PATH to scrape scheduled runs. With METRICS_HTTP_PORT set, the
+same text is also served on http://127.0.0.1:<port>/metrics.
+
+Exported: assets processed, throughput, ETA, current PerfPhaseTracker phase,
+time of the last processed asset (for stall alerts), per-endpoint API request
+counts, errors and latency, cache hits/misses, modifications by
+ModificationKind and memory use.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional
+
+import attrs
+
+from immich_autotag.logging.levels import LogLevel
+from immich_autotag.logging.utils import log
+
+_PREFIX = "immich_autotag"
+_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+_instance: Optional["MetricsExporter"] = None
+_instance_lock = threading.Lock()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _fmt(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+@attrs.define(auto_attribs=True, slots=True)
+class _MetricsText:
+    """Accumulates metric families in the OpenMetrics text format."""
+
+    _lines: list[str] = attrs.field(factory=list)
+
+    def family(self, name: str, kind: str, help_text: str) -> None:
+        self._lines.append(f"# TYPE {_PREFIX}_{name} {kind}")
+        self._lines.append(f"# HELP {_PREFIX}_{name} {help_text}")
+
+    def sample(
+        self, name: str, value: float, labels: Optional[dict[str, str]] = None
+    ) -> None:
+        label_str = ""
+        if labels:
+            label_str = (
+                "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+            )
+        self._lines.append(f"{_PREFIX}_{name}{label_str} {_fmt(value)}")
+
+    def gauge(self, name: str, value: Optional[float], help_text: str) -> None:
+        if value is None:
+            return
+        self.family(name, "gauge", help_text)
+        self.sample(name, value)
+
+    def render(self) -> str:
+        return "\n".join(self._lines + ["# EOF"]) + "\n"
+
+
+@attrs.define(auto_attribs=True, slots=True)
+class MetricsExporter:
+    _last_export: float = attrs.field(default=0.0, init=False)
+    _last_count: int = attrs.field(default=-1, init=False)
+    _last_progress_at: Optional[float] = attrs.field(default=None, init=False)
+    _latest: str = attrs.field(default="# EOF\n", init=False)
+    _lock: threading.Lock = attrs.field(factory=threading.Lock, init=False)
+    _server: Optional[ThreadingHTTPServer] = attrs.field(default=None, init=False)
+
+    @staticmethod
+    def get_instance() -> "MetricsExporter":
+        global _instance
+        if _instance is None:
+            with _instance_lock:
+                if _instance is None:
+                    _instance = MetricsExporter()
+        return _instance
+
+    @staticmethod
+    def is_enabled() -> bool:
+        from immich_autotag.config.internal_config import ENABLE_METRICS_EXPORT
+
+        return ENABLE_METRICS_EXPORT
+
+    def maybe_export(self) -> None:
+        """export(), at most once every METRICS_EXPORT_INTERVAL_SECONDS."""
+        from immich_autotag.config.internal_config import (
+            METRICS_EXPORT_INTERVAL_SECONDS,
+        )
+
+        now = time.monotonic()
+        if now - self._last_export < METRICS_EXPORT_INTERVAL_SECONDS:
+            return
+        self._last_export = now
+        self.export()
+
+    @staticmethod
+    def _get_textfile_path() -> Optional[Path]:
+        from immich_autotag.config.internal_config import METRICS_TEXTFILE_PATH
+
+        if METRICS_TEXTFILE_PATH is not None:
+            return Path(METRICS_TEXTFILE_PATH)
+        try:
+            from immich_autotag.run_output.manager import RunOutputManager
+
+            return RunOutputManager.current().get_run_output_dir().get_metrics_path()
+        except Exception:  # No run output folder yet
+            return None
+
+    def _ensure_http_server(self) -> None:
+        from immich_autotag.config.internal_config import METRICS_HTTP_PORT
+
+        if METRICS_HTTP_PORT is None or self._server is not None:
+            return
+        exporter = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802 (http.server API)
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = exporter.get_latest().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", _CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass  # Scrapes are not worth a log line
+
+        try:
+            self._server = ThreadingHTTPServer(
+                ("127.0.0.1", METRICS_HTTP_PORT), _Handler
+            )
+        except OSError as e:
+            log(
+                f"[METRICS] Cannot serve metrics on port {METRICS_HTTP_PORT}: {e}",
+                level=LogLevel.WARNING,
+            )
+            self._server = None
+            return
+        self._server.daemon_threads = True
+        threading.Thread(
+            target=self._server.serve_forever, name="metrics-http", daemon=True
+        ).start()
+
+    def _collect_progress(self, out: _MetricsText) -> None:
+        from immich_autotag.statistics.statistics_manager import StatisticsManager
+        from immich_autotag.utils.perf.perf_phase_tracker import perf_phase_tracker
+
+        progress = StatisticsManager.get_instance().get_progress_snapshot()
+        now = time.time()
+        if progress.abs_count != self._last_count:
+            self._last_count = progress.abs_count
+            self._last_progress_at = now
+        out.gauge(
+            "assets_processed",
+            progress.abs_count,
+            "Assets processed, including those of resumed sessions",
+        )
+        out.gauge(
+            "assets_processed_session",
+            progress.count,
+            "Assets processed by this session",
+        )
+        out.gauge("assets_in_library", progress.abs_total, "Assets in the library")
+        out.gauge(
+            "assets_to_process",
+            progress.total_to_process,
+            "Assets this session is expected to process",
+        )
+        out.gauge(
+            "assets_per_second",
+            progress.assets_per_second,
+            "Average throughput of this session",
+        )
+        out.gauge(
+            "eta_seconds",
+            progress.est_remaining_session,
+            "Estimated time until this session finishes",
+        )
+        out.gauge("session_elapsed_seconds", progress.elapsed, "Session run time")
+        out.gauge(
+            "last_progress_timestamp_seconds",
+            self._last_progress_at,
+            "Time the processed asset count last increased",
+        )
+        out.gauge("export_timestamp_seconds", now, "Time of this export")
+        out.family("phase", "gauge", "Current PerfPhaseTracker phase (1)")
+        out.sample(
+            "phase", 1, {"phase": perf_phase_tracker.get_current_phase() or "none"}
+        )
+
+    def _collect_api_requests(self, out: _MetricsText) -> None:
+        from immich_autotag.utils.perf.api_request_stats import (
+            LATENCY_BUCKETS_SECONDS,
+            ApiRequestStats,
+        )
+
+        endpoints = sorted(ApiRequestStats.get_instance().snapshot().items())
+        out.family("api_requests", "counter", "API requests sent, by endpoint")
+        for endpoint, stats in endpoints:
+            out.sample("api_requests_total", stats.count, {"endpoint": endpoint})
+        out.family("api_request_errors", "counter", "API responses with status >= 400")
+        for endpoint, stats in endpoints:
+            out.sample("api_request_errors_total", stats.errors, {"endpoint": endpoint})
+        out.family(
+            "api_request_duration_seconds",
+            "histogram",
+            "API latency up to the response headers, by endpoint",
+        )
+        for endpoint, stats in endpoints:
+            cumulative = 0
+            bounds = [str(b) for b in LATENCY_BUCKETS_SECONDS] + ["+Inf"]
+            for bound, count in zip(bounds, stats.buckets):
+                cumulative += count
+                out.sample(
+                    "api_request_duration_seconds_bucket",
+                    cumulative,
+                    {"endpoint": endpoint, "le": bound},
+                )
+            out.sample(
+                "api_request_duration_seconds_sum",
+                stats.latency_sum,
+                {"endpoint": endpoint},
+            )
+            out.sample(
+                "api_request_duration_seconds_count",
+                stats.count,
+                {"endpoint": endpoint},
+            )
+
+    def _collect_caches(self, out: _MetricsText) -> None:
+        from immich_autotag.api.logging_proxy.read_coalescing_stats import (
+            get_read_coalescing_stats,
+        )
+        from immich_autotag.assets.asset_manager import AssetManager
+        from immich_autotag.utils.api_disk_cache import (
+            CacheLookupCounts,
+            get_lookup_counts,
+        )
+
+        lookups: dict[str, CacheLookupCounts] = {}
+        asset_stats = AssetManager.get_instance().get_cache_stats()
+        lookups["assets_memory"] = CacheLookupCounts(
+            hits=asset_stats.hits, misses=asset_stats.misses
+        )
+        for name, stats in get_read_coalescing_stats().items():
+            lookups[name] = CacheLookupCounts(
+                hits=stats.saved_calls(), misses=stats.requests
+            )
+        for cache_type, counts in get_lookup_counts().items():
+            lookups[f"api_disk_{cache_type}"] = counts
+        out.family("cache_hits", "counter", "Lookups served by the cache")
+        for name, counts in sorted(lookups.items()):
+            out.sample("cache_hits_total", counts.hits, {"cache": name})
+        out.family("cache_misses", "counter", "Lookups the cache could not serve")
+        for name, counts in sorted(lookups.items()):
+            out.sample("cache_misses_total", counts.misses, {"cache": name})
+
+    def _collect_modifications(self, out: _MetricsText) -> None:
+        from immich_autotag.report.modification_kind import ModificationKind
+        from immich_autotag.statistics.statistics_manager import StatisticsManager
+
+        counters = StatisticsManager.get_instance().get_stats().event_counters
+        out.family("modifications", "counter", "Modifications by ModificationKind")
+        for kind in ModificationKind:
+            count = counters.get(kind.name, 0)
+            if count:
+                out.sample("modifications_total", count, {"kind": kind.name})
+
+    def _collect_memory(self, out: _MetricsText) -> None:
+        from immich_autotag.utils.perf.memory_governor import (
+            MemoryGovernor,
+            read_rss_bytes,
+        )
+
+        out.gauge("memory_rss_bytes", read_rss_bytes(), "Resident set size")
+        if MemoryGovernor.is_enabled():
+            out.gauge(
+                "memory_budget_bytes",
+                MemoryGovernor.get_instance().get_budget_bytes(),
+                "Memory budget of the cache governor",
+            )
+
+    def _collect(self) -> str:
+        out = _MetricsText()
+        self._collect_progress(out)
+        self._collect_api_requests(out)
+        self._collect_caches(out)
+        self._collect_modifications(out)
+        self._collect_memory(out)
+        return out.render()
+
+    def export(self) -> None:
+        """Collects the metrics, writes the textfile and updates the HTTP endpoint."""
+        try:
+            text = self._collect()
+        except Exception as e:  # Metrics must never break the run
+            log(f"[METRICS] Could not collect metrics: {e}", level=LogLevel.WARNING)
+            return
+        with self._lock:
+            self._latest = text
+        self._ensure_http_server()
+        path = self._get_textfile_path()
+        if path is None:
+            return
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(text, encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError as e:
+            log(f"[METRICS] Could not write {path}: {e}", level=LogLevel.WARNING)
+
+    def get_latest(self) -> str:
+        with self._lock:
+            return self._latest
@@ -40,8 +40,23 @@ class PerfPhaseTracker:
         }
 
     def mark(self, phase: str, event: str) -> None:
-        assert phase in self.phases and event in ("start", "end")
-        self.phases[phase][event] = time.time()
+        """
+        Records `event` ('start' or 'end') for `phase`. Phases other than the
+        built-in ones (e.g. startup phases) are registered on first use.
+        """
+        assert event in ("start", "end")
+        self.phases.setdefault(phase, {"start": None, "end": None})[event] = time.time()
+
+    def get_current_phase(self) -> Optional[str]:
+        """The most recently started phase that has not ended, if any."""
+        current, current_start = None, None
+        for phase, times in list(self.phases.items()):
+            s, e = times["start"], times["end"]
+            if s is None or (e is not None and e >= s):
+                continue
+            if current_start is None or s > current_start:
+                current, current_start = phase, s
+        return current
 
     def log_summary(self) -> None:
         for phase, times in self.phases.items():
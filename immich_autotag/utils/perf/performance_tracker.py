@@ -24,6 +24,17 @@ class AvgAndTotals:
     estimation_mode: TimeEstimationMode
 
 
+@dataclass
+class ProgressSnapshot:
+    count: int
+    abs_count: int
+    total_to_process: Optional[int]
+    abs_total: Optional[int]
+    elapsed: float
+    assets_per_second: float
+    est_remaining_session: Optional[float]
+
+
 @attr.s(auto_attribs=True, kw_only=True, slots=True)
 class PerformanceTracker:
 
@@ -142,11 +153,14 @@ class PerformanceTracker:
         ) or self._last_log_time is None
 
     @typechecked
-    def update(self, count: int):
+    def update(self, count: int) -> bool:
+        """Prints the progress if it is time to. Returns whether it was printed."""
         now = time.time()
         if self._should_emit_log(now):
             self.print_progress(count=count)
             self._last_log_time = now
+            return True
+        return False
 
     @typechecked
     def _printable_value_avg(self, *, count: int, elapsed: float) -> float:
@@ -398,6 +412,22 @@ class PerformanceTracker:
         elapsed = time.time() - self._start_time
         return self._format_perf_progress(count=count, elapsed=elapsed)
 
+    @typechecked
+    def get_progress_snapshot(self, count: int) -> ProgressSnapshot:
+        """The figures of the progress line, as numbers (for the metrics export)."""
+        elapsed = time.time() - self._start_time
+        return ProgressSnapshot(
+            count=count,
+            abs_count=self._printable_value_abs_count(count),
+            total_to_process=self._printable_value_total_to_process(),
+            abs_total=self._printable_value_abs_total(),
+            elapsed=elapsed,
+            assets_per_second=count / elapsed if elapsed > 0 else 0.0,
+            est_remaining_session=self._printable_value_est_remaining_session(
+                count, elapsed
+            ),
+        )
+
     @typechecked
     def set_max_assets(self, value: int | None) -> None:
         """
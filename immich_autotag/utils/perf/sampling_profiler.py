@@ -0,0 +1,203 @@
+"""
+Low-overhead sampling profiler, meant to stay on during real runs.
+
+Two kinds of samples are taken at SAMPLING_PROFILER_HZ:
+
+- wall: a timer thread records the stack of every other thread, whatever it is
+  doing, so time blocked on HTTP requests, locks or disk shows up;
+- cpu: a SIGPROF interval timer (process CPU time) records the stack of the
+  main thread when it fires (POSIX only; skipped elsewhere or when not set up
+  from the main thread).
+
+Samples are attributed to the current PerfPhaseTracker phase and written, as
+collapsed stacks ("frame;frame;frame count", the input of flamegraph.pl and
+speedscope), to <run output>/sampling_profile/<phase>.<wall|cpu>.collapsed
+every SAMPLING_PROFILER_FLUSH_INTERVAL_SECONDS and at exit. Unlike cProfile,
+the profiled code is not traced, so its timings are not distorted.
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import re
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+from types import CodeType, FrameType
+from typing import Optional
+
+import attrs
+
+from immich_autotag.logging.levels import LogLevel
+from immich_autotag.logging.utils import log
+from immich_autotag.utils.perf.perf_phase_tracker import perf_phase_tracker
+
+_NO_PHASE = "no_phase"
+# Deepest frames kept per sample (the outermost ones are dropped)
+_MAX_STACK_DEPTH = 128
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9_.-]")
+
+_instance: Optional["SamplingProfiler"] = None
+_instance_lock = threading.Lock()
+
+
+@attrs.define(auto_attribs=True, slots=True)
+class SamplingProfiler:
+    _interval_seconds: float
+    _flush_interval_seconds: float
+    # (phase, "wall" | "cpu") -> collapsed stack -> samples
+    _samples: dict[tuple[str, str], Counter[str]] = attrs.field(
+        factory=dict, init=False
+    )
+    _labels: dict[CodeType, str] = attrs.field(factory=dict, init=False)
+    _lock: threading.Lock = attrs.field(factory=threading.Lock, init=False)
+    _stop: threading.Event = attrs.field(factory=threading.Event, init=False)
+    _thread: Optional[threading.Thread] = attrs.field(default=None, init=False)
+    _cpu_timer_set: bool = attrs.field(default=False, init=False)
+
+    @staticmethod
+    def get_instance() -> "SamplingProfiler":
+        global _instance
+        if _instance is None:
+            with _instance_lock:
+                if _instance is None:
+                    from immich_autotag.config.internal_config import (
+                        SAMPLING_PROFILER_FLUSH_INTERVAL_SECONDS,
+                        SAMPLING_PROFILER_HZ,
+                    )
+
+                    _instance = SamplingProfiler(
+                        1.0 / SAMPLING_PROFILER_HZ,
+                        SAMPLING_PROFILER_FLUSH_INTERVAL_SECONDS,
+                    )
+        return _instance
+
+    def get_hz(self) -> float:
+        return 1.0 / self._interval_seconds
+
+    @staticmethod
+    def is_enabled() -> bool:
+        from immich_autotag.config.internal_config import ENABLE_SAMPLING_PROFILER
+
+        return ENABLE_SAMPLING_PROFILER
+
+    def _label(self, code: CodeType) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            filename = "/".join(code.co_filename.replace("\\", "/").split("/")[-2:])
+            label = f"{code.co_name} ({filename}:{code.co_firstlineno})"
+            # ';' separates frames in the collapsed format (the count follows the
+            # last space, so spaces are fine)
+            label = label.replace(";", ":")
+            self._labels[code] = label
+        return label
+
+    def _record(self, kind: str, thread_name: str, frame: FrameType) -> None:
+        labels: list[str] = []
+        current: Optional[FrameType] = frame
+        while current is not None and len(labels) < _MAX_STACK_DEPTH:
+            labels.append(self._label(current.f_code))
+            current = current.f_back
+        labels.append(f"thread:{thread_name.replace(';', ':')}")
+        stack = ";".join(reversed(labels))
+        phase = perf_phase_tracker.get_current_phase() or _NO_PHASE
+        # The CPU signal handler runs on the main thread between bytecodes: never
+        # block on the lock there (the main thread may be holding it in flush())
+        if not self._lock.acquire(blocking=kind != "cpu"):
+            return
+        try:
+            self._samples.setdefault((phase, kind), Counter())[stack] += 1
+        finally:
+            self._lock.release()
+
+    def _on_cpu_signal(self, _signum: int, frame: Optional[FrameType]) -> None:
+        if frame is not None:
+            self._record("cpu", "MainThread", frame)
+
+    def _start_cpu_timer(self) -> None:
+        if sys.platform == "win32":  # No setitimer / SIGPROF
+            return
+        if threading.current_thread() is not threading.main_thread():
+            return
+        try:
+            signal.signal(signal.SIGPROF, self._on_cpu_signal)
+            signal.setitimer(
+                signal.ITIMER_PROF, self._interval_seconds, self._interval_seconds
+            )
+        except (OSError, ValueError) as e:
+            log(
+                f"[PROFILE] CPU sampling unavailable ({e}); wall samples only",
+                level=LogLevel.WARNING,
+            )
+            return
+        self._cpu_timer_set = True
+
+    def _run(self) -> None:
+        own_ident = threading.get_ident()
+        next_flush = time.monotonic() + self._flush_interval_seconds
+        while not self._stop.wait(self._interval_seconds):
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident != own_ident:
+                    self._record("wall", names.get(ident, str(ident)), frame)
+            if time.monotonic() >= next_flush:
+                next_flush = time.monotonic() + self._flush_interval_seconds
+                self.flush()
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="sampling-profiler", daemon=True
+        )
+        self._thread.start()
+        self._start_cpu_timer()
+        atexit.register(self.stop)
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        if self._cpu_timer_set:
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            self._cpu_timer_set = False
+        self._stop.set()
+        self._thread.join(timeout=5)
+        self._thread = None
+        self.flush()
+
+    def flush(self) -> None:
+        """Writes the collapsed stacks gathered so far (whole run, not a delta)."""
+        try:
+            from immich_autotag.run_output.manager import RunOutputManager
+
+            run_dir = RunOutputManager.current().get_run_output_dir()
+            profile_dir = run_dir.get_sampling_profile_dir()
+        except Exception as e:  # No run output yet (early startup): next flush
+            log(f"[PROFILE] Sampling profile not saved: {e}", level=LogLevel.DEBUG)
+            return
+        with self._lock:
+            snapshot: list[tuple[tuple[str, str], list[tuple[str, int]]]] = [
+                (key, list(counter.items())) for key, counter in self._samples.items()
+            ]
+        for (phase, kind), stacks in snapshot:
+            safe_phase = _UNSAFE_FILENAME_CHARS.sub("_", phase)
+            path = profile_dir / f"{safe_phase}.{kind}.collapsed"
+            tmp_path = path.with_suffix(".collapsed.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for stack, count in stacks:
+                    f.write(f"{stack} {count}\n")
+            os.replace(tmp_path, path)
+
+
+def setup_sampling_profiler() -> None:
+    """Starts the sampling profiler (from the main thread, for CPU samples)."""
+    profiler = SamplingProfiler.get_instance()
+    profiler.start()
+    log(
+        f"[PROFILE] Sampling profiler on ({profiler.get_hz():.0f} Hz); "
+        "collapsed stacks in the run output folder 'sampling_profile'",
+        level=LogLevel.DEBUG,
+    )
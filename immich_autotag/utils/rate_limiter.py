@@ -0,0 +1,32 @@
+"""
+Thread-safe rate limiter: spaces out operations started from several threads so
+that at most `per_second` of them start in any second. Callers wait in
+acquire() until their slot comes up.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Optional
+
+import attrs
+
+
+@attrs.define(auto_attribs=True, slots=True)
+class RateLimiter:
+    # None (or 0): unlimited
+    _per_second: Optional[float]
+    _next_slot: float = attrs.field(default=0.0, init=False)
+    _lock: threading.Lock = attrs.field(factory=threading.Lock, init=False)
+
+    def acquire(self) -> None:
+        """Blocks until the caller may start one operation."""
+        if not self._per_second:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + 1.0 / self._per_second
+        if slot > now:
+            time.sleep(slot - now)
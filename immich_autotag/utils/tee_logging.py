@@ -1,21 +1,202 @@
 # tee_logging.py
 #
-# Utility to duplicate stdout and stderr to a file in real time,
-# without memory buffers.
+# Utility to duplicate stdout and stderr to a file in real time.
+#
+# With TEE_LOG_ASYNC (the default), writes only enqueue the text: a background
+# writer thread filters large DTO reprs and writes the console and the log file
+# in batches, so log I/O does not stall asset processing. The queue is bounded
+# (TEE_LOG_QUEUE_MAX_RECORDS); when it is full, TEE_LOG_QUEUE_FULL_POLICY
+# decides whether the writing thread waits ("block") or the text is dropped and
+# counted ("drop"). The queue is drained at exit; output printed after that
+# (e.g. summaries of atexit handlers registered earlier) is written
+# synchronously to the console and the log file.
+#
+# The log file is rotated (gzip-compressed segments) once it exceeds
+# TEE_LOG_ROTATE_MAX_BYTES, and full logs of old runs are compressed at startup.
 
 
+import atexit
+import gzip
+import queue
+import shutil
 import sys
+import threading
+import time
 from pathlib import Path
+from typing import IO, Optional, TextIO
 
 from typeguard import typechecked
 
+_BANNED_MARKERS = (
+    "AssetResponseDto(",
+    "ExifResponseDto(",
+    "AlbumResponseDto(",
+    "DuplicateResponseDto(",
+)
+_MAX_DTO_LINE_LEN = 1000
+# Seconds close() waits for the writer to drain the queue
+_DRAIN_TIMEOUT_SECONDS = 10.0
+_STOP = object()
+
+
+def _filter_dto_reprs(data: str) -> str:
+    # Filter out extremely large DTO reprs that flood the logs.
+    # If a known DTO pattern appears in the output,
+    # replace it with a short placeholder.
+    try:
+        if data:
+            for marker in _BANNED_MARKERS:
+                if marker in data:
+                    # Replace the large representation with a concise marker.
+                    data = data.replace(marker, "[DTO_TRUNCATED:(")
+                    # Additionally, if the line is extremely long,
+                    # truncate it to a safe size
+                    if len(data) > _MAX_DTO_LINE_LEN:
+                        data = data[:_MAX_DTO_LINE_LEN] + "... [TRUNCATED]\n"
+                    break
+    except Exception:
+        # Don't let filtering break logging; fall back to original data
+        pass
+    return data
+
+
+def _gzip_file(path: Path, gz_path: Path) -> None:
+    with open(path, "rb") as src, gzip.open(gz_path, "wb", compresslevel=6) as dst:
+        shutil.copyfileobj(src, dst)
+    path.unlink()
+
 
 class Tee:
-    def __init__(self, *, filename: Path, mode: str = "a"):
+    # Set by close(); the file itself is also closed briefly by rotation
+    _closed: bool
+    filename: Path
+    file: IO[str]
+    stdout: TextIO
+    stderr: TextIO
+    _rotate_max_bytes: Optional[int]
+    _rotate_keep: int
+    _batch_max_records: int
+    _drop_when_full: bool
+    _dropped: int
+    # Set once the writer is stopped at exit: writes become synchronous
+    _drained: bool
+    # Serializes file writes and rotation between the writer and late
+    # synchronous writes
+    _write_lock: threading.Lock
+    _queue: Optional[queue.Queue]
+    _writer: Optional[threading.Thread]
+
+    def _maybe_rotate(self) -> None:
+        if self._rotate_max_bytes is None or self.file.tell() < self._rotate_max_bytes:
+            return
+        self.file.close()
+        for index in range(self._rotate_keep, 0, -1):
+            older = self.filename.with_name(f"{self.filename.name}.{index}.gz")
+            if not older.exists():
+                continue
+            if index == self._rotate_keep:
+                older.unlink()
+            else:
+                older.rename(
+                    self.filename.with_name(f"{self.filename.name}.{index + 1}.gz")
+                )
+        if self._rotate_keep > 0:
+            _gzip_file(
+                self.filename, self.filename.with_name(f"{self.filename.name}.1.gz")
+            )
+        else:
+            self.filename.unlink()
+        self.file = open(self.filename, "a", buffering=1, encoding="utf-8")
+
+    def _write_out(self, data: str) -> None:
+        with self._write_lock:
+            self.stdout.write(data)
+            self.file.write(data)
+            self.file.flush()
+            self.stdout.flush()
+            self._maybe_rotate()
+
+    def _writer_loop(self) -> None:
+        assert self._queue is not None
+        while True:
+            item = self._queue.get()
+            batch = []
+            stop = item is _STOP
+            if not stop:
+                batch.append(item)
+            while not stop and len(batch) < self._batch_max_records:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                else:
+                    batch.append(item)
+            if self._dropped:
+                dropped, self._dropped = self._dropped, 0
+                batch.append(f"[LOG] {dropped} log writes dropped (queue full)\n")
+            if batch:
+                try:
+                    text = "".join(_filter_dto_reprs(d) for d in batch if d)
+                    self._write_out(text)
+                except Exception as e:  # Keep the writer alive (e.g. disk full)
+                    self.stdout.write(f"[LOG] Log writer error: {e}\n")
+            if stop:
+                return
+
+    def _stop_writer(self) -> None:
+        writer = self._writer
+        if writer is None or not writer.is_alive():
+            return
+        assert self._queue is not None
+        try:
+            self._queue.put(_STOP, timeout=_DRAIN_TIMEOUT_SECONDS)
+        except queue.Full:
+            pass
+        writer.join(timeout=_DRAIN_TIMEOUT_SECONDS)
+
+    def _drain_at_exit(self) -> None:
+        # atexit runs handlers in reverse order, so the ones registered before
+        # this Tee (e.g. the API call summaries) still print after it: keep the
+        # streams and the file, and only switch to synchronous writes
+        self._drained = True
+        self._stop_writer()
+
+    def __init__(
+        self,
+        *,
+        filename: Path,
+        mode: str = "a",
+        async_writes: bool = False,
+        queue_max_records: int = 0,
+        drop_when_full: bool = False,
+        batch_max_records: int = 512,
+        rotate_max_bytes: Optional[int] = None,
+        rotate_keep: int = 10,
+    ):
+        self._closed = False
         # Usar pathlib.Path para robustez
-        self.file = open(filename, mode, buffering=1, encoding="utf-8")
+        self.filename = Path(filename)
+        self.file = open(self.filename, mode, buffering=1, encoding="utf-8")
         self.stdout = sys.stdout
         self.stderr = sys.stderr
+        self._rotate_max_bytes = rotate_max_bytes
+        self._rotate_keep = rotate_keep
+        self._batch_max_records = batch_max_records
+        self._drop_when_full = drop_when_full
+        self._dropped = 0
+        self._drained = False
+        self._write_lock = threading.Lock()
+        self._queue = None
+        self._writer = None
+        if async_writes:
+            self._queue = queue.Queue(maxsize=queue_max_records)
+            self._writer = threading.Thread(
+                target=self._writer_loop, name="tee-log-writer", daemon=True
+            )
+            self._writer.start()
+            atexit.register(self._drain_at_exit)
         # Redirect global streams
         sys.stdout = self
         sys.stderr = self
@@ -24,63 +205,107 @@ class Tee:
         self.close()
 
     def write(self, data):
-        # Filter out extremely large DTO reprs that flood the logs.
-        # If a known DTO pattern appears in the output,
-        # replace it with a short placeholder.
+        if self._closed:  # Late writes through a stale reference after close()
+            self.stdout.write(data)
+            return
+        if self._queue is None or self._writer is None or self._drained:
+            self._write_out(_filter_dto_reprs(data))
+            return
+        if threading.current_thread() is self._writer:
+            # Output of the writer itself (e.g. a warning while writing)
+            self.stdout.write(data)
+            return
         try:
-            if isinstance(data, str) and data:
-                banned_markers = (
-                    "AssetResponseDto(",
-                    "ExifResponseDto(",
-                    "AlbumResponseDto(",
-                    "DuplicateResponseDto(",
-                )
-                for marker in banned_markers:
-                    if marker in data:
-                        # Replace the large representation with a concise marker.
-                        data = data.replace(marker, "[DTO_TRUNCATED:(")
-                        # Additionally, if the line is extremely long,
-                        # truncate it to a safe size
-                        MAX_LEN = 1000
-                        if len(data) > MAX_LEN:
-                            data = data[:MAX_LEN] + "... [TRUNCATED]\n"
-                        break
-        except Exception:
-            # Don't let filtering break logging; fall back to original data
-            pass
-
-        self.stdout.write(data)
-        self.file.write(data)
-        self.file.flush()
-        self.stdout.flush()
+            self._queue.put(data, block=not self._drop_when_full)
+        except queue.Full:
+            self._dropped += 1
 
     def flush(self):
-        self.stdout.flush()
-        self.file.flush()
+        # Async writes are flushed by the writer after each batch
+        if self._queue is None and not self._closed:
+            self.stdout.flush()
+            self.file.flush()
 
     def close(self):
+        if self._closed:
+            return
+        # Writes from here on go synchronously to the console. The queue and
+        # writer are kept: other threads may be between this check and put()
+        self._closed = True
         if sys.stdout is self:
             sys.stdout = self.stdout
         if sys.stderr is self:
-            self.stderr = self.stderr
-        if not self.file.closed:
-            self.file.close()
+            sys.stderr = self.stderr
+        self._stop_writer()
+        with self._write_lock:
+            if not self.file.closed:
+                self.file.close()
+
+
+def compress_old_run_logs(log_path: Path, min_age_hours: float) -> None:
+    """
+    Gzips the full output logs of the other runs in the logs folder that were
+    last written more than min_age_hours ago (so runs still in progress, e.g.
+    other shards, are left alone).
+    """
+    from immich_autotag.run_output.manager import RunOutputManager
+
+    run_dir = log_path.parent
+    cutoff = time.time() - min_age_hours * 3600
+    for other in run_dir.parent.iterdir():
+        if (
+            other == run_dir
+            or RunOutputManager.get_run_dir_pid_mark() not in other.name
+        ):
+            continue
+        old_log = other / log_path.name
+        try:
+            if old_log.is_file() and old_log.stat().st_mtime < cutoff:
+                _gzip_file(old_log, old_log.with_name(old_log.name + ".gz"))
+        except OSError as e:
+            print(f"[LOG] Could not compress {old_log}: {e}")
 
 
 @typechecked
 def setup_tee_logging() -> None:
     """
-    Duplicates stdout and stderr to a file in real time, without memory buffers.
+    Duplicates stdout and stderr to a file in real time (see the module notes for
+    the asynchronous writer, rotation and compression of old run logs).
     The file is created in the current run's log directory
     (get_run_output_dir()), and the base name can be customized.
     """
+    from immich_autotag.config.internal_config import (
+        TEE_LOG_ASYNC,
+        TEE_LOG_BATCH_MAX_RECORDS,
+        TEE_LOG_COMPRESS_OLD_RUNS_AFTER_HOURS,
+        TEE_LOG_QUEUE_FULL_POLICY,
+        TEE_LOG_QUEUE_MAX_RECORDS,
+        TEE_LOG_ROTATE_KEEP,
+        TEE_LOG_ROTATE_MAX_BYTES,
+    )
     from immich_autotag.logging.utils import LogLevel, log
     from immich_autotag.run_output.manager import RunOutputManager
 
     run_exec = RunOutputManager.current().get_run_output_dir()
     log_path = run_exec.get_full_output_log_path()
-    Tee(filename=log_path, mode="a")
+    Tee(
+        filename=log_path,
+        mode="a",
+        async_writes=TEE_LOG_ASYNC,
+        queue_max_records=TEE_LOG_QUEUE_MAX_RECORDS,
+        drop_when_full=TEE_LOG_QUEUE_FULL_POLICY == "drop",
+        batch_max_records=TEE_LOG_BATCH_MAX_RECORDS,
+        rotate_max_bytes=TEE_LOG_ROTATE_MAX_BYTES,
+        rotate_keep=TEE_LOG_ROTATE_KEEP,
+    )
     log(
         f"[LOG] Tee logging initialized. Absolute log file path: {log_path.resolve()}",
         level=LogLevel.FOCUS,
     )
+    if TEE_LOG_COMPRESS_OLD_RUNS_AFTER_HOURS is not None:
+        threading.Thread(
+            target=compress_old_run_logs,
+            args=(log_path, TEE_LOG_COMPRESS_OLD_RUNS_AFTER_HOURS),
+            name="compress-old-run-logs",
+            daemon=True,
+        ).start()